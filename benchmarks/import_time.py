@@ -0,0 +1,76 @@
+# benchmarks/import_time.py
+"""
+Import-time guard for short-lived scripts.
+
+Each module is imported in a fresh interpreter, timed, and checked against
+a budget and a list of heavy dependencies that must not load at import.
+
+Usage:
+    python benchmarks/import_time.py            # report; exit 1 on regression
+    python benchmarks/import_time.py --repeat 7 --scale 2.0
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+# module → (budget in ms, modules that must stay unloaded)
+CASES: dict[str, tuple[float, tuple[str, ...]]] = {
+    "optiv_lib": (60.0, ("requests", "optiv_lib.providers.pan.session", "azure")),
+    "optiv_lib.providers.pan": (60.0, ("requests", "xmltodict", "truststore")),
+    "optiv_lib.providers.pan.session": (250.0, ("xmltodict", "truststore")),
+    "optiv_lib.providers.azure.clients": (60.0, ("azure.core", "azure.identity", "azure.mgmt")),
+    "optiv_lib.providers.azure.threads": (40.0, ("azure",)),
+}
+
+_PROBE = """
+import json, sys, time
+t = time.perf_counter()
+import {module}
+dt = (time.perf_counter() - t) * 1000
+print(json.dumps({{"ms": dt, "loaded": sorted(m for m in sys.modules)}}))
+"""
+
+
+def measure(module: str) -> tuple[float, set[str]]:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(SRC), os.environ.get("PYTHONPATH")])))
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module)],
+        check=True, capture_output=True, text=True, env=env,
+    ).stdout
+    data = json.loads(out.strip().splitlines()[-1])
+    return data["ms"], set(data["loaded"])
+
+
+def _loaded(forbidden: str, loaded: set[str]) -> bool:
+    return forbidden in loaded or any(m.startswith(forbidden + ".") for m in loaded)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--repeat", type=int, default=5, help="runs per module; the median is reported")
+    ap.add_argument("--scale", type=float, default=1.0, help="multiply budgets (slow CI hosts)")
+    args = ap.parse_args()
+
+    failures = 0
+    for module, (budget, forbidden) in CASES.items():
+        runs = [measure(module) for _ in range(args.repeat)]
+        ms = statistics.median(r[0] for r in runs)
+        leaked = [f for f in forbidden if _loaded(f, runs[0][1])]
+        limit = budget * args.scale
+        ok = ms <= limit and not leaked
+        failures += not ok
+        note = f"  loaded: {', '.join(leaked)}" if leaked else ""
+        print(f"{'ok  ' if ok else 'FAIL'} {module:<40} {ms:8.1f} ms  (budget {limit:.0f}){note}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,20 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any
+
 from optiv_lib.config import AppConfig, PanoramaConfig
 
+if TYPE_CHECKING:
+    from optiv_lib.providers import pan as Panorama
 
-from optiv_lib.providers import pan as Panorama
 __all__ = ["AppConfig", "Panorama"]
+
+
+def __getattr__(name: str) -> Any:
+    # Provider packages pull in HTTP stacks; load them on first access.
+    if name == "Panorama":
+        from optiv_lib.providers import pan as Panorama
+
+        globals()["Panorama"] = Panorama
+        return Panorama
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
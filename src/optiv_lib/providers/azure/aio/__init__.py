@@ -0,0 +1,15 @@
+# src/optiv_lib/providers/azure/aio/__init__.py
+"""
+Asyncio Azure surface on the SDK aio clients.
+
+Object APIs mirror optiv_lib.providers.azure.objects under
+optiv_lib.providers.azure.aio.objects with the same function names, as
+coroutines. Clients share one aiohttp session per event loop; call
+close_all() before the loop ends. Requires aiohttp (the 'aio' extra).
+"""
+from __future__ import annotations
+
+from .clients import close_all, network_client, resource_client, subscription_client
+from .tasks import TaskError, amap, amap_flat
+
+__all__ = ["close_all", "network_client", "resource_client", "subscription_client", "TaskError", "amap", "amap_flat"]
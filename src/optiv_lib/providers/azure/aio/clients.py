@@ -0,0 +1,135 @@
+# src/optiv_lib/providers/azure/aio/clients.py
+from __future__ import annotations
+
+import asyncio
+import weakref
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from optiv_lib.providers.azure.clients import USER_AGENT
+from optiv_lib.providers.azure.session import get_session
+
+from .credentials import AsyncCredentialAdapter
+
+if TYPE_CHECKING:
+    import aiohttp
+    from azure.core.pipeline.transport import AioHttpTransport
+    from azure.mgmt.network.aio import NetworkManagementClient
+    from azure.mgmt.resource.aio import ResourceManagementClient
+    from azure.mgmt.resource.subscriptions.aio import SubscriptionClient
+
+__all__ = [
+    "subscription_client",
+    "network_client",
+    "resource_client",
+    "close_all",
+    "MAX_CONCURRENCY",
+]
+
+# In-flight HTTP requests per event loop, across every client. Requests past
+# this wait on the semaphore rather than opening more sockets; ARM throttling
+# is still paced by AsyncRateLimitPolicy.
+MAX_CONCURRENCY = 256
+
+
+@dataclass(slots=True)
+class _LoopState:
+    """Transport, credential and client caches for one event loop (aiohttp sessions are loop-bound)."""
+    session: aiohttp.ClientSession
+    transport: AioHttpTransport
+    credential: AsyncCredentialAdapter
+    limit: asyncio.Semaphore
+    subscription: Optional[SubscriptionClient] = None
+    network: Dict[str, NetworkManagementClient] = field(default_factory=dict)
+    resource: Dict[str, ResourceManagementClient] = field(default_factory=dict)
+
+
+_STATES: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState] = weakref.WeakKeyDictionary()
+
+
+def _state() -> _LoopState:
+    """State for the running loop, created on first client."""
+    loop = asyncio.get_running_loop()
+    st = _STATES.get(loop)
+    if st is None:
+        import aiohttp
+        from azure.core.pipeline.transport import AioHttpTransport
+
+        session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=MAX_CONCURRENCY, ttl_dns_cache=300))
+        st = _STATES[loop] = _LoopState(
+            session=session,
+            transport=AioHttpTransport(session=session, session_owner=False, connection_timeout=10, read_timeout=60),
+            credential=AsyncCredentialAdapter(get_session().credential),
+            limit=asyncio.Semaphore(MAX_CONCURRENCY),
+        )
+    return st
+
+
+def _client_kwargs(st: _LoopState) -> Dict[str, Any]:
+    from azure.core.pipeline.policies import AsyncHTTPPolicy
+
+    from optiv_lib.providers.azure.throttle import AsyncRateLimitPolicy
+
+    class _Limit(AsyncHTTPPolicy):
+        # Holds a loop-wide slot per HTTP attempt only, so nested fan-out
+        # (e.g. subnets per vnet inside a per-subscription task) cannot deadlock.
+        async def send(self, request):  # type: ignore[override]
+            async with st.limit:
+                return await self.next.send(request)
+
+    return {
+        "transport": st.transport,
+        "user_agent": USER_AGENT,
+        "per_retry_policies": [AsyncRateLimitPolicy(), _Limit()],
+    }
+
+
+def subscription_client() -> SubscriptionClient:
+    """Cached async SubscriptionClient for the running loop."""
+    st = _state()
+    if st.subscription is None:
+        from azure.mgmt.resource.subscriptions.aio import SubscriptionClient
+
+        st.subscription = SubscriptionClient(credential=st.credential, **_client_kwargs(st))
+    return st.subscription
+
+
+def network_client(subscription_id: str) -> NetworkManagementClient:
+    """Cached async NetworkManagementClient per subscription for the running loop."""
+    st = _state()
+    client = st.network.get(subscription_id)
+    if client is None:
+        from azure.mgmt.network.aio import NetworkManagementClient
+
+        client = NetworkManagementClient(credential=st.credential, subscription_id=subscription_id, **_client_kwargs(st))
+        st.network[subscription_id] = client
+    return client
+
+
+def resource_client(subscription_id: str) -> ResourceManagementClient:
+    """Cached async ResourceManagementClient per subscription for the running loop."""
+    st = _state()
+    client = st.resource.get(subscription_id)
+    if client is None:
+        from azure.mgmt.resource.aio import ResourceManagementClient
+
+        client = ResourceManagementClient(credential=st.credential, subscription_id=subscription_id, **_client_kwargs(st))
+        st.resource[subscription_id] = client
+    return client
+
+
+async def close_all() -> None:
+    """
+    Close the running loop's clients and its shared aiohttp session.
+    Call before the loop ends (e.g. at the end of the coroutine passed to asyncio.run).
+    """
+    st = _STATES.pop(asyncio.get_running_loop(), None)
+    if st is None:
+        return
+    clients = [*st.network.values(), *st.resource.values()]
+    if st.subscription is not None:
+        clients.append(st.subscription)
+    for c in clients:
+        await c.close()
+    await st.credential.close()
+    await st.session.close()
@@ -0,0 +1,71 @@
+# src/optiv_lib/providers/azure/aio/credentials.py
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from azure.core.credentials import AccessToken, TokenCredential
+
+__all__ = ["AsyncCredentialAdapter"]
+
+_TokenKey = Tuple[Tuple[str, ...], Optional[str], Optional[str]]
+
+
+class AsyncCredentialAdapter:
+    """
+    Async TokenCredential over the sync session credential.
+
+    The session credential is interactive (and its token cache is shared
+    with the sync clients), so it is wrapped rather than replaced. Over a
+    CachingCredential, tokens come straight from its cache (peek), which
+    refreshes in the background and never blocks; other credentials are
+    cached here until `refresh_margin` seconds before expiry. Only a
+    missing or expired token runs the sync get_token in a worker thread,
+    one at a time, so thousands of concurrent requests cost one token call
+    and never block the loop.
+    """
+
+    def __init__(self, credential: TokenCredential, *, refresh_margin: float = 300.0) -> None:
+        self.credential = credential
+        self.refresh_margin = refresh_margin
+        self._tokens: Dict[_TokenKey, AccessToken] = {}
+        self._lock = asyncio.Lock()
+
+    def _fresh(self, key: _TokenKey, enable_cae: bool = False) -> Optional[AccessToken]:
+        scopes, claims, tenant_id = key
+        peek = getattr(self.credential, "peek", None)
+        if peek is not None and claims is None:
+            return peek(*scopes, tenant_id=tenant_id, enable_cae=enable_cae)
+        tok = self._tokens.get(key)
+        if tok is not None and tok.expires_on - self.refresh_margin > time.time():
+            return tok
+        return None
+
+    async def get_token(self, *scopes: str, claims: Optional[str] = None, tenant_id: Optional[str] = None, **kwargs: Any) -> AccessToken:
+        key: _TokenKey = (scopes, claims, tenant_id)
+        cae = bool(kwargs.get("enable_cae"))
+        tok = self._fresh(key, cae)
+        if tok is not None:
+            return tok
+        async with self._lock:
+            tok = self._fresh(key, cae)
+            if tok is None:
+                if claims is not None:
+                    kwargs["claims"] = claims
+                if tenant_id is not None:
+                    kwargs["tenant_id"] = tenant_id
+                tok = await asyncio.to_thread(self.credential.get_token, *scopes, **kwargs)
+                self._tokens[key] = tok
+        return tok
+
+    async def close(self) -> None:
+        """Drop cached tokens; the wrapped sync credential belongs to the session."""
+        self._tokens.clear()
+
+    async def __aenter__(self) -> AsyncCredentialAdapter:
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.close()
@@ -0,0 +1,52 @@
+# src/optiv_lib/providers/azure/aio/objects/application_gateway/api.py
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, List, Optional
+
+from azure.mgmt.core.tools import parse_resource_id
+
+from optiv_lib.providers.azure.aio.clients import network_client
+from optiv_lib.providers.azure.aio.objects.subscription.api import subscription_ids
+from optiv_lib.providers.azure.aio.tasks import amap_flat
+
+if TYPE_CHECKING:
+    from azure.mgmt.network.models import ApplicationGateway
+
+
+async def list_application_gateways(subscription_id: str, resource_group: str) -> List[ApplicationGateway]:
+    client = network_client(subscription_id)
+    return [g async for g in client.application_gateways.list(resource_group_name=resource_group)]
+
+
+async def list_all_application_gateways() -> List[ApplicationGateway]:
+    """
+    List all Application Gateways across all accessible subscriptions concurrently.
+    """
+    sub_ids = await subscription_ids()
+
+    async def _fetch(sub_id: str) -> List[ApplicationGateway]:
+        return [g async for g in network_client(sub_id).application_gateways.list_all()]
+
+    return await amap_flat(_fetch, sub_ids, ignore_errors=True)
+
+
+async def get_application_gateway_by_id(appgw_id: str) -> ApplicationGateway:
+    """
+    Fetch a single Application Gateway by its full resource ID.
+    """
+    rid = parse_resource_id(appgw_id)
+    client = network_client(rid["subscription"])
+    return await client.application_gateways.get(resource_group_name=rid["resource_group"], application_gateway_name=rid["resource_name"])
+
+
+async def get_backend_health_by_id(appgw_id: str, timeout: Optional[float] = 35, ) -> Any:
+    """
+    Call Application Gateway Backend Health and return the resolved result.
+    Uses the LRO 'begin_backend_health' API; `timeout` bounds the wait for the poller.
+    """
+    rid = parse_resource_id(appgw_id)
+    client = network_client(rid["subscription"])
+    poller = await client.application_gateways.begin_backend_health(resource_group_name=rid["resource_group"], application_gateway_name=rid["resource_name"],
+                                                                     expand="All", )
+    return await asyncio.wait_for(poller.result(), timeout)
@@ -0,0 +1,50 @@
+# src/optiv_lib/providers/azure/aio/objects/public_ip/api.py
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List
+
+from azure.mgmt.core.tools import parse_resource_id
+
+from optiv_lib.providers.azure.aio.clients import network_client
+from optiv_lib.providers.azure.objects.public_ip.model import PublicIPRecord, to_record
+
+if TYPE_CHECKING:
+    from azure.mgmt.network.models import PublicIPAddress
+
+
+async def list_public_ips(subscription_id: str, *, project: bool = False) -> List[PublicIPAddress] | List[PublicIPRecord]:
+    """
+    List all Public IP addresses in the subscription.
+    project=True returns PublicIPRecords, converted as each page arrives.
+    """
+    client = network_client(subscription_id)
+    if project:
+        return [to_record(p) async for p in client.public_ip_addresses.list_all()]
+    return [p async for p in client.public_ip_addresses.list_all()]
+
+
+async def list_public_ips_in_rg(subscription_id: str, resource_group: str, *, project: bool = False) -> List[PublicIPAddress] | List[PublicIPRecord]:
+    """
+    List Public IP addresses in a specific resource group.
+    """
+    client = network_client(subscription_id)
+    if project:
+        return [to_record(p) async for p in client.public_ip_addresses.list(resource_group_name=resource_group)]
+    return [p async for p in client.public_ip_addresses.list(resource_group_name=resource_group)]
+
+
+async def get_public_ip(subscription_id: str, resource_group: str, name: str) -> PublicIPAddress:
+    """
+    Get a specific Public IP address by name.
+    """
+    client = network_client(subscription_id)
+    return await client.public_ip_addresses.get(resource_group_name=resource_group, public_ip_address_name=name)
+
+
+async def get_public_ip_by_id(resource_id: str) -> PublicIPAddress:
+    """
+    Retrieve a Public IP object directly by its Azure resource ID.
+    """
+    id_parts = parse_resource_id(resource_id)
+    client = network_client(subscription_id=id_parts.get('subscription'))
+    return await client.public_ip_addresses.get(resource_group_name=id_parts.get('resource_group'), public_ip_address_name=id_parts.get('name'))
@@ -0,0 +1,25 @@
+# src/optiv_lib/providers/azure/aio/objects/resource_group/api.py
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List
+
+from optiv_lib.providers.azure.aio.clients import resource_client
+
+if TYPE_CHECKING:
+    from azure.mgmt.resource.resources.v2025_04_01.models import ResourceGroup
+
+
+async def list_resource_groups(subscription_id: str) -> List[ResourceGroup]:
+    """
+    List all resource groups in the given subscription.
+    """
+    client = resource_client(subscription_id)
+    return [rg async for rg in client.resource_groups.list()]
+
+
+async def get_resource_group(subscription_id: str, name: str) -> ResourceGroup:
+    """
+    Get a specific resource group by name.
+    """
+    client = resource_client(subscription_id)
+    return await client.resource_groups.get(name)
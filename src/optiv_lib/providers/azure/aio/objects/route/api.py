@@ -0,0 +1,75 @@
+# src/optiv_lib/providers/azure/aio/objects/route/api.py
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, List
+
+from azure.mgmt.core.tools import parse_resource_id
+
+from optiv_lib.providers.azure.aio.clients import network_client
+from optiv_lib.providers.azure.aio.objects.subscription.api import subscription_ids
+from optiv_lib.providers.azure.aio.tasks import amap_flat
+from optiv_lib.providers.azure.objects.route.api import CrawlMode, embedded_routes
+from optiv_lib.providers.azure.objects.route.model import RouteRecord, to_record
+
+if TYPE_CHECKING:
+    from azure.mgmt.network.models import Route
+
+
+async def list_routes(subscription_id: str, resource_group: str, route_table_name: str, *, project: bool = False) -> List[Route] | List[RouteRecord]:
+    """List routes within a specific route table (RouteRecords with project=True)."""
+    net = network_client(subscription_id)
+    pager = net.routes.list(resource_group_name=resource_group, route_table_name=route_table_name)
+    if project:
+        return [to_record(r) async for r in pager]
+    return [r async for r in pager]
+
+
+async def get_route(subscription_id: str, resource_group: str, route_table_name: str, route_name: str) -> Route:
+    """Get a specific route."""
+    net = network_client(subscription_id)
+    return await net.routes.get(
+        resource_group_name=resource_group,
+        route_table_name=route_table_name,
+        route_name=route_name,
+    )
+
+
+async def get_route_by_id(resource_id: str) -> Route:
+    """
+    Get a route by full resource ID:
+    /subscriptions/<sub>/resourceGroups/<rg>/providers/Microsoft.Network/routeTables/<rt>/routes/<route>
+    """
+    rid = parse_resource_id(resource_id)
+    net = network_client(rid["subscription"])
+    return await net.routes.get(
+        resource_group_name=rid["resource_group"],
+        route_table_name=rid["name"],
+        route_name=rid.get("child_name_1") or rid["resource_name"],
+    )
+
+
+async def list_all_routes(*, mode: CrawlMode = "embedded", project: bool = False) -> List[Route] | List[RouteRecord]:
+    """
+    Across all subscriptions: walk each subscription's route tables, take each table's
+    embedded routes, and list routes concurrently only for tables without them (see
+    CrawlMode). project=True returns RouteRecords, projected as pages arrive.
+    """
+
+    async def _fetch_routes(rt_id: str) -> List[Any]:
+        rid = parse_resource_id(rt_id)
+        return await list_routes(rid["subscription"], rid["resource_group"], rid["name"], project=project)
+
+    async def _fetch_sub(sub_id: str) -> List[Any]:
+        out: List[Any] = []
+        missing: List[str] = []
+        async for rt in network_client(sub_id).route_tables.list_all():
+            got = embedded_routes(rt) if mode == "embedded" else None
+            if got is None:
+                missing.append(rt.id)
+            else:
+                out.extend([to_record(r) for r in got] if project else got)
+        if missing:
+            out.extend(await amap_flat(_fetch_routes, missing, ignore_errors=True))
+        return out
+
+    return await amap_flat(_fetch_sub, await subscription_ids(), ignore_errors=True)
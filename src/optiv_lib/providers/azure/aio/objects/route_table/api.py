@@ -0,0 +1,45 @@
+# src/optiv_lib/providers/azure/aio/objects/route_table/api.py
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, List
+
+from azure.mgmt.core.tools import parse_resource_id
+
+from optiv_lib.providers.azure.aio.clients import network_client
+from optiv_lib.providers.azure.aio.objects.subscription.api import subscription_ids
+from optiv_lib.providers.azure.aio.tasks import amap_flat
+from optiv_lib.providers.azure.objects.route_table.model import RouteTableRecord, to_record
+
+if TYPE_CHECKING:
+    from azure.mgmt.network.models import RouteTable
+
+
+async def list_route_tables(subscription_id: str, *, project: bool = False) -> List[RouteTable] | List[RouteTableRecord]:
+    client = network_client(subscription_id)
+    if project:
+        return [to_record(rt) async for rt in client.route_tables.list_all()]
+    return [rt async for rt in client.route_tables.list_all()]
+
+
+async def list_route_tables_in_rg(subscription_id: str, resource_group: str) -> List[RouteTable]:
+    client = network_client(subscription_id)
+    return [rt async for rt in client.route_tables.list(resource_group_name=resource_group)]
+
+
+async def get_route_table(subscription_id: str, resource_group: str, name: str) -> RouteTable:
+    client = network_client(subscription_id)
+    return await client.route_tables.get(resource_group_name=resource_group, route_table_name=name)
+
+
+async def get_route_table_by_id(resource_id: str) -> RouteTable:
+    rid = parse_resource_id(resource_id)
+    client = network_client(rid["subscription"])
+    return await client.route_tables.get(resource_group_name=rid["resource_group"], route_table_name=rid["resource_name"])
+
+
+async def list_all_route_tables(*, project: bool = False) -> List[RouteTable] | List[RouteTableRecord]:
+    subs = await subscription_ids()
+
+    async def _fetch(sub_id: str) -> List[Any]:
+        return await list_route_tables(sub_id, project=project)
+
+    return await amap_flat(_fetch, subs, ignore_errors=True)
@@ -0,0 +1,84 @@
+# src/optiv_lib/providers/azure/aio/objects/subnet/api.py
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, List, Optional
+
+from azure.mgmt.core.tools import parse_resource_id
+
+from optiv_lib.providers.azure.aio.clients import network_client
+from optiv_lib.providers.azure.aio.objects.subscription.api import subscription_ids
+from optiv_lib.providers.azure.aio.tasks import amap, amap_flat
+from optiv_lib.providers.azure.objects.subnet.api import CrawlMode, embedded_subnets
+from optiv_lib.providers.azure.objects.subnet.model import SubnetRecord, to_record
+
+if TYPE_CHECKING:
+    from azure.mgmt.network.models import Subnet
+
+
+async def list_subnets(subscription_id: str, resource_group: str, vnet_name: str, *, project: bool = False) -> List[Subnet] | List[SubnetRecord]:
+    """
+    List all subnets in a virtual network (SubnetRecords with project=True).
+    """
+    client = network_client(subscription_id)
+    pager = client.subnets.list(resource_group_name=resource_group, virtual_network_name=vnet_name)
+    if project:
+        return [to_record(s) async for s in pager]
+    return [s async for s in pager]
+
+
+async def get_subnet(subscription_id: str, resource_group: str, vnet_name: str, subnet_name: str) -> Subnet:
+    """
+    Get a specific subnet by name.
+    """
+    client = network_client(subscription_id)
+    return await client.subnets.get(
+        resource_group_name=resource_group,
+        virtual_network_name=vnet_name,
+        subnet_name=subnet_name,
+    )
+
+
+async def get_subnet_by_id(resource_id: str) -> Subnet:
+    """
+    Get a subnet by its full resource ID.
+    """
+    rid = parse_resource_id(resource_id)
+    client = network_client(subscription_id=rid["subscription"])
+    return await client.subnets.get(
+        resource_group_name=rid["resource_group"],
+        virtual_network_name=rid["name"],
+        subnet_name=rid.get("child_name_1") or rid.get("resource_name"),
+    )
+
+
+async def list_all_subnets(*, mode: CrawlMode = "embedded", project: bool = False) -> List[Subnet] | List[SubnetRecord]:
+    """
+    List all subnets across all accessible subscriptions concurrently.
+
+    mode="embedded" costs one call per subscription unless a vnet's embedded
+    subnets are missing (see CrawlMode). project=True returns SubnetRecords,
+    projected per vnet as pages arrive.
+    """
+    sub_ids = await subscription_ids()
+
+    async def _fetch_vnet_subnets(vnet_id: str) -> List[Subnet]:
+        vrid = parse_resource_id(vnet_id)
+        vnet_name = vrid.get("resource_name") or vrid["name"]
+        return await list_subnets(vrid["subscription"], vrid["resource_group"], vnet_name, project=project)
+
+    async def _fetch_subnets(sub_id: str) -> List[Subnet]:
+        per_vnet: List[Optional[List[Any]]] = []
+        missing: List[str] = []
+        async for v in network_client(sub_id).virtual_networks.list_all():
+            got = embedded_subnets(v) if mode == "embedded" else None
+            if got is None:
+                missing.append(v.id)
+                per_vnet.append(None)
+            else:
+                per_vnet.append([to_record(s) for s in got] if project else got)
+        if missing:
+            fetched = iter(await amap(_fetch_vnet_subnets, missing, ignore_errors=False))
+            per_vnet = [got if got is not None else next(fetched) for got in per_vnet]
+        return [s for got in per_vnet for s in got]  # type: ignore[union-attr]
+
+    return await amap_flat(_fetch_subnets, sub_ids, ignore_errors=True)
@@ -0,0 +1,23 @@
+# src/optiv_lib/providers/azure/aio/objects/subscription/api.py
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Iterable, List, Optional
+
+from optiv_lib.providers.azure.aio.clients import subscription_client
+from optiv_lib.providers.azure.objects.subscription.catalog import ACTIVE_STATES, CATALOG
+
+if TYPE_CHECKING:
+    from azure.mgmt.resource.subscriptions.v2022_12_01.models import Subscription
+
+
+async def list_subscriptions() -> List[Subscription]:
+    return [s async for s in subscription_client().subscriptions.list()]
+
+
+async def subscription_ids(states: Optional[Iterable[str]] = ACTIVE_STATES, *, refresh: bool = False) -> List[str]:
+    """Subscription IDs from the shared catalog; a refresh runs in a worker thread (single flight with sync callers)."""
+    ids = None if refresh else CATALOG.peek(states)
+    if ids is None:
+        ids = await asyncio.to_thread(CATALOG.subscription_ids, states, refresh=refresh)
+    return ids
@@ -0,0 +1,73 @@
+# src/optiv_lib/providers/azure/aio/tasks.py
+from __future__ import annotations
+
+import asyncio
+import random
+from typing import Awaitable, Callable, Iterable, List, Optional, Sequence, TypeVar
+
+from optiv_lib.providers.azure.threads import TaskError, default_retry_if, retry_after_seconds
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+__all__ = ["amap", "amap_flat", "TaskError"]
+
+
+async def _call(func: Callable[[T], Awaitable[R]], item: T, *, retries: int, base_delay: float, backoff: float, max_delay: float,
+        retry_if: Callable[[BaseException], bool]) -> R | TaskError:
+    attempt = 0
+    while True:
+        try:
+            return await func(item)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if attempt >= retries or not retry_if(e):
+                return TaskError(item, e)
+            delay = min(max_delay, base_delay * (backoff ** attempt)) * (0.5 + random.random())
+            await asyncio.sleep(retry_after_seconds(e, delay))
+            attempt += 1
+
+
+async def amap(func: Callable[[T], Awaitable[R]], items: Sequence[T], *, ignore_errors: bool = True, max_in_flight: Optional[int] = None, retries: int = 2,
+        base_delay: float = 0.5, backoff: float = 2.0, max_delay: float = 8.0, retry_if: Callable[[BaseException], bool] | None = None, ) -> List[R]:
+    """
+    Await func over items concurrently; results in item order.
+
+    HTTP concurrency is bounded per event loop by the clients (MAX_CONCURRENCY)
+    and paced against ARM rate-limit headers, so this only needs
+    `max_in_flight` to cap the number of live coroutines for very large inputs.
+    Nested amap calls are safe. Failed items are retried like thread_map,
+    then dropped (ignore_errors) or re-raised.
+    """
+    if not items:
+        return []
+    gate = asyncio.Semaphore(max_in_flight) if max_in_flight else None
+    check = retry_if or default_retry_if
+
+    async def _one(item: T) -> R | TaskError:
+        if gate is None:
+            return await _call(func, item, retries=retries, base_delay=base_delay, backoff=backoff, max_delay=max_delay, retry_if=check)
+        async with gate:
+            return await _call(func, item, retries=retries, base_delay=base_delay, backoff=backoff, max_delay=max_delay, retry_if=check)
+
+    results: List[R] = []
+    for r in await asyncio.gather(*(_one(it) for it in items)):
+        if isinstance(r, TaskError):
+            if not ignore_errors:
+                raise r.error
+            continue
+        results.append(r)
+    return results
+
+
+async def amap_flat(func: Callable[[T], Awaitable[Iterable[R]]], items: Sequence[T], *, ignore_errors: bool = True, max_in_flight: Optional[int] = None,
+        retries: int = 2, base_delay: float = 0.5, backoff: float = 2.0, max_delay: float = 8.0,
+        retry_if: Callable[[BaseException], bool] | None = None, ) -> List[R]:
+    """amap for funcs returning iterables; results are concatenated in item order."""
+    chunks = await amap(func, items, ignore_errors=ignore_errors, max_in_flight=max_in_flight, retries=retries, base_delay=base_delay, backoff=backoff,
+                        max_delay=max_delay, retry_if=retry_if)
+    out: List[R] = []
+    for chunk in chunks:
+        out.extend(chunk)
+    return out
@@ -1,16 +1,19 @@
 # src/optiv_lib/providers/azure/clients.py
 from __future__ import annotations
 
-from typing import Dict, Optional
-
-from azure.core.pipeline.transport import RequestsTransport
-from azure.mgmt.compute import ComputeManagementClient
-from azure.mgmt.network import NetworkManagementClient
-from azure.mgmt.resource import ResourceManagementClient
-from azure.mgmt.resource.subscriptions import SubscriptionClient
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from .session import clear_session_cache, get_session
 
+if TYPE_CHECKING:
+    from azure.core.pipeline.transport import RequestsTransport
+    from azure.mgmt.compute import ComputeManagementClient
+    from azure.mgmt.network import NetworkManagementClient
+    from azure.mgmt.resource import ResourceManagementClient
+    from azure.mgmt.resource.subscriptions import SubscriptionClient
+
 
 __all__ = [
     "subscription_client",
@@ -22,11 +25,13 @@ __all__ = [
     "close_all",
 ]
 
-from .threads import shutdown_threads
+from .threads import shutdown_threads, slot_released
 
-# Shared HTTP transport and UA across clients
+# Shared HTTP transport and UA across clients. The management SDKs are
+# imported by the factories below, so only the services actually used are loaded.
 USER_AGENT = "optiv-lib/0.99.1 (+https://github.com/JasonBarrett77/optiv-lib)"
-_TRANSPORT = RequestsTransport(connection_timeout=10, read_timeout=60, connection_pool_maxsize=32)
+_TRANSPORT: Optional[RequestsTransport] = None
+_TRANSPORT_LOCK = threading.Lock()
 
 # Module-level caches
 _SUBSCRIPTION_CLIENT: Optional[SubscriptionClient] = None
@@ -35,14 +40,46 @@ _COMPUTE_CLIENTS: Dict[str, ComputeManagementClient] = {}
 _RESOURCE_CLIENTS: Dict[str, ResourceManagementClient] = {}
 
 
+def _transport() -> RequestsTransport:
+    """Shared RequestsTransport, created on first client."""
+    global _TRANSPORT
+    if _TRANSPORT is None:
+        with _TRANSPORT_LOCK:
+            if _TRANSPORT is None:
+                from azure.core.pipeline.transport import RequestsTransport
+
+                class _SlotReleasingTransport(RequestsTransport):
+                    # The SDK retry policy sleeps through transport.sleep();
+                    # give the global concurrency slot back while it does.
+                    def sleep(self, duration: float) -> None:
+                        with slot_released():
+                            time.sleep(duration)
+
+                _TRANSPORT = _SlotReleasingTransport(connection_timeout=10, read_timeout=60, connection_pool_maxsize=32)
+    return _TRANSPORT
+
+
+def _client_kwargs() -> Dict[str, Any]:
+    from .etag import ETagPolicy
+    from .throttle import RateLimitPolicy
+
+    return {
+        "transport": _transport(),
+        "user_agent": USER_AGENT,
+        "per_call_policies": [ETagPolicy()],
+        "per_retry_policies": [RateLimitPolicy()],
+    }
+
+
 def subscription_client() -> SubscriptionClient:
     """Cached SubscriptionClient. Single tenant → one per process."""
     global _SUBSCRIPTION_CLIENT
     if _SUBSCRIPTION_CLIENT is None:
+        from azure.mgmt.resource.subscriptions import SubscriptionClient
+
         _SUBSCRIPTION_CLIENT = SubscriptionClient(
             credential=get_session().credential,
-            transport=_TRANSPORT,
-            user_agent=USER_AGENT,
+            **_client_kwargs(),
         )
     return _SUBSCRIPTION_CLIENT
 
@@ -51,11 +88,12 @@ def network_client(subscription_id: str) -> NetworkManagementClient:
     """Cached NetworkManagementClient per subscription."""
     client = _NETWORK_CLIENTS.get(subscription_id)
     if client is None:
+        from azure.mgmt.network import NetworkManagementClient
+
         client = NetworkManagementClient(
             credential=get_session().credential,
             subscription_id=subscription_id,
-            transport=_TRANSPORT,
-            user_agent=USER_AGENT,
+            **_client_kwargs(),
         )
         _NETWORK_CLIENTS[subscription_id] = client
     return client
@@ -65,11 +103,12 @@ def compute_client(subscription_id: str) -> ComputeManagementClient:
     """Cached ComputeManagementClient per subscription."""
     client = _COMPUTE_CLIENTS.get(subscription_id)
     if client is None:
+        from azure.mgmt.compute import ComputeManagementClient
+
         client = ComputeManagementClient(
             credential=get_session().credential,
             subscription_id=subscription_id,
-            transport=_TRANSPORT,
-            user_agent=USER_AGENT,
+            **_client_kwargs(),
         )
         _COMPUTE_CLIENTS[subscription_id] = client
     return client
@@ -79,11 +118,12 @@ def resource_client(subscription_id: str) -> ResourceManagementClient:
     """Cached ResourceManagementClient per subscription."""
     client = _RESOURCE_CLIENTS.get(subscription_id)
     if client is None:
+        from azure.mgmt.resource import ResourceManagementClient
+
         client = ResourceManagementClient(
             credential=get_session().credential,
             subscription_id=subscription_id,
-            transport=_TRANSPORT,
-            user_agent=USER_AGENT,
+            **_client_kwargs(),
         )
         _RESOURCE_CLIENTS[subscription_id] = client
     return client
@@ -92,6 +132,11 @@ def resource_client(subscription_id: str) -> ResourceManagementClient:
 def clear_client_cache() -> None:
     """Clear all client caches. Call if session/credential changes."""
     global _SUBSCRIPTION_CLIENT
+    from .etag import ETAG_CACHE
+    from .objects.subscription.catalog import CATALOG
+
+    CATALOG.invalidate()
+    ETAG_CACHE.clear()
     _SUBSCRIPTION_CLIENT = None
     _NETWORK_CLIENTS.clear()
     _COMPUTE_CLIENTS.clear()
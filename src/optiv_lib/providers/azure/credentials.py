@@ -0,0 +1,105 @@
+# src/optiv_lib/providers/azure/credentials.py
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from azure.core.credentials import AccessToken, TokenCredential
+
+__all__ = ["CachingCredential"]
+
+_TokenKey = Tuple[Tuple[str, ...], Optional[str], bool]
+
+
+class CachingCredential:
+    """
+    TokenCredential wrapper sharing one access token per (scopes, tenant)
+    across every client and thread.
+
+    A cached token is returned as is until it expires. Within
+    `refresh_margin` seconds of expiry, the first caller starts one
+    background refresh and everyone keeps using the current token, so pool
+    threads never wait on the identity provider while a token is still
+    valid. Only a missing or nearly expired (< 30 s) token blocks, and then
+    one thread per key fetches while the others wait for its result. A failed background
+    refresh keeps the old token; the next call in the margin tries again.
+    Claims challenges bypass the cache.
+    """
+
+    def __init__(self, credential: TokenCredential, *, refresh_margin: float = 300.0) -> None:
+        self.credential = credential
+        self.refresh_margin = refresh_margin
+        self._tokens: Dict[_TokenKey, AccessToken] = {}
+        self._locks: Dict[_TokenKey, threading.Lock] = {}
+        self._refreshing: Set[_TokenKey] = set()
+        self._lock = threading.Lock()
+
+    def _fetch(self, key: _TokenKey, **kwargs: Any) -> AccessToken:
+        scopes, tenant_id, enable_cae = key
+        if tenant_id is not None:
+            kwargs["tenant_id"] = tenant_id
+        if enable_cae:
+            kwargs["enable_cae"] = True
+        tok = self.credential.get_token(*scopes, **kwargs)
+        self._tokens[key] = tok
+        return tok
+
+    def _refresh(self, key: _TokenKey) -> None:
+        try:
+            self._fetch(key)
+        except Exception:
+            pass  # keep the current token until it actually expires
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def peek(self, *scopes: str, tenant_id: Optional[str] = None, enable_cae: bool = False) -> Optional[AccessToken]:
+        """
+        The cached token if it has more than 30 s left, else None. Starts the
+        background refresh inside the margin; never waits on the identity provider.
+        """
+        key: _TokenKey = (scopes, tenant_id, enable_cae)
+        now = time.time()
+        tok = self._tokens.get(key)
+        if tok is None or tok.expires_on <= now + 30:
+            return None
+        if tok.expires_on - self.refresh_margin <= now:
+            with self._lock:
+                start = key not in self._refreshing
+                self._refreshing.add(key)
+            if start:
+                threading.Thread(target=self._refresh, args=(key,), name="token-refresh", daemon=True).start()
+        return tok
+
+    def get_token(self, *scopes: str, claims: Optional[str] = None, tenant_id: Optional[str] = None, enable_cae: bool = False, **kwargs: Any) -> AccessToken:
+        key: _TokenKey = (scopes, tenant_id, enable_cae)
+        if claims is not None:
+            return self._fetch(key, claims=claims, **kwargs)
+        tok = self.peek(*scopes, tenant_id=tenant_id, enable_cae=enable_cae)
+        if tok is not None:
+            return tok
+        with self._lock:
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            tok = self._tokens.get(key)
+            if tok is not None and tok.expires_on > time.time() + 30:
+                return tok
+            return self._fetch(key, **kwargs)
+
+    def invalidate(self) -> None:
+        """Drop cached tokens (the wrapped credential's own cache is untouched)."""
+        self._tokens.clear()
+
+    def close(self) -> None:
+        self.invalidate()
+        close = getattr(self.credential, "close", None)
+        if close is not None:
+            close()
+
+    def __enter__(self) -> CachingCredential:
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
@@ -0,0 +1,157 @@
+# src/optiv_lib/providers/azure/etag.py
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+from azure.core.pipeline import PipelineRequest, PipelineResponse
+from azure.core.pipeline.policies import SansIOHTTPPolicy
+
+__all__ = ["ETagCache", "ETagPolicy", "ETAG_CACHE"]
+
+_CONTEXT_KEY = "optiv_etag_entry"
+
+
+@dataclass(slots=True)
+class _Entry:
+    etag: str
+    path: str
+    size: int
+    response: Any  # the fully read 200 response, replayed on 304
+
+
+def _etag_of(response: Any) -> Optional[str]:
+    """ETag header, else the top-level "etag" of a single-resource JSON body."""
+    etag = response.headers.get("ETag")
+    if etag:
+        return etag
+    if "json" not in (response.headers.get("Content-Type") or ""):
+        return None
+    try:
+        body = response.json()
+    except ValueError:
+        return None
+    value = body.get("etag") if isinstance(body, dict) else None
+    return value if isinstance(value, str) and value else None
+
+
+class ETagCache:
+    """
+    Conditional-GET cache keyed by request URL (resource ID + api-version).
+
+    Holds the last 200 response and its ETag per URL; ETagPolicy sends
+    If-None-Match and swaps a 304 for the stored response. Entries are
+    evicted least recently used past `max_entries` or `max_bytes` of body.
+    Any write (PUT/PATCH/POST/DELETE) drops the entries of that resource,
+    its children and its parents, since parents embed their children.
+
+    One cache per process (ETAG_CACHE), shared by every sync client.
+    """
+
+    def __init__(self, *, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, url: str) -> Optional[_Entry]:
+        key = url.lower()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, url: str, etag: str, response: Any) -> None:
+        if self.max_entries <= 0:
+            return
+        size = len(response.content)
+        if size > self.max_bytes:
+            return
+        key = url.lower()
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old.size
+            self._entries[key] = _Entry(etag, urlsplit(key).path.rstrip("/"), size, response)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+
+    def invalidate(self, url: str) -> None:
+        """Drop entries for the resource at `url`, its children and its parents."""
+        path = urlsplit(url.lower()).path.rstrip("/")
+        with self._lock:
+            for key in [k for k, e in self._entries.items() if _related(e.path, path)]:
+                self._bytes -= self._entries.pop(key).size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self._bytes, "hits": self.hits, "misses": self.misses}
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+
+def _related(a: str, b: str) -> bool:
+    return a == b or a.startswith(b + "/") or b.startswith(a + "/")
+
+
+ETAG_CACHE = ETagCache()
+
+
+class ETagPolicy(SansIOHTTPPolicy):
+    """
+    Per-call pipeline policy over ETagCache: GETs of cached URLs carry
+    If-None-Match, a 304 is answered with the cached 200 response, and a
+    new 200 with an ETag replaces the entry. Writes invalidate.
+    """
+
+    def __init__(self, cache: Optional[ETagCache] = None) -> None:
+        self.cache = cache or ETAG_CACHE
+
+    def on_request(self, request: PipelineRequest) -> None:
+        http = request.http_request
+        if http.method.upper() != "GET":
+            self.cache.invalidate(http.url)
+            return
+        entry = self.cache.get(http.url)
+        if entry is not None:
+            http.headers["If-None-Match"] = entry.etag
+            request.context[_CONTEXT_KEY] = entry
+
+    def on_response(self, request: PipelineRequest, response: PipelineResponse) -> None:
+        http = request.http_request
+        if http.method.upper() != "GET":
+            return
+        entry = request.context.get(_CONTEXT_KEY)
+        status = response.http_response.status_code
+        if status == 304 and entry is not None:
+            response.http_response = entry.response
+            self.cache._count(True)
+            return
+        if status != 200:
+            return
+        self.cache._count(False)
+        try:
+            etag = _etag_of(response.http_response)
+            if etag:
+                self.cache.put(http.url, etag, response.http_response)
+        except Exception:
+            return  # body not read (streamed)
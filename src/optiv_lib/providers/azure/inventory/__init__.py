@@ -0,0 +1,21 @@
+# src/optiv_lib/providers/azure/inventory/__init__.py
+from __future__ import annotations
+
+from .crawler import KINDS, SubscriptionHaul, crawl_inventory, crawl_subscription
+from .ip_index import IPIndex, IPOwner
+from .refresh import ChangeSource, ResourceChangedTimeSource, refresh_inventory
+from .snapshot import InventorySnapshot, SnapshotWriter
+
+__all__ = [
+    "KINDS",
+    "SubscriptionHaul",
+    "crawl_inventory",
+    "crawl_subscription",
+    "IPIndex",
+    "IPOwner",
+    "ChangeSource",
+    "ResourceChangedTimeSource",
+    "refresh_inventory",
+    "InventorySnapshot",
+    "SnapshotWriter",
+]
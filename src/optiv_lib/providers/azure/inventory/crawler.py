@@ -0,0 +1,226 @@
+# src/optiv_lib/providers/azure/inventory/crawler.py
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from azure.core.exceptions import ResourceNotFoundError
+from azure.mgmt.core.tools import parse_resource_id
+
+from optiv_lib.providers.azure.clients import network_client, resource_client
+from optiv_lib.providers.azure.objects.route.api import embedded_routes
+from optiv_lib.providers.azure.objects.subnet.api import embedded_subnets
+from optiv_lib.providers.azure.objects.subscription.catalog import ACTIVE_STATES, CATALOG
+from optiv_lib.providers.azure.threads import TaskError, TaskGroup
+
+from .snapshot import InventorySnapshot, SnapshotWriter
+
+__all__ = ["KINDS", "crawl_inventory", "crawl_subscription", "SubscriptionHaul"]
+
+KINDS: Tuple[str, ...] = (
+    "resource_group",
+    "virtual_network",
+    "subnet",
+    "route_table",
+    "route",
+    "public_ip",
+    "application_gateway",
+)
+
+
+@dataclass(slots=True)
+class SubscriptionHaul:
+    """Everything crawled from one subscription: (kind, SDK model) pairs plus per-kind errors."""
+    subscription_id: str
+    items: List[Tuple[str, Any]] = field(default_factory=list)
+    errors: List[Tuple[str, str]] = field(default_factory=list)
+
+
+def _call(fn: Callable[[], List[Any]]) -> List[Any]:
+    return fn()
+
+
+def _in_group(fn: Callable[[], List[Any]]) -> List[Any]:
+    """A group-level list; a group deleted meanwhile (404) has nothing in it."""
+    try:
+        return fn()
+    except ResourceNotFoundError:
+        return []
+
+
+def _children(kind: str, parents: List[Any], embedded: Callable[[Any], Optional[List[Any]]], fetch: Callable[[Any], List[Any]],
+        haul: SubscriptionHaul, group: TaskGroup) -> List[Tuple[Any, Any]]:
+    """Embedded children where complete; queue per-parent fetches for the rest. Returns (parent, future)."""
+    pending = []
+    for p in parents:
+        got = embedded(p)
+        if got is None:
+            pending.append((p, group.submit(fetch, p, scope=haul.subscription_id)))
+        else:
+            haul.items.extend((kind, c) for c in got)
+    return pending
+
+
+def crawl_subscription(subscription_id: str, resource_groups: Optional[Iterable[str]] = None) -> SubscriptionHaul:
+    """
+    One subscription in one pass: the list calls run in parallel, subnets
+    and routes come from the vnet / route table payloads, and only parents
+    with missing embedded children get a per-parent call.
+
+    With `resource_groups`, the subscription's resource-group list is fetched
+    first and only the requested groups that still exist are listed (one
+    call per kind per group); deleted groups yield nothing. Used by
+    refresh_inventory. A failing kind is recorded in `errors` and the rest
+    is kept.
+    """
+    haul = SubscriptionHaul(subscription_id)
+    net = network_client(subscription_id)
+    listers: List[Tuple[str, Callable[[], List[Any]]]] = []
+    if resource_groups is None:
+        listers += [
+            ("resource_group", lambda: list(resource_client(subscription_id).resource_groups.list())),
+            ("virtual_network", lambda: list(net.virtual_networks.list_all())),
+            ("route_table", lambda: list(net.route_tables.list_all())),
+            ("public_ip", lambda: list(net.public_ip_addresses.list_all())),
+            ("application_gateway", lambda: list(net.application_gateways.list_all())),
+        ]
+    else:
+        rgs = list(resource_groups)
+        try:
+            groups = list(resource_client(subscription_id).resource_groups.list())
+        except Exception as e:
+            haul.errors.append(("resource_group", str(e)))
+        else:
+            haul.items.extend(("resource_group", g) for g in groups)
+            existing = {(g.name or "").lower() for g in groups}
+            rgs = [rg for rg in rgs if rg.lower() in existing]
+        for rg in rgs:
+            listers += [
+                ("virtual_network", lambda rg=rg: list(net.virtual_networks.list(resource_group_name=rg))),
+                ("route_table", lambda rg=rg: list(net.route_tables.list(resource_group_name=rg))),
+                ("public_ip", lambda rg=rg: list(net.public_ip_addresses.list(resource_group_name=rg))),
+                ("application_gateway", lambda rg=rg: list(net.application_gateways.list(resource_group_name=rg))),
+            ]
+    with TaskGroup() as group:
+        run = _call if resource_groups is None else _in_group
+        futures = [(kind, group.submit(run, fn, scope=subscription_id)) for kind, fn in listers]
+    lists: Dict[str, List[Any]] = {}
+    for kind, fut in futures:
+        try:
+            got = fut.result()
+        except Exception as e:
+            haul.errors.append((kind, str(e)))
+            got = []
+        lists.setdefault(kind, []).extend(got)
+        haul.items.extend((kind, m) for m in got)
+
+    def _subnets(vnet: Any) -> List[Any]:
+        rid = parse_resource_id(vnet.id)
+        return list(net.subnets.list(resource_group_name=rid["resource_group"], virtual_network_name=rid["name"]))
+
+    def _routes(rt: Any) -> List[Any]:
+        rid = parse_resource_id(rt.id)
+        return list(net.routes.list(resource_group_name=rid["resource_group"], route_table_name=rid["name"]))
+
+    with TaskGroup() as group:
+        pending = [("subnet", p, f) for p, f in _children("subnet", lists.get("virtual_network", []), embedded_subnets, _subnets, haul, group)]
+        pending += [("route", p, f) for p, f in _children("route", lists.get("route_table", []), embedded_routes, _routes, haul, group)]
+    for kind, parent, fut in pending:
+        try:
+            haul.items.extend((kind, c) for c in fut.result())
+        except Exception as e:
+            haul.errors.append((kind, f"{parent.id}: {e}"))
+    return haul
+
+
+# ----------------------------
+# Snapshot rows
+# ----------------------------
+
+def _parent_id(kind: str, rid: str) -> Optional[str]:
+    if kind == "subnet":
+        return rid.rsplit("/subnets/", 1)[0]
+    if kind == "route":
+        return rid.rsplit("/routes/", 1)[0]
+    return None
+
+
+def _prefixes(kind: str, m: Any) -> Iterable[str]:
+    if kind == "virtual_network":
+        return (m.address_space.address_prefixes or []) if m.address_space else []
+    if kind == "subnet":
+        return [p for p in (m.address_prefix, *(m.address_prefixes or [])) if p]
+    if kind == "route":
+        return [m.address_prefix] if m.address_prefix else []
+    if kind == "public_ip":
+        return [m.ip_address] if m.ip_address else []
+    if kind == "application_gateway":
+        return [f.private_ip_address for f in (m.frontend_ip_configurations or []) if f.private_ip_address]
+    return []
+
+
+def write_haul(writer: SnapshotWriter, haul: SubscriptionHaul) -> None:
+    rows = []
+    for kind, m in haul.items:
+        rid = m.id
+        if not rid:
+            continue
+        if kind == "resource_group":
+            rg = m.name
+        else:
+            rg = parse_resource_id(rid).get("resource_group")
+        rows.append((rid, kind, haul.subscription_id, rg, m.name, getattr(m, "location", None), _parent_id(kind, rid), m.as_dict()))
+        writer.add_prefixes(rid, _prefixes(kind, m))
+    writer.add_resources(rows)
+    writer.add_errors((haul.subscription_id, k, msg) for k, msg in haul.errors)
+
+
+def crawl_inventory(path: Union[Path, str], *, subscription_ids: Optional[Iterable[str]] = None, states: Optional[Iterable[str]] = ACTIVE_STATES,
+        ) -> InventorySnapshot:
+    """
+    Crawl subscriptions, resource groups, vnets/subnets, route tables/routes,
+    public IPs and application gateways in one coordinated pass over the
+    shared thread pool, and write them to a SQLite snapshot at `path`.
+
+    Subscriptions come from the catalog (filtered by `states`) unless given.
+    The file replaces any previous snapshot only once the whole crawl is
+    done. Failures are recorded in the snapshot's errors table rather than
+    raised.
+
+    Example:
+        snap = crawl_inventory("inventory.db")
+        snap.containing("10.20.30.40")
+    """
+    started = time.time()
+    infos = {s.subscription_id: s for s in CATALOG.subscriptions(None)}
+    sub_ids = list(subscription_ids) if subscription_ids is not None else CATALOG.subscription_ids(states)
+
+    writer = SnapshotWriter(path)
+    try:
+        writer.add_subscriptions(
+            (s, infos[s].display_name, infos[s].state, infos[s].tenant_id) if s in infos else (s, "", "", "")
+            for s in sub_ids
+        )
+        with TaskGroup() as group:
+            for s in sub_ids:
+                group.submit(crawl_subscription, s, scope=s)
+        synced = {}
+        for r in group.results():
+            if isinstance(r, TaskError):
+                writer.add_errors([(r.item, "subscription", str(r.error))])
+            else:
+                write_haul(writer, r)
+                if not r.errors:
+                    synced[r.subscription_id.lower()] = started
+        writer.set_meta("started_at", started)
+        writer.set_meta("synced_at", synced)
+        writer.set_meta("full_crawl_at", started)
+        writer.set_meta("finished_at", time.time())
+        writer.set_meta("subscriptions", sub_ids)
+        writer.commit()
+    except BaseException:
+        writer.abort()
+        raise
+    return InventorySnapshot(path)
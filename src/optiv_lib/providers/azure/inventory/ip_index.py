@@ -0,0 +1,200 @@
+# src/optiv_lib/providers/azure/inventory/ip_index.py
+from __future__ import annotations
+
+import ipaddress
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Literal, Optional, Tuple, Union
+
+from optiv_lib.providers.azure.objects.public_ip.model import PublicIPRecord, to_record as public_ip_record
+from optiv_lib.providers.azure.objects.subnet.model import SubnetRecord, to_record as subnet_record
+from optiv_lib.providers.azure.records import id_scope, istr
+from optiv_lib.providers.azure.trie import PrefixTrie
+
+if TYPE_CHECKING:
+    from azure.mgmt.network.models import ApplicationGateway, PublicIPAddress, Subnet
+
+__all__ = ["IPOwner", "IPIndex"]
+
+OwnerKind = Literal["public_ip", "subnet", "application_gateway"]
+IP = Union[ipaddress.IPv4Address, ipaddress.IPv6Address]
+
+_CONFIG_SEGMENTS = ("/ipconfigurations/", "/frontendipconfigurations/")
+
+
+@dataclass(slots=True, frozen=True)
+class IPOwner:
+    """
+    One claim on an address: a public IP resource, a subnet prefix, or an
+    application gateway frontend. `attached_to` is the NIC / gateway /
+    load balancer using it, `via` the ip configuration that binds it.
+    """
+    kind: OwnerKind
+    match: str
+    resource_id: str
+    subscription_id: str
+    resource_group: Optional[str]
+    attached_to: Optional[str] = None
+    via: Optional[str] = None
+
+
+def _attached(config_id: Optional[str]) -> Optional[str]:
+    """Owning resource of an ip configuration ID (the NIC, gateway, LB, ...)."""
+    if not config_id:
+        return None
+    low = config_id.lower()
+    for seg in _CONFIG_SEGMENTS:
+        i = low.rfind(seg)
+        if i >= 0:
+            return istr(config_id[:i])
+    return None
+
+
+class IPIndex:
+    """
+    Reverse index: address → owning Azure resources.
+
+    Exact addresses (public IPs, application gateway frontends) are held in
+    a hash; private addresses resolve by prefix containment over subnet
+    prefixes in a PrefixTrie, most specific first. Overlapping address
+    spaces are normal across vnets, so every containing subnet is returned.
+
+    Re-listing a scope replaces what that scope contributed (sync()); single
+    resources can be upserted or removed.
+
+    Example:
+        index = IPIndex.from_azure()
+        index.lookup("20.30.40.50")
+    """
+
+    def __init__(self) -> None:
+        self._exact: Dict[IP, List[IPOwner]] = {}
+        self._prefixes: PrefixTrie[List[IPOwner]] = PrefixTrie()
+        # resource id (lower) → (kind, subscription, [(exact address | prefix, is_prefix)])
+        self._claims: Dict[str, Tuple[OwnerKind, str, List[Tuple[Any, bool]]]] = {}
+
+    # ----------------------------
+    # Building
+    # ----------------------------
+
+    @classmethod
+    def build(cls, *, public_ips: Iterable[PublicIPRecord | PublicIPAddress] = (), subnets: Iterable[SubnetRecord | Subnet] = (),
+            application_gateways: Iterable[ApplicationGateway] = ()) -> IPIndex:
+        index = cls()
+        for p in public_ips:
+            index.add_public_ip(p)
+        for s in subnets:
+            index.add_subnet(s)
+        for g in application_gateways:
+            index.add_application_gateway(g)
+        return index
+
+    @classmethod
+    def from_azure(cls, max_workers: int | None = None) -> IPIndex:
+        """Build from live listings (projected records) across the catalog's subscriptions."""
+        from optiv_lib.providers.azure.objects.application_gateway.api import list_all_application_gateways
+        from optiv_lib.providers.azure.objects.public_ip.api import list_public_ips
+        from optiv_lib.providers.azure.objects.subnet.api import list_all_subnets
+        from optiv_lib.providers.azure.objects.subscription.api import subscription_ids
+        from optiv_lib.providers.azure.threads import thread_map_flat
+
+        def _pips(sub_id: str) -> List[PublicIPRecord]:
+            return list_public_ips(sub_id, project=True)  # type: ignore[return-value]
+
+        return cls.build(
+            public_ips=thread_map_flat(_pips, subscription_ids(), max_workers=max_workers, ignore_errors=True),
+            subnets=list_all_subnets(max_workers, project=True),
+            application_gateways=list_all_application_gateways(max_workers),
+        )
+
+    def _claim(self, owner: IPOwner, key: Any, is_prefix: bool) -> None:
+        if is_prefix:
+            owners = self._prefixes.get(key)
+            if owners is None:
+                owners = []
+                self._prefixes.insert(key, owners)
+            owners.append(owner)
+        else:
+            self._exact.setdefault(key, []).append(owner)
+        entry = self._claims.setdefault(owner.resource_id.lower(), (owner.kind, owner.subscription_id.lower(), []))
+        entry[2].append((key, is_prefix))
+
+    def add_public_ip(self, pip: PublicIPRecord | PublicIPAddress) -> None:
+        rec = pip if isinstance(pip, PublicIPRecord) else public_ip_record(pip)
+        self.remove(rec.id)
+        if not rec.ip_address:
+            return  # dynamic and unallocated
+        ip = ipaddress.ip_address(rec.ip_address)
+        owner = IPOwner("public_ip", str(ip), rec.id, rec.subscription_id, rec.resource_group,
+                        attached_to=_attached(rec.ip_configuration_id), via=rec.ip_configuration_id)
+        self._claim(owner, ip, False)
+
+    def add_subnet(self, subnet: SubnetRecord | Subnet) -> None:
+        rec = subnet if isinstance(subnet, SubnetRecord) else subnet_record(subnet)
+        self.remove(rec.id)
+        for prefix in rec.address_prefixes:
+            try:
+                net = str(ipaddress.ip_network(prefix, strict=False))
+            except ValueError:
+                continue
+            self._claim(IPOwner("subnet", net, rec.id, rec.subscription_id, rec.resource_group, attached_to=rec.vnet_id), net, True)
+
+    def add_application_gateway(self, gateway: ApplicationGateway) -> None:
+        """Private frontend addresses exactly; public frontends point at their public IP resource."""
+        gid = gateway.id or ""
+        self.remove(gid)
+        sub, rg = id_scope(gid)
+        for fe in gateway.frontend_ip_configurations or []:
+            if fe.private_ip_address:
+                ip = ipaddress.ip_address(fe.private_ip_address)
+                self._claim(IPOwner("application_gateway", str(ip), gid, sub, rg, attached_to=gid, via=fe.id), ip, False)
+
+    def remove(self, resource_id: str) -> None:
+        """Drop everything a resource contributed."""
+        entry = self._claims.pop(resource_id.lower(), None)
+        if entry is None:
+            return
+        rid = resource_id.lower()
+        for key, is_prefix in entry[2]:
+            owners = self._prefixes.get(key) if is_prefix else self._exact.get(key)
+            if owners is None:
+                continue
+            owners[:] = [o for o in owners if o.resource_id.lower() != rid]
+            if not owners and not is_prefix:
+                del self._exact[key]
+
+    def sync(self, subscription_id: str, kind: OwnerKind, items: Iterable[Any]) -> None:
+        """
+        Replace one subscription's `kind` entries with a fresh listing:
+        resources no longer listed are removed, the rest upserted.
+        """
+        sub = subscription_id.lower()
+        stale = {rid for rid, (k, s, _) in self._claims.items() if k == kind and s == sub}
+        add = {"public_ip": self.add_public_ip, "subnet": self.add_subnet, "application_gateway": self.add_application_gateway}[kind]
+        for item in items:
+            stale.discard((item.id or "").lower())
+            add(item)
+        for rid in stale:
+            self.remove(rid)
+
+    # ----------------------------
+    # Lookups
+    # ----------------------------
+
+    def lookup(self, address: str | IP) -> List[IPOwner]:
+        """Exact owners first, then containing subnets (most specific first)."""
+        ip = address if isinstance(address, (ipaddress.IPv4Address, ipaddress.IPv6Address)) else ipaddress.ip_address(address.strip())
+        out = list(self._exact.get(ip, ()))
+        for _, owners in self._prefixes.lookup_all(ip):
+            out.extend(owners)
+        return out
+
+    def lookup_many(self, addresses: Iterable[str]) -> Dict[str, List[IPOwner]]:
+        """lookup() over a batch, keyed by the input strings; duplicates resolved once."""
+        out: Dict[str, List[IPOwner]] = {}
+        for a in addresses:
+            if a not in out:
+                out[a] = self.lookup(a)
+        return out
+
+    def __len__(self) -> int:
+        return len(self._claims)
@@ -0,0 +1,186 @@
+# src/optiv_lib/providers/azure/inventory/refresh.py
+from __future__ import annotations
+
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, Optional, Protocol, Set, Union
+
+from azure.mgmt.core.tools import parse_resource_id
+
+from optiv_lib.providers.azure.clients import resource_client
+from optiv_lib.providers.azure.objects.subscription.catalog import ACTIVE_STATES, CATALOG
+from optiv_lib.providers.azure.threads import TaskError, TaskGroup
+
+from .crawler import KINDS, SubscriptionHaul, crawl_inventory, crawl_subscription, write_haul
+from .snapshot import InventorySnapshot, SnapshotWriter
+
+__all__ = ["ChangeSource", "ResourceChangedTimeSource", "TRACKED_TYPES", "refresh_inventory"]
+
+# Top-level resource types the crawler stores. Subnet and route edits change
+# their parent's changedTime, so children need no tracking of their own.
+TRACKED_TYPES: Dict[str, str] = {
+    "microsoft.network/virtualnetworks": "virtual_network",
+    "microsoft.network/routetables": "route_table",
+    "microsoft.network/publicipaddresses": "public_ip",
+    "microsoft.network/applicationgateways": "application_gateway",
+}
+
+# Children come from their parent's payload; a failed parent list fails them too.
+_CHILD_KINDS: Dict[str, str] = {"virtual_network": "subnet", "route_table": "route"}
+
+
+class ChangeSource(Protocol):
+    """
+    Cheap change signal for one subscription.
+
+    `known` holds the lower-cased IDs of the tracked resources the snapshot
+    has for the subscription. Return the (lower-cased) resource groups to
+    re-fetch, an empty set if nothing changed, or None to re-crawl the whole
+    subscription. Implement this over Activity Log or Resource Graph change
+    queries, or a fake for tests.
+    """
+
+    def changed_resource_groups(self, subscription_id: str, since: float, known: FrozenSet[str]) -> Optional[Set[str]]:
+        ...
+
+
+class ResourceChangedTimeSource:
+    """
+    ChangeSource over one paged Resources - List call per subscription
+    ($expand=changedTime). A group is changed if a tracked resource in it
+    changed after `since` (less `skew` seconds), appeared, or disappeared.
+    """
+
+    def __init__(self, *, skew: float = 300.0) -> None:
+        self.skew = skew
+
+    def changed_resource_groups(self, subscription_id: str, since: float, known: FrozenSet[str]) -> Optional[Set[str]]:
+        cutoff = datetime.fromtimestamp(since - self.skew, tz=timezone.utc)
+        changed: Set[str] = set()
+        seen: Set[str] = set()
+        for r in resource_client(subscription_id).resources.list(expand="changedTime"):
+            if (r.type or "").lower() not in TRACKED_TYPES or not r.id:
+                continue
+            rid = r.id.lower()
+            seen.add(rid)
+            ct = r.changed_time
+            if rid not in known or ct is None or ct >= cutoff:
+                changed.add(_rg_of(rid))
+        for rid in known - seen:
+            changed.add(_rg_of(rid))
+        return changed
+
+
+def _rg_of(resource_id: str) -> str:
+    return (parse_resource_id(resource_id).get("resource_group") or "").lower()
+
+
+def _known(snap: InventorySnapshot, subscription_id: str) -> FrozenSet[str]:
+    kinds = tuple(TRACKED_TYPES.values())
+    rows = snap.conn.execute(
+        f"SELECT id FROM resources WHERE subscription_id = ? AND kind IN ({', '.join('?' * len(kinds))})",
+        (subscription_id, *kinds),
+    )
+    return frozenset(r[0].lower() for r in rows)
+
+
+def _crawl(args: tuple) -> SubscriptionHaul:
+    sub_id, rgs = args
+    return crawl_subscription(sub_id, rgs)
+
+
+def _failed_kinds(haul: SubscriptionHaul) -> Set[str]:
+    failed = {k for k, _ in haul.errors}
+    return failed | {_CHILD_KINDS[k] for k in failed if k in _CHILD_KINDS}
+
+
+def refresh_inventory(path: Union[Path, str], *, source: Optional[ChangeSource] = None, subscription_ids: Optional[Iterable[str]] = None,
+        states: Optional[Iterable[str]] = ACTIVE_STATES, max_age: Optional[float] = None, ) -> InventorySnapshot:
+    """
+    Bring the snapshot at `path` up to date by re-fetching only what changed.
+
+    Each subscription asks `source` (default ResourceChangedTimeSource) which
+    resource groups changed since its last clean fetch started; only those
+    are listed again. New subscriptions, and any whose change check fails,
+    are crawled in full; vanished ones are dropped, and so are the rows of
+    deleted resource groups. Results are applied per kind: if listing a
+    kind fails, its previous rows are kept and the subscription's sync time
+    stays put, so the next refresh fetches those changes again.
+    Falls back to crawl_inventory() when there is no snapshot yet or the
+    last full crawl is older than `max_age` seconds.
+    """
+    p = Path(path)
+    if not p.exists():
+        return crawl_inventory(p, subscription_ids=subscription_ids, states=states)
+    with InventorySnapshot(p) as old:
+        meta = old.meta()
+        full_at = float(meta.get("full_crawl_at", 0.0))
+        if max_age is not None and time.time() - full_at > max_age:
+            old.close()
+            return crawl_inventory(p, subscription_ids=subscription_ids, states=states)
+        # Per subscription: start of the last crawl that fetched it cleanly.
+        synced: Dict[str, float] = {k.lower(): float(v) for k, v in meta.get("synced_at", {}).items()}
+        previous = {r["subscription_id"] for r in old.query("SELECT subscription_id FROM subscriptions")}
+        known = {s: _known(old, s) for s in previous}
+
+    src = source or ResourceChangedTimeSource()
+    started = time.time()
+    infos = {s.subscription_id: s for s in CATALOG.subscriptions(None)}
+    sub_ids = list(subscription_ids) if subscription_ids is not None else CATALOG.subscription_ids(states)
+
+    def _check(sub_id: str) -> Optional[Set[str]]:
+        since = synced.get(sub_id.lower())
+        if sub_id not in previous or since is None:
+            return None
+        try:
+            return src.changed_resource_groups(sub_id, since, known[sub_id])
+        except Exception:
+            return None
+
+    with TaskGroup() as group:
+        for s in sub_ids:
+            group.submit(_check, s, scope=s)
+    plan = dict(zip(sub_ids, group.results(raise_errors=True)))
+    work = {s: rgs for s, rgs in plan.items() if rgs is None or rgs}
+
+    writer = SnapshotWriter(p, base=p)
+    try:
+        for s in previous - set(sub_ids):
+            writer.delete_scope(s)
+            writer.clear_errors(s)
+            writer.conn.execute("DELETE FROM subscriptions WHERE subscription_id = ?", (s,))
+        writer.add_subscriptions(
+            (s, infos[s].display_name, infos[s].state, infos[s].tenant_id) if s in infos else (s, "", "", "")
+            for s in sub_ids
+        )
+        with TaskGroup() as group:
+            for s, rgs in work.items():
+                group.submit(_crawl, (s, rgs), scope=s)
+        for s in plan:
+            writer.clear_errors(s)
+        for (s, rgs), r in zip(work.items(), group.results()):
+            if isinstance(r, TaskError):
+                # Keep the previous rows and sync time, so the next refresh
+                # sees the same changes again.
+                writer.add_errors([(s, "subscription", str(r.error))])
+                continue
+            failed = _failed_kinds(r)
+            ok = [k for k in KINDS if k not in failed]
+            writer.delete_scope(s, rgs, kinds=ok)
+            write_haul(writer, SubscriptionHaul(s, [(k, m) for k, m in r.items if k not in failed], r.errors))
+            if not failed:
+                synced[s.lower()] = started
+        for s in plan:
+            if s not in work:
+                synced[s.lower()] = started
+        writer.set_meta("started_at", started)
+        writer.set_meta("synced_at", {s: t for s, t in synced.items() if s in {x.lower() for x in sub_ids}})
+        writer.set_meta("finished_at", time.time())
+        writer.set_meta("subscriptions", sub_ids)
+        writer.set_meta("refreshed", {s: (None if rgs is None else sorted(rgs)) for s, rgs in work.items()})
+        writer.commit()
+    except BaseException:
+        writer.abort()
+        raise
+    return InventorySnapshot(p)
@@ -0,0 +1,243 @@
+# src/optiv_lib/providers/azure/inventory/snapshot.py
+from __future__ import annotations
+
+import ipaddress
+import json
+import os
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+__all__ = ["InventorySnapshot", "SnapshotWriter", "SCHEMA_VERSION", "prefix_range"]
+
+SCHEMA_VERSION = 1
+
+# Resource IDs are case-insensitive in ARM; NOCASE keeps lookups and joins
+# on the primary key index whatever casing the caller has.
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE subscriptions (
+    subscription_id TEXT PRIMARY KEY COLLATE NOCASE,
+    display_name TEXT,
+    state TEXT,
+    tenant_id TEXT
+);
+CREATE TABLE resources (
+    id TEXT PRIMARY KEY COLLATE NOCASE,
+    kind TEXT NOT NULL,
+    subscription_id TEXT NOT NULL COLLATE NOCASE,
+    resource_group TEXT COLLATE NOCASE,
+    name TEXT,
+    location TEXT,
+    parent_id TEXT COLLATE NOCASE,
+    data TEXT NOT NULL
+);
+CREATE TABLE prefixes (
+    resource_id TEXT NOT NULL COLLATE NOCASE,
+    prefix TEXT NOT NULL,
+    family INTEGER NOT NULL,
+    lo TEXT NOT NULL,
+    hi TEXT NOT NULL
+);
+CREATE TABLE errors (
+    subscription_id TEXT COLLATE NOCASE,
+    kind TEXT,
+    message TEXT
+);
+"""
+
+_INDEXES = """
+CREATE INDEX IF NOT EXISTS ix_resources_sub ON resources (subscription_id, kind);
+CREATE INDEX IF NOT EXISTS ix_resources_rg ON resources (subscription_id, resource_group, kind);
+CREATE INDEX IF NOT EXISTS ix_resources_kind ON resources (kind);
+CREATE INDEX IF NOT EXISTS ix_resources_parent ON resources (parent_id);
+CREATE INDEX IF NOT EXISTS ix_prefixes_prefix ON prefixes (prefix);
+CREATE INDEX IF NOT EXISTS ix_prefixes_range ON prefixes (family, lo, hi);
+CREATE INDEX IF NOT EXISTS ix_prefixes_resource ON prefixes (resource_id);
+"""
+
+
+def prefix_range(value: str) -> Optional[Tuple[str, int, str, str]]:
+    """
+    (normalized prefix, family, lo, hi) for a CIDR or bare address; None for
+    anything else (e.g. a service tag used as a route prefix). lo/hi are
+    fixed-width hex so SQLite can compare them as text.
+    """
+    try:
+        net = ipaddress.ip_network(value.strip(), strict=False)
+    except ValueError:
+        return None
+    width = 8 if net.version == 4 else 32
+    lo = format(int(net.network_address), f"0{width}x")
+    hi = format(int(net.broadcast_address), f"0{width}x")
+    return str(net), net.version, lo, hi
+
+
+class SnapshotWriter:
+    """
+    Builds a snapshot at `path + '.part'` and moves it into place on commit(),
+    so readers never see a half-written crawl. Indexes are created after the
+    bulk insert.
+
+    With `base`, the new snapshot starts as a copy of that one (incremental
+    refresh): delete_scope() drops what is about to be re-fetched.
+    """
+
+    def __init__(self, path: Union[Path, str], *, base: Union[Path, str, None] = None) -> None:
+        self.path = Path(path)
+        self._tmp = self.path.with_name(self.path.name + ".part")
+        self._tmp.unlink(missing_ok=True)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self._tmp)
+        if base is not None:
+            src = sqlite3.connect(f"file:{Path(base)}?mode=ro", uri=True)
+            try:
+                src.backup(self.conn)
+            finally:
+                src.close()
+        self.conn.execute("PRAGMA journal_mode = OFF")
+        self.conn.execute("PRAGMA synchronous = OFF")
+        if base is None:
+            self.conn.executescript(_SCHEMA)
+
+    def set_meta(self, key: str, value: Any) -> None:
+        self.conn.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (key, json.dumps(value)))
+
+    def add_subscriptions(self, rows: Iterable[Tuple[str, str, str, str]]) -> None:
+        self.conn.executemany("INSERT OR REPLACE INTO subscriptions VALUES (?, ?, ?, ?)", rows)
+
+    def add_resources(self, rows: Iterable[Tuple[str, str, str, Optional[str], Optional[str], Optional[str], Optional[str], Dict[str, Any]]]) -> None:
+        """Rows of (id, kind, subscription_id, resource_group, name, location, parent_id, data)."""
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO resources VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            ((*r[:7], json.dumps(r[7], default=str, separators=(",", ":"))) for r in rows),
+        )
+
+    def add_prefixes(self, resource_id: str, prefixes: Iterable[str]) -> None:
+        rows = []
+        for p in prefixes:
+            rng = prefix_range(p) if p else None
+            if rng is not None:
+                rows.append((resource_id, *rng))
+        self.conn.executemany("INSERT INTO prefixes VALUES (?, ?, ?, ?, ?)", rows)
+
+    def delete_scope(self, subscription_id: str, resource_groups: Optional[Iterable[str]] = None, *, kinds: Optional[Iterable[str]] = None) -> None:
+        """
+        Drop a subscription's rows, or only those in `resource_groups` (plus
+        the subscription's resource-group rows, which are always re-listed).
+        `kinds` limits the drop to those resource kinds.
+        """
+        if resource_groups is None:
+            cond, params = "subscription_id = ?", [subscription_id]
+        else:
+            rgs = list(resource_groups)
+            marks = ", ".join("?" * len(rgs))
+            cond = f"subscription_id = ? AND (kind = 'resource_group' OR resource_group IN ({marks}))" if rgs else \
+                "subscription_id = ? AND kind = 'resource_group'"
+            params = [subscription_id, *rgs]
+        if kinds is not None:
+            ks = list(kinds)
+            cond = f"{cond} AND kind IN ({', '.join('?' * len(ks))})"
+            params += ks
+        self.conn.execute(f"DELETE FROM prefixes WHERE resource_id IN (SELECT id FROM resources WHERE {cond})", params)
+        self.conn.execute(f"DELETE FROM resources WHERE {cond}", params)
+
+    def clear_errors(self, subscription_id: str) -> None:
+        self.conn.execute("DELETE FROM errors WHERE subscription_id = ?", (subscription_id,))
+
+    def add_errors(self, rows: Iterable[Tuple[Optional[str], str, str]]) -> None:
+        self.conn.executemany("INSERT INTO errors VALUES (?, ?, ?)", rows)
+
+    def commit(self) -> None:
+        self.set_meta("schema_version", SCHEMA_VERSION)
+        self.conn.executescript(_INDEXES)
+        self.conn.execute("ANALYZE")
+        self.conn.commit()
+        self.conn.close()
+        os.replace(self._tmp, self.path)
+
+    def abort(self) -> None:
+        self.conn.close()
+        self._tmp.unlink(missing_ok=True)
+
+
+class InventorySnapshot:
+    """
+    Read-only view of a crawl written by crawl_inventory().
+
+    Rows come back as dicts; `data` is the SDK model's as_dict() payload.
+    query() runs arbitrary SQL for reporting (tables: resources, prefixes,
+    subscriptions, errors, meta).
+    """
+
+    def __init__(self, path: Union[Path, str]) -> None:
+        self.path = Path(path)
+        self.conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+
+    @staticmethod
+    def _row(row: sqlite3.Row) -> Dict[str, Any]:
+        out = dict(row)
+        if "data" in out and isinstance(out["data"], str):
+            out["data"] = json.loads(out["data"])
+        return out
+
+    def query(self, sql: str, params: Sequence[Any] = ()) -> List[Dict[str, Any]]:
+        return [self._row(r) for r in self.conn.execute(sql, params)]
+
+    def meta(self) -> Dict[str, Any]:
+        return {r["key"]: json.loads(r["value"]) for r in self.conn.execute("SELECT key, value FROM meta")}
+
+    def get(self, resource_id: str) -> Optional[Dict[str, Any]]:
+        row = self.conn.execute("SELECT * FROM resources WHERE id = ?", (resource_id,)).fetchone()
+        return self._row(row) if row is not None else None
+
+    def resources(self, kind: Optional[str] = None, *, subscription_id: Optional[str] = None, resource_group: Optional[str] = None) -> List[Dict[str, Any]]:
+        where, params = [], []
+        for col, val in (("kind", kind), ("subscription_id", subscription_id), ("resource_group", resource_group)):
+            if val is not None:
+                where.append(f"{col} = ?")
+                params.append(val)
+        sql = "SELECT * FROM resources" + (" WHERE " + " AND ".join(where) if where else "")
+        return self.query(sql, params)
+
+    def children(self, parent_id: str) -> List[Dict[str, Any]]:
+        return self.query("SELECT * FROM resources WHERE parent_id = ?", (parent_id,))
+
+    def _by_range(self, value: str, cond: str, *, swap: bool) -> List[Dict[str, Any]]:
+        rng = prefix_range(value)
+        if rng is None:
+            raise ValueError(f"not an IP address or prefix: {value!r}")
+        _, family, lo, hi = rng
+        # For nested prefixes a higher lo (then lower hi) is more specific.
+        return self.query(
+            "SELECT r.*, p.prefix FROM prefixes p JOIN resources r ON r.id = p.resource_id "
+            f"WHERE p.family = ? AND {cond} ORDER BY p.lo DESC, p.hi ASC",
+            (family, hi, lo) if swap else (family, lo, hi),
+        )
+
+    def containing(self, value: str) -> List[Dict[str, Any]]:
+        """Resources whose prefixes contain the address or prefix `value`, most specific first."""
+        return self._by_range(value, "p.lo <= ? AND p.hi >= ?", swap=False)
+
+    def overlapping(self, value: str) -> List[Dict[str, Any]]:
+        """Resources with any prefix overlapping `value`."""
+        return self._by_range(value, "p.lo <= ? AND p.hi >= ?", swap=True)
+
+    def counts(self) -> Dict[str, int]:
+        return {r[0]: r[1] for r in self.conn.execute("SELECT kind, COUNT(*) FROM resources GROUP BY kind")}
+
+    def errors(self) -> List[Dict[str, Any]]:
+        return self.query("SELECT * FROM errors")
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> InventorySnapshot:
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self.resources())
@@ -1,14 +1,23 @@
 # src/optiv_lib/providers/azure/objects/application_gateway/api.py
 from __future__ import annotations
 
-from typing import Any, List, Optional
-
+import heapq
+import itertools
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from azure.core.polling import NoPolling
+from azure.mgmt.core.polling.arm_polling import ARMPolling
 from azure.mgmt.core.tools import parse_resource_id
-from azure.mgmt.network.models import ApplicationGateway
 
 from optiv_lib.providers.azure.clients import network_client
-from optiv_lib.providers.azure.objects.subscription.api import list_subscriptions
-from optiv_lib.providers.azure.threads import thread_map_flat
+from optiv_lib.providers.azure.objects.application_gateway.model import GatewayHealth, to_gateway_health
+from optiv_lib.providers.azure.objects.subscription.api import subscription_ids
+from optiv_lib.providers.azure.threads import TaskError, TaskGroup, slot_released, thread_map_flat
+
+if TYPE_CHECKING:
+    from azure.mgmt.network.models import ApplicationGateway
 
 
 def list_application_gateways(subscription_id: str, resource_group: str) -> List[ApplicationGateway]:
@@ -20,8 +29,7 @@ def list_all_application_gateways(max_workers: int | None = None) -> List[Applic
     """
     List all Application Gateways across all accessible subscriptions using a shared thread pool.
     """
-    subs = list_subscriptions()
-    sub_ids = [s.subscription_id for s in subs]
+    sub_ids = subscription_ids()
 
     def _fetch(sub_id: str) -> List[ApplicationGateway]:
         return list(network_client(sub_id).application_gateways.list_all())
@@ -56,3 +64,129 @@ def get_backend_health_by_id(appgw_id: str, timeout: Optional[float] = 35, ) ->
 
     poller = client.application_gateways.begin_backend_health(resource_group_name=rg, application_gateway_name=name, expand="All", )
     return poller.result(timeout=timeout)
+
+
+# ----------------------------
+# Bulk backend health
+# ----------------------------
+
+def _retry_after(headers: Any, fallback: float) -> float:
+    """Retry-After (seconds) or Retry-After-Ms of a polling response; `fallback` when absent or not positive."""
+    if not headers:
+        return fallback
+    try:
+        ra = headers.get("Retry-After-Ms")
+        delay = float(ra) / 1000.0 if ra is not None else float(headers.get("Retry-After") or 0)
+    except (TypeError, ValueError):
+        return fallback  # HTTP-date form: use the interval
+    return delay if delay > 0 else fallback
+
+
+class _SteppedPolling(NoPolling):
+    """
+    Handed to begin_backend_health as its polling method. Being NoPolling,
+    the LROPoller starts no thread; the wrapped ARMPolling is stepped one
+    status GET at a time by iter_backend_health instead.
+    """
+
+    def __init__(self, interval: float) -> None:
+        super().__init__()
+        self.interval = interval
+        self.arm = ARMPolling(interval)
+
+    def initialize(self, client: Any, initial_response: Any, deserialization_callback: Any) -> None:
+        super().initialize(client, initial_response, deserialization_callback)
+        self.arm.initialize(client, initial_response, deserialization_callback)
+
+    def next_delay(self) -> float:
+        """Retry-After of the last response, else the polling interval."""
+        response = getattr(self.arm, "_pipeline_response", None)
+        return _retry_after(getattr(getattr(response, "http_response", None), "headers", None), self.interval)
+
+
+def _begin_health(args: Tuple[str, float, str]) -> _SteppedPolling:
+    appgw_id, interval, expand = args
+    rid = parse_resource_id(appgw_id)
+    polling = _SteppedPolling(interval)
+    network_client(rid["subscription"]).application_gateways.begin_backend_health(
+        resource_group_name=rid["resource_group"], application_gateway_name=rid["resource_name"], expand=expand, polling=polling,
+    )
+    return polling
+
+
+def _step_health(polling: _SteppedPolling) -> bool:
+    """One status GET; once terminal, raise on failure or fetch the final result. True when done."""
+    arm = polling.arm
+    if not arm.finished():
+        arm.update_status()
+    if arm.finished():
+        arm.run()
+        return True
+    return False
+
+
+def iter_backend_health(appgw_ids: Iterable[str], *, timeout: float = 120.0, poll_interval: float = 5.0, expand: str = "All",
+        ) -> Iterator[GatewayHealth | TaskError]:
+    """
+    Backend health for many application gateways, yielded as each completes.
+
+    Every gateway's Backend Health LRO is started on the shared thread pool;
+    this generator then schedules the status polls itself, each at the time
+    its last response asked for (Retry-After, else `poll_interval`). Pool
+    threads only run the individual HTTP calls, so no thread waits out an
+    LRO. Gateways that fail, or are not done within `timeout` seconds of
+    being started, yield a TaskError. Closing the generator cancels polls
+    not yet started; started LROs are left to finish server-side.
+
+    Example:
+        for h in iter_backend_health(g.id for g in list_all_application_gateways()):
+            if isinstance(h, TaskError):
+                log.warning("%s: %s", h.item, h.error)
+            else:
+                report(h.gateway_id, h.unhealthy())
+    """
+    group = TaskGroup()
+    pending: Dict[Future[Any], Tuple[str, Optional[_SteppedPolling], float]] = {}
+    due: List[Tuple[float, int, str, _SteppedPolling, float]] = []
+    seq = itertools.count()
+    for gid in dict.fromkeys(appgw_ids):
+        pending[group.submit(_begin_health, (gid, poll_interval, expand), scope=gid)] = (gid, None, 0.0)
+
+    try:
+        while pending or due:
+            now = time.monotonic()
+            while due and due[0][0] <= now:
+                _, _, gid, polling, deadline = heapq.heappop(due)
+                pending[group.submit(_step_health, polling, scope=gid)] = (gid, polling, deadline)
+            wake = due[0][0] - now if due else None
+            with slot_released():
+                if not pending:
+                    time.sleep(wake or 0.0)
+                    continue
+                done, _ = wait(list(pending), timeout=wake, return_when=FIRST_COMPLETED)
+            for fut in done:
+                gid, polling, deadline = pending.pop(fut)
+                try:
+                    result = fut.result()
+                except BaseException as exc:
+                    yield TaskError(gid, exc)
+                    continue
+                now = time.monotonic()
+                if polling is None:
+                    # Started: first poll straight away if already terminal.
+                    polling, deadline = result, now + timeout
+                    delay = 0.0 if polling.arm.finished() else polling.next_delay()
+                elif result:
+                    try:
+                        yield to_gateway_health(gid, polling.arm.resource())
+                    except Exception as exc:
+                        yield TaskError(gid, exc)
+                    continue
+                elif now >= deadline:
+                    yield TaskError(gid, TimeoutError(f"backend health not done after {timeout:g}s"))
+                    continue
+                else:
+                    delay = polling.next_delay()
+                heapq.heappush(due, (now + min(delay, max(0.0, deadline - now)), next(seq), gid, polling, deadline))
+    finally:
+        group.cancel()
@@ -0,0 +1,58 @@
+# src/optiv_lib/providers/azure/objects/application_gateway/model.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from optiv_lib.providers.azure.records import enum_str, istr, ref_id
+
+if TYPE_CHECKING:
+    from azure.mgmt.network.models import ApplicationGatewayBackendHealth
+
+
+@dataclass(slots=True, frozen=True)
+class BackendServerHealth:
+    """One backend server's health under one (backend pool, HTTP settings) pair."""
+    gateway_id: str
+    backend_pool_id: Optional[str]
+    http_settings_id: Optional[str]
+    address: Optional[str]
+    health: Optional[str]
+    health_probe_log: Optional[str] = None
+    ip_configuration_id: Optional[str] = None
+
+    def key(self) -> str:
+        return f"{(self.http_settings_id or '').lower()}|{self.address or ''}"
+
+
+@dataclass(slots=True, frozen=True)
+class GatewayHealth:
+    """Backend health of one application gateway."""
+    gateway_id: str
+    servers: Tuple[BackendServerHealth, ...]
+
+    def key(self) -> str:
+        return self.gateway_id.lower()
+
+    def unhealthy(self) -> List[BackendServerHealth]:
+        """Servers not reported Healthy (Unhealthy, Partial, Draining, Unknown)."""
+        return [s for s in self.servers if s.health != "Healthy"]
+
+
+def to_gateway_health(gateway_id: str, health: Optional[ApplicationGatewayBackendHealth]) -> GatewayHealth:
+    servers: List[BackendServerHealth] = []
+    for pool in (health.backend_address_pools if health is not None else None) or []:
+        pool_id = ref_id(pool.backend_address_pool)
+        for settings in pool.backend_http_settings_collection or []:
+            settings_id = ref_id(settings.backend_http_settings)
+            for s in settings.servers or []:
+                servers.append(BackendServerHealth(
+                    gateway_id=gateway_id,
+                    backend_pool_id=pool_id,
+                    http_settings_id=settings_id,
+                    address=istr(s.address),
+                    health=enum_str(s.health),
+                    health_probe_log=s.health_probe_log,
+                    ip_configuration_id=ref_id(s.ip_configuration),
+                ))
+    return GatewayHealth(gateway_id=gateway_id, servers=tuple(servers))
@@ -1,28 +1,38 @@
 # src/optiv_lib/providers/azure/objects/public_ip/api.py
 from __future__ import annotations
 
-from typing import List
+from typing import TYPE_CHECKING, Any, List
 
 from azure.mgmt.core.tools import parse_resource_id
-from azure.mgmt.network.models import PublicIPAddress
 
 from optiv_lib.providers.azure.clients import network_client
+from optiv_lib.providers.azure.objects.public_ip.model import PublicIPRecord, to_record
 
+if TYPE_CHECKING:
+    from azure.mgmt.network.models import PublicIPAddress
 
-def list_public_ips(subscription_id: str) -> List[PublicIPAddress]:
+
+def _keep(p: Any) -> Any:
+    return p
+
+
+def list_public_ips(subscription_id: str, *, project: bool = False) -> List[PublicIPAddress] | List[PublicIPRecord]:
     """
     List all Public IP addresses in the subscription.
+    project=True returns PublicIPRecords, converted as each page arrives.
     """
     client = network_client(subscription_id)
-    return list(client.public_ip_addresses.list_all())
+    conv = to_record if project else _keep
+    return [conv(p) for p in client.public_ip_addresses.list_all()]
 
 
-def list_public_ips_in_rg(subscription_id: str, resource_group: str) -> List[PublicIPAddress]:
+def list_public_ips_in_rg(subscription_id: str, resource_group: str, *, project: bool = False) -> List[PublicIPAddress] | List[PublicIPRecord]:
     """
     List Public IP addresses in a specific resource group.
     """
     client = network_client(subscription_id)
-    return list(client.public_ip_addresses.list(resource_group_name=resource_group))
+    conv = to_record if project else _keep
+    return [conv(p) for p in client.public_ip_addresses.list(resource_group_name=resource_group)]
 
 
 def get_public_ip(subscription_id: str, resource_group: str, name: str) -> PublicIPAddress:
@@ -0,0 +1,47 @@
+# src/optiv_lib/providers/azure/objects/public_ip/model.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+from optiv_lib.providers.azure.records import enum_str, id_scope, istr, ref_id
+
+if TYPE_CHECKING:
+    from azure.mgmt.network.models import PublicIPAddress
+
+
+@dataclass(slots=True, frozen=True)
+class PublicIPRecord:
+    """Compact projection of a PublicIPAddress: address and what it is attached to."""
+    id: str
+    name: str
+    subscription_id: str
+    resource_group: Optional[str]
+    location: Optional[str]
+    ip_address: Optional[str]
+    version: Optional[str] = None
+    allocation: Optional[str] = None
+    sku: Optional[str] = None
+    ip_configuration_id: Optional[str] = None
+    fqdn: Optional[str] = None
+
+    def key(self) -> str:
+        return self.id.lower()
+
+
+def to_record(pip: PublicIPAddress) -> PublicIPRecord:
+    rid = istr(pip.id) or ""
+    sub, rg = id_scope(rid)
+    return PublicIPRecord(
+        id=rid,
+        name=pip.name or rid.rsplit("/", 1)[-1],
+        subscription_id=sub,
+        resource_group=rg,
+        location=istr(pip.location),
+        ip_address=pip.ip_address,
+        version=enum_str(pip.public_ip_address_version),
+        allocation=enum_str(pip.public_ip_allocation_method),
+        sku=enum_str(pip.sku.name) if pip.sku else None,
+        ip_configuration_id=ref_id(pip.ip_configuration),
+        fqdn=pip.dns_settings.fqdn if pip.dns_settings else None,
+    )
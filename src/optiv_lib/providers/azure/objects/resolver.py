@@ -0,0 +1,206 @@
+# src/optiv_lib/providers/azure/objects/resolver.py
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from optiv_lib.providers.azure.clients import network_client
+from optiv_lib.providers.azure.objects.application_gateway.api import get_application_gateway_by_id
+from optiv_lib.providers.azure.objects.public_ip.api import get_public_ip_by_id
+from optiv_lib.providers.azure.objects.route.api import embedded_routes, get_route_by_id
+from optiv_lib.providers.azure.objects.route_table.api import get_route_table_by_id
+from optiv_lib.providers.azure.objects.subnet.api import embedded_subnets, get_subnet_by_id
+from optiv_lib.providers.azure.threads import TaskError, TaskGroup
+
+__all__ = ["resolve_ids", "clear_resolver_cache", "SUPPORTED_TYPES"]
+
+# (parent type, child type) as they appear in lower-cased Microsoft.Network IDs.
+SUPPORTED_TYPES: Dict[Tuple[str, Optional[str]], str] = {
+    ("publicipaddresses", None): "public_ip",
+    ("virtualnetworks", "subnets"): "subnet",
+    ("routetables", None): "route_table",
+    ("routetables", "routes"): "route",
+    ("applicationgateways", None): "application_gateway",
+}
+
+# Listing results: found models by lower-cased ID, plus lower-cased parent IDs
+# whose children were not embedded (their IDs need a GET).
+_Listing = Tuple[Dict[str, Any], Set[str]]
+
+_GETTERS: Dict[str, Callable[[str], Any]] = {
+    "public_ip": get_public_ip_by_id,
+    "subnet": get_subnet_by_id,
+    "route_table": get_route_table_by_id,
+    "route": get_route_by_id,
+    "application_gateway": get_application_gateway_by_id,
+}
+
+# Operations group listed for each kind (children come embedded in their parents).
+_LIST_OPS: Dict[str, str] = {
+    "public_ip": "public_ip_addresses",
+    "subnet": "virtual_networks",
+    "route_table": "route_tables",
+    "route": "route_tables",
+    "application_gateway": "application_gateways",
+}
+
+_CACHE: Dict[str, Tuple[float, Any]] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+@dataclass(slots=True, frozen=True)
+class _Ref:
+    id: str
+    subscription_id: str
+    resource_group: str
+    kind: str
+    parent_id: Optional[str]  # lower-cased, child kinds only
+
+
+def _parse(resource_id: str) -> _Ref:
+    parts = resource_id.strip("/").split("/")
+    low = [p.lower() for p in parts]
+    try:
+        p = low.index("providers")
+    except ValueError:
+        raise ValueError(f"not a resource ID: {resource_id!r}") from None
+    if low[0] != "subscriptions" or low[2] != "resourcegroups" or low[p + 1] != "microsoft.network" or len(parts) not in (p + 4, p + 6):
+        raise ValueError(f"unsupported resource ID: {resource_id!r}")
+    child = low[p + 4] if len(parts) == p + 6 else None
+    kind = SUPPORTED_TYPES.get((low[p + 2], child))
+    if kind is None:
+        raise ValueError(f"unsupported resource type in {resource_id!r}")
+    parent = "/" + "/".join(low[: p + 4]) if child else None
+    return _Ref(resource_id, parts[1].lower(), parts[3], kind, parent)
+
+
+# ----------------------------
+# Fetchers
+# ----------------------------
+
+def _get(ref: _Ref) -> Any:
+    from azure.core.exceptions import ResourceNotFoundError
+
+    try:
+        return _GETTERS[ref.kind](ref.id)
+    except ResourceNotFoundError:
+        return None
+
+
+def _list(subscription_id: str, kind: str, resource_group: Optional[str]) -> _Listing:
+    """One list call (RG-level, or subscription-wide when resource_group is None)."""
+    ops = getattr(network_client(subscription_id), _LIST_OPS[kind])
+    pager = ops.list_all() if resource_group is None else ops.list(resource_group_name=resource_group)
+    found: Dict[str, Any] = {}
+    unknown: Set[str] = set()
+    for parent in pager:
+        if kind in ("subnet", "route"):
+            children = embedded_subnets(parent) if kind == "subnet" else embedded_routes(parent)
+            if children is None:
+                unknown.add((parent.id or "").lower())
+                continue
+            for c in children:
+                found[c.id.lower()] = c
+        else:
+            found[(parent.id or "").lower()] = parent
+    return found, unknown
+
+
+# ----------------------------
+# Public API
+# ----------------------------
+
+def clear_resolver_cache() -> None:
+    with _CACHE_LOCK:
+        _CACHE.clear()
+
+
+def resolve_ids(ids: Iterable[str], *, ttl: float = 300.0, rg_threshold: int = 3, sub_threshold: int = 25) -> Dict[str, Any]:
+    """
+    Resolve Microsoft.Network resource IDs to SDK models in bulk.
+
+    IDs are deduplicated case-insensitively and grouped by subscription,
+    resource group and type. A group of `rg_threshold`+ IDs is served by
+    one RG-level list, and `sub_threshold`+ IDs of one type spread over
+    several groups by one subscription-wide list_all; subnets and routes
+    come from their parents' embedded payloads. Everything else is a GET.
+    All calls run on the shared thread pool (with TaskGroup retries), and
+    results are memoized for `ttl` seconds.
+
+    Returns {id: model} keyed by the IDs as given: None if the resource
+    does not exist, a TaskError if fetching it failed. Supported types:
+    SUPPORTED_TYPES. Raises ValueError for anything else.
+    """
+    wanted: Dict[str, List[str]] = {}
+    for rid in ids:
+        wanted.setdefault(rid.lower(), []).append(rid)
+
+    now = time.monotonic()
+    resolved: Dict[str, Any] = {}
+    with _CACHE_LOCK:
+        for key in wanted:
+            hit = _CACHE.get(key)
+            if hit is not None and hit[0] > now:
+                resolved[key] = hit[1]
+    refs = [_parse(orig[0]) for key, orig in wanted.items() if key not in resolved]
+
+    # Plan: (subscription, kind) → resource group → refs
+    groups: Dict[Tuple[str, str], Dict[str, List[_Ref]]] = {}
+    for ref in refs:
+        groups.setdefault((ref.subscription_id, ref.kind), {}).setdefault(ref.resource_group.lower(), []).append(ref)
+
+    listings: List[Tuple[Tuple[str, str, Optional[str]], List[_Ref]]] = []
+    gets: List[_Ref] = []
+    for (sub, kind), by_rg in groups.items():
+        total = sum(len(v) for v in by_rg.values())
+        if total >= sub_threshold and len(by_rg) > 1:
+            listings.append(((sub, kind, None), [r for v in by_rg.values() for r in v]))
+            continue
+        for rg_refs in by_rg.values():
+            if len(rg_refs) >= rg_threshold:
+                listings.append(((sub, kind, rg_refs[0].resource_group), rg_refs))
+            else:
+                gets.extend(rg_refs)
+
+    def _run_list(args: Tuple[str, str, Optional[str]]) -> _Listing:
+        return _list(*args)
+
+    with TaskGroup() as group:
+        for key, _ in listings:
+            group.submit(_run_list, key, scope=key[0])
+        for ref in gets:
+            group.submit(_get, ref, scope=ref.subscription_id)
+    results = group.results()
+
+    retry: List[_Ref] = []
+    for (_, covered), listing in zip(listings, results):
+        if isinstance(listing, TaskError):
+            retry.extend(covered)  # fall back to GETs for this group
+            continue
+        found, unknown = listing
+        for ref in covered:
+            k = ref.id.lower()
+            if k in found:
+                resolved[k] = found[k]
+            elif ref.parent_id is not None and ref.parent_id in unknown:
+                retry.append(ref)
+            else:
+                resolved[k] = None
+    for ref, r in zip(gets, results[len(listings):]):
+        resolved[ref.id.lower()] = TaskError(ref.id, r.error) if isinstance(r, TaskError) else r
+    if retry:
+        with TaskGroup() as group:
+            for ref in retry:
+                group.submit(_get, ref, scope=ref.subscription_id)
+        for ref, r in zip(retry, group.results()):
+            resolved[ref.id.lower()] = TaskError(ref.id, r.error) if isinstance(r, TaskError) else r
+
+    expires = time.monotonic() + ttl
+    with _CACHE_LOCK:
+        for key, value in resolved.items():
+            if not isinstance(value, TaskError):
+                _CACHE[key] = (expires, value)
+
+    return {orig: resolved.get(key) for key, origs in wanted.items() for orig in origs}
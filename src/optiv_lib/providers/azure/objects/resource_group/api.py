@@ -1,12 +1,13 @@
 # src/optiv_lib/providers/azure/objects/resource_group/api.py
 from __future__ import annotations
 
-from typing import List
-
-from azure.mgmt.resource.resources.v2025_04_01.models import ResourceGroup
+from typing import TYPE_CHECKING, List
 
 from optiv_lib.providers.azure.clients import resource_client
 
+if TYPE_CHECKING:
+    from azure.mgmt.resource.resources.v2025_04_01.models import ResourceGroup
+
 
 def list_resource_groups(subscription_id: str) -> List[ResourceGroup]:
     """
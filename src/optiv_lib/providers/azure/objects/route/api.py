@@ -1,20 +1,44 @@
 # src/optiv_lib/providers/azure/objects/route/api.py
 from __future__ import annotations
 
-from typing import List
+from typing import TYPE_CHECKING, Any, Callable, List, Literal, Optional
 
 from azure.mgmt.core.tools import parse_resource_id
-from azure.mgmt.network.models import Route
 
 from optiv_lib.providers.azure.clients import network_client
-from optiv_lib.providers.azure.objects.route_table import api as rt_api
-from optiv_lib.providers.azure.threads import thread_map_flat
+from optiv_lib.providers.azure.objects.route.model import RouteRecord, to_record
+from optiv_lib.providers.azure.objects.subscription.api import subscription_ids
+from optiv_lib.providers.azure.threads import thread_map, thread_map_flat
 
+if TYPE_CHECKING:
+    from azure.mgmt.network.models import Route, RouteTable
 
-def list_routes(subscription_id: str, resource_group: str, route_table_name: str) -> List[Route]:
-    """List routes within a specific route table."""
+# "embedded": take routes from the route_tables.list_all payload and call
+# routes.list only for tables whose embedded data is missing or incomplete.
+# "per_parent": always call routes.list per route table.
+CrawlMode = Literal["embedded", "per_parent"]
+
+
+def embedded_routes(route_table: RouteTable) -> Optional[List[Route]]:
+    """Routes embedded in a RouteTable payload, or None if absent or incomplete."""
+    routes = route_table.routes
+    if routes is None:
+        return None
+    for r in routes:
+        if not r.id or r.address_prefix is None or r.next_hop_type is None:
+            return None
+    return list(routes)
+
+
+def _keep(r: Any) -> Any:
+    return r
+
+
+def list_routes(subscription_id: str, resource_group: str, route_table_name: str, *, project: bool = False) -> List[Route] | List[RouteRecord]:
+    """List routes within a specific route table (RouteRecords with project=True)."""
     net = network_client(subscription_id)
-    return list(net.routes.list(resource_group_name=resource_group, route_table_name=route_table_name))
+    conv = to_record if project else _keep
+    return [conv(r) for r in net.routes.list(resource_group_name=resource_group, route_table_name=route_table_name)]
 
 
 def get_route(subscription_id: str, resource_group: str, route_table_name: str, route_name: str) -> Route:
@@ -33,26 +57,41 @@ def get_route_by_id(resource_id: str) -> Route:
     /subscriptions/<sub>/resourceGroups/<rg>/providers/Microsoft.Network/routeTables/<rt>/routes/<route>
     """
     rid = parse_resource_id(resource_id)
-    sub_id = rid["subscription"]
-    rg = rid["resource_group"]
-    rt_name, route_name = rid["name"].split("/routes/", 1)
-    net = network_client(sub_id)
-    return net.routes.get(resource_group_name=rg, route_table_name=rt_name, route_name=route_name)
+    net = network_client(rid["subscription"])
+    return net.routes.get(
+        resource_group_name=rid["resource_group"],
+        route_table_name=rid["name"],
+        route_name=rid.get("child_name_1") or rid["resource_name"],
+    )
 
 
-def list_all_routes(max_workers: int | None = None) -> List[Route]:
+def list_all_routes(max_workers: int | None = None, *, mode: CrawlMode = "embedded", project: bool = False) -> List[Route] | List[RouteRecord]:
     """
-    Across all subscriptions: reuse route_table/api.py to enumerate all route tables,
-    then list routes per route table in threads.
+    Across all subscriptions: walk each subscription's route tables, take each
+    table's embedded routes, and list routes in threads only for tables
+    without them (or for every table with mode="per_parent").
+
+    project=True returns RouteRecords; tables are projected page by page and
+    not kept, so full SDK objects are never all held at once.
     """
-    route_tables = rt_api.list_all_route_tables(max_workers=max_workers)
+    conv: Callable[[Any], Any] = to_record if project else _keep
+
+    def _fetch_routes(rt_id: str) -> List[Any]:
+        rid = parse_resource_id(rt_id)
+        return list_routes(rid["subscription"], rid["resource_group"], rid["name"], project=project)
 
-    def _fetch_routes(rt_obj) -> List[Route]:
-        rid = parse_resource_id(rt_obj.id)  # RouteTable.id
-        sub_id = rid["subscription"]
-        rg = rid["resource_group"]
-        rt_name = rid["resource_name"]
-        net = network_client(sub_id)
-        return list(net.routes.list(resource_group_name=rg, route_table_name=rt_name))
+    def _fetch_sub(sub_id: str) -> List[Any]:
+        out: List[Any] = []
+        missing: List[str] = []
+        for rt in network_client(sub_id).route_tables.list_all():
+            got = embedded_routes(rt) if mode == "embedded" else None
+            if got is None:
+                missing.append(rt.id)
+            else:
+                out.extend(conv(r) for r in got)
+        if missing:
+            for routes in thread_map(_fetch_routes, missing, ignore_errors=True):
+                out.extend(routes)
+        return out
 
-    return thread_map_flat(_fetch_routes, route_tables, max_workers=max_workers, ignore_errors=True)
+    return thread_map_flat(_fetch_sub, subscription_ids(), max_workers=max_workers, ignore_errors=True)
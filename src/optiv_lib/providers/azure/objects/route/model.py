@@ -0,0 +1,41 @@
+# src/optiv_lib/providers/azure/objects/route/model.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+from optiv_lib.providers.azure.records import enum_str, id_scope, istr
+
+if TYPE_CHECKING:
+    from azure.mgmt.network.models import Route
+
+
+@dataclass(slots=True, frozen=True)
+class RouteRecord:
+    """Compact projection of a Route: destination and next hop."""
+    id: str
+    name: str
+    subscription_id: str
+    resource_group: Optional[str]
+    route_table_id: str
+    address_prefix: Optional[str]
+    next_hop_type: Optional[str]
+    next_hop_ip: Optional[str] = None
+
+    def key(self) -> str:
+        return self.id.lower()
+
+
+def to_record(route: Route) -> RouteRecord:
+    rid = istr(route.id) or ""
+    sub, rg = id_scope(rid)
+    return RouteRecord(
+        id=rid,
+        name=route.name or rid.rsplit("/", 1)[-1],
+        subscription_id=sub,
+        resource_group=rg,
+        route_table_id=istr(rid.rsplit("/routes/", 1)[0]),
+        address_prefix=istr(route.address_prefix),
+        next_hop_type=enum_str(route.next_hop_type),
+        next_hop_ip=istr(route.next_hop_ip_address),
+    )
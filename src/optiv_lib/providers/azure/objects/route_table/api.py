@@ -1,18 +1,26 @@
 # src/optiv_lib/providers/azure/objects/route_table/api.py
 from __future__ import annotations
-from typing import List
+from typing import TYPE_CHECKING, Any, List
 
 from azure.mgmt.core.tools import parse_resource_id
-from azure.mgmt.network.models import RouteTable
 
 from optiv_lib.providers.azure.clients import network_client
-from optiv_lib.providers.azure.objects.subscription.api import list_subscriptions
+from optiv_lib.providers.azure.objects.route_table.model import RouteTableRecord, to_record
+from optiv_lib.providers.azure.objects.subscription.api import subscription_ids
 from optiv_lib.providers.azure.threads import thread_map_flat
 
+if TYPE_CHECKING:
+    from azure.mgmt.network.models import RouteTable
 
-def list_route_tables(subscription_id: str) -> List[RouteTable]:
+
+def _keep(rt: Any) -> Any:
+    return rt
+
+
+def list_route_tables(subscription_id: str, *, project: bool = False) -> List[RouteTable] | List[RouteTableRecord]:
     client = network_client(subscription_id)
-    return list(client.route_tables.list_all())
+    conv = to_record if project else _keep
+    return [conv(rt) for rt in client.route_tables.list_all()]
 
 
 def list_route_tables_in_rg(subscription_id: str, resource_group: str) -> List[RouteTable]:
@@ -34,10 +42,10 @@ def get_route_table_by_id(resource_id: str) -> RouteTable:
     return client.route_tables.get(resource_group_name=rg, route_table_name=name)
 
 
-def list_all_route_tables(max_workers: int | None = None) -> List[RouteTable]:
-    subs = [s.subscription_id for s in list_subscriptions()]
+def list_all_route_tables(max_workers: int | None = None, *, project: bool = False) -> List[RouteTable] | List[RouteTableRecord]:
+    subs = subscription_ids()
 
-    def _fetch(sub_id: str) -> List[RouteTable]:
-        return list(network_client(sub_id).route_tables.list_all())
+    def _fetch(sub_id: str) -> List[Any]:
+        return list_route_tables(sub_id, project=project)
 
     return thread_map_flat(_fetch, subs, max_workers=max_workers, ignore_errors=True)
@@ -0,0 +1,180 @@
+# src/optiv_lib/providers/azure/objects/route_table/index.py
+from __future__ import annotations
+
+import ipaddress
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from optiv_lib.providers.azure.objects.route.model import RouteRecord, to_record as route_record
+from optiv_lib.providers.azure.records import enum_str
+from optiv_lib.providers.azure.trie import PrefixTrie
+
+if TYPE_CHECKING:
+    from azure.mgmt.network.models import RouteTable, VirtualNetwork
+
+__all__ = ["RouteIndex"]
+
+
+class RouteIndex:
+    """
+    Longest-prefix-match over user-defined routes, per route table.
+
+    Each route table gets a PrefixTrie of its routes; subnets map to their
+    associated table. lookup(subnet_id, destination) returns the UDR that
+    applies (its next_hop_type / next_hop_ip), or None when Azure's own
+    routes decide. Routes whose address_prefix is a service tag cannot be
+    matched by address; they are kept in `tagged`.
+
+    System routes are only known for vnets registered with add_vnet (or
+    passed to from_route_tables): the vnet's address space (VnetLocal) and
+    the address spaces of connected peerings (VNetPeering). When one of
+    them is a longer match than the best UDR, lookup returns None; on equal
+    prefixes the UDR wins, as in Azure. Default system routes and routes
+    learned over BGP from a gateway are not modeled; `bgp_disabled` holds
+    the tables that do not propagate gateway routes
+    (disable_bgp_route_propagation).
+
+    IDs are compared case-insensitively, like ARM.
+
+    Example:
+        index = RouteIndex.from_route_tables(list_all_route_tables())
+        index.lookup(subnet.id, "10.20.30.40").next_hop_ip
+    """
+
+    def __init__(self) -> None:
+        self._tries: Dict[str, PrefixTrie[RouteRecord]] = {}
+        self._subnet_table: Dict[str, str] = {}
+        self.tagged: Dict[str, List[RouteRecord]] = {}
+        self.bgp_disabled: set[str] = set()
+        self._system: Dict[str, PrefixTrie[str]] = {}
+        # Route tables listed without embedded routes (load them with add_routes).
+        self.incomplete: set[str] = set()
+
+    @classmethod
+    def from_route_tables(cls, route_tables: Iterable[RouteTable], vnets: Iterable[VirtualNetwork] = ()) -> RouteIndex:
+        """
+        Build from SDK RouteTables (e.g. list_all_route_tables()) in one pass:
+        embedded routes, subnet associations and BGP propagation. `vnets`
+        adds their VnetLocal and peering system routes.
+        """
+        index = cls()
+        for rt in route_tables:
+            rt_id = rt.id or ""
+            index.add_table(
+                rt_id,
+                (route_record(r) for r in (rt.routes or [])),
+                (s.id for s in (rt.subnets or []) if s.id),
+                disable_bgp_route_propagation=bool(rt.disable_bgp_route_propagation),
+            )
+            if rt.routes is None:
+                index.incomplete.add(rt_id.lower())
+        for vnet in vnets:
+            index.add_vnet(vnet)
+        return index
+
+    def add_table(self, route_table_id: str, routes: Iterable[RouteRecord], subnet_ids: Iterable[str] = (), *, disable_bgp_route_propagation: bool = False) -> None:
+        """Register a route table, its routes and the subnets associated with it."""
+        key = route_table_id.lower()
+        self._tries.setdefault(key, PrefixTrie())
+        for sid in subnet_ids:
+            self._subnet_table[sid.lower()] = key
+        if disable_bgp_route_propagation:
+            self.bgp_disabled.add(key)
+        else:
+            self.bgp_disabled.discard(key)
+        self.add_routes(route_table_id, routes)
+
+    def add_vnet(self, vnet: VirtualNetwork) -> None:
+        """System routes of an SDK VirtualNetwork: its address space and the address spaces of connected peerings."""
+        prefixes = [("VnetLocal", p) for p in ((vnet.address_space.address_prefixes or []) if vnet.address_space else [])]
+        for peering in vnet.virtual_network_peerings or []:
+            state = enum_str(peering.peering_state)
+            if state is not None and state != "Connected":
+                continue
+            space = peering.remote_address_space
+            prefixes.extend(("VNetPeering", p) for p in ((space.address_prefixes or []) if space else []))
+        self.add_system_routes(vnet.id or "", prefixes)
+
+    def add_system_routes(self, vnet_id: str, routes: Iterable[Tuple[str, str]]) -> None:
+        """Register (next_hop_type, prefix) system routes for every subnet of a vnet."""
+        trie = self._system.setdefault(vnet_id.lower(), PrefixTrie())
+        for next_hop_type, prefix in routes:
+            trie.insert(prefix, next_hop_type)
+
+    def add_routes(self, route_table_id: str, routes: Iterable[RouteRecord]) -> None:
+        key = route_table_id.lower()
+        trie = self._tries.setdefault(key, PrefixTrie())
+        self.incomplete.discard(key)
+        for r in routes:
+            if not r.address_prefix:
+                continue
+            try:
+                trie.insert(r.address_prefix, r)
+            except ValueError:
+                self.tagged.setdefault(key, []).append(r)
+
+    def table_for(self, subnet_id: str) -> Optional[str]:
+        """Lower-cased ID of the route table associated with a subnet, or None."""
+        return self._subnet_table.get(subnet_id.lower())
+
+    def lookup_table(self, route_table_id: str, destination: str) -> Optional[RouteRecord]:
+        """Longest-prefix UDR in one route table for a destination address."""
+        trie = self._tries.get(route_table_id.lower())
+        return trie.lookup_value(destination) if trie is not None else None
+
+    def propagates_bgp(self, subnet_id: str) -> bool:
+        """False when the subnet's route table drops gateway (BGP) routes."""
+        return self._subnet_table.get(subnet_id.lower()) not in self.bgp_disabled
+
+    def lookup(self, subnet_id: str, destination: str) -> Optional[RouteRecord]:
+        """UDR applied to traffic from `subnet_id` to `destination`; None if none (system routes)."""
+        sid = subnet_id.lower()
+        table = self._subnet_table.get(sid)
+        if table is None:
+            return None
+        return self._match(table, _vnet_of(sid), ipaddress.ip_address(destination))
+
+    def _match(self, table: str, vnet: str, ip: ipaddress.IPv4Address | ipaddress.IPv6Address) -> Optional[RouteRecord]:
+        udr = self._tries[table].lookup(ip)
+        if udr is None:
+            return None
+        system = self._system.get(vnet)
+        if system is not None:
+            hit = system.lookup(ip)
+            if hit is not None and _length(hit[0]) > _length(udr[0]):
+                return None
+        return udr[1]
+
+    def lookup_many(self, flows: Sequence[Tuple[str, str]]) -> List[Optional[RouteRecord]]:
+        """
+        lookup() over (subnet_id, destination) pairs. Destinations are parsed
+        once and each distinct (table, destination) is matched once.
+        """
+        parsed: Dict[str, ipaddress.IPv4Address | ipaddress.IPv6Address] = {}
+        memo: Dict[Tuple[str, str, str], Optional[RouteRecord]] = {}
+        out: List[Optional[RouteRecord]] = []
+        for subnet_id, dest in flows:
+            sid = subnet_id.lower()
+            table = self._subnet_table.get(sid)
+            if table is None:
+                out.append(None)
+                continue
+            vnet = _vnet_of(sid)
+            k = (table, vnet, dest)
+            if k not in memo:
+                ip = parsed.get(dest)
+                if ip is None:
+                    ip = parsed[dest] = ipaddress.ip_address(dest)
+                memo[k] = self._match(table, vnet, ip)
+            out.append(memo[k])
+        return out
+
+    def __len__(self) -> int:
+        return len(self._tries)
+
+
+def _vnet_of(subnet_id: str) -> str:
+    return subnet_id.rsplit("/subnets/", 1)[0]
+
+
+def _length(prefix: str) -> int:
+    return int(prefix.rsplit("/", 1)[1])
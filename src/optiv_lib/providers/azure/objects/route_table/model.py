@@ -0,0 +1,39 @@
+# src/optiv_lib/providers/azure/objects/route_table/model.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional, Tuple
+
+from optiv_lib.providers.azure.records import id_scope, istr, ref_id
+
+if TYPE_CHECKING:
+    from azure.mgmt.network.models import RouteTable
+
+
+@dataclass(slots=True, frozen=True)
+class RouteTableRecord:
+    """Compact projection of a RouteTable: identity and subnet associations (routes are separate)."""
+    id: str
+    name: str
+    subscription_id: str
+    resource_group: Optional[str]
+    location: Optional[str]
+    disable_bgp_route_propagation: bool = False
+    subnet_ids: Tuple[str, ...] = ()
+
+    def key(self) -> str:
+        return self.id.lower()
+
+
+def to_record(route_table: RouteTable) -> RouteTableRecord:
+    rid = istr(route_table.id) or ""
+    sub, rg = id_scope(rid)
+    return RouteTableRecord(
+        id=rid,
+        name=route_table.name or rid.rsplit("/", 1)[-1],
+        subscription_id=sub,
+        resource_group=rg,
+        location=istr(route_table.location),
+        disable_bgp_route_propagation=bool(route_table.disable_bgp_route_propagation),
+        subnet_ids=tuple(i for i in (ref_id(s) for s in (route_table.subnets or [])) if i),
+    )
@@ -1,22 +1,47 @@
 # src/optiv_lib/providers/azure/objects/subnet/api.py
 from __future__ import annotations
 
-from typing import List
+from typing import TYPE_CHECKING, Any, Callable, List, Literal, Optional
 
 from azure.mgmt.core.tools import parse_resource_id
-from azure.mgmt.network.models import Subnet
 
 from optiv_lib.providers.azure.clients import network_client
-from optiv_lib.providers.azure.objects.subscription.api import list_subscriptions
-from optiv_lib.providers.azure.threads import thread_map_flat
+from optiv_lib.providers.azure.objects.subnet.model import SubnetRecord, to_record
+from optiv_lib.providers.azure.objects.subscription.api import subscription_ids
+from optiv_lib.providers.azure.threads import thread_map, thread_map_flat
 
+if TYPE_CHECKING:
+    from azure.mgmt.network.models import Subnet, VirtualNetwork
 
-def list_subnets(subscription_id: str, resource_group: str, vnet_name: str) -> List[Subnet]:
+# "embedded": take subnets from the virtual_networks.list_all payload and call
+# subnets.list only for vnets whose embedded data is missing or incomplete.
+# "per_parent": always call subnets.list per vnet.
+CrawlMode = Literal["embedded", "per_parent"]
+
+
+def embedded_subnets(vnet: VirtualNetwork) -> Optional[List[Subnet]]:
+    """Subnets embedded in a VirtualNetwork payload, or None if absent or incomplete."""
+    subnets = vnet.subnets
+    if subnets is None:
+        return None
+    for s in subnets:
+        if not s.id or (s.address_prefix is None and not s.address_prefixes):
+            return None
+    return list(subnets)
+
+
+def _keep(s: Any) -> Any:
+    return s
+
+
+def list_subnets(subscription_id: str, resource_group: str, vnet_name: str, *, project: bool = False) -> List[Subnet] | List[SubnetRecord]:
     """
-    List all subnets in a virtual network.
+    List all subnets in a virtual network. project=True returns SubnetRecords,
+    converted as each page arrives.
     """
     client = network_client(subscription_id)
-    return list(client.subnets.list(resource_group_name=resource_group, virtual_network_name=vnet_name))
+    conv = to_record if project else _keep
+    return [conv(s) for s in client.subnets.list(resource_group_name=resource_group, virtual_network_name=vnet_name)]
 
 
 def get_subnet(subscription_id: str, resource_group: str, vnet_name: str, subnet_name: str) -> Subnet:
@@ -44,20 +69,37 @@ def get_subnet_by_id(resource_id: str) -> Subnet:
     )
 
 
-def list_all_subnets(max_workers: int | None = None) -> List[Subnet]:
+def list_all_subnets(max_workers: int | None = None, *, mode: CrawlMode = "embedded", project: bool = False) -> List[Subnet] | List[SubnetRecord]:
     """
     List all subnets across all accessible subscriptions using threads.
+
+    mode="embedded" costs one call per subscription unless a vnet's embedded
+    subnets are missing (see CrawlMode). project=True returns SubnetRecords;
+    each vnet page is projected as it arrives, so full SDK objects are never
+    all held at once.
     """
-    sub_ids = [s.subscription_id for s in list_subscriptions()]
-
-    def _fetch_subnets(sub_id: str) -> List[Subnet]:
-        net = network_client(sub_id)
-        out: List[Subnet] = []
-        for vnet in net.virtual_networks.list_all():
-            vrid = parse_resource_id(vnet.id)
-            rg = vrid["resource_group"]
-            vnet_name = vrid.get("resource_name") or vrid["name"]
-            out.extend(net.subnets.list(resource_group_name=rg, virtual_network_name=vnet_name))
-        return out
+    sub_ids = subscription_ids()
+    conv: Callable[[Any], Any] = to_record if project else _keep
+
+    def _fetch_vnet_subnets(vnet_id: str) -> List[Any]:
+        vrid = parse_resource_id(vnet_id)
+        vnet_name = vrid.get("resource_name") or vrid["name"]
+        return list_subnets(vrid["subscription"], vrid["resource_group"], vnet_name, project=project)
+
+    def _fetch_subnets(sub_id: str) -> List[Any]:
+        per_vnet: List[Optional[List[Any]]] = []
+        missing: List[str] = []
+        for v in network_client(sub_id).virtual_networks.list_all():
+            got = embedded_subnets(v) if mode == "embedded" else None
+            if got is None:
+                missing.append(v.id)
+                per_vnet.append(None)
+            else:
+                per_vnet.append([conv(s) for s in got])
+        if missing:
+            # Nested fan-out: vnets within a subscription are fetched in parallel too.
+            fetched = iter(thread_map(_fetch_vnet_subnets, missing, ignore_errors=False))
+            per_vnet = [got if got is not None else next(fetched) for got in per_vnet]
+        return [s for got in per_vnet for s in got]  # type: ignore[union-attr]
 
     return thread_map_flat(_fetch_subnets, sub_ids, max_workers=max_workers, ignore_errors=True)
@@ -0,0 +1,48 @@
+# src/optiv_lib/providers/azure/objects/subnet/model.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional, Tuple
+
+from optiv_lib.providers.azure.records import enum_str, id_scope, istr, ref_id
+
+if TYPE_CHECKING:
+    from azure.mgmt.network.models import Subnet
+
+
+@dataclass(slots=True, frozen=True)
+class SubnetRecord:
+    """Compact projection of a Subnet: identity, prefixes and associations."""
+    id: str
+    name: str
+    subscription_id: str
+    resource_group: Optional[str]
+    vnet_id: str
+    address_prefixes: Tuple[str, ...]
+    nsg_id: Optional[str] = None
+    route_table_id: Optional[str] = None
+    nat_gateway_id: Optional[str] = None
+    delegations: Tuple[str, ...] = ()
+    provisioning_state: Optional[str] = None
+
+    def key(self) -> str:
+        return self.id.lower()
+
+
+def to_record(subnet: Subnet) -> SubnetRecord:
+    rid = istr(subnet.id) or ""
+    sub, rg = id_scope(rid)
+    prefixes = tuple(istr(p) for p in (subnet.address_prefixes or ([subnet.address_prefix] if subnet.address_prefix else [])))
+    return SubnetRecord(
+        id=rid,
+        name=subnet.name or rid.rsplit("/", 1)[-1],
+        subscription_id=sub,
+        resource_group=rg,
+        vnet_id=istr(rid.rsplit("/subnets/", 1)[0]),
+        address_prefixes=prefixes,
+        nsg_id=ref_id(subnet.network_security_group),
+        route_table_id=ref_id(subnet.route_table),
+        nat_gateway_id=ref_id(subnet.nat_gateway),
+        delegations=tuple(istr(d.service_name) for d in (subnet.delegations or []) if d.service_name),
+        provisioning_state=enum_str(subnet.provisioning_state),
+    )
@@ -1,10 +1,22 @@
 # src/optiv_lib/providers/azure/objects/subscription/api.py
-from typing import List
+from __future__ import annotations
 
-from azure.mgmt.resource.subscriptions.v2022_12_01.models import Subscription
+from typing import TYPE_CHECKING, Iterable, List, Optional
 
 from optiv_lib.providers.azure.clients import subscription_client
+from optiv_lib.providers.azure.objects.subscription.catalog import ACTIVE_STATES, CATALOG
+
+if TYPE_CHECKING:
+    from azure.mgmt.resource.subscriptions.v2022_12_01.models import Subscription
 
 
 def list_subscriptions() -> List[Subscription]:
     return list(subscription_client().subscriptions.list())
+
+
+def subscription_ids(states: Optional[Iterable[str]] = ACTIVE_STATES, *, refresh: bool = False) -> List[str]:
+    """
+    Subscription IDs from the process-wide catalog (TTL-cached, single flight).
+    Used by the list_all_* crawlers; disabled subscriptions are skipped by default.
+    """
+    return CATALOG.subscription_ids(states, refresh=refresh)
@@ -0,0 +1,145 @@
+# src/optiv_lib/providers/azure/objects/subscription/catalog.py
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple, Union
+
+from optiv_lib.providers.azure.clients import subscription_client
+
+__all__ = ["SubscriptionInfo", "SubscriptionCatalog", "CATALOG", "ACTIVE_STATES"]
+
+# Subscription states that still serve reads. Disabled and Deleted
+# subscriptions are skipped by default before any fan-out.
+ACTIVE_STATES: Tuple[str, ...] = ("Enabled", "Warned", "PastDue")
+
+
+@dataclass(slots=True, frozen=True)
+class SubscriptionInfo:
+    subscription_id: str
+    display_name: str
+    state: str
+    tenant_id: str
+
+
+def _in_states(records: List[SubscriptionInfo], states: Optional[Iterable[str]]) -> List[SubscriptionInfo]:
+    if states is None:
+        return list(records)
+    wanted = {s.lower() for s in states}
+    return [r for r in records if r.state.lower() in wanted]
+
+
+class SubscriptionCatalog:
+    """
+    Process-wide subscription list with a TTL.
+
+    The first caller after expiry fetches; concurrent callers wait for that
+    same fetch instead of issuing their own (single flight). With `path`
+    set, the list is also written there as JSON and reused across
+    processes while younger than `ttl` and from the session's tenant.
+    """
+
+    def __init__(self, *, ttl: float = 900.0, path: Union[Path, str, None] = None) -> None:
+        self.ttl = ttl
+        self.path = Path(path) if path is not None else None
+        self._lock = threading.Lock()
+        self._records: Optional[List[SubscriptionInfo]] = None
+        self._fetched_at = 0.0  # wall clock, so persisted entries age correctly
+        self._inflight: Optional[Future] = None
+
+    def _fresh(self) -> bool:
+        return self._records is not None and time.time() - self._fetched_at < self.ttl
+
+    def _fetch(self) -> List[SubscriptionInfo]:
+        out: List[SubscriptionInfo] = []
+        for s in subscription_client().subscriptions.list():
+            state = getattr(s.state, "value", s.state)
+            out.append(SubscriptionInfo(s.subscription_id, s.display_name or "", str(state or ""), s.tenant_id or ""))
+        return out
+
+    def _tenant(self) -> str:
+        from optiv_lib.providers.azure.session import get_session
+
+        return get_session().tenant_id
+
+    def _load(self) -> Optional[Tuple[float, List[SubscriptionInfo]]]:
+        if self.path is None:
+            return None
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            fetched_at = float(data["fetched_at"])
+            if time.time() - fetched_at >= self.ttl or data.get("tenant") != self._tenant():
+                return None
+            return fetched_at, [SubscriptionInfo(**r) for r in data["subscriptions"]]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _save(self, fetched_at: float, records: List[SubscriptionInfo]) -> None:
+        if self.path is None:
+            return
+        doc = {"fetched_at": fetched_at, "tenant": self._tenant(), "subscriptions": [asdict(r) for r in records]}
+        tmp = self.path.with_name(self.path.name + ".part")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(doc), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            tmp.unlink(missing_ok=True)  # persistence is best effort
+
+    def all(self, *, refresh: bool = False) -> List[SubscriptionInfo]:
+        """Every subscription visible to the session, fetching at most once per TTL."""
+        with self._lock:
+            if not refresh and self._fresh():
+                return list(self._records)  # type: ignore[arg-type]
+            fut = self._inflight
+            owner = fut is None
+            if owner:
+                fut = self._inflight = Future()
+        if not owner:
+            return list(fut.result())
+        try:
+            loaded = None if refresh else self._load()
+            if loaded is not None:
+                fetched_at, records = loaded
+            else:
+                fetched_at, records = time.time(), self._fetch()
+                self._save(fetched_at, records)
+            with self._lock:
+                self._records, self._fetched_at = records, fetched_at
+            fut.set_result(records)
+            return list(records)
+        except BaseException as e:
+            fut.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight = None
+
+    def subscriptions(self, states: Optional[Iterable[str]] = ACTIVE_STATES, *, refresh: bool = False) -> List[SubscriptionInfo]:
+        """Subscriptions in one of `states` (None: all)."""
+        return _in_states(self.all(refresh=refresh), states)
+
+    def subscription_ids(self, states: Optional[Iterable[str]] = ACTIVE_STATES, *, refresh: bool = False) -> List[str]:
+        return [r.subscription_id for r in self.subscriptions(states, refresh=refresh)]
+
+    def peek(self, states: Optional[Iterable[str]] = ACTIVE_STATES) -> Optional[List[str]]:
+        """Cached subscription IDs if still fresh, else None; never fetches."""
+        with self._lock:
+            if not self._fresh():
+                return None
+            records = self._records
+        return [r.subscription_id for r in _in_states(records, states)]  # type: ignore[arg-type]
+
+    def invalidate(self) -> None:
+        """Forget the in-memory list (the persisted file is kept; it is tenant-checked on load)."""
+        with self._lock:
+            self._records = None
+            self._fetched_at = 0.0
+
+
+CATALOG = SubscriptionCatalog()
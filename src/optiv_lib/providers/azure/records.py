@@ -0,0 +1,33 @@
+# src/optiv_lib/providers/azure/records.py
+from __future__ import annotations
+
+import sys
+from typing import Any, Optional, Tuple
+
+__all__ = ["istr", "enum_str", "id_scope", "ref_id"]
+
+
+def istr(value: Optional[str]) -> Optional[str]:
+    """Interned copy of a string (None passes through). IDs, locations and enum
+    values repeat across thousands of records; interning stores each once."""
+    return sys.intern(value) if value else value
+
+
+def enum_str(value: Any) -> Optional[str]:
+    """Interned string value of an SDK enum (or plain string); None if unset."""
+    if value is None:
+        return None
+    return istr(str(getattr(value, "value", value)))
+
+
+def id_scope(resource_id: str) -> Tuple[str, Optional[str]]:
+    """(subscription, resource group) from an ARM ID, by plain splitting; both interned."""
+    parts = resource_id.split("/")
+    sub = parts[2] if len(parts) > 2 else ""
+    rg = parts[4] if len(parts) > 4 and parts[3].lower() == "resourcegroups" else None
+    return sys.intern(sub), istr(rg)
+
+
+def ref_id(ref: Any) -> Optional[str]:
+    """Interned .id of an SDK sub-resource reference, or None."""
+    return istr(getattr(ref, "id", None)) if ref is not None else None
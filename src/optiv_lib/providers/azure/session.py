@@ -3,18 +3,23 @@ from __future__ import annotations
 
 import base64
 import json
+import re
 import threading
 from dataclasses import dataclass
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from azure.core.credentials import TokenCredential
-from azure.identity import (InteractiveBrowserCredential, TokenCachePersistenceOptions, )
-from azure.mgmt.resource.subscriptions import SubscriptionClient
+from .credentials import CachingCredential
+
+if TYPE_CHECKING:
+    from azure.core.credentials import TokenCredential
+    from azure.identity import InteractiveBrowserCredential
+    from azure.mgmt.resource.subscriptions import SubscriptionClient
 
 __all__ = ["AzureSession", "create_azure_session", "get_session", "clear_session_cache"]
 
 ARM_SCOPE = "https://management.azure.com/.default"
 MSA_CONSUMERS_TENANT = "9188040d-6c67-4c5b-b112-36a304b66dad"
+_GUID_RE = re.compile(r"^[0-9a-fA-F]{8}-(?:[0-9a-fA-F]{4}-){3}[0-9a-fA-F]{12}$")
 
 _SESSION_LOCK = threading.Lock()
 _SESSION: Optional["AzureSession"] = None
@@ -39,10 +44,12 @@ def _jwt_tid(access_token: str) -> Optional[str]:
 
 @dataclass(slots=True)
 class AzureSession:
-    credential: InteractiveBrowserCredential | TokenCredential
+    credential: CachingCredential | InteractiveBrowserCredential | TokenCredential
     tenant_id: str
 
     def subscriptions_client(self) -> SubscriptionClient:
+        from azure.mgmt.resource.subscriptions import SubscriptionClient
+
         return SubscriptionClient(credential=self.credential)
 
     def list_subscriptions(self) -> list[tuple[str, str]]:
@@ -55,10 +62,21 @@ class AzureSession:
 
 
 def create_azure_session(preferred_tenant: Optional[str] = None, *, use_persistent_cache: bool = True, allow_unencrypted_cache: bool = False, ) -> AzureSession:
+    from azure.identity import InteractiveBrowserCredential, TokenCachePersistenceOptions
+    from azure.mgmt.resource.subscriptions import SubscriptionClient
+
     cache_opts = TokenCachePersistenceOptions(enabled=use_persistent_cache, allow_unencrypted_storage=allow_unencrypted_cache, name="azure_identity_tokens", )
 
-    # Acquire ONE token to discover tenant
-    base_cred = InteractiveBrowserCredential(tenant_id=preferred_tenant or "organizations", token_cache_persistence_options=cache_opts, additionally_allowed_tenants=["*"], )
+    # Every client shares this wrapper, so the ARM token is fetched once
+    # and refreshed ahead of expiry off the request path.
+    base_cred = CachingCredential(
+        InteractiveBrowserCredential(tenant_id=preferred_tenant or "organizations", token_cache_persistence_options=cache_opts, additionally_allowed_tenants=["*"], )
+    )
+    if preferred_tenant and _GUID_RE.match(preferred_tenant) and preferred_tenant.lower() != MSA_CONSUMERS_TENANT:
+        # Tenant already known: the first ARM call prompts instead.
+        return AzureSession(credential=base_cred, tenant_id=preferred_tenant)
+
+    # Acquire ONE token to discover tenant; the clients reuse it from the cache.
     token = base_cred.get_token(ARM_SCOPE)  # single prompt happens here
     tid = _jwt_tid(token.token) or ""
 
@@ -1,13 +1,15 @@
 # src/optiv_lib/providers/azure/objects/threads.py
 from __future__ import annotations
 
+import heapq
+import itertools
 import random
 import threading
 import time
-from concurrent.futures import Future, ThreadPoolExecutor, as_completed
-from typing import Callable, Iterable, Sequence, TypeVar
-
-from azure.core.exceptions import HttpResponseError, ServiceRequestError, ServiceResponseError
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, CancelledError, Future, ThreadPoolExecutor, as_completed, wait
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence, TypeVar
 
 T = TypeVar("T")
 R = TypeVar("R")
@@ -16,11 +18,44 @@ R = TypeVar("R")
 # Global concurrency controls
 # ----------------------------
 _GLOBAL_MAX_WORKERS = 32
-_GLOBAL_EXECUTOR = ThreadPoolExecutor(max_workers=_GLOBAL_MAX_WORKERS)
+# Threads outnumber slots: a thread waiting out a throttle delay gives its
+# slot back (slot_released), and another thread can use it meanwhile.
+_GLOBAL_MAX_THREADS = _GLOBAL_MAX_WORKERS * 2
+_GLOBAL_EXECUTOR: Optional[ThreadPoolExecutor] = None
 _GLOBAL_SEMAPHORE = threading.Semaphore(_GLOBAL_MAX_WORKERS)
+_EXECUTOR_LOCK = threading.Lock()
+_LOCAL = threading.local()
+
+
+def _executor() -> ThreadPoolExecutor:
+    """Global executor, created on first submit (and again after shutdown_threads)."""
+    global _GLOBAL_EXECUTOR
+    if _GLOBAL_EXECUTOR is None:
+        with _EXECUTOR_LOCK:
+            if _GLOBAL_EXECUTOR is None:
+                _GLOBAL_EXECUTOR = ThreadPoolExecutor(max_workers=_GLOBAL_MAX_THREADS, thread_name_prefix="optiv-azure")
+    return _GLOBAL_EXECUTOR
+
+
+@contextmanager
+def slot_released() -> Iterator[None]:
+    """Give the calling thread's global slot back for the duration; no-op if it holds none."""
+    if not getattr(_LOCAL, "held", False):
+        yield
+        return
+    _LOCAL.held = False
+    _GLOBAL_SEMAPHORE.release()
+    try:
+        yield
+    finally:
+        _GLOBAL_SEMAPHORE.acquire()
+        _LOCAL.held = True
+
 
+def default_retry_if(exc: BaseException) -> bool:
+    """Retry transport errors and 408/429/502/503/504 responses."""
+    from azure.core.exceptions import HttpResponseError, ServiceRequestError, ServiceResponseError
 
-def _default_retry_if(exc: BaseException) -> bool:
     if isinstance(exc, (ServiceRequestError, ServiceResponseError)):
         return True
     if isinstance(exc, HttpResponseError):
@@ -28,7 +63,8 @@ def _default_retry_if(exc: BaseException) -> bool:
     return False
 
 
-def _retry_after_seconds(exc: HttpResponseError, fallback: float) -> float:
+def retry_after_seconds(exc: BaseException, fallback: float) -> float:
+    """Retry-After (or Retry-After-Ms) of an HttpResponseError, never below `fallback`."""
     try:
         headers = getattr(exc, "response", None).headers  # type: ignore[attr-defined]
         if headers:
@@ -43,57 +79,307 @@ def _retry_after_seconds(exc: HttpResponseError, fallback: float) -> float:
     return fallback
 
 
-def _retry_call(func: Callable[[T], R], arg: T, *, retries: int, base_delay: float, backoff: float, max_delay: float, retry_if: Callable[[BaseException], bool], ) -> R:
-    attempt = 0
-    delay = max(0.0, base_delay)
+# ----------------------------
+# Scheduler
+# ----------------------------
+
+class _Job:
+    __slots__ = ("func", "arg", "future", "scope", "retries", "delay", "backoff", "max_delay", "retry_if", "attempt", "claimed", "started", "cancelled",
+                 "waiter")
+
+    def __init__(self, func: Callable[[Any], Any], arg: Any, *, scope: Optional[str], retries: int, base_delay: float, backoff: float, max_delay: float,
+            retry_if: Callable[[BaseException], bool]) -> None:
+        self.func = func
+        self.arg = arg
+        self.future: Future[Any] = Future()
+        self.scope = scope
+        self.retries = retries
+        self.delay = max(0.0, base_delay)
+        self.backoff = max(1.0, backoff)
+        self.max_delay = max_delay
+        self.retry_if = retry_if
+        self.attempt = 0
+        self.claimed = False  # an attempt is running or waiting on the delay queue
+        self.started = False
+        self.cancelled = False
+        self.waiter: Optional[threading.Event] = None  # set by a parent waiting in _wait_jobs
 
-    while True:
-        _GLOBAL_SEMAPHORE.acquire()
-        try:
-            return func(arg)
-        except BaseException as exc:
-            attempt += 1
-            if attempt > retries or not retry_if(exc):
-                raise
-            sleep_for = delay
-            if isinstance(exc, HttpResponseError) and getattr(exc, "status_code", None) in (408, 429, 502, 503, 504):
-                sleep_for = _retry_after_seconds(exc, fallback=delay)
-            # jitter: +/-25% to avoid synchronized retries
-            jitter = random.uniform(-0.25 * sleep_for, 0.25 * sleep_for)
-            time.sleep(max(0.0, min(max_delay, sleep_for + jitter)))
-            delay = min(max_delay, delay * max(1.0, backoff))
-        finally:
-            _GLOBAL_SEMAPHORE.release()
-
-
-def _submit_with_retry(func: Callable[[T], R], arg: T, *, retries: int, base_delay: float, backoff: float, max_delay: float, retry_if: Callable[[BaseException], bool], ) -> Future[
-    R]:
-    return _GLOBAL_EXECUTOR.submit(_retry_call, func, arg, retries=retries, base_delay=base_delay, backoff=backoff, max_delay=max_delay, retry_if=retry_if, )
+    def cancel(self) -> None:
+        """Stop before the next attempt; an attempt already running finishes."""
+        self.cancelled = True
+        self.future.cancel()
+        self.wake()
+
+    def wake(self) -> None:
+        waiter = self.waiter
+        if waiter is not None:
+            waiter.set()
+
+
+class _DelayQueue:
+    """One timer thread that hands jobs back to the executor when their delay expires."""
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[float, int, _Job]] = []
+        self._cv = threading.Condition()
+        self._seq = itertools.count()
+        self._thread: Optional[threading.Thread] = None
+
+    def push(self, delay: float, job: _Job) -> None:
+        with self._cv:
+            heapq.heappush(self._heap, (time.monotonic() + delay, next(self._seq), job))
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._loop, name="optiv-azure-delay", daemon=True)
+                self._thread.start()
+            self._cv.notify()
+
+    def _loop(self) -> None:
+        while True:
+            with self._cv:
+                while not self._heap or self._heap[0][0] > time.monotonic():
+                    self._cv.wait(None if not self._heap else self._heap[0][0] - time.monotonic())
+                _, _, job = heapq.heappop(self._heap)
+            _release(job)
+
+    def drain(self) -> list[_Job]:
+        with self._cv:
+            jobs = [j for _, _, j in self._heap]
+            self._heap.clear()
+        return jobs
+
+
+_DELAYED = _DelayQueue()
+_CLAIM_LOCK = threading.Lock()
+
+
+def _attempt(job: _Job) -> None:
+    """Next attempt. Whoever claims the job first runs it: a pool thread or a waiting parent."""
+    with _CLAIM_LOCK:
+        if job.claimed:
+            return
+        job.claimed = True
+        first, job.started = not job.started, True
+    if first and not job.future.set_running_or_notify_cancel():
+        job.wake()
+        return
+    _run(job)
+
+
+def _release(job: _Job) -> None:
+    """A delayed job is due: hand it to the pool, and to its waiting parent if there is one."""
+    with _CLAIM_LOCK:
+        job.claimed = False
+    job.wake()
+    _executor().submit(_attempt, job)
+
+
+def _run(job: _Job) -> None:
+    """
+    One attempt. The global slot is held only while func runs: throttle
+    delays and retry backoff put the job back on the delay queue instead of
+    sleeping in a worker.
+    """
+    from azure.core.exceptions import HttpResponseError
+
+    from .throttle import TRACKER
+
+    fut = job.future
+    if job.cancelled:
+        if not fut.done():
+            fut.set_exception(CancelledError())
+        job.wake()
+        return
+
+    wait = TRACKER.delay_for(job.scope)
+    if wait > 0:
+        _DELAYED.push(wait, job)
+        return
+
+    _GLOBAL_SEMAPHORE.acquire()
+    _LOCAL.held = True
+    try:
+        result = job.func(job.arg)
+    except BaseException as exc:
+        error: Optional[BaseException] = exc
+    else:
+        error = None
+    finally:
+        _LOCAL.held = False
+        _GLOBAL_SEMAPHORE.release()
+
+    if error is None:
+        fut.set_result(result)
+        job.wake()
+        return
+    job.attempt += 1
+    if job.attempt > job.retries or not job.retry_if(error):
+        fut.set_exception(error)
+        job.wake()
+        return
+    sleep_for = job.delay
+    if isinstance(error, HttpResponseError) and getattr(error, "status_code", None) in (408, 429, 502, 503, 504):
+        sleep_for = retry_after_seconds(error, fallback=job.delay)
+    # jitter: +/-25% to avoid synchronized retries
+    jitter = random.uniform(-0.25 * sleep_for, 0.25 * sleep_for)
+    job.delay = min(job.max_delay, job.delay * job.backoff)
+    _DELAYED.push(max(0.0, min(job.max_delay, sleep_for + jitter)), job)
+
+
+def _default_scope(item: Any) -> Optional[str]:
+    """Subscription GUID for pacing: the item itself, or a resource ID on it."""
+    from .throttle import subscription_of
+
+    return subscription_of(item if isinstance(item, str) else getattr(item, "id", None))
+
+
+def _submit_job(func: Callable[[T], R], arg: T, *, retries: int, base_delay: float, backoff: float, max_delay: float, retry_if: Callable[[BaseException], bool],
+        scope: Optional[str] = None, ) -> _Job:
+    job = _Job(func, arg, scope=scope, retries=retries, base_delay=base_delay, backoff=backoff, max_delay=max_delay, retry_if=retry_if)
+    _executor().submit(_attempt, job)
+    return job
+
+
+def _wait_jobs(jobs: Sequence[_Job], *, first: bool = False) -> None:
+    """
+    Wait for all jobs (or the first, with first=True).
+
+    Called from inside a pool task (the thread holds a slot), the waiter
+    gives its slot back and runs its own jobs inline whenever one is ready:
+    not yet started, or due again after a throttle or retry delay. Nested
+    fan-out therefore always makes progress, even when every pool thread is
+    a waiting parent.
+    """
+    futures = [j.future for j in jobs]
+    if not getattr(_LOCAL, "held", False):
+        wait(futures, return_when=FIRST_COMPLETED if first else ALL_COMPLETED)
+        return
+
+    def finished() -> bool:
+        return any(f.done() for f in futures) if first else all(f.done() for f in futures)
+
+    ready = threading.Event()
+    for job in jobs:
+        job.waiter = ready
+    try:
+        with slot_released():
+            while True:
+                ready.clear()
+                for job in jobs:
+                    if finished():
+                        return
+                    if not job.claimed:
+                        _attempt(job)
+                if finished():
+                    return
+                ready.wait()
+    finally:
+        for job in jobs:
+            if job.waiter is ready:
+                job.waiter = None
+
+
+# ----------------------------
+# Structured fan-out
+# ----------------------------
+
+class TaskGroup:
+    """
+    A set of tasks on the global pool, awaited together; nests to any depth.
+
+    All levels share the one global concurrency budget. A parent waiting on
+    its group (exit, wait(), results()) releases its slot and runs its own
+    queued children inline, so crawls can fan out per subscription, then per
+    vnet, then per subnet, without starving the pool or deadlocking.
+
+    Leaving the block waits for every task; if the block raised, tasks not yet
+    started are cancelled first.
+
+    Example:
+        def per_sub(sub_id):
+            vnets = list(network_client(sub_id).virtual_networks.list_all())
+            with TaskGroup() as g:
+                for v in vnets:
+                    g.submit(list_vnet_subnets, v)
+            return [s for r in g.results(raise_errors=True) for s in r]
+
+        subnets = thread_map_flat(per_sub, sub_ids)
+    """
+
+    def __init__(self, *, retries: int = 2, base_delay: float = 0.5, backoff: float = 2.0, max_delay: float = 8.0,
+            retry_if: Callable[[BaseException], bool] | None = None, scope_of: Callable[[Any], Optional[str]] | None = None, ) -> None:
+        self._opts = dict(retries=retries, base_delay=base_delay, backoff=backoff, max_delay=max_delay, retry_if=retry_if or default_retry_if)
+        self._scope_of = scope_of or _default_scope
+        self._jobs: list[_Job] = []
+
+    def submit(self, func: Callable[[T], R], item: T, *, scope: Optional[str] = None) -> Future[R]:
+        """Queue func(item). scope overrides scope_of for this item."""
+        job = _submit_job(func, item, scope=scope if scope is not None else self._scope_of(item), **self._opts)  # type: ignore[arg-type]
+        self._jobs.append(job)
+        return job.future
+
+    def wait(self) -> None:
+        """Block until every submitted task has finished (helping from inside pool tasks)."""
+        _wait_jobs(self._jobs)
+
+    def cancel(self) -> None:
+        """Cancel tasks that have not started; running attempts finish."""
+        for job in self._jobs:
+            job.cancel()
+
+    def results(self, *, raise_errors: bool = False) -> list[Any]:
+        """Results in submission order; failures as TaskError unless raise_errors."""
+        self.wait()
+        out: list[Any] = []
+        for job in self._jobs:
+            try:
+                out.append(job.future.result())
+            except BaseException as exc:
+                if raise_errors:
+                    raise
+                out.append(TaskError(job.arg, exc))
+        return out
+
+    def __enter__(self) -> "TaskGroup":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        if exc_type is not None:
+            self.cancel()
+        self.wait()
 
 
 def thread_map(func: Callable[[T], R], items: Sequence[T], max_workers: int | None = None,  # retained for API compat; global 32-cap enforced
         ignore_errors: bool = True, *, retries: int = 2, base_delay: float = 0.5, backoff: float = 2.0, max_delay: float = 8.0,
-        retry_if: Callable[[BaseException], bool] | None = None, ) -> list[R]:
+        retry_if: Callable[[BaseException], bool] | None = None, scope_of: Callable[[T], Optional[str]] | None = None, ) -> list[R]:
+    """
+    Run func over items on the global pool; results in item order.
+
+    scope_of maps an item to the subscription its calls hit (default: the
+    item if it is a subscription GUID, or the subscription in its resource
+    ID). Items are paced against ARM rate-limit headers for that
+    subscription and the tenant; throttled and retrying items wait off-slot.
+    Safe to call from inside another thread_map task (see TaskGroup).
+    """
     if not items:
         return []
-    predicate = retry_if or _default_retry_if
-    futures = [_submit_with_retry(func, it, retries=retries, base_delay=base_delay, backoff=backoff, max_delay=max_delay, retry_if=predicate, ) for it in items]
+    with TaskGroup(retries=retries, base_delay=base_delay, backoff=backoff, max_delay=max_delay, retry_if=retry_if, scope_of=scope_of) as group:
+        for it in items:
+            group.submit(func, it)
     results: list[R] = []
-    for fut in as_completed(futures):
-        if ignore_errors:
-            try:
-                results.append(fut.result())
-            except BaseException:
-                pass
-        else:
-            results.append(fut.result())
+    for r in group.results():
+        if isinstance(r, TaskError):
+            if not ignore_errors:
+                raise r.error
+            continue
+        results.append(r)
     return results
 
 
 def thread_map_flat(func: Callable[[T], Iterable[R]], items: Sequence[T], max_workers: int | None = None, ignore_errors: bool = True, *, retries: int = 2, base_delay: float = 0.5,
-        backoff: float = 2.0, max_delay: float = 8.0, retry_if: Callable[[BaseException], bool] | None = None, ) -> list[R]:
+        backoff: float = 2.0, max_delay: float = 8.0, retry_if: Callable[[BaseException], bool] | None = None,
+        scope_of: Callable[[T], Optional[str]] | None = None, ) -> list[R]:
     chunks = thread_map(func, items, max_workers=max_workers, ignore_errors=ignore_errors, retries=retries, base_delay=base_delay, backoff=backoff, max_delay=max_delay,
-        retry_if=retry_if, )
+        retry_if=retry_if, scope_of=scope_of, )
     out: list[R] = []
     for c in chunks:
         if c is None:
@@ -102,6 +388,94 @@ def thread_map_flat(func: Callable[[T], Iterable[R]], items: Sequence[T], max_wo
     return out
 
 
+# ----------------------------
+# Streaming
+# ----------------------------
+
+@dataclass(slots=True, frozen=True)
+class TaskError:
+    """Yielded by thread_imap in place of a result when func(item) failed (after retries)."""
+    item: Any
+    error: BaseException
+
+
+def thread_imap(func: Callable[[T], R], items: Iterable[T], *, max_in_flight: int | None = None, raise_errors: bool = False, retries: int = 2, base_delay: float = 0.5,
+        backoff: float = 2.0, max_delay: float = 8.0, retry_if: Callable[[BaseException], bool] | None = None,
+        scope_of: Callable[[T], Optional[str]] | None = None, ) -> Iterator[R | TaskError]:
+    """
+    Like thread_map, but a generator: results are yielded as they complete.
+
+    `items` is consumed lazily, with at most `max_in_flight` items submitted
+    and not yet yielded (default: twice the global worker cap), so a slow
+    consumer applies backpressure. Failed items yield a TaskError unless
+    `raise_errors` is set. Closing the generator (break, exception, garbage
+    collection) cancels everything not yet started.
+
+    Example:
+        for r in thread_imap(fetch, sub_ids):
+            if isinstance(r, TaskError):
+                log.warning("%s: %s", r.item, r.error)
+            else:
+                store(r)
+    """
+    limit = max(1, max_in_flight or _GLOBAL_MAX_WORKERS * 2)
+    predicate = retry_if or default_retry_if
+    scope_fn = scope_of or _default_scope
+    source = iter(items)
+    pending: dict[Future[Any], tuple[Any, _Job]] = {}
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(pending) < limit:
+                try:
+                    item = next(source)
+                except StopIteration:
+                    exhausted = True
+                    break
+                job = _submit_job(func, item, retries=retries, base_delay=base_delay, backoff=backoff, max_delay=max_delay, retry_if=predicate, scope=scope_fn(item))
+                pending[job.future] = (item, job)
+            if not pending:
+                return
+            _wait_jobs([job for _item, job in pending.values()], first=True)
+            done = [f for f in pending if f.done()]
+            for fut in done:
+                item, _job = pending.pop(fut)
+                try:
+                    result = fut.result()
+                except BaseException as exc:
+                    if raise_errors:
+                        raise
+                    yield TaskError(item, exc)
+                else:
+                    yield result
+    finally:
+        for _item, job in pending.values():
+            job.cancel()
+
+
+def thread_imap_flat(func: Callable[[T], Iterable[R]], items: Iterable[T], *, max_in_flight: int | None = None, raise_errors: bool = False, retries: int = 2,
+        base_delay: float = 0.5, backoff: float = 2.0, max_delay: float = 8.0, retry_if: Callable[[BaseException], bool] | None = None,
+        scope_of: Callable[[T], Optional[str]] | None = None, ) -> Iterator[R | TaskError]:
+    """thread_imap for functions returning iterables; yields their elements (and TaskErrors)."""
+    for chunk in thread_imap(func, items, max_in_flight=max_in_flight, raise_errors=raise_errors, retries=retries, base_delay=base_delay, backoff=backoff,
+            max_delay=max_delay, retry_if=retry_if, scope_of=scope_of):
+        if isinstance(chunk, TaskError):
+            yield chunk
+        elif chunk is not None:
+            yield from chunk
+
+
 def shutdown_threads(wait: bool = True) -> None:
-    """Gracefully shut down the global executor."""
-    _GLOBAL_EXECUTOR.shutdown(wait=wait, cancel_futures=not wait)
+    """
+    Gracefully shut down the global executor. Jobs waiting on a throttle or
+    retry delay are cancelled. A later submit starts a fresh executor.
+    """
+    global _GLOBAL_EXECUTOR
+    with _EXECUTOR_LOCK:
+        executor, _GLOBAL_EXECUTOR = _GLOBAL_EXECUTOR, None
+    for job in _DELAYED.drain():
+        if not job.future.done():
+            job.future.set_exception(CancelledError())
+        job.wake()
+    if executor is not None:
+        executor.shutdown(wait=wait, cancel_futures=not wait)
@@ -0,0 +1,217 @@
+# src/optiv_lib/providers/azure/throttle.py
+from __future__ import annotations
+
+import asyncio
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Mapping, Optional, Tuple
+
+from azure.core.pipeline import PipelineRequest, PipelineResponse
+from azure.core.pipeline.policies import SansIOHTTPPolicy
+
+__all__ = ["RateLimitTracker", "RateLimitPolicy", "AsyncRateLimitPolicy", "TRACKER", "TENANT", "subscription_of"]
+
+TENANT = "tenant"
+_HEADER_PREFIX = "x-ms-ratelimit-remaining-"
+_SUB_RE = re.compile(r"/subscriptions/([0-9a-fA-F-]{36})(?:/|$)")
+_GUID_RE = re.compile(r"^[0-9a-fA-F]{8}-(?:[0-9a-fA-F]{4}-){3}[0-9a-fA-F]{12}$")
+
+
+def subscription_of(value: object) -> Optional[str]:
+    """Subscription GUID from a GUID string or any ARM URL / resource ID; else None."""
+    if not isinstance(value, str):
+        return None
+    if _GUID_RE.match(value):
+        return value.lower()
+    m = _SUB_RE.search(value)
+    return m.group(1).lower() if m else None
+
+
+def _operation(method: str) -> str:
+    m = method.upper()
+    if m in ("GET", "HEAD"):
+        return "reads"
+    if m == "DELETE":
+        return "deletes"
+    return "writes"
+
+
+@dataclass(slots=True)
+class _Bucket:
+    """Last reported remaining count for one (scope, operation), plus local spend since."""
+    remaining: int
+    observed_at: float
+    spent: int = 0
+
+
+@dataclass(slots=True)
+class _ScopeState:
+    buckets: Dict[str, _Bucket] = field(default_factory=dict)
+    blocked_until: float = 0.0
+
+
+class RateLimitTracker:
+    """
+    ARM throttling state per subscription and for the tenant.
+
+    Every response's x-ms-ratelimit-remaining-* headers update a local
+    estimate: tokens = reported + refill × elapsed − requests sent since the
+    report. delay_for() returns how long to wait so the estimate stays above
+    `reserve`; a 429's Retry-After blocks the scope outright until it
+    expires. `refill_per_second` is deliberately conservative; the next
+    response corrects the estimate either way.
+
+    One tracker per process (TRACKER), matching the single-tenant session.
+    """
+
+    def __init__(self, *, reserve: int = 25, refill_per_second: float = 4.0) -> None:
+        self.reserve = reserve
+        self.refill_per_second = refill_per_second
+        self._lock = threading.Lock()
+        self._scopes: Dict[str, _ScopeState] = {}
+
+    def _state(self, scope: str) -> _ScopeState:
+        st = self._scopes.get(scope)
+        if st is None:
+            st = self._scopes[scope] = _ScopeState()
+        return st
+
+    def observe(self, subscription: Optional[str], method: str, headers: Mapping[str, str]) -> None:
+        """Record rate-limit headers from one ARM response."""
+        now = time.monotonic()
+        op = _operation(method)
+        with self._lock:
+            for k, v in headers.items():
+                lk = k.lower()
+                if not lk.startswith(_HEADER_PREFIX):
+                    continue
+                try:
+                    remaining = int(v)
+                except ValueError:
+                    continue
+                kind = lk[len(_HEADER_PREFIX):]  # e.g. subscription-reads, tenant-resource-requests
+                if kind.startswith("tenant"):
+                    scope = TENANT
+                elif subscription is not None:
+                    scope = subscription
+                else:
+                    continue
+                for suffix in ("reads", "writes", "deletes"):
+                    if kind.endswith(suffix):
+                        bucket_op = suffix
+                        break
+                else:
+                    bucket_op = op  # resource-requests and other per-provider counters
+                self._state(scope).buckets[bucket_op] = _Bucket(remaining, now)
+
+    def block(self, scope: str, seconds: float) -> None:
+        """Hold all calls for `scope` (a subscription or TENANT) for `seconds`."""
+        until = time.monotonic() + max(0.0, seconds)
+        with self._lock:
+            st = self._state(scope)
+            st.blocked_until = max(st.blocked_until, until)
+
+    def _scope_delay(self, scope: str, op: str, now: float) -> float:
+        st = self._scopes.get(scope)
+        if st is None:
+            return 0.0
+        delay = st.blocked_until - now
+        b = st.buckets.get(op)
+        if b is not None:
+            tokens = b.remaining + self.refill_per_second * (now - b.observed_at) - b.spent
+            if tokens - 1 < self.reserve and self.refill_per_second > 0:
+                delay = max(delay, (self.reserve + 1 - tokens) / self.refill_per_second)
+        return max(0.0, delay)
+
+    def delay_for(self, subscription: Optional[str], method: str = "GET") -> float:
+        """Seconds to wait before the next call against `subscription` (and the tenant)."""
+        op = _operation(method)
+        now = time.monotonic()
+        with self._lock:
+            scopes: Tuple[str, ...] = (TENANT,) if subscription is None else (subscription, TENANT)
+            return max(self._scope_delay(s, op, now) for s in scopes)
+
+    def spend(self, subscription: Optional[str], method: str = "GET") -> None:
+        """Count one request against the local estimate until the next report."""
+        op = _operation(method)
+        with self._lock:
+            for scope in ((TENANT,) if subscription is None else (subscription, TENANT)):
+                st = self._scopes.get(scope)
+                b = st.buckets.get(op) if st is not None else None
+                if b is not None:
+                    b.spent += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        """Last reported remaining counts per scope and operation (for logging)."""
+        with self._lock:
+            return {s: {op: b.remaining for op, b in st.buckets.items()} for s, st in self._scopes.items()}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._scopes.clear()
+
+
+TRACKER = RateLimitTracker()
+
+
+def _retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    for name, scale in (("retry-after-ms", 1000.0), ("x-ms-retry-after-ms", 1000.0), ("retry-after", 1.0)):
+        v = headers.get(name)
+        if v is not None:
+            try:
+                return float(v) / scale
+            except ValueError:
+                return None
+    return None
+
+
+class RateLimitPolicy(SansIOHTTPPolicy):
+    """
+    Per-retry pipeline policy feeding TRACKER.
+
+    Before each HTTP attempt it waits out the scope's delay with its global
+    concurrency slot released (threads.slot_released), so paced or blocked
+    calls do not hold up other subscriptions. Responses update the tracker;
+    a 429 blocks the subscription (or the tenant, for tenant-level calls)
+    for its Retry-After.
+    """
+
+    def __init__(self, tracker: RateLimitTracker = TRACKER) -> None:
+        self.tracker = tracker
+
+    def on_request(self, request: PipelineRequest) -> None:
+        from .threads import slot_released
+
+        http = request.http_request
+        sub = subscription_of(http.url)
+        delay = self.tracker.delay_for(sub, http.method)
+        while delay > 0:
+            with slot_released():
+                time.sleep(delay)
+            delay = self.tracker.delay_for(sub, http.method)
+        self.tracker.spend(sub, http.method)
+
+    def on_response(self, request: PipelineRequest, response: PipelineResponse) -> None:
+        http_req = request.http_request
+        http_resp = response.http_response
+        headers = {k.lower(): v for k, v in http_resp.headers.items()}
+        sub = subscription_of(http_req.url)
+        self.tracker.observe(sub, http_req.method, headers)
+        if http_resp.status_code == 429:
+            wait = _retry_after(headers)
+            self.tracker.block(sub or TENANT, wait if wait is not None else 5.0)
+
+
+class AsyncRateLimitPolicy(RateLimitPolicy):
+    """RateLimitPolicy for the aio clients: waits with asyncio.sleep instead of blocking the loop."""
+
+    async def on_request(self, request: PipelineRequest) -> None:  # type: ignore[override]
+        http = request.http_request
+        sub = subscription_of(http.url)
+        delay = self.tracker.delay_for(sub, http.method)
+        while delay > 0:
+            await asyncio.sleep(delay)
+            delay = self.tracker.delay_for(sub, http.method)
+        self.tracker.spend(sub, http.method)
@@ -0,0 +1,201 @@
+# src/optiv_lib/providers/azure/trie.py
+from __future__ import annotations
+
+import ipaddress
+from typing import Generic, Iterable, Iterator, List, Optional, Tuple, TypeVar, Union
+
+__all__ = ["PrefixTrie"]
+
+V = TypeVar("V")
+
+Address = Union[str, ipaddress.IPv4Address, ipaddress.IPv6Address]
+
+
+class _Node:
+    """Path-compressed node: `key` holds the first `length` bits (left-aligned in the family width)."""
+    __slots__ = ("key", "length", "value", "has_value", "children")
+
+    def __init__(self, key: int, length: int) -> None:
+        self.key = key
+        self.length = length
+        self.value = None
+        self.has_value = False
+        self.children: List[Optional[_Node]] = [None, None]
+
+
+class _FamilyTrie:
+    __slots__ = ("width", "root", "size")
+
+    def __init__(self, width: int) -> None:
+        self.width = width
+        self.root = _Node(0, 0)
+        self.size = 0
+
+    def _bit(self, key: int, pos: int) -> int:
+        return (key >> (self.width - 1 - pos)) & 1
+
+    def _common(self, a: int, b: int, limit: int) -> int:
+        x = a ^ b
+        return limit if x == 0 else min(limit, self.width - x.bit_length())
+
+    def insert(self, key: int, length: int, value: object) -> None:
+        node = self.root
+        while True:
+            if length == node.length:
+                if not node.has_value:
+                    self.size += 1
+                node.value, node.has_value = value, True
+                return
+            bit = self._bit(key, node.length)
+            child = node.children[bit]
+            if child is None:
+                leaf = node.children[bit] = _Node(key, length)
+                leaf.value, leaf.has_value = value, True
+                self.size += 1
+                return
+            cpl = self._common(key, child.key, min(length, child.length))
+            if cpl == child.length:
+                node = child
+                continue
+            # Split the edge at the first differing bit (or where the new prefix ends).
+            mid = _Node(key & ~((1 << (self.width - cpl)) - 1), cpl)
+            mid.children[self._bit(child.key, cpl)] = child
+            node.children[bit] = mid
+            if cpl == length:
+                mid.value, mid.has_value = value, True
+            else:
+                leaf = mid.children[self._bit(key, cpl)] = _Node(key, length)
+                leaf.value, leaf.has_value = value, True
+            self.size += 1
+            return
+
+    def lookup(self, addr: int) -> Optional[_Node]:
+        node: Optional[_Node] = self.root
+        best = self.root if self.root.has_value else None
+        width = self.width
+        while node is not None:
+            if node.length and (addr ^ node.key) >> (width - node.length):
+                break
+            if node.has_value:
+                best = node
+            if node.length == width:
+                break
+            node = node.children[(addr >> (width - 1 - node.length)) & 1]
+        return best
+
+    def matches(self, addr: int) -> List[_Node]:
+        """Every valued node containing addr, least specific first."""
+        out: List[_Node] = []
+        node: Optional[_Node] = self.root
+        width = self.width
+        while node is not None:
+            if node.length and (addr ^ node.key) >> (width - node.length):
+                break
+            if node.has_value:
+                out.append(node)
+            if node.length == width:
+                break
+            node = node.children[(addr >> (width - 1 - node.length)) & 1]
+        return out
+
+    def find(self, key: int, length: int) -> Optional[_Node]:
+        """Node holding exactly key/length, or None."""
+        node: Optional[_Node] = self.root
+        while node is not None and node.length <= length:
+            if node.length and (key ^ node.key) >> (self.width - node.length):
+                return None
+            if node.length == length:
+                return node if node.has_value else None
+            node = node.children[self._bit(key, node.length)]
+        return None
+
+    def items(self) -> Iterator[_Node]:
+        stack = [self.root]
+        while stack:
+            n = stack.pop()
+            if n.has_value:
+                yield n
+            stack.extend(c for c in n.children if c is not None)
+
+
+class PrefixTrie(Generic[V]):
+    """
+    Binary radix (path-compressed) trie keyed by IPv4/IPv6 prefixes, for
+    longest-prefix match. Lookups walk at most one node per branching bit,
+    independent of how many prefixes are stored.
+
+    Example:
+        t = PrefixTrie()
+        t.insert("10.0.0.0/8", "a"); t.insert("10.1.0.0/16", "b")
+        t.lookup("10.1.2.3")  # ("10.1.0.0/16", "b")
+    """
+
+    def __init__(self, items: Iterable[Tuple[str, V]] = ()) -> None:
+        self._v4 = _FamilyTrie(32)
+        self._v6 = _FamilyTrie(128)
+        for prefix, value in items:
+            self.insert(prefix, value)
+
+    def insert(self, prefix: str, value: V) -> None:
+        """Add or replace a prefix. Host bits are ignored; raises ValueError if not a prefix."""
+        net = ipaddress.ip_network(prefix.strip(), strict=False)
+        fam = self._v4 if net.version == 4 else self._v6
+        fam.insert(int(net.network_address), net.prefixlen, value)
+
+    @staticmethod
+    def _addr(address: Address) -> Tuple[int, int]:
+        ip = address if isinstance(address, (ipaddress.IPv4Address, ipaddress.IPv6Address)) else ipaddress.ip_address(address)
+        return ip.version, int(ip)
+
+    def _prefix(self, version: int, node: _Node) -> str:
+        cls = ipaddress.IPv4Network if version == 4 else ipaddress.IPv6Network
+        return str(cls((node.key, node.length)))
+
+    def lookup(self, address: Address) -> Optional[Tuple[str, V]]:
+        """(matched prefix, value) for the longest prefix containing `address`, or None."""
+        version, addr = self._addr(address)
+        node = (self._v4 if version == 4 else self._v6).lookup(addr)
+        if node is None:
+            return None
+        return self._prefix(version, node), node.value  # type: ignore[return-value]
+
+    def lookup_all(self, address: Address) -> List[Tuple[str, V]]:
+        """Every (prefix, value) containing `address`, most specific first."""
+        version, addr = self._addr(address)
+        nodes = (self._v4 if version == 4 else self._v6).matches(addr)
+        return [(self._prefix(version, n), n.value) for n in reversed(nodes)]  # type: ignore[misc]
+
+    def lookup_value(self, address: Address) -> Optional[V]:
+        """Value of the longest match only (skips building the prefix string)."""
+        version, addr = self._addr(address)
+        node = (self._v4 if version == 4 else self._v6).lookup(addr)
+        return node.value if node is not None else None  # type: ignore[return-value]
+
+    def lookup_many(self, addresses: Iterable[Address]) -> List[Optional[V]]:
+        """lookup_value over a batch; repeated addresses are resolved once."""
+        memo: dict = {}
+        out: List[Optional[V]] = []
+        for a in addresses:
+            if a in memo:
+                out.append(memo[a])
+            else:
+                out.append(memo.setdefault(a, self.lookup_value(a)))
+        return out
+
+    def items(self) -> Iterator[Tuple[str, V]]:
+        for version, fam in ((4, self._v4), (6, self._v6)):
+            for node in fam.items():
+                yield self._prefix(version, node), node.value  # type: ignore[misc]
+
+    def __len__(self) -> int:
+        return self._v4.size + self._v6.size
+
+    def get(self, prefix: str, default: Optional[V] = None) -> Optional[V]:
+        """Value stored for exactly `prefix` (no longest-match)."""
+        net = ipaddress.ip_network(prefix.strip(), strict=False)
+        node = (self._v4 if net.version == 4 else self._v6).find(int(net.network_address), net.prefixlen)
+        return node.value if node is not None else default  # type: ignore[return-value]
+
+    def __contains__(self, prefix: str) -> bool:
+        net = ipaddress.ip_network(prefix.strip(), strict=False)
+        return (self._v4 if net.version == 4 else self._v6).find(int(net.network_address), net.prefixlen) is not None
@@ -1,36 +1,96 @@
 from __future__ import annotations
 
-# Re-export object APIs at provider level
-from .objects.address.api import (
-    list_addresses,
-    create_address,
-    update_address,
-    rename_address,
-    delete_address,
-)
-from .objects.url_category.api import (
-    list_predefined_url_categories,
-    list_url_categories,
-    create_url_category,
-    update_url_category,
-    rename_url_category,
-    delete_url_category,
-)
-
-__all__ = [
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, Tuple
+
+# Re-export object APIs at provider level. Modules are imported on first
+# attribute access so `import optiv_lib.providers.pan` stays cheap.
+_EXPORTS: Dict[str, Tuple[str, ...]] = {
 
     # Address APIs
-    "list_addresses",
-    "create_address",
-    "update_address",
-    "rename_address",
-    "delete_address",
+    ".objects.address.api": (
+        "list_addresses",
+        "create_address",
+        "update_address",
+        "rename_address",
+        "delete_address",
+    ),
+
+    # Address Group APIs
+    ".objects.address_group.api": (
+        "list_address_groups",
+        "create_address_group",
+        "update_address_group",
+        "rename_address_group",
+        "delete_address_group",
+    ),
+
+    # Security Rule APIs
+    ".objects.security_rule.api": (
+        "list_security_rules",
+        "create_security_rule",
+        "update_security_rule",
+        "rename_security_rule",
+        "delete_security_rule",
+        "move_security_rule",
+    ),
 
     # URL Category APIs
-    "list_predefined_url_categories",
-    "list_url_categories",
-    "create_url_category",
-    "update_url_category",
-    "rename_url_category",
-    "delete_url_category",
-]
+    ".objects.url_category.api": (
+        "list_predefined_url_categories",
+        "list_url_categories",
+        "create_url_category",
+        "update_url_category",
+        "rename_url_category",
+        "delete_url_category",
+    ),
+}
+
+_MODULE_OF: Dict[str, str] = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = list(_MODULE_OF)
+
+if TYPE_CHECKING:
+    from .objects.address.api import (
+        list_addresses,
+        create_address,
+        update_address,
+        rename_address,
+        delete_address,
+    )
+    from .objects.address_group.api import (
+        list_address_groups,
+        create_address_group,
+        update_address_group,
+        rename_address_group,
+        delete_address_group,
+    )
+    from .objects.security_rule.api import (
+        list_security_rules,
+        create_security_rule,
+        update_security_rule,
+        rename_security_rule,
+        delete_security_rule,
+        move_security_rule,
+    )
+    from .objects.url_category.api import (
+        list_predefined_url_categories,
+        list_url_categories,
+        create_url_category,
+        update_url_category,
+        rename_url_category,
+        delete_url_category,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULE_OF.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
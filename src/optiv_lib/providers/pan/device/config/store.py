@@ -0,0 +1,383 @@
+# src/optiv_lib/providers/pan/device/config/store.py
+from __future__ import annotations
+
+import hashlib
+import json
+import lzma
+import sqlite3
+import threading
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Literal, Optional, Tuple
+
+from optiv_lib.providers.pan.device.config.api import get_effective_running_config
+from optiv_lib.providers.pan.session import PanoramaSession
+from optiv_lib.providers.pan.util import split_xpath
+
+Codec = Literal["zlib", "lzma", "none"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    hash  TEXT PRIMARY KEY,
+    codec TEXT NOT NULL,
+    size  INTEGER NOT NULL,
+    data  BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS snapshots (
+    serial   TEXT NOT NULL,
+    taken_at TEXT NOT NULL,
+    root     TEXT NOT NULL,
+    PRIMARY KEY (serial, taken_at)
+);
+"""
+
+# Encoded node shapes (JSON):
+#   scalar             → "text" | null
+#   dict               → {"d": [[key, node], ...]}      (key order preserved)
+#   list               → {"l": [node, ...], "n": [@name | null, ...]}
+#   chunked list       → {"c": [[<sha256 of {"l": [...]}>, count], ...], "n": [...]}
+#   stored subtree ref → {"$": "<sha256>"}
+_REF = "$"
+_CHUNK_MIN_ITEMS = 64
+_CHUNK_AVG_ITEMS = 32
+_CHUNK_MAX_ITEMS = 256
+
+
+class ConfigStoreError(RuntimeError):
+    """Raised for missing snapshots or xpaths that do not resolve."""
+
+
+@dataclass(slots=True, frozen=True)
+class SnapshotInfo:
+    serial: str
+    taken_at: str
+    root: str
+    new_blobs: int = 0
+    new_bytes: int = 0
+
+
+def _ts(when: datetime | str | None) -> str:
+    if when is None:
+        when = datetime.now(timezone.utc)
+    if isinstance(when, str):
+        return when
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return when.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _dumps(node: Any) -> bytes:
+    return json.dumps(node, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _compress(raw: bytes, codec: Codec, level: int) -> bytes:
+    if codec == "zlib":
+        return zlib.compress(raw, level)
+    if codec == "lzma":
+        return lzma.compress(raw, preset=min(level, 9))
+    return raw
+
+
+def _decompress(data: bytes, codec: str) -> bytes:
+    if codec == "zlib":
+        return zlib.decompress(data)
+    if codec == "lzma":
+        return lzma.decompress(data)
+    if codec == "none":
+        return data
+    raise ConfigStoreError(f"unknown codec: {codec}")
+
+
+def _is_ref(node: Any) -> bool:
+    return isinstance(node, dict) and _REF in node
+
+
+class ConfigSnapshotStore:
+    """
+    Content-addressed, compressed store for device running configs.
+
+    Configs (parse_xml dicts) are split into subtrees; any encoded subtree of at
+    least `min_blob_bytes` is stored once by SHA-256 and referenced by hash, so
+    nightly snapshots that differ in a handful of rules share almost every blob.
+    Blobs and the (serial, timestamp) → root index live in one SQLite file.
+
+    Example:
+        store = ConfigSnapshotStore("configs.db")
+        store.put("0123456789", cfg)
+        store.open("0123456789").get("/config/devices/entry[@name='localhost.localdomain']/vsys")
+    """
+
+    def __init__(self, path: Path | str, *, codec: Codec = "zlib", level: int = 6, min_blob_bytes: int = 512, cache_size: int = 1024) -> None:
+        if codec not in ("zlib", "lzma", "none"):
+            raise ValueError(f"invalid codec: {codec}")
+        self.path = Path(path)
+        self.codec: Codec = codec
+        self.level = level
+        self.min_blob_bytes = min_blob_bytes
+        self._cache_size = cache_size
+        self._cache: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.RLock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self) -> "ConfigSnapshotStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ---------------------------
+    # Write
+    # ---------------------------
+
+    def put(self, serial: str, config: Dict[str, Any], *, taken_at: datetime | str | None = None) -> SnapshotInfo:
+        """Store one snapshot. `config` is the inner 'result' of a config/op call."""
+        ts = _ts(taken_at)
+        stats = [0, 0]
+        with self._lock, self._db:
+            root = self._store(self._encode(config, stats), stats)
+            self._db.execute("INSERT OR REPLACE INTO snapshots (serial, taken_at, root) VALUES (?, ?, ?)", (serial, ts, root))
+        return SnapshotInfo(serial=serial, taken_at=ts, root=root, new_blobs=stats[0], new_bytes=stats[1])
+
+    def _encode(self, node: Any, stats: List[int]) -> Any:
+        if isinstance(node, dict):
+            enc: Any = {"d": [[k, self._encode(v, stats)] for k, v in node.items()]}
+        elif isinstance(node, list):
+            names = [e.get("@name") if isinstance(e, dict) else None for e in node]
+            items = [self._encode(e, stats) for e in node]
+            enc = {"l": items, "n": names}
+            if len(items) > _CHUNK_MIN_ITEMS:
+                raw = _dumps(enc)
+                if len(raw) >= self.min_blob_bytes:
+                    enc = {"c": self._chunk(items, stats), "n": names}
+        else:
+            return None if node is None else str(node)
+        raw = _dumps(enc)
+        if len(raw) < self.min_blob_bytes:
+            return enc
+        return {_REF: self._store_raw(raw, stats)}
+
+    def _chunk(self, items: List[Any], stats: List[int]) -> List[List[Any]]:
+        # Content-defined boundaries: inserting one rule or address only rewrites
+        # the chunk it lands in, not every chunk after it.
+        chunks: List[List[Any]] = []
+        cur: List[Any] = []
+        for item in items:
+            cur.append(item)
+            if len(cur) >= _CHUNK_MAX_ITEMS or zlib.crc32(_dumps(item)) % _CHUNK_AVG_ITEMS == 0:
+                chunks.append([self._store_raw(_dumps({"l": cur}), stats), len(cur)])
+                cur = []
+        if cur:
+            chunks.append([self._store_raw(_dumps({"l": cur}), stats), len(cur)])
+        return chunks
+
+    def _store(self, enc: Any, stats: List[int]) -> str:
+        return enc[_REF] if _is_ref(enc) else self._store_raw(_dumps(enc), stats)
+
+    def _store_raw(self, raw: bytes, stats: List[int]) -> str:
+        digest = hashlib.sha256(raw).hexdigest()
+        data = _compress(raw, self.codec, self.level)
+        cur = self._db.execute("INSERT OR IGNORE INTO blobs (hash, codec, size, data) VALUES (?, ?, ?, ?)", (digest, self.codec, len(raw), data))
+        if cur.rowcount:
+            stats[0] += 1
+            stats[1] += len(data)
+        return digest
+
+    # ---------------------------
+    # Read
+    # ---------------------------
+
+    def snapshots(self, serial: str) -> List[SnapshotInfo]:
+        """Snapshots for a device, oldest first."""
+        with self._lock:
+            rows = self._db.execute("SELECT taken_at, root FROM snapshots WHERE serial = ? ORDER BY taken_at", (serial,)).fetchall()
+        return [SnapshotInfo(serial=serial, taken_at=t, root=r) for t, r in rows]
+
+    def serials(self) -> List[str]:
+        with self._lock:
+            return [r[0] for r in self._db.execute("SELECT DISTINCT serial FROM snapshots ORDER BY serial")]
+
+    def open(self, serial: str, taken_at: datetime | str | None = None) -> "ConfigSnapshot":
+        """Open a snapshot lazily; latest when taken_at is None."""
+        with self._lock:
+            if taken_at is None:
+                row = self._db.execute("SELECT taken_at, root FROM snapshots WHERE serial = ? ORDER BY taken_at DESC LIMIT 1", (serial,)).fetchone()
+            else:
+                ts = _ts(taken_at)
+                row = self._db.execute("SELECT taken_at, root FROM snapshots WHERE serial = ? AND taken_at = ?", (serial, ts)).fetchone()
+        if row is None:
+            raise ConfigStoreError(f"no snapshot for {serial} at {taken_at or 'latest'}")
+        return ConfigSnapshot(self, SnapshotInfo(serial=serial, taken_at=row[0], root=row[1]))
+
+    def load_blob(self, digest: str) -> Any:
+        with self._lock:
+            node = self._cache.get(digest)
+            if node is not None:
+                self._cache.move_to_end(digest)
+                return node
+            row = self._db.execute("SELECT codec, data FROM blobs WHERE hash = ?", (digest,)).fetchone()
+            if row is None:
+                raise ConfigStoreError(f"missing blob {digest}")
+            node = json.loads(_decompress(row[1], row[0]))
+            self._cache[digest] = node
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+            return node
+
+    # ---------------------------
+    # Maintenance
+    # ---------------------------
+
+    def delete(self, serial: str, *, before: datetime | str | None = None) -> int:
+        """Drop snapshot index rows (all, or older than `before`). Run gc() to reclaim blobs."""
+        with self._lock, self._db:
+            if before is None:
+                cur = self._db.execute("DELETE FROM snapshots WHERE serial = ?", (serial,))
+            else:
+                cur = self._db.execute("DELETE FROM snapshots WHERE serial = ? AND taken_at < ?", (serial, _ts(before)))
+            return cur.rowcount
+
+    def prune(self, *, keep_days: int = 30) -> int:
+        """Delete snapshots older than keep_days for every device, then gc(). Returns blobs removed."""
+        cutoff = datetime.now(timezone.utc) - timedelta(days=keep_days)
+        for serial in self.serials():
+            self.delete(serial, before=cutoff)
+        return self.gc()
+
+    def gc(self) -> int:
+        """Mark-and-sweep blobs unreachable from any snapshot. Returns blobs removed."""
+        with self._lock:
+            live: set[str] = set()
+            stack = [r[0] for r in self._db.execute("SELECT DISTINCT root FROM snapshots")]
+            while stack:
+                digest = stack.pop()
+                if digest in live:
+                    continue
+                live.add(digest)
+                stack.extend(_refs(self.load_blob(digest)))
+            dead = [r[0] for r in self._db.execute("SELECT hash FROM blobs") if r[0] not in live]
+            with self._db:
+                self._db.executemany("DELETE FROM blobs WHERE hash = ?", [(d,) for d in dead])
+            for d in dead:
+                self._cache.pop(d, None)
+            if dead:
+                self._db.execute("VACUUM")
+        return len(dead)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            blobs, raw, stored = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(LENGTH(data)), 0) FROM blobs").fetchone()
+            snaps = self._db.execute("SELECT COUNT(*) FROM snapshots").fetchone()[0]
+        return {"snapshots": snaps, "blobs": blobs, "raw_bytes": raw, "stored_bytes": stored}
+
+
+def _refs(node: Any) -> List[str]:
+    out: List[str] = []
+    stack = [node]
+    while stack:
+        n = stack.pop()
+        if not isinstance(n, dict):
+            continue
+        if _REF in n:
+            out.append(n[_REF])
+        elif "d" in n:
+            stack.extend(v for _, v in n["d"])
+        elif "c" in n:
+            out.extend(ref for ref, _ in n["c"])
+        else:
+            stack.extend(n["l"])
+    return out
+
+
+class ConfigSnapshot:
+    """Lazy view of one stored snapshot; only blobs along a requested xpath are read."""
+
+    __slots__ = ("_store", "info")
+
+    def __init__(self, store: ConfigSnapshotStore, info: SnapshotInfo) -> None:
+        self._store = store
+        self.info = info
+
+    def _deref(self, node: Any) -> Any:
+        while _is_ref(node):
+            node = self._store.load_blob(node[_REF])
+        return node
+
+    def _materialize(self, node: Any) -> Any:
+        node = self._deref(node)
+        if not isinstance(node, dict):
+            return node
+        if "d" in node:
+            return {k: self._materialize(v) for k, v in node["d"]}
+        if "c" in node:
+            return [self._materialize(e) for ref, _ in node["c"] for e in self._store.load_blob(ref)["l"]]
+        return [self._materialize(e) for e in node["l"]]
+
+    def _list_item(self, node: Dict[str, Any], index: int) -> Any:
+        if "l" in node:
+            return node["l"][index]
+        for ref, count in node["c"]:
+            if index < count:
+                return self._store.load_blob(ref)["l"][index]
+            index -= count
+        raise IndexError(index)
+
+    def _walk(self, steps: List[Tuple[str, Optional[str]]]) -> Any:
+        node = self._deref({_REF: self.info.root})
+        for tag, name in steps:
+            if not isinstance(node, dict) or "d" not in node:
+                return None
+            child = next((v for k, v in node["d"] if k == tag), None)
+            if child is None:
+                return None
+            child = self._deref(child)
+            if isinstance(child, dict) and "n" in child:
+                if name is None:
+                    node = child
+                    continue
+                try:
+                    child = self._deref(self._list_item(child, child["n"].index(name)))
+                except ValueError:
+                    return None
+            elif name is not None:
+                # Single entry not stored as a list (custom force_list).
+                if not isinstance(child, dict) or "d" not in child or dict(child["d"]).get("@name") != name:
+                    return None
+            node = child
+        return node
+
+    def get(self, xpath: str) -> Dict[str, Any]:
+        """
+        Materialize the subtree at `xpath` in config_get/config_show result shape,
+        e.g. {'address': {...}} or {'entry': [{...}]}, so object parsers accept it.
+        Raises ConfigStoreError when the xpath does not exist in this snapshot.
+        """
+        steps = split_xpath(xpath)
+        if not steps:
+            return self.to_dict()
+        node = self._walk(steps)
+        if node is None:
+            raise ConfigStoreError(f"xpath not found in {self.info.serial}@{self.info.taken_at}: {xpath}")
+        tag, name = steps[-1]
+        value = self._materialize(node)
+        return {tag: [value] if name is not None else value}
+
+    def exists(self, xpath: str) -> bool:
+        return self._walk(split_xpath(xpath)) is not None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Materialize the whole snapshot."""
+        return self._materialize({_REF: self.info.root})
+
+
+def capture_running_config(store: ConfigSnapshotStore, *, session: PanoramaSession, device_serial: str, taken_at: datetime | str | None = None) -> SnapshotInfo:
+    """Fetch a device's effective running config via Panorama and store it."""
+    config = get_effective_running_config(session=session, device_serial=device_serial)
+    return store.put(device_serial, config, taken_at=taken_at)
@@ -0,0 +1,272 @@
+# src/optiv_lib/providers/pan/export.py
+from __future__ import annotations
+
+import gzip
+import hashlib
+import lzma
+import os
+import re
+import xml.etree.ElementTree as ET
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List, Literal, Optional, Tuple, Union
+
+import requests
+
+from optiv_lib.providers.pan.session import PanoramaHTTPError, PanoramaSession, PanoramaTimeoutError
+from optiv_lib.providers.pan.util import parse_xml, split_xpath
+
+ExportKind = Literal["configuration", "device-state"]
+Compression = Literal["gzip", "lzma", "none"]
+Dest = Union[Path, str, IO[bytes]]
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_XZ_MAGIC = b"\xfd7zXZ\x00"
+# Optional BOM and <?xml ...?> declaration, then a <response status="error"> root.
+_ERROR_HEAD = re.compile(rb"""(?:\xef\xbb\xbf)?\s*(?:<\?xml[^>]*\?>\s*)?<response\b[^>]*\bstatus\s*=\s*["']error["']""")
+
+
+@dataclass(slots=True, frozen=True)
+class ExportResult:
+    path: Optional[str]
+    bytes_read: int
+    bytes_written: int
+    compression: Compression
+    digest: Optional[str] = None
+    hash_algorithm: Optional[str] = None
+
+
+def _infer_compression(dest: Dest) -> Compression:
+    if isinstance(dest, (str, Path)):
+        suffix = Path(dest).suffix.lower()
+        if suffix in (".gz", ".gzip"):
+            return "gzip"
+        if suffix in (".xz", ".lzma"):
+            return "lzma"
+    return "none"
+
+
+def _wrap(fh: IO[bytes], compression: Compression) -> IO[bytes]:
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=fh, mode="wb")  # type: ignore[return-value]
+    if compression == "lzma":
+        return lzma.LZMAFile(fh, mode="wb")  # type: ignore[return-value]
+    return fh
+
+
+class _CountingWriter:
+    """Counts bytes that actually reach the destination (post-compression)."""
+
+    def __init__(self, fh: IO[bytes]) -> None:
+        self.fh = fh
+        self.count = 0
+
+    def write(self, b: bytes) -> int:
+        self.count += len(b)
+        return self.fh.write(b)
+
+    def flush(self) -> None:
+        self.fh.flush()
+
+
+def _read_head(chunks: Iterator[bytes], size: int = 512) -> bytes:
+    """At least `size` bytes (or the whole body), however small the chunks are."""
+    head = b""
+    for chunk in chunks:
+        head += chunk
+        if len(head) >= size:
+            break
+    return head
+
+
+def _raise_if_error(head: bytes, rest: Iterator[bytes]) -> None:
+    """PAN-OS reports export failures as a small <response status="error"> document."""
+    if not _ERROR_HEAD.match(head[:512]):
+        return
+    body = head + b"".join(rest)
+    try:
+        root = ET.fromstring(body)
+        msg = " ".join(t.strip() for t in root.itertext() if t.strip())
+    except ET.ParseError:
+        msg = body[:200].decode("utf-8", "replace")
+    raise PanoramaHTTPError(msg or "PAN-OS export error")
+
+
+def export_config(
+    *,
+    session: PanoramaSession,
+    dest: Dest,
+    kind: ExportKind = "configuration",
+    source: Optional[str] = None,
+    target: Optional[str] = None,
+    compression: Optional[Compression] = None,
+    hash_algorithm: Optional[str] = "sha256",
+    chunk_size: int = 1 << 16,
+) -> ExportResult:
+    """
+    Stream a type=export download straight to `dest` (path or binary file-like).
+
+    kind="configuration" exports the running config, or the saved config file
+    named by `source`; kind="device-state" exports a firewall's device state.
+    target=<serial> proxies the export to a managed firewall.
+    compression defaults from the path suffix (.gz / .xz). The digest covers
+    the uncompressed XML. Path destinations are written to a temp file and
+    renamed only after the download completes.
+    """
+    params: Dict[str, Any] = {"type": "export", "category": kind}
+    if source:
+        params["from"] = source
+    if target:
+        params["target"] = target
+    comp: Compression = compression or _infer_compression(dest)
+    hasher = hashlib.new(hash_algorithm) if hash_algorithm else None
+
+    try:
+        r = session.get("", params=params, stream=True)
+        r.raise_for_status()
+    except requests.Timeout as e:
+        raise PanoramaTimeoutError(str(e)) from None
+    except requests.RequestException as e:
+        raise PanoramaHTTPError(str(e)) from None
+
+    path: Optional[Path] = None
+    tmp: Optional[Path] = None
+    with r:
+        chunks = r.iter_content(chunk_size=chunk_size)
+        head = _read_head(chunks)
+        _raise_if_error(head, chunks)
+
+        if isinstance(dest, (str, Path)):
+            path = Path(dest)
+            tmp = path.with_name(path.name + ".part")
+            raw_fh: IO[bytes] = open(tmp, "wb")
+        else:
+            raw_fh = dest
+
+        counter = _CountingWriter(raw_fh)
+        out = _wrap(counter, comp)  # type: ignore[arg-type]
+        read = 0
+        try:
+            for chunk in _prepend(head, chunks):
+                if not chunk:
+                    continue
+                read += len(chunk)
+                if hasher is not None:
+                    hasher.update(chunk)
+                out.write(chunk)
+            if out is not counter:
+                out.close()
+            raw_fh.flush()
+        except requests.RequestException as e:
+            _discard(tmp, raw_fh)
+            raise PanoramaHTTPError(str(e)) from None
+        except BaseException:
+            _discard(tmp, raw_fh)
+            raise
+        if tmp is not None and path is not None:
+            raw_fh.close()
+            os.replace(tmp, path)
+
+    return ExportResult(
+        path=str(path) if path is not None else None,
+        bytes_read=read,
+        bytes_written=counter.count,
+        compression=comp,
+        digest=hasher.hexdigest() if hasher is not None else None,
+        hash_algorithm=hash_algorithm if hasher is not None else None,
+    )
+
+
+def _prepend(head: bytes, rest: Iterator[bytes]) -> Iterator[bytes]:
+    yield head
+    yield from rest
+
+
+def _discard(tmp: Optional[Path], fh: IO[bytes]) -> None:
+    """Remove a partial download; caller-owned file-likes are left as is."""
+    if tmp is not None:
+        fh.close()
+        tmp.unlink(missing_ok=True)
+
+
+# ---------------------------
+# Lazy reader
+# ---------------------------
+
+@contextmanager
+def _open_maybe_compressed(path: Path) -> Iterator[IO[bytes]]:
+    with open(path, "rb") as fh:
+        magic = fh.peek(6)[:6]
+        if magic.startswith(_GZIP_MAGIC):
+            with gzip.GzipFile(fileobj=fh, mode="rb") as gz:
+                yield gz  # type: ignore[misc]
+        elif magic.startswith(_XZ_MAGIC):
+            with lzma.LZMAFile(fh, mode="rb") as xz:
+                yield xz  # type: ignore[misc]
+        else:
+            yield fh
+
+
+class ExportedConfig:
+    """
+    Lazy XPath reader over an exported config file (plain, .gz or .xz).
+
+    Each call streams the file once; only the matching subtrees are kept in
+    memory and everything else is discarded as soon as it is parsed. Matches
+    come back in config_get result shape ({'address': {...}} or
+    {'entry': [{...}]}) so the object parsers accept them.
+
+    Example:
+        cfg = ExportedConfig("panorama.xml.gz")
+        addrs = from_xml(cfg.get("/config/shared/address"))
+    """
+
+    def __init__(self, path: Union[Path, str]) -> None:
+        self.path = Path(path)
+
+    def iter_xpath(self, xpath: str) -> Iterator[Dict[str, Any]]:
+        steps = split_xpath(xpath)
+        if not steps:
+            raise ValueError("xpath required")
+        with _open_maybe_compressed(self.path) as fh:
+            yield from _iter_matches(fh, steps)
+
+    def get(self, xpath: str) -> Dict[str, Any]:
+        """First subtree at `xpath`. Raises KeyError if absent."""
+        for match in self.iter_xpath(xpath):
+            return match
+        raise KeyError(xpath)
+
+    def exists(self, xpath: str) -> bool:
+        return next(self.iter_xpath(xpath), None) is not None
+
+
+def _iter_matches(fh: IO[bytes], steps: List[Tuple[str, Optional[str]]]) -> Iterator[Dict[str, Any]]:
+    depth_target = len(steps)
+    # Per open element: (element, still on the xpath prefix?)
+    stack: List[Tuple[ET.Element, bool]] = []
+    inside = 0  # >0 while within a matched subtree
+    for event, elem in ET.iterparse(fh, events=("start", "end")):
+        if event == "start":
+            on_path = (not stack or stack[-1][1]) and len(stack) < depth_target
+            if on_path:
+                tag, name = steps[len(stack)]
+                on_path = elem.tag == tag and (name is None or elem.get("name") == name)
+            stack.append((elem, on_path))
+            if on_path and len(stack) == depth_target:
+                inside += 1
+            continue
+
+        _, on_path = stack.pop()
+        if on_path and len(stack) + 1 == depth_target:
+            inside -= 1
+            yield parse_xml(ET.tostring(elem, encoding="unicode"))
+        elif inside:
+            continue
+        # Done with this element: drop it from its parent to keep memory flat.
+        if stack:
+            parent = stack[-1][0]
+            parent.remove(elem)
+        else:
+            elem.clear()
@@ -0,0 +1,264 @@
+# src/optiv_lib/providers/pan/jobs.py
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from optiv_lib.providers.pan import ops
+from optiv_lib.providers.pan.session import PanoramaHTTPError, PanoramaSession, PanoramaTimeoutError
+from optiv_lib.providers.pan.util import as_list, node_text
+
+CMD_JOBS_ALL = "<show><jobs><all/></jobs></show>"
+
+
+class JobFailedError(PanoramaHTTPError):
+    """A tracked job finished with a result other than OK."""
+
+    def __init__(self, status: "JobStatus") -> None:
+        detail = "; ".join(status.details) or status.result
+        super().__init__(f"job {status.id} ({status.type}) failed: {detail}")
+        self.status = status
+
+
+class JobTimeoutError(PanoramaTimeoutError):
+    """Tracked jobs were still running when the wait deadline passed."""
+
+
+@dataclass(slots=True, frozen=True)
+class JobHandle:
+    """Reference to an enqueued PAN-OS job (commit, commit-all, ...)."""
+    id: int
+    kind: str
+    description: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class DeviceJobStatus:
+    serial: str
+    device_name: Optional[str] = None
+    status: Optional[str] = None
+    result: Optional[str] = None
+    progress: Optional[int] = None
+    details: tuple[str, ...] = field(default_factory=tuple)
+
+
+@dataclass(slots=True, frozen=True)
+class JobStatus:
+    id: int
+    type: str
+    status: str
+    result: Optional[str] = None
+    progress: Optional[int] = None
+    details: tuple[str, ...] = field(default_factory=tuple)
+    devices: tuple[DeviceJobStatus, ...] = field(default_factory=tuple)
+
+    @property
+    def done(self) -> bool:
+        return self.status == "FIN"
+
+    @property
+    def ok(self) -> bool:
+        return self.done and self.result == "OK"
+
+
+# ---------------------------
+# Parsing
+# ---------------------------
+
+def _int(s: Optional[str]) -> Optional[int]:
+    return int(s) if s and s.isdigit() else None
+
+
+def _lines(node: Any) -> tuple[str, ...]:
+    """All text under a details/warnings node, flattened to lines."""
+    out: List[str] = []
+    stack: List[Any] = [node]
+    while stack:
+        n = stack.pop()
+        if isinstance(n, list):
+            stack.extend(reversed(n))
+        elif isinstance(n, dict):
+            stack.extend(reversed([v for k, v in n.items() if not k.startswith("@")]))
+        else:
+            t = node_text(n)
+            if t:
+                out.append(t)
+    return tuple(out)
+
+
+def _device_from_xml(entry: Dict[str, Any]) -> DeviceJobStatus:
+    return DeviceJobStatus(
+        serial=node_text(entry.get("serial-no")) or node_text(entry.get("serial")) or (entry.get("@name") or ""),
+        device_name=node_text(entry.get("devicename")),
+        status=node_text(entry.get("status")),
+        result=node_text(entry.get("result")),
+        progress=_int(node_text(entry.get("progress"))),
+        details=_lines(entry.get("details")),
+    )
+
+
+def parse_jobs(result: Dict[str, Any]) -> List[JobStatus]:
+    """Convert 'show jobs all|id' result (inner 'result') into JobStatus items."""
+    out: List[JobStatus] = []
+    for job in as_list(result.get("job") if isinstance(result, dict) else None):
+        if not isinstance(job, dict):
+            continue
+        jid = _int(node_text(job.get("id")))
+        if jid is None:
+            continue
+        devices_node = job.get("devices") if isinstance(job.get("devices"), dict) else {}
+        out.append(JobStatus(
+            id=jid,
+            type=node_text(job.get("type")) or "",
+            status=(node_text(job.get("status")) or "").upper(),
+            result=node_text(job.get("result")),
+            progress=_int(node_text(job.get("progress"))),
+            details=_lines(job.get("details")),
+            devices=tuple(_device_from_xml(e) for e in as_list(devices_node.get("entry")) if isinstance(e, dict)),
+        ))
+    return out
+
+
+def handle_from_result(result: Dict[str, Any], *, kind: str, description: Optional[str] = None) -> Optional[JobHandle]:
+    """JobHandle from a commit/commit-all result, or None when nothing was enqueued."""
+    jid = _int(node_text(result.get("job")) if isinstance(result, dict) else None)
+    return None if jid is None else JobHandle(id=jid, kind=kind, description=description)
+
+
+# ---------------------------
+# Single calls
+# ---------------------------
+
+def list_jobs(*, session: PanoramaSession) -> List[JobStatus]:
+    """show jobs all (summary rows; no per-device detail)."""
+    return parse_jobs(ops.op(session=session, cmd=CMD_JOBS_ALL))
+
+
+def get_job(*, session: PanoramaSession, job_id: int) -> JobStatus:
+    """show jobs id N (includes per-device results for commit-all)."""
+    jobs = parse_jobs(ops.op(session=session, cmd=f"<show><jobs><id>{int(job_id)}</id></jobs></show>"))
+    if not jobs:
+        raise PanoramaHTTPError(f"job {job_id} not found")
+    return jobs[0]
+
+
+# ---------------------------
+# Batched polling
+# ---------------------------
+
+class JobScheduler:
+    """
+    Tracks many jobs and polls them together.
+
+    Each poll() is one 'show jobs all' call covering every outstanding job.
+    The poll interval grows by `backoff` while nothing progresses and resets
+    when any job moves. Jobs that fall out of the 'all' listing, and finished
+    jobs when `detail` is set (per-device results for pushes), get a single
+    'show jobs id' call.
+
+    Example:
+        sched = JobScheduler(pano)
+        sched.track(push_device_groups(session=pano, device_groups=["branch"]))
+        for status in sched.iter_finished(timeout=1800):
+            print(status.id, status.result)
+    """
+
+    def __init__(
+        self,
+        session: PanoramaSession,
+        *,
+        initial_delay: float = 2.0,
+        max_delay: float = 30.0,
+        backoff: float = 1.6,
+        detail: bool = True,
+    ) -> None:
+        self._session = session
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.backoff = backoff
+        self.detail = detail
+        self._handles: Dict[int, JobHandle] = {}
+        self._last: Dict[int, JobStatus] = {}
+        self._finished: Dict[int, JobStatus] = {}
+        self._delay = initial_delay
+        self.api_calls = 0
+
+    def track(self, *handles: Optional[JobHandle]) -> None:
+        """Add handles; None (nothing enqueued) is ignored."""
+        for h in handles:
+            if h is not None and h.id not in self._finished:
+                self._handles[h.id] = h
+
+    @property
+    def pending(self) -> List[JobHandle]:
+        return list(self._handles.values())
+
+    def status(self, job_id: int) -> Optional[JobStatus]:
+        return self._finished.get(job_id) or self._last.get(job_id)
+
+    def poll(self) -> List[JobStatus]:
+        """One status round for all outstanding jobs. Returns jobs that finished in this round."""
+        if not self._handles:
+            return []
+        self.api_calls += 1
+        seen = {j.id: j for j in list_jobs(session=self._session) if j.id in self._handles}
+        for jid in self._handles.keys() - seen.keys():
+            self.api_calls += 1
+            seen[jid] = get_job(session=self._session, job_id=jid)
+
+        progressed = False
+        newly: List[JobStatus] = []
+        for jid, st in seen.items():
+            prev = self._last.get(jid)
+            if prev is None or (prev.status, prev.progress) != (st.status, st.progress):
+                progressed = True
+            self._last[jid] = st
+            if st.done:
+                if self.detail and not st.devices and self._handles[jid].kind == "commit-all":
+                    self.api_calls += 1
+                    st = get_job(session=self._session, job_id=jid)
+                self._finished[jid] = st
+                self._handles.pop(jid)
+                self._last.pop(jid, None)
+                newly.append(st)
+
+        self._delay = self.initial_delay if progressed else min(self.max_delay, self._delay * self.backoff)
+        return newly
+
+    def iter_finished(self, *, timeout: Optional[float] = None, raise_on_failure: bool = False) -> Iterator[JobStatus]:
+        """Yield jobs as they finish. Raises JobTimeoutError if the deadline passes first."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._handles:
+            for st in self.poll():
+                if raise_on_failure and not st.ok:
+                    raise JobFailedError(st)
+                yield st
+            if not self._handles:
+                return
+            sleep_for = self._delay
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise JobTimeoutError(f"jobs still running: {sorted(self._handles)}")
+                sleep_for = min(sleep_for, remaining)
+            time.sleep(sleep_for)
+
+    def wait(self, *, timeout: Optional[float] = None, raise_on_failure: bool = False) -> Dict[int, JobStatus]:
+        """Block until every tracked job finishes. Returns job ID → final status."""
+        for _ in self.iter_finished(timeout=timeout, raise_on_failure=raise_on_failure):
+            pass
+        return dict(self._finished)
+
+
+def wait_for_jobs(
+    handles: Iterable[Optional[JobHandle]],
+    *,
+    session: PanoramaSession,
+    timeout: Optional[float] = None,
+    raise_on_failure: bool = False,
+) -> Dict[int, JobStatus]:
+    """Convenience wrapper: track `handles` on a fresh JobScheduler and wait."""
+    sched = JobScheduler(session)
+    sched.track(*handles)
+    return sched.wait(timeout=timeout, raise_on_failure=raise_on_failure)
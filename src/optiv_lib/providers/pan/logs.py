@@ -0,0 +1,169 @@
+# src/optiv_lib/providers/pan/logs.py
+from __future__ import annotations
+
+import time
+import xml.etree.ElementTree as ET
+from typing import IO, Callable, Dict, Iterator, List, Optional
+
+import requests
+
+from optiv_lib.providers.pan import ops
+from optiv_lib.providers.pan.session import PanoramaHTTPError, PanoramaSession, PanoramaTimeoutError
+from optiv_lib.providers.pan.util import node_text
+
+MAX_NLOGS = 5000
+
+LogEntry = Dict[str, str]
+
+_JOB_STATUS_PATH = ["response", "result", "job", "status"]
+
+
+class _NotReady(Exception):
+    """Log job has not reached FIN yet."""
+
+
+def _entry_to_dict(elem: ET.Element) -> LogEntry:
+    d: LogEntry = {f"@{k}": v for k, v in elem.attrib.items()}
+    for child in elem:
+        d[child.tag] = "".join(child.itertext()).strip()
+    return d
+
+
+def _read_page(session: PanoramaSession, job_id: str, on_count: Callable[[int], None]) -> Iterator[LogEntry]:
+    """
+    Stream one finished log job page, parsing <entry> elements one at a time.
+
+    Raises _NotReady before yielding anything if the job is still running.
+    on_count receives the page's entry count as soon as <logs count="..."> is seen.
+    """
+    try:
+        r = session.get("", params={"type": "log", "action": "get", "job-id": job_id}, stream=True)
+        r.raise_for_status()
+    except requests.Timeout as e:
+        raise PanoramaTimeoutError(str(e)) from None
+    except requests.RequestException as e:
+        raise PanoramaHTTPError(str(e)) from None
+
+    with r:
+        r.raw.decode_content = True
+        yield from _parse_page(r.raw, job_id, on_count)
+
+
+def _parse_page(stream: IO[bytes], job_id: str, on_count: Callable[[int], None]) -> Iterator[LogEntry]:
+    """
+    Parse a log get response from a byte stream. Only the job's own
+    response/result/job/status is checked for FIN; entries carry status
+    fields of their own (system, GlobalProtect logs).
+    """
+    logs_elem: Optional[ET.Element] = None
+    error = False
+    path: List[str] = []
+    try:
+        for event, elem in ET.iterparse(stream, events=("start", "end")):
+            tag = elem.tag
+            if event == "start":
+                path.append(tag)
+                if tag == "response" and len(path) == 1:
+                    error = elem.get("status") != "success"
+                elif tag == "logs" and logs_elem is None:
+                    logs_elem = elem
+                    count = elem.get("count")
+                    on_count(int(count) if count and count.isdigit() else 0)
+                continue
+            is_job_status = path == _JOB_STATUS_PATH
+            path.pop()
+            if is_job_status and not error and (elem.text or "").strip().upper() != "FIN":
+                raise _NotReady(job_id)
+            if tag == "entry" and logs_elem is not None and path and path[-1] == "logs":
+                yield _entry_to_dict(elem)
+                # Drop the parsed entry so memory stays bounded by one entry.
+                logs_elem.remove(elem)
+            elif tag == "response" and not path and error:
+                msg = " ".join(t.strip() for t in elem.itertext() if t.strip())
+                raise PanoramaHTTPError(msg or "PAN-OS log API error")
+    except ET.ParseError as e:
+        raise PanoramaHTTPError(f"malformed log response for job {job_id}: {e}") from None
+
+
+def _enqueue(session: PanoramaSession, log_type: str, query: Optional[str], nlogs: int, skip: int, direction: str) -> str:
+    result = ops.log_enqueue(session=session, log_type=log_type, query=query, nlogs=nlogs, skip=skip, direction=direction)
+    job_id = node_text(result.get("job")) if isinstance(result, dict) else None
+    if not job_id:
+        raise PanoramaHTTPError("log query did not return a job ID")
+    return job_id
+
+
+def _finish_quietly(session: PanoramaSession, job_id: Optional[str]) -> None:
+    if not job_id:
+        return
+    try:
+        ops.log_finish(session=session, job_id=job_id)
+    except Exception:
+        pass
+
+
+def iter_logs(
+    *,
+    session: PanoramaSession,
+    query: Optional[str] = None,
+    log_type: str = "traffic",
+    nlogs: int = MAX_NLOGS,
+    max_logs: Optional[int] = None,
+    direction: str = "backward",
+    poll_interval: float = 0.5,
+    timeout: float = 300.0,
+) -> Iterator[LogEntry]:
+    """
+    Stream log entries (flat dicts of field → text) across as many pages as needed.
+
+    Each page is an async log job paged with nlogs/skip. As soon as a page's
+    count shows it is full, the next page's job is enqueued, so Panorama runs
+    it while the current page is still being parsed. Entries are parsed one at
+    a time from the HTTP stream. Closing the generator early (break, max_logs)
+    finishes any outstanding jobs.
+
+    Example:
+        for e in pano.iter_logs("(addr.src in 10.0.0.0/8)", "threat", max_logs=100_000):
+            print(e["receive_time"], e["threatid"])
+    """
+    if not 1 <= nlogs <= MAX_NLOGS:
+        raise ValueError(f"nlogs must be between 1 and {MAX_NLOGS}")
+    page = nlogs if max_logs is None else min(nlogs, max_logs)
+    if page <= 0:
+        return
+
+    emitted = 0
+    skip = 0
+    job_id: Optional[str] = _enqueue(session, log_type, query, page, skip, direction)
+    next_job: list[Optional[str]] = [None]
+    try:
+        while job_id:
+            count = [0]
+
+            def _on_count(n: int) -> None:
+                count[0] = n
+                remaining = None if max_logs is None else max_logs - emitted - n
+                if n >= page and (remaining is None or remaining > 0):
+                    size = page if remaining is None else min(page, remaining)
+                    next_job[0] = _enqueue(session, log_type, query, size, skip + n, direction)
+
+            deadline = time.monotonic() + timeout
+            while True:
+                try:
+                    for entry in _read_page(session, job_id, _on_count):
+                        yield entry
+                        emitted += 1
+                        if max_logs is not None and emitted >= max_logs:
+                            return
+                    break
+                except _NotReady:
+                    if time.monotonic() >= deadline:
+                        raise PanoramaTimeoutError(f"log job {job_id} not finished after {timeout}s") from None
+                    time.sleep(poll_interval)
+
+            _finish_quietly(session, job_id)
+            skip += count[0]
+            job_id, next_job[0] = next_job[0], None
+    finally:
+        _finish_quietly(session, job_id)
+        _finish_quietly(session, next_job[0])
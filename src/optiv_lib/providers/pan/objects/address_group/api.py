@@ -0,0 +1,43 @@
+# src/optiv_lib/providers/pan/objects/address_group/api.py
+from __future__ import annotations
+
+from typing import List, Optional
+
+from optiv_lib.providers.pan import ops
+from optiv_lib.providers.pan.objects.address_group.model import AddressGroupObject
+from optiv_lib.providers.pan.objects.address_group.parser import from_xml
+from optiv_lib.providers.pan.objects.address_group.serializer import entry_xpath, parent_xpath, to_xml
+from optiv_lib.providers.pan.session import PanoramaSession
+
+
+def list_address_groups(*, session: PanoramaSession, candidate: bool = True, device_group: Optional[str] = None) -> List[AddressGroupObject]:
+    """List address groups from candidate or running config."""
+    xpath = parent_xpath(device_group)
+    result = ops.config_get(session=session, xpath=xpath) if candidate else ops.config_show(session=session, xpath=xpath)
+    return from_xml(result, strict=True)
+
+
+def create_address_group(address_group: AddressGroupObject, *, device_group: Optional[str], session: PanoramaSession) -> dict:
+    """Create (or merge) an address-group entry."""
+    xpath = parent_xpath(device_group)
+    element = to_xml(address_group)
+    return ops.config_set(session=session, xpath=xpath, element=element)
+
+
+def update_address_group(address_group: AddressGroupObject, *, device_group: Optional[str], session: PanoramaSession) -> dict:
+    """Replace an existing address-group entry in place."""
+    xpath = entry_xpath(address_group.name, device_group)
+    element = to_xml(address_group)
+    return ops.config_edit(session=session, xpath=xpath, element=element)
+
+
+def rename_address_group(*, old_name: str, new_name: str, device_group: Optional[str], session: PanoramaSession) -> dict:
+    """Rename an existing address-group entry."""
+    xpath = entry_xpath(old_name, device_group)
+    return ops.config_rename(session=session, xpath=xpath, newname=new_name)
+
+
+def delete_address_group(*, name: str, device_group: Optional[str], session: PanoramaSession) -> dict:
+    """Delete an address-group entry."""
+    xpath = entry_xpath(name, device_group)
+    return ops.config_delete(session=session, xpath=xpath)
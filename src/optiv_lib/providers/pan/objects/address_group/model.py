@@ -0,0 +1,62 @@
+# src/optiv_lib/providers/pan/objects/address_group/model.py
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Literal, Optional, Sequence
+
+AddressGroupKind = Literal["static", "dynamic"]
+
+
+def _normalize_keep_order(values: Sequence[str]) -> tuple[str, ...]:
+    """Trim, dedupe by exact case, preserve original order."""
+    seen: set[str] = set()
+    out: list[str] = []
+    for raw in values:
+        v = raw.strip()
+        if v and v not in seen:
+            seen.add(v)
+            out.append(v)
+    return tuple(out)
+
+
+@dataclass(slots=True, frozen=True)
+class AddressGroupObject:
+    """
+    PAN-OS Address Group.
+
+    kind == "static"  → members (address or address-group names) is used
+    kind == "dynamic" → filter (tag expression, e.g. "'web' and 'prod'") is used
+    """
+    name: str
+    kind: AddressGroupKind
+    members: tuple[str, ...] = field(default_factory=tuple)
+    filter: Optional[str] = None
+
+    description: Optional[str] = None
+    tags: tuple[str, ...] = field(default_factory=tuple)
+    disable_override: bool = False
+
+    def __post_init__(self) -> None:
+        if not self.name:
+            raise ValueError("name required")
+
+        object.__setattr__(self, "members", _normalize_keep_order(self.members))
+        object.__setattr__(self, "tags", _normalize_keep_order(self.tags))
+        flt = (self.filter or "").strip() or None
+        object.__setattr__(self, "filter", flt)
+
+        if self.kind == "static":
+            if not self.members:
+                raise ValueError("static group requires at least one member")
+            if flt:
+                raise ValueError("static group must not define filter")
+        elif self.kind == "dynamic":
+            if not flt:
+                raise ValueError("dynamic group requires filter")
+            if self.members:
+                raise ValueError("dynamic group must not define members")
+        else:
+            raise ValueError(f"invalid kind: {self.kind}")
+
+    def key(self) -> str:
+        return self.name
@@ -0,0 +1,95 @@
+# src/optiv_lib/providers/pan/objects/address_group/parser.py
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List
+
+from .model import AddressGroupObject
+from optiv_lib.providers.pan.util import as_list, collect_members, node_text, yn_bool
+
+
+class AddressGroupParseError(ValueError):
+    """Raised when an address-group <entry> cannot be parsed in strict mode."""
+
+
+# ----------------------------
+# XML → model
+# ----------------------------
+
+def from_xml(result: Dict[str, Any], *, strict: bool = True) -> List[AddressGroupObject]:
+    """
+    Convert ops.config_show/get result (inner 'result') into AddressGroupObject items.
+    """
+    entries = _pick_entries(result)
+    objs: List[AddressGroupObject] = []
+    for entry in entries:
+        try:
+            objs.append(_xml_entry_to_model(entry))
+        except Exception as exc:
+            if strict:
+                raise AddressGroupParseError(f"failed to parse address-group entry: {exc}") from exc
+    return objs
+
+
+def _pick_entries(result: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Accept either:
+      result['address-group']['entry']  OR  result['entry']
+    """
+    group_node = result.get("address-group")
+    raw = group_node.get("entry") if isinstance(group_node, dict) and "entry" in group_node else result.get("entry")
+    return [e for e in as_list(raw) if isinstance(e, dict)]
+
+
+def _xml_entry_to_model(entry: Dict[str, Any]) -> AddressGroupObject:
+    name = (entry.get("@name") or "").strip()
+    if not name:
+        raise ValueError("missing @name")
+
+    description = node_text(entry.get("description"))
+    disable_override = yn_bool(node_text(entry.get("disable-override")))
+    tags = tuple(collect_members(entry.get("tag")))
+
+    if "dynamic" in entry:
+        dyn = entry.get("dynamic")
+        flt = node_text(dyn.get("filter")) if isinstance(dyn, dict) else None
+        return AddressGroupObject(name=name, kind="dynamic", filter=flt, description=description, tags=tags, disable_override=disable_override)
+
+    members = tuple(collect_members(entry.get("static")))
+    return AddressGroupObject(name=name, kind="static", members=members, description=description, tags=tags, disable_override=disable_override)
+
+
+# ----------------------------
+# JSON → model
+# ----------------------------
+
+def from_json_dict(d: Dict[str, Any]) -> AddressGroupObject:
+    """
+    Convert a JSON-ready dict (from serializer.to_json_dict) into AddressGroupObject.
+    """
+    name = str(d.get("name") or "").strip()
+    if not name:
+        raise ValueError("name is required")
+
+    kind = str(d.get("kind") or "").strip()
+    if kind not in ("static", "dynamic"):
+        raise ValueError(f"kind must be 'static' or 'dynamic'; got {kind!r}")
+
+    description = d.get("description")
+    tags = tuple(e for e in as_list(d.get("tags")) if isinstance(e, str))
+    disable_override = bool(d.get("disable_override", False))
+
+    if kind == "dynamic":
+        return AddressGroupObject(name=name, kind="dynamic", filter=d.get("filter"), description=description, tags=tags, disable_override=disable_override)
+    members = tuple(e for e in as_list(d.get("members")) if isinstance(e, str))
+    return AddressGroupObject(name=name, kind="static", members=members, description=description, tags=tags, disable_override=disable_override)
+
+
+def from_json_list(items: Iterable[Dict[str, Any]], *, strict: bool = True) -> List[AddressGroupObject]:
+    out: List[AddressGroupObject] = []
+    for it in items:
+        try:
+            out.append(from_json_dict(it))
+        except Exception as exc:
+            if strict:
+                raise AddressGroupParseError(f"failed to parse address-group json: {exc}") from exc
+    return out
@@ -0,0 +1,231 @@
+# src/optiv_lib/providers/pan/objects/address_group/resolver.py
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Tuple, Union
+
+from optiv_lib.providers.pan.objects.address.model import AddressObject
+from optiv_lib.providers.pan.objects.address_group.model import AddressGroupObject
+
+# Compiled filter AST:
+#   ("tag", name) | ("not", node) | ("and", node, node, ...) | ("or", node, node, ...)
+FilterNode = Tuple[Union[str, "FilterNode"], ...]
+
+_EMPTY: FrozenSet[str] = frozenset()
+
+
+class AddressGroupResolveError(ValueError):
+    """Raised for malformed dynamic filters or static-group cycles."""
+
+
+# ----------------------------
+# Filter compilation
+# ----------------------------
+
+def _tokenize(expr: str) -> List[str]:
+    tokens: List[str] = []
+    i, n = 0, len(expr)
+    while i < n:
+        c = expr[i]
+        if c.isspace():
+            i += 1
+        elif c in "()":
+            tokens.append(c)
+            i += 1
+        elif c in "'\"":
+            end = expr.find(c, i + 1)
+            if end < 0:
+                raise AddressGroupResolveError(f"unterminated quote in filter: {expr!r}")
+            # Prefix quoted names so a tag called 'and' is not an operator.
+            tokens.append("=" + expr[i + 1:end])
+            i = end + 1
+        else:
+            j = i
+            while j < n and not expr[j].isspace() and expr[j] not in "()'\"":
+                j += 1
+            word = expr[i:j]
+            tokens.append(word.lower() if word.lower() in ("and", "or", "not") else "=" + word)
+            i = j
+    return tokens
+
+
+@lru_cache(maxsize=4096)
+def compile_filter(expr: str) -> FilterNode:
+    """
+    Parse a dynamic-group tag expression once; results are cached by text.
+
+    Grammar: or-expr := and-expr ('or' and-expr)*
+             and-expr := unary ('and' unary)*
+             unary := 'not' unary | '(' or-expr ')' | 'tag' | tag
+    """
+    tokens = _tokenize(expr)
+    pos = 0
+
+    def peek() -> str | None:
+        return tokens[pos] if pos < len(tokens) else None
+
+    def take() -> str:
+        nonlocal pos
+        if pos >= len(tokens):
+            raise AddressGroupResolveError(f"unexpected end of filter: {expr!r}")
+        pos += 1
+        return tokens[pos - 1]
+
+    def parse_or() -> FilterNode:
+        parts = [parse_and()]
+        while peek() == "or":
+            take()
+            parts.append(parse_and())
+        return parts[0] if len(parts) == 1 else ("or", *parts)
+
+    def parse_and() -> FilterNode:
+        parts = [parse_unary()]
+        while peek() == "and":
+            take()
+            parts.append(parse_unary())
+        return parts[0] if len(parts) == 1 else ("and", *parts)
+
+    def parse_unary() -> FilterNode:
+        tok = take()
+        if tok == "not":
+            return ("not", parse_unary())
+        if tok == "(":
+            node = parse_or()
+            if take() != ")":
+                raise AddressGroupResolveError(f"missing ')' in filter: {expr!r}")
+            return node
+        if tok.startswith("="):
+            return ("tag", tok[1:])
+        raise AddressGroupResolveError(f"unexpected {tok!r} in filter: {expr!r}")
+
+    node = parse_or()
+    if pos != len(tokens):
+        raise AddressGroupResolveError(f"trailing tokens in filter: {expr!r}")
+    return node
+
+
+def filter_tags(expr: str) -> FrozenSet[str]:
+    """All tag names referenced by a dynamic filter."""
+    out: set[str] = set()
+    stack: List[FilterNode] = [compile_filter(expr)]
+    while stack:
+        node = stack.pop()
+        if node[0] == "tag":
+            out.add(node[1])  # type: ignore[arg-type]
+        else:
+            stack.extend(node[1:])  # type: ignore[arg-type]
+    return frozenset(out)
+
+
+# ----------------------------
+# Resolution
+# ----------------------------
+
+class AddressGroupResolver:
+    """
+    Resolve address-group membership for one scope.
+
+    Builds an inverted tag → address-name index once; each dynamic filter is
+    compiled once and evaluated as set algebra over that index (smallest
+    operand first for 'and'), so cost scales with matching objects rather
+    than groups × objects. Static groups are flattened through nested groups
+    with memoization.
+
+    Pass the objects visible in one scope (e.g. shared followed by a device
+    group); later entries with the same name override earlier ones. Dynamic
+    groups match address objects only; runtime registered-IP tags are not
+    visible in config.
+    """
+
+    def __init__(self, addresses: Iterable[AddressObject], groups: Iterable[AddressGroupObject]) -> None:
+        self.addresses: Dict[str, AddressObject] = {a.name: a for a in addresses}
+        self.groups: Dict[str, AddressGroupObject] = {g.name: g for g in groups}
+        self._universe: FrozenSet[str] = frozenset(self.addresses)
+        index: Dict[str, set[str]] = {}
+        for a in self.addresses.values():
+            for t in a.tags:
+                index.setdefault(t, set()).add(a.name)
+        self.tag_index: Dict[str, FrozenSet[str]] = {t: frozenset(v) for t, v in index.items()}
+        self._resolved: Dict[str, FrozenSet[str]] = {}
+        self._memo: Dict[FilterNode, FrozenSet[str]] = {}
+        self.unresolved: Dict[str, Tuple[str, ...]] = {}
+
+    def _eval(self, node: FilterNode) -> FrozenSet[str]:
+        # Groups often share filters or sub-expressions; compiled nodes are
+        # hashable, so each distinct one is evaluated once per resolver.
+        hit = self._memo.get(node)
+        if hit is None:
+            hit = self._memo[node] = self._eval_uncached(node)
+        return hit
+
+    def _eval_uncached(self, node: FilterNode) -> FrozenSet[str]:
+        op = node[0]
+        if op == "tag":
+            return self.tag_index.get(node[1], _EMPTY)  # type: ignore[arg-type]
+        if op == "not":
+            return self._universe - self._eval(node[1])  # type: ignore[arg-type]
+        if op == "and":
+            pos = [n for n in node[1:] if n[0] != "not"]  # type: ignore[index]
+            neg = [n[1] for n in node[1:] if n[0] == "not"]  # type: ignore[index]
+            if not pos:
+                pos, neg = [neg[0]], neg[1:]
+                acc = self._universe - self._eval(pos[0])  # type: ignore[arg-type]
+            else:
+                sets = sorted((self._eval(n) for n in pos), key=len)  # type: ignore[arg-type]
+                acc = sets[0]
+                for s in sets[1:]:
+                    if not acc:
+                        return _EMPTY
+                    acc = acc & s
+            # 'a and not b' → a - b, never materializing the complement of b.
+            for n in neg:
+                if not acc:
+                    break
+                acc = acc - self._eval(n)  # type: ignore[arg-type]
+            return acc
+        out: set[str] = set()
+        for n in node[1:]:
+            out |= self._eval(n)  # type: ignore[arg-type]
+        return frozenset(out)
+
+    def match(self, expr: str) -> FrozenSet[str]:
+        """Address names matching a dynamic tag expression."""
+        return self._eval(compile_filter(expr))
+
+    def members(self, group: str) -> FrozenSet[str]:
+        """Flattened address names for a group (nested groups expanded)."""
+        return self._resolve(group, ())
+
+    def _resolve(self, name: str, path: Tuple[str, ...]) -> FrozenSet[str]:
+        done = self._resolved.get(name)
+        if done is not None:
+            return done
+        if name in path:
+            raise AddressGroupResolveError("address-group cycle: " + " → ".join(path + (name,)))
+        group = self.groups.get(name)
+        if group is None:
+            raise KeyError(name)
+        if group.kind == "dynamic":
+            result = self.match(group.filter or "")
+        else:
+            acc: set[str] = set()
+            missing: List[str] = []
+            for m in group.members:
+                if m in self.groups:
+                    acc |= self._resolve(m, path + (name,))
+                elif m in self.addresses:
+                    acc.add(m)
+                else:
+                    missing.append(m)
+            if missing:
+                self.unresolved[name] = tuple(missing)
+            result = frozenset(acc)
+        self._resolved[name] = result
+        return result
+
+    def resolve_all(self) -> Dict[str, FrozenSet[str]]:
+        """Membership for every group."""
+        return {name: self.members(name) for name in self.groups}
+
+    def addresses_of(self, group: str) -> List[AddressObject]:
+        return [self.addresses[n] for n in sorted(self.members(group))]
@@ -0,0 +1,92 @@
+# src/optiv_lib/providers/pan/objects/address_group/serializer.py
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List
+
+import xmltodict
+
+from .model import AddressGroupObject
+
+
+def parent_xpath(device_group: str | None) -> str:
+    """Shared or device-group container XPath for address groups."""
+    if device_group is None:
+        return "/config/shared/address-group"
+    return f"/config/devices/entry/device-group/entry[@name='{device_group}']/address-group"
+
+
+def entry_xpath(name: str, device_group: str | None) -> str:
+    """XPath for a specific address-group entry."""
+    return f"{parent_xpath(device_group)}/entry[@name='{name}']"
+
+
+# ----------------------------
+# XML serialization
+# ----------------------------
+
+def to_xml(obj: AddressGroupObject) -> str:
+    """
+    Serialize AddressGroupObject to a PAN-OS <entry> XML fragment.
+
+    Layout:
+      <entry name="...">
+        <static><member>...</member>...</static> | <dynamic><filter>...</filter></dynamic>
+        <description>...</description>
+        <tag><member>...</member>...</tag>
+        <disable-override>yes</disable-override>
+      </entry>
+    """
+    entry: Dict[str, Any] = OrderedDict()
+    entry["@name"] = obj.name
+    if obj.kind == "static":
+        entry["static"] = {"member": list(obj.members)}
+    else:
+        entry["dynamic"] = {"filter": obj.filter}
+    if obj.description:
+        entry["description"] = obj.description
+    if obj.tags:
+        entry["tag"] = {"member": list(obj.tags)}
+    if obj.disable_override:
+        entry["disable-override"] = "yes"
+
+    return xmltodict.unparse({"entry": entry}, full_document=False)
+
+
+def to_xml_list(objs: Iterable[AddressGroupObject]) -> List[str]:
+    """Serialize many AddressGroupObject items to a list of <entry> XML strings."""
+    return [to_xml(o) for o in objs]
+
+
+# ----------------------------
+# JSON serialization
+# ----------------------------
+
+def to_json_dict(obj: AddressGroupObject) -> Dict[str, Any]:
+    """Serialize to a compact JSON-ready dict."""
+    d: Dict[str, Any] = {
+        "name": obj.name,
+        "kind": obj.kind,
+    }
+    if obj.kind == "static":
+        d["members"] = list(obj.members)
+    else:
+        d["filter"] = obj.filter
+    if obj.description:
+        d["description"] = obj.description
+    if obj.tags:
+        d["tags"] = list(obj.tags)
+    if obj.disable_override:
+        d["disable_override"] = True
+    return d
+
+
+def to_json_list(objs: Iterable[AddressGroupObject]) -> List[Dict[str, Any]]:
+    """Serialize many to JSON-ready dicts."""
+    return [to_json_dict(o) for o in objs]
+
+
+def to_json(obj: AddressGroupObject, *, indent: int = 2) -> str:
+    """Serialize one object to a JSON string."""
+    import json
+    return json.dumps(to_json_dict(obj), indent=indent, ensure_ascii=False)
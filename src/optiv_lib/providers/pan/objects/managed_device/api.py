@@ -1,7 +1,10 @@
 # src/optiv_lib/providers/pan/objects/managed_devices/api.py
 from __future__ import annotations
 
-from optiv_lib.providers.pan import ops
+from typing import List
+
+from optiv_lib.providers.pan.panorama.managed_devices import api as _md
+from optiv_lib.providers.pan.panorama.managed_devices.model import ManagedDevice
 from optiv_lib.providers.pan.session import PanoramaSession
 
 
@@ -10,10 +13,9 @@ def list_managed_devices_connected(*, session: PanoramaSession) -> dict:
     Panorama → show devices connected
 
     Returns the inner 'result' dict from the XML API.
-    Callers handle normalization as needed.
+    Callers handle normalization as needed; see list_managed_devices for typed output.
     """
-    cmd = "<show><devices><connected/></devices></show>"
-    return ops.op(session=session, cmd=cmd)
+    return _md.list_connected(session=session)
 
 
 def list_managed_devices_all(*, session: PanoramaSession) -> dict:
@@ -22,5 +24,9 @@ def list_managed_devices_all(*, session: PanoramaSession) -> dict:
 
     Returns the inner 'result' dict from the XML API.
     """
-    cmd = "<show><devices><all/></devices></show>"
-    return ops.op(session=session, cmd=cmd)
+    return _md.list_all(session=session)
+
+
+def list_managed_devices(*, session: PanoramaSession, connected_only: bool = False, membership: bool = False) -> List[ManagedDevice]:
+    """Typed managed-device list. See panorama.managed_devices.api.list_devices."""
+    return _md.list_devices(session=session, connected_only=connected_only, membership=membership)
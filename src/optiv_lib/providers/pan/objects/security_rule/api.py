@@ -0,0 +1,49 @@
+# src/optiv_lib/providers/pan/objects/security_rule/api.py
+from __future__ import annotations
+
+from typing import List, Optional
+
+from optiv_lib.providers.pan import ops
+from optiv_lib.providers.pan.objects.security_rule.model import Rulebase, SecurityRuleObject
+from optiv_lib.providers.pan.objects.security_rule.parser import from_xml
+from optiv_lib.providers.pan.objects.security_rule.serializer import entry_xpath, parent_xpath, to_xml
+from optiv_lib.providers.pan.session import PanoramaSession
+
+
+def list_security_rules(*, session: PanoramaSession, candidate: bool = True, device_group: Optional[str] = None, rulebase: Rulebase = "pre") -> List[SecurityRuleObject]:
+    """List security rules, in evaluation order, from candidate or running config."""
+    xpath = parent_xpath(device_group, rulebase)
+    result = ops.config_get(session=session, xpath=xpath) if candidate else ops.config_show(session=session, xpath=xpath)
+    return from_xml(result, strict=True)
+
+
+def create_security_rule(rule: SecurityRuleObject, *, device_group: Optional[str], session: PanoramaSession, rulebase: Rulebase = "pre") -> dict:
+    """Create (or merge) a security rule; new rules land at the bottom of the rulebase."""
+    xpath = parent_xpath(device_group, rulebase)
+    element = to_xml(rule)
+    return ops.config_set(session=session, xpath=xpath, element=element)
+
+
+def update_security_rule(rule: SecurityRuleObject, *, device_group: Optional[str], session: PanoramaSession, rulebase: Rulebase = "pre") -> dict:
+    """Replace an existing security rule in place."""
+    xpath = entry_xpath(rule.name, device_group, rulebase)
+    element = to_xml(rule)
+    return ops.config_edit(session=session, xpath=xpath, element=element)
+
+
+def rename_security_rule(*, old_name: str, new_name: str, device_group: Optional[str], session: PanoramaSession, rulebase: Rulebase = "pre") -> dict:
+    """Rename an existing security rule."""
+    xpath = entry_xpath(old_name, device_group, rulebase)
+    return ops.config_rename(session=session, xpath=xpath, newname=new_name)
+
+
+def delete_security_rule(*, name: str, device_group: Optional[str], session: PanoramaSession, rulebase: Rulebase = "pre") -> dict:
+    """Delete a security rule."""
+    xpath = entry_xpath(name, device_group, rulebase)
+    return ops.config_delete(session=session, xpath=xpath)
+
+
+def move_security_rule(*, name: str, where: str, device_group: Optional[str], session: PanoramaSession, dst: Optional[str] = None, rulebase: Rulebase = "pre") -> dict:
+    """Move a rule: where is top | bottom | before | after (dst names the reference rule)."""
+    xpath = entry_xpath(name, device_group, rulebase)
+    return ops.config_move(session=session, xpath=xpath, where=where, dst=dst)
@@ -0,0 +1,434 @@
+# src/optiv_lib/providers/pan/objects/security_rule/engine.py
+from __future__ import annotations
+
+import ipaddress
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+from optiv_lib.providers.pan.objects.address.model import AddressObject
+from optiv_lib.providers.pan.objects.address_group.model import AddressGroupObject
+from optiv_lib.providers.pan.objects.address_group.resolver import AddressGroupResolver
+from optiv_lib.providers.pan.objects.security_rule.model import SecurityRuleObject
+
+ServicePort = Tuple[str, int, int]  # (protocol, low port, high port)
+ServiceSpec = Union[str, ServicePort]
+
+BUILTIN_SERVICES: Dict[str, Tuple[ServicePort, ...]] = {
+    "service-http": (("tcp", 80, 80), ("tcp", 8080, 8080)),
+    "service-https": (("tcp", 443, 443),),
+}
+
+_V4_MAX = (1 << 32) - 1
+_V6_MAX = (1 << 128) - 1
+_MAX_WILDCARD_SPANS = 256
+
+
+@dataclass(slots=True, frozen=True)
+class Flow:
+    """
+    One flow to evaluate. Optional fields left as None are not constrained
+    (e.g. application=None matches rules for any application).
+    """
+    from_zone: str
+    to_zone: str
+    source: str
+    destination: str
+    protocol: str = "tcp"
+    port: int = 0
+    application: Optional[str] = None
+    source_user: Optional[str] = None
+    category: Optional[str] = None
+
+
+def parse_service_port(spec: ServiceSpec) -> ServicePort:
+    """'tcp/443', 'udp/1000-2000' or ('tcp', 80, 80) → (protocol, low, high)."""
+    if not isinstance(spec, str):
+        proto, lo, hi = spec
+        return proto.lower(), int(lo), int(hi)
+    proto, sep, ports = spec.partition("/")
+    if not sep:
+        raise ValueError(f"service must be 'proto/port[-port]': {spec!r}")
+    a, _, b = ports.partition("-")
+    lo, hi = int(a), int(b or a)
+    if not 0 <= lo <= hi <= 65535:
+        raise ValueError(f"invalid port range: {spec!r}")
+    return proto.strip().lower(), lo, hi
+
+
+# ----------------------------
+# Per-field indexes (bit i = rule i)
+# ----------------------------
+
+class _ValueIndex:
+    """Exact-value field (zones, applications, users, categories)."""
+
+    __slots__ = ("by_value", "any")
+
+    def __init__(self) -> None:
+        self.by_value: Dict[str, int] = {}
+        self.any = 0
+
+    def add(self, bit: int, values: Iterable[str]) -> None:
+        for v in values:
+            if v == "any":
+                self.any |= bit
+            else:
+                self.by_value[v] = self.by_value.get(v, 0) | bit
+
+    def lookup(self, value: Optional[str]) -> int:
+        return self.any | self.by_value.get(value, 0) if value is not None else -1
+
+
+class _IntervalIndex:
+    """
+    Integer intervals → rule masks.
+
+    freeze() sweeps all interval endpoints once and stores the rule mask of
+    every elementary segment, so a lookup is one bisect.
+    """
+
+    __slots__ = ("_spans", "_points", "_masks")
+
+    def __init__(self) -> None:
+        self._spans: List[Tuple[int, int, int]] = []
+        self._points: List[int] = []
+        self._masks: List[int] = []
+
+    def add(self, lo: int, hi: int, bit: int) -> None:
+        self._spans.append((lo, hi, bit))
+
+    def freeze(self) -> None:
+        events: Dict[int, List[Tuple[int, int]]] = {}
+        for lo, hi, bit in self._spans:
+            events.setdefault(lo, []).append((bit, 1))
+            events.setdefault(hi + 1, []).append((bit, -1))
+        counts: Dict[int, int] = {}
+        mask = 0
+        points: List[int] = []
+        masks: List[int] = []
+        for p in sorted(events):
+            for bit, d in events[p]:
+                c = counts.get(bit, 0) + d
+                counts[bit] = c
+                if c == 0:
+                    mask &= ~bit
+                elif c == 1 and d == 1:
+                    mask |= bit
+            if masks and masks[-1] == mask:
+                continue
+            points.append(p)
+            masks.append(mask)
+        self._points, self._masks = points, masks
+        self._spans = []
+
+    def lookup(self, x: int) -> int:
+        i = bisect_right(self._points, x) - 1
+        return self._masks[i] if i >= 0 else 0
+
+
+class _AddressIndex:
+    """Source or destination field: v4/v6 interval indexes plus negation."""
+
+    __slots__ = ("any", "negated", "_pos", "_neg")
+
+    def __init__(self) -> None:
+        self.any = 0
+        self.negated = 0
+        self._pos = {4: _IntervalIndex(), 6: _IntervalIndex()}
+        self._neg = {4: _IntervalIndex(), 6: _IntervalIndex()}
+
+    def add(self, bit: int, spans: Iterable[Tuple[int, int, int]], *, is_any: bool, negate: bool) -> None:
+        target = self._neg if negate else self._pos
+        if negate:
+            self.negated |= bit
+        if is_any:
+            if not negate:
+                self.any |= bit
+                return
+            spans = [(4, 0, _V4_MAX), (6, 0, _V6_MAX)]
+        for version, lo, hi in spans:
+            target[version].add(lo, hi, bit)
+
+    def freeze(self) -> None:
+        for idx in (*self._pos.values(), *self._neg.values()):
+            idx.freeze()
+
+    def lookup(self, ip: Union[ipaddress.IPv4Address, ipaddress.IPv6Address]) -> int:
+        n, v = int(ip), ip.version
+        return self.any | self._pos[v].lookup(n) | (self.negated & ~self._neg[v].lookup(n))
+
+
+class _ServiceIndex:
+    __slots__ = ("any", "_by_proto")
+
+    def __init__(self) -> None:
+        self.any = 0
+        self._by_proto: Dict[str, _IntervalIndex] = {}
+
+    def add(self, bit: int, ports: Iterable[ServicePort]) -> None:
+        for proto, lo, hi in ports:
+            self._by_proto.setdefault(proto, _IntervalIndex()).add(lo, hi, bit)
+
+    def freeze(self) -> None:
+        for idx in self._by_proto.values():
+            idx.freeze()
+
+    def lookup(self, protocol: str, port: int) -> int:
+        idx = self._by_proto.get(protocol.lower())
+        return self.any | (idx.lookup(port) if idx is not None else 0)
+
+
+# ----------------------------
+# Address resolution
+# ----------------------------
+
+def _wildcard_spans(value: str) -> Optional[List[Tuple[int, int, int]]]:
+    """Expand an ip-wildcard into intervals; None when it would be too many."""
+    ip_str, _, mask_str = value.partition("/")
+    base = int(ipaddress.IPv4Address(ip_str))
+    mask = int(ipaddress.IPv4Address(mask_str))
+    low = mask & ~(mask + 1)  # contiguous low-order wildcard bits
+    scattered = [b for b in range(32) if (mask >> b) & 1 and not (low >> b) & 1]
+    if 1 << len(scattered) > _MAX_WILDCARD_SPANS:
+        return None
+    base &= ~mask & _V4_MAX
+    out: List[Tuple[int, int, int]] = []
+    for combo in range(1 << len(scattered)):
+        start = base
+        for i, b in enumerate(scattered):
+            if (combo >> i) & 1:
+                start |= 1 << b
+        out.append((4, start, start + low))
+    return out
+
+
+def _literal_spans(value: str) -> Optional[List[Tuple[int, int, int]]]:
+    """Inline IP / CIDR / range members ('10.0.0.0/8', '10.0.0.1-10.0.0.9')."""
+    try:
+        if "-" in value:
+            a, _, b = value.partition("-")
+            ia, ib = ipaddress.ip_address(a.strip()), ipaddress.ip_address(b.strip())
+            if ia.version != ib.version or int(ia) > int(ib):
+                return None
+            return [(ia.version, int(ia), int(ib))]
+        net = ipaddress.ip_network(value, strict=False)
+    except ValueError:
+        return None
+    return [(net.version, int(net.network_address), int(net.broadcast_address))]
+
+
+def address_spans(obj: AddressObject) -> Optional[List[Tuple[int, int, int]]]:
+    """(version, low, high) intervals for an address object; None for fqdn."""
+    if obj.kind in ("ip-netmask", "ip-range"):
+        return _literal_spans(obj.value)
+    if obj.kind == "ip-wildcard":
+        return _wildcard_spans(obj.value)
+    return None
+
+
+# ----------------------------
+# Engine
+# ----------------------------
+
+class SecurityRuleEngine:
+    """
+    First-match evaluation of an ordered security rulebase.
+
+    Rules are compiled once into per-field indexes that map a flow attribute
+    to a bitmask of candidate rules (bit i = rule i): zones, applications,
+    users and categories by exact value; source/destination by IP interval
+    (elementary segments + bisect, v4 and v6); services by protocol and port
+    interval. A lookup ANDs one mask per field, and the lowest set bit is
+    the first matching rule, so the cost barely grows with rule count.
+
+    Address members resolve through the scope's AddressObjects and
+    AddressGroupResolver (nested and dynamic groups); inline IPs, CIDRs and
+    ranges are accepted. FQDN objects and unknown names cannot be matched
+    and are reported in `unresolved` (rule name → members). Service members
+    resolve through `services` (name → 'tcp/443' style specs), `service_groups`
+    and the built-in service-http/service-https; 'application-default' is
+    treated as any port because App-ID port defaults are not in config.
+    Disabled rules never match.
+
+    Example:
+        engine = SecurityRuleEngine(rules, addresses=addrs, address_groups=groups)
+        rule = engine.match(Flow("trust", "untrust", "10.1.1.5", "8.8.8.8", "udp", 53, "dns"))
+    """
+
+    def __init__(
+        self,
+        rules: Iterable[SecurityRuleObject],
+        *,
+        addresses: Iterable[AddressObject] = (),
+        address_groups: Iterable[AddressGroupObject] = (),
+        services: Optional[Mapping[str, Sequence[ServiceSpec]]] = None,
+        service_groups: Optional[Mapping[str, Sequence[str]]] = None,
+        application_groups: Optional[Mapping[str, Sequence[str]]] = None,
+    ) -> None:
+        self.rules: Tuple[SecurityRuleObject, ...] = tuple(rules)
+        self.resolver = AddressGroupResolver(addresses, address_groups)
+        self._services: Dict[str, Tuple[ServicePort, ...]] = dict(BUILTIN_SERVICES)
+        for name, specs in (services or {}).items():
+            self._services[name] = tuple(parse_service_port(s) for s in specs)
+        self._service_groups = {k: tuple(v) for k, v in (service_groups or {}).items()}
+        self._app_groups = {k: tuple(v) for k, v in (application_groups or {}).items()}
+        self.unresolved: Dict[str, Tuple[str, ...]] = {}
+        self._addr_cache: Dict[str, Optional[List[Tuple[int, int, int]]]] = {}
+
+        self._enabled = 0
+        self._intrazone_only = 0
+        self._interzone_only = 0
+        self._from = _ValueIndex()
+        self._to = _ValueIndex()
+        self._users = _ValueIndex()
+        self._apps = _ValueIndex()
+        self._categories = _ValueIndex()
+        self._src = _AddressIndex()
+        self._dst = _AddressIndex()
+        self._svc = _ServiceIndex()
+        self._compile()
+
+    # ----------------------------
+    # Compilation
+    # ----------------------------
+
+    def _compile(self) -> None:
+        for i, rule in enumerate(self.rules):
+            bit = 1 << i
+            missing: List[str] = []
+            if not rule.disabled:
+                self._enabled |= bit
+            if rule.rule_type == "intrazone":
+                self._intrazone_only |= bit
+            elif rule.rule_type == "interzone":
+                self._interzone_only |= bit
+
+            self._from.add(bit, rule.from_zones)
+            self._to.add(bit, rule.to_zones)
+            self._users.add(bit, rule.source_users)
+            self._categories.add(bit, rule.categories)
+            self._apps.add(bit, self._expand_apps(rule.applications))
+
+            for index, members, negate in (
+                (self._src, rule.sources, rule.negate_source),
+                (self._dst, rule.destinations, rule.negate_destination),
+            ):
+                is_any = members == ("any",)
+                spans = [] if is_any else self._address_member_spans(members, missing)
+                index.add(bit, spans, is_any=is_any, negate=negate)
+
+            if rule.services in (("any",), ("application-default",)):
+                self._svc.any |= bit
+            else:
+                self._svc.add(bit, self._service_ports(rule.services, missing, ()))
+
+            if missing:
+                self.unresolved[rule.name] = tuple(dict.fromkeys(missing))
+
+        for index in (self._src, self._dst, self._svc):
+            index.freeze()
+
+    def _address_member_spans(self, members: Sequence[str], missing: List[str]) -> List[Tuple[int, int, int]]:
+        out: List[Tuple[int, int, int]] = []
+        for m in members:
+            spans = self._addr_cache.get(m, False)
+            if spans is False:
+                spans = self._addr_cache[m] = self._resolve_address(m)
+            if spans is None:
+                missing.append(m)
+            else:
+                out.extend(spans)
+        return out
+
+    def _resolve_address(self, name: str) -> Optional[List[Tuple[int, int, int]]]:
+        # Same lookup order as PAN-OS: objects shadow inline values.
+        obj = self.resolver.addresses.get(name)
+        if obj is not None:
+            return address_spans(obj)
+        if name in self.resolver.groups:
+            spans: List[Tuple[int, int, int]] = []
+            for member in self.resolver.addresses_of(name):
+                s = address_spans(member)
+                if s:
+                    spans.extend(s)
+            return spans
+        return _literal_spans(name)
+
+    def _service_ports(self, members: Sequence[str], missing: List[str], path: Tuple[str, ...]) -> List[ServicePort]:
+        out: List[ServicePort] = []
+        for m in members:
+            if m in self._services:
+                out.extend(self._services[m])
+            elif m in self._service_groups and m not in path:
+                out.extend(self._service_ports(self._service_groups[m], missing, path + (m,)))
+            else:
+                missing.append(m)
+        return out
+
+    def _expand_apps(self, members: Sequence[str]) -> List[str]:
+        out: List[str] = []
+        stack = list(reversed(members))
+        seen: set[str] = set()
+        while stack:
+            m = stack.pop()
+            if m in seen:
+                continue
+            seen.add(m)
+            if m in self._app_groups:
+                stack.extend(reversed(self._app_groups[m]))
+            else:
+                out.append(m)
+        return out
+
+    # ----------------------------
+    # Lookup
+    # ----------------------------
+
+    def candidates_mask(self, flow: Flow) -> int:
+        """Bitmask of every rule that matches `flow` (bit i = self.rules[i])."""
+        m = self._enabled & self._from.lookup(flow.from_zone) & self._to.lookup(flow.to_zone)
+        if not m:
+            return 0
+        m &= ~self._interzone_only if flow.from_zone == flow.to_zone else ~self._intrazone_only
+        m &= self._apps.lookup(flow.application) & self._users.lookup(flow.source_user) & self._categories.lookup(flow.category)
+        if not m:
+            return 0
+        m &= self._svc.lookup(flow.protocol, flow.port)
+        if not m:
+            return 0
+        m &= self._src.lookup(ipaddress.ip_address(flow.source))
+        if not m:
+            return 0
+        return m & self._dst.lookup(ipaddress.ip_address(flow.destination))
+
+    def match_index(self, flow: Flow) -> Optional[int]:
+        """Position of the first matching rule, or None (implicit default rules)."""
+        m = self.candidates_mask(flow)
+        return (m & -m).bit_length() - 1 if m else None
+
+    def match(self, flow: Flow) -> Optional[SecurityRuleObject]:
+        """First matching rule, or None."""
+        i = self.match_index(flow)
+        return None if i is None else self.rules[i]
+
+    def candidates(self, flow: Flow) -> List[SecurityRuleObject]:
+        """Every matching rule in rulebase order (shadowing analysis)."""
+        m = self.candidates_mask(flow)
+        out: List[SecurityRuleObject] = []
+        while m:
+            low = m & -m
+            out.append(self.rules[low.bit_length() - 1])
+            m ^= low
+        return out
+
+    def match_many(self, flows: Iterable[Flow]) -> List[Optional[SecurityRuleObject]]:
+        """Batch first-match; repeated flows are evaluated once."""
+        memo: Dict[Flow, Optional[int]] = {}
+        out: List[Optional[SecurityRuleObject]] = []
+        for f in flows:
+            i = memo.get(f, -1)
+            if i == -1:
+                i = memo[f] = self.match_index(f)
+            out.append(None if i is None else self.rules[i])
+        return out
@@ -0,0 +1,75 @@
+# src/optiv_lib/providers/pan/objects/security_rule/model.py
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Literal, Optional, Sequence
+
+RuleAction = Literal["allow", "deny", "drop", "reset-client", "reset-server", "reset-both"]
+RuleType = Literal["universal", "intrazone", "interzone"]
+Rulebase = Literal["pre", "post"]
+
+ACTIONS: tuple[RuleAction, ...] = ("allow", "deny", "drop", "reset-client", "reset-server", "reset-both")
+RULE_TYPES: tuple[RuleType, ...] = ("universal", "intrazone", "interzone")
+
+
+def _normalize_members(values: Sequence[str], *, field_name: str) -> tuple[str, ...]:
+    """Trim, dedupe preserving order; 'any' must stand alone. Empty → ('any',)."""
+    seen: set[str] = set()
+    out: list[str] = []
+    for raw in values:
+        v = raw.strip()
+        if v and v not in seen:
+            seen.add(v)
+            out.append(v)
+    if not out:
+        return ("any",)
+    if "any" in seen and len(out) > 1:
+        raise ValueError(f"{field_name}: 'any' cannot be combined with other members")
+    return tuple(out)
+
+
+@dataclass(slots=True, frozen=True)
+class SecurityRuleObject:
+    """
+    PAN-OS Security policy rule.
+
+    Member fields default to ('any',); services default to ('application-default',).
+    """
+    name: str
+    from_zones: tuple[str, ...] = ("any",)
+    to_zones: tuple[str, ...] = ("any",)
+    sources: tuple[str, ...] = ("any",)
+    destinations: tuple[str, ...] = ("any",)
+    source_users: tuple[str, ...] = ("any",)
+    applications: tuple[str, ...] = ("any",)
+    services: tuple[str, ...] = ("application-default",)
+    categories: tuple[str, ...] = ("any",)
+    action: RuleAction = "allow"
+    rule_type: RuleType = "universal"
+    negate_source: bool = False
+    negate_destination: bool = False
+    disabled: bool = False
+
+    description: Optional[str] = None
+    tags: tuple[str, ...] = field(default_factory=tuple)
+    profile_group: Optional[str] = None
+    log_setting: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        if not self.name:
+            raise ValueError("name required")
+        if self.action not in ACTIONS:
+            raise ValueError(f"invalid action: {self.action}")
+        if self.rule_type not in RULE_TYPES:
+            raise ValueError(f"invalid rule_type: {self.rule_type}")
+
+        for f in ("from_zones", "to_zones", "sources", "destinations", "source_users", "applications", "categories"):
+            object.__setattr__(self, f, _normalize_members(getattr(self, f), field_name=f))
+        services = _normalize_members(self.services, field_name="services")
+        object.__setattr__(self, "services", services)
+
+        tags = _normalize_members(self.tags, field_name="tags") if self.tags else ()
+        object.__setattr__(self, "tags", tags)
+
+    def key(self) -> str:
+        return self.name
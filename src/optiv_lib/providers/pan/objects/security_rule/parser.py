@@ -0,0 +1,116 @@
+# src/optiv_lib/providers/pan/objects/security_rule/parser.py
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List
+
+from .model import RULE_TYPES, SecurityRuleObject
+from optiv_lib.providers.pan.util import as_list, collect_members, node_text, yn_bool
+
+
+class SecurityRuleParseError(ValueError):
+    """Raised when a security rule <entry> cannot be parsed in strict mode."""
+
+
+# ----------------------------
+# XML → model
+# ----------------------------
+
+def from_xml(result: Dict[str, Any], *, strict: bool = True) -> List[SecurityRuleObject]:
+    """
+    Convert ops.config_show/get result (inner 'result') into SecurityRuleObject items, in rule order.
+    """
+    entries = _pick_entries(result)
+    objs: List[SecurityRuleObject] = []
+    for entry in entries:
+        try:
+            objs.append(_xml_entry_to_model(entry))
+        except Exception as exc:
+            if strict:
+                raise SecurityRuleParseError(f"failed to parse security rule entry: {exc}") from exc
+    return objs
+
+
+def _pick_entries(result: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Accept either:
+      result['rules']['entry']  OR  result['entry']
+    """
+    rules_node = result.get("rules")
+    raw = rules_node.get("entry") if isinstance(rules_node, dict) and "entry" in rules_node else result.get("entry")
+    return [e for e in as_list(raw) if isinstance(e, dict)]
+
+
+def _xml_entry_to_model(entry: Dict[str, Any]) -> SecurityRuleObject:
+    name = (entry.get("@name") or "").strip()
+    if not name:
+        raise ValueError("missing @name")
+
+    rule_type = node_text(entry.get("rule-type")) or "universal"
+    if rule_type not in RULE_TYPES:
+        raise ValueError(f"invalid rule-type: {rule_type}")
+
+    profile = entry.get("profile-setting")
+    groups = collect_members(profile.get("group")) if isinstance(profile, dict) else []
+
+    return SecurityRuleObject(
+        name=name,
+        from_zones=tuple(collect_members(entry.get("from"))),
+        to_zones=tuple(collect_members(entry.get("to"))),
+        sources=tuple(collect_members(entry.get("source"))),
+        destinations=tuple(collect_members(entry.get("destination"))),
+        source_users=tuple(collect_members(entry.get("source-user"))),
+        applications=tuple(collect_members(entry.get("application"))),
+        services=tuple(collect_members(entry.get("service"))),
+        categories=tuple(collect_members(entry.get("category"))),
+        action=node_text(entry.get("action")) or "allow",  # type: ignore[arg-type]
+        rule_type=rule_type,  # type: ignore[arg-type]
+        negate_source=yn_bool(node_text(entry.get("negate-source"))),
+        negate_destination=yn_bool(node_text(entry.get("negate-destination"))),
+        disabled=yn_bool(node_text(entry.get("disabled"))),
+        description=node_text(entry.get("description")),
+        tags=tuple(collect_members(entry.get("tag"))),
+        profile_group=groups[0] if groups else None,
+        log_setting=node_text(entry.get("log-setting")),
+    )
+
+
+# ----------------------------
+# JSON → model
+# ----------------------------
+
+_MEMBER_FIELDS = ("from_zones", "to_zones", "sources", "destinations", "source_users", "applications", "services", "categories")
+
+
+def from_json_dict(d: Dict[str, Any]) -> SecurityRuleObject:
+    """
+    Convert a JSON-ready dict (from serializer.to_json_dict) into SecurityRuleObject.
+    """
+    name = str(d.get("name") or "").strip()
+    if not name:
+        raise ValueError("name is required")
+
+    members = {f: tuple(e for e in as_list(d.get(f)) if isinstance(e, str)) for f in _MEMBER_FIELDS}
+    return SecurityRuleObject(
+        name=name,
+        action=str(d.get("action") or "allow"),  # type: ignore[arg-type]
+        rule_type=str(d.get("rule_type") or "universal"),  # type: ignore[arg-type]
+        negate_source=bool(d.get("negate_source", False)),
+        negate_destination=bool(d.get("negate_destination", False)),
+        disabled=bool(d.get("disabled", False)),
+        description=d.get("description"),
+        tags=tuple(e for e in as_list(d.get("tags")) if isinstance(e, str)),
+        profile_group=d.get("profile_group"),
+        log_setting=d.get("log_setting"),
+        **members,
+    )
+
+
+def from_json_list(items: Iterable[Dict[str, Any]], *, strict: bool = True) -> List[SecurityRuleObject]:
+    out: List[SecurityRuleObject] = []
+    for it in items:
+        try:
+            out.append(from_json_dict(it))
+        except Exception as exc:
+            if strict:
+                raise SecurityRuleParseError(f"failed to parse security rule json: {exc}") from exc
+    return out
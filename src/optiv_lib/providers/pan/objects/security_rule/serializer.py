@@ -0,0 +1,124 @@
+# src/optiv_lib/providers/pan/objects/security_rule/serializer.py
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List
+
+import xmltodict
+
+from .model import Rulebase, SecurityRuleObject
+
+
+def parent_xpath(device_group: str | None, rulebase: Rulebase = "pre") -> str:
+    """Shared or device-group container XPath for security rules."""
+    if rulebase not in ("pre", "post"):
+        raise ValueError(f"invalid rulebase: {rulebase}")
+    if device_group is None:
+        return f"/config/shared/{rulebase}-rulebase/security/rules"
+    return f"/config/devices/entry/device-group/entry[@name='{device_group}']/{rulebase}-rulebase/security/rules"
+
+
+def entry_xpath(name: str, device_group: str | None, rulebase: Rulebase = "pre") -> str:
+    """XPath for a specific security rule entry."""
+    return f"{parent_xpath(device_group, rulebase)}/entry[@name='{name}']"
+
+
+# ----------------------------
+# XML serialization
+# ----------------------------
+
+def to_xml(obj: SecurityRuleObject) -> str:
+    """
+    Serialize SecurityRuleObject to a PAN-OS <entry> XML fragment.
+
+    Layout:
+      <entry name="...">
+        <from/> <to/> <source/> <destination/> <source-user/>
+        <category/> <application/> <service/>      (each <member>...</member>)
+        <action>allow</action>
+        <rule-type>universal</rule-type>          (only when not universal)
+        <negate-source>yes</negate-source> <negate-destination>yes</negate-destination>
+        <disabled>yes</disabled>
+        <description>...</description>
+        <tag><member>...</member></tag>
+        <profile-setting><group><member>...</member></group></profile-setting>
+        <log-setting>...</log-setting>
+      </entry>
+    """
+    entry: Dict[str, Any] = OrderedDict()
+    entry["@name"] = obj.name
+    entry["from"] = {"member": list(obj.from_zones)}
+    entry["to"] = {"member": list(obj.to_zones)}
+    entry["source"] = {"member": list(obj.sources)}
+    entry["destination"] = {"member": list(obj.destinations)}
+    entry["source-user"] = {"member": list(obj.source_users)}
+    entry["category"] = {"member": list(obj.categories)}
+    entry["application"] = {"member": list(obj.applications)}
+    entry["service"] = {"member": list(obj.services)}
+    entry["action"] = obj.action
+    if obj.rule_type != "universal":
+        entry["rule-type"] = obj.rule_type
+    if obj.negate_source:
+        entry["negate-source"] = "yes"
+    if obj.negate_destination:
+        entry["negate-destination"] = "yes"
+    if obj.disabled:
+        entry["disabled"] = "yes"
+    if obj.description:
+        entry["description"] = obj.description
+    if obj.tags:
+        entry["tag"] = {"member": list(obj.tags)}
+    if obj.profile_group:
+        entry["profile-setting"] = {"group": {"member": [obj.profile_group]}}
+    if obj.log_setting:
+        entry["log-setting"] = obj.log_setting
+
+    return xmltodict.unparse({"entry": entry}, full_document=False)
+
+
+def to_xml_list(objs: Iterable[SecurityRuleObject]) -> List[str]:
+    """Serialize many SecurityRuleObject items to a list of <entry> XML strings."""
+    return [to_xml(o) for o in objs]
+
+
+# ----------------------------
+# JSON serialization
+# ----------------------------
+
+_MEMBER_FIELDS = ("from_zones", "to_zones", "sources", "destinations", "source_users", "applications", "services", "categories")
+
+
+def to_json_dict(obj: SecurityRuleObject) -> Dict[str, Any]:
+    """Serialize to a compact JSON-ready dict."""
+    d: Dict[str, Any] = {"name": obj.name}
+    for f in _MEMBER_FIELDS:
+        d[f] = list(getattr(obj, f))
+    d["action"] = obj.action
+    if obj.rule_type != "universal":
+        d["rule_type"] = obj.rule_type
+    if obj.negate_source:
+        d["negate_source"] = True
+    if obj.negate_destination:
+        d["negate_destination"] = True
+    if obj.disabled:
+        d["disabled"] = True
+    if obj.description:
+        d["description"] = obj.description
+    if obj.tags:
+        d["tags"] = list(obj.tags)
+    if obj.profile_group:
+        d["profile_group"] = obj.profile_group
+    if obj.log_setting:
+        d["log_setting"] = obj.log_setting
+    return d
+
+
+def to_json_list(objs: Iterable[SecurityRuleObject]) -> List[Dict[str, Any]]:
+    """Serialize many to JSON-ready dicts."""
+    return [to_json_dict(o) for o in objs]
+
+
+def to_json(obj: SecurityRuleObject, *, indent: int = 2) -> str:
+    """Serialize one object to a JSON string."""
+    import json
+    return json.dumps(to_json_dict(obj), indent=indent, ensure_ascii=False)
@@ -68,7 +68,8 @@ def _call(*, session: PanoramaSession, method: str, params: Dict[str, Any], retr
 
 
 # ---------------------------
-# Config API (returns response.result)
+# Config API (returns response.result; rename/clone are not retried, a replay
+# after a lost response fails or duplicates)
 # ---------------------------
 
 def config_show(*, session: PanoramaSession, xpath: str) -> dict:
@@ -92,11 +93,11 @@ def config_delete(*, session: PanoramaSession, xpath: str) -> dict:
 
 
 def config_rename(*, session: PanoramaSession, xpath: str, newname: str) -> dict:
-    return _call(session=session, method="POST", params={"type": "config", "action": "rename", "xpath": xpath, "newname": newname}, )
+    return _call(session=session, method="POST", params={"type": "config", "action": "rename", "xpath": xpath, "newname": newname}, retries=0)
 
 
 def config_clone(*, session: PanoramaSession, xpath: str, newname: str) -> dict:
-    return _call(session=session, method="POST", params={"type": "config", "action": "clone", "xpath": xpath, "newname": newname}, )
+    return _call(session=session, method="POST", params={"type": "config", "action": "clone", "xpath": xpath, "newname": newname}, retries=0)
 
 
 def config_move(*, session: PanoramaSession, xpath: str, where: str, dst: str | None = None) -> dict:
@@ -117,6 +118,41 @@ def op(*, session: PanoramaSession, cmd: str) -> dict:
     return _call(session=session, method="GET", params={"type": "op", "cmd": cmd})
 
 
+# ---------------------------
+# Commit API (returns response.result; 'job' holds the job ID when one was enqueued)
+# ---------------------------
+
+def commit(*, session: PanoramaSession, cmd: str, action: str | None = None) -> dict:
+    """
+    Example cmd: "<commit></commit>", or with action="all":
+    "<commit-all><shared-policy>...</shared-policy></commit-all>"
+
+    Not retried: a timeout or 5xx may arrive after Panorama enqueued the
+    job, and a retry would enqueue a second commit.
+    """
+    p: Dict[str, Any] = {"type": "commit", "cmd": cmd}
+    if action:
+        p["action"] = action
+    return _call(session=session, method="POST", params=p, retries=0)
+
+
+# ---------------------------
+# Log API (async jobs; see logs.iter_logs for streaming retrieval)
+# ---------------------------
+
+def log_enqueue(*, session: PanoramaSession, log_type: str, query: str | None = None, nlogs: int = 20, skip: int = 0, direction: str = "backward") -> dict:
+    """Enqueue a log query job. Returns inner 'result' ({'job': '<id>', ...}). Not retried (a retry can leave an orphan job)."""
+    p: Dict[str, Any] = {"type": "log", "log-type": log_type, "nlogs": nlogs, "skip": skip, "dir": direction}
+    if query:
+        p["query"] = query
+    return _call(session=session, method="GET", params=p, retries=0)
+
+
+def log_finish(*, session: PanoramaSession, job_id: str) -> dict:
+    """Stop a log job and release it on the management plane."""
+    return _call(session=session, method="GET", params={"type": "log", "action": "finish", "job-id": job_id}, retries=0)
+
+
 # ---------------------------
 # Panorama → device proxy ops/config
 # ---------------------------
@@ -0,0 +1,93 @@
+# src/optiv_lib/providers/pan/panorama/commit/api.py
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Dict, Mapping, Optional, Sequence
+
+import xmltodict
+
+from optiv_lib.providers.pan import ops
+from optiv_lib.providers.pan.jobs import JobHandle, handle_from_result
+from optiv_lib.providers.pan.session import PanoramaSession
+
+
+def _unparse(root: str, body: Dict[str, Any]) -> str:
+    return xmltodict.unparse({root: body}, full_document=False)
+
+
+def _push_flags(body: Dict[str, Any], *, merge_with_candidate: bool, force_template_values: bool, description: Optional[str]) -> None:
+    if description:
+        body["description"] = description
+    if merge_with_candidate:
+        body["merge-with-candidate-cfg"] = "yes"
+    if force_template_values:
+        body["force-template-values"] = "yes"
+
+
+def commit(*, session: PanoramaSession, description: Optional[str] = None, admins: Sequence[str] | None = None, force: bool = False) -> Optional[JobHandle]:
+    """
+    Commit the Panorama candidate config.
+    admins limits the commit to those administrators' changes (partial commit).
+    Returns None when there is nothing to commit.
+    """
+    body: Dict[str, Any] = OrderedDict()
+    if description:
+        body["description"] = description
+    if admins:
+        body["partial"] = {"admin": {"member": list(admins)}}
+    if force:
+        body["force"] = ""
+    result = ops.commit(session=session, cmd=_unparse("commit", body))
+    return handle_from_result(result, kind="commit", description=description)
+
+
+def push_device_groups(
+    *,
+    session: PanoramaSession,
+    device_groups: Sequence[str],
+    devices: Mapping[str, Sequence[str]] | None = None,
+    include_template: bool = False,
+    merge_with_candidate: bool = False,
+    force_template_values: bool = False,
+    description: Optional[str] = None,
+) -> Optional[JobHandle]:
+    """
+    Push shared policy to device groups in one commit-all job.
+    devices maps device group → serials to limit the push; omitted groups push to all members.
+    """
+    if not device_groups:
+        raise ValueError("device_groups required")
+    entries = []
+    for dg in device_groups:
+        entry: Dict[str, Any] = OrderedDict()
+        entry["@name"] = dg
+        serials = (devices or {}).get(dg)
+        if serials:
+            entry["devices"] = {"entry": [{"@name": s} for s in serials]}
+        entries.append(entry)
+    body: Dict[str, Any] = OrderedDict()
+    body["device-group"] = {"entry": entries}
+    if include_template:
+        body["include-template"] = "yes"
+    _push_flags(body, merge_with_candidate=merge_with_candidate, force_template_values=force_template_values, description=description)
+    result = ops.commit(session=session, cmd=_unparse("commit-all", {"shared-policy": body}), action="all")
+    return handle_from_result(result, kind="commit-all", description=description)
+
+
+def push_template_stack(
+    *,
+    session: PanoramaSession,
+    template_stack: str,
+    devices: Sequence[str] | None = None,
+    merge_with_candidate: bool = False,
+    force_template_values: bool = False,
+    description: Optional[str] = None,
+) -> Optional[JobHandle]:
+    """Push a template stack to its devices (or only `devices`) in one commit-all job."""
+    body: Dict[str, Any] = OrderedDict()
+    body["name"] = template_stack
+    if devices:
+        body["device"] = {"member": list(devices)}
+    _push_flags(body, merge_with_candidate=merge_with_candidate, force_template_values=force_template_values, description=description)
+    result = ops.commit(session=session, cmd=_unparse("commit-all", {"template-stack": body}), action="all")
+    return handle_from_result(result, kind="commit-all", description=description)
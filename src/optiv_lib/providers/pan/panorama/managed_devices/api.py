@@ -1,17 +1,25 @@
 # src/optiv_lib/providers/pan/panorama/managed_devices/api.py
 from __future__ import annotations
 
+from typing import List
+
 from optiv_lib.providers.pan import ops
+from optiv_lib.providers.pan.panorama.managed_devices.model import ManagedDevice
+from optiv_lib.providers.pan.panorama.managed_devices.parser import from_xml, membership_from_xml
 from optiv_lib.providers.pan.session import PanoramaSession
 
+CMD_DEVICES_CONNECTED = "<show><devices><connected/></devices></show>"
+CMD_DEVICES_ALL = "<show><devices><all/></devices></show>"
+CMD_DEVICE_GROUPS = "<show><devicegroups/></show>"
+CMD_TEMPLATES = "<show><templates/></show>"
+
 
 def list_connected(*, session: PanoramaSession) -> dict:
     """
     Panorama → show devices connected
     Returns inner 'result'.
     """
-    cmd = "<show><devices><connected/></devices></show>"
-    return ops.op(session=session, cmd=cmd)
+    return ops.op(session=session, cmd=CMD_DEVICES_CONNECTED)
 
 
 def list_all(*, session: PanoramaSession) -> dict:
@@ -19,5 +27,36 @@ def list_all(*, session: PanoramaSession) -> dict:
     Panorama → show devices all
     Returns inner 'result'.
     """
-    cmd = "<show><devices><all/></devices></show>"
-    return ops.op(session=session, cmd=cmd)
+    return ops.op(session=session, cmd=CMD_DEVICES_ALL)
+
+
+def list_device_groups(*, session: PanoramaSession) -> dict:
+    """
+    Panorama → show devicegroups
+    Returns inner 'result'.
+    """
+    return ops.op(session=session, cmd=CMD_DEVICE_GROUPS)
+
+
+def list_templates(*, session: PanoramaSession) -> dict:
+    """
+    Panorama → show templates
+    Returns inner 'result'.
+    """
+    return ops.op(session=session, cmd=CMD_TEMPLATES)
+
+
+def list_devices(*, session: PanoramaSession, connected_only: bool = False, membership: bool = False) -> List[ManagedDevice]:
+    """
+    Typed managed-device list.
+
+    membership=True adds two op calls to fill device_group, template_stack and template.
+    """
+    result = list_connected(session=session) if connected_only else list_all(session=session)
+    if not membership:
+        return from_xml(result, strict=True)
+    dg_map = membership_from_xml(list_device_groups(session=session), "devicegroups")
+    templates = list_templates(session=session)
+    ts_map = membership_from_xml(templates, "templates", stack=True)
+    tpl_map = membership_from_xml(templates, "templates", stack=False)
+    return from_xml(result, device_groups=dg_map, template_stacks=ts_map, templates=tpl_map, strict=True)
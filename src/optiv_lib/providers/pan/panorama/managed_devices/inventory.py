@@ -0,0 +1,244 @@
+# src/optiv_lib/providers/pan/panorama/managed_devices/inventory.py
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional
+
+from optiv_lib.providers.pan.panorama.managed_devices.api import list_devices
+from optiv_lib.providers.pan.panorama.managed_devices.model import ManagedDevice
+from optiv_lib.providers.pan.session import PanoramaSession
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(slots=True, frozen=True)
+class InventoryDiff:
+    """Changes between two inventory refreshes."""
+    added: tuple[ManagedDevice, ...] = field(default_factory=tuple)
+    removed: tuple[ManagedDevice, ...] = field(default_factory=tuple)
+    connected: tuple[ManagedDevice, ...] = field(default_factory=tuple)
+    disconnected: tuple[ManagedDevice, ...] = field(default_factory=tuple)
+    changed: tuple[ManagedDevice, ...] = field(default_factory=tuple)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.connected or self.disconnected or self.changed)
+
+
+Listener = Callable[[InventoryDiff], None]
+
+
+def diff_devices(old: Dict[str, ManagedDevice], new: Dict[str, ManagedDevice]) -> InventoryDiff:
+    """
+    Compare two serial → device maps.
+
+    A device that flips connection state is reported under connected/disconnected
+    only; 'changed' covers any other attribute change.
+    """
+    added = tuple(d for s, d in new.items() if s not in old)
+    removed = tuple(d for s, d in old.items() if s not in new)
+    connected: List[ManagedDevice] = []
+    disconnected: List[ManagedDevice] = []
+    changed: List[ManagedDevice] = []
+    for serial, dev in new.items():
+        prev = old.get(serial)
+        if prev is None or prev == dev:
+            continue
+        if prev.connected != dev.connected:
+            (connected if dev.connected else disconnected).append(dev)
+        else:
+            changed.append(dev)
+    return InventoryDiff(added=added, removed=removed, connected=tuple(connected), disconnected=tuple(disconnected), changed=tuple(changed))
+
+
+def _group(devices: List[ManagedDevice], attr: str) -> Dict[str, tuple[ManagedDevice, ...]]:
+    buckets: Dict[str, List[ManagedDevice]] = {}
+    for d in devices:
+        k = getattr(d, attr)
+        if k:
+            buckets.setdefault(k, []).append(d)
+    return {k: tuple(v) for k, v in buckets.items()}
+
+
+class _Index:
+    """Immutable lookup tables; swapped as a whole on refresh."""
+    __slots__ = ("by_serial", "by_hostname", "by_ip", "by_device_group", "by_template_stack", "by_template", "loaded_at")
+
+    def __init__(self, devices: List[ManagedDevice], loaded_at: float) -> None:
+        self.by_serial: Dict[str, ManagedDevice] = {d.serial: d for d in devices}
+        self.by_hostname: Dict[str, ManagedDevice] = {d.hostname.lower(): d for d in devices if d.hostname}
+        self.by_ip: Dict[str, ManagedDevice] = {}
+        for d in devices:
+            for ip in (d.ip_address, d.ipv6_address):
+                if ip:
+                    self.by_ip[ip] = d
+        self.by_device_group = _group(devices, "device_group")
+        self.by_template_stack = _group(devices, "template_stack")
+        self.by_template = _group(devices, "template")
+        self.loaded_at = loaded_at
+
+
+_EMPTY = _Index([], 0.0)
+
+
+class DeviceInventory:
+    """
+    Indexed managed-device inventory with TTL refresh and change notifications.
+
+    Lookups never call Panorama once loaded. With start(), a daemon thread
+    refreshes every `ttl` seconds; without it, the first lookup after the TTL
+    expires refreshes inline, and concurrent stale lookups share that one
+    fetch. Subscribers get an InventoryDiff whenever a refresh changes
+    anything.
+
+    Example:
+        inv = DeviceInventory(pano, ttl=120)
+        inv.subscribe(lambda d: print([x.hostname for x in d.disconnected]))
+        inv.start()
+        inv.in_device_group("branch")
+    """
+
+    def __init__(self, session: PanoramaSession, *, ttl: float = 300.0, membership: bool = True) -> None:
+        self._session = session
+        self._ttl = ttl
+        self._membership = membership
+        self._index = _EMPTY
+        self._listeners: List[Listener] = []
+        self._lock = threading.Lock()  # listeners and index swap
+        self._refresh_lock = threading.Lock()  # one Panorama fetch at a time
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ---------------------------
+    # Refresh
+    # ---------------------------
+
+    def refresh(self) -> InventoryDiff:
+        """Fetch from Panorama, swap indexes and notify subscribers."""
+        return self._refresh(force=True)
+
+    def _refresh(self, *, force: bool) -> InventoryDiff:
+        with self._refresh_lock:
+            if not force and not self._due():
+                # Another thread refreshed while this one waited for the lock.
+                return InventoryDiff()
+            devices = list_devices(session=self._session, membership=self._membership)
+            new = _Index(devices, time.monotonic())
+            with self._lock:
+                old, self._index = self._index, new
+                listeners = list(self._listeners)
+        diff = diff_devices(old.by_serial, new.by_serial)
+        if diff and old is not _EMPTY:
+            for listener in listeners:
+                try:
+                    listener(diff)
+                except Exception:
+                    log.exception("inventory listener failed")
+        return diff
+
+    @property
+    def stale(self) -> bool:
+        idx = self._index
+        return idx is _EMPTY or (time.monotonic() - idx.loaded_at) >= self._ttl
+
+    def _due(self) -> bool:
+        running = self._thread is not None and self._thread.is_alive()
+        return self._index is _EMPTY or (self.stale and not running)
+
+    def _current(self) -> _Index:
+        if self._due():
+            self._refresh(force=False)
+        return self._index
+
+    def subscribe(self, listener: Listener) -> Callable[[], None]:
+        """Register a change listener. Returns an unsubscribe callable."""
+        with self._lock:
+            self._listeners.append(listener)
+
+        def _unsubscribe() -> None:
+            with self._lock:
+                if listener in self._listeners:
+                    self._listeners.remove(listener)
+
+        return _unsubscribe
+
+    def start(self) -> None:
+        """Start background TTL refresh (idempotent)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="pan-device-inventory", daemon=True)
+        self._thread.start()
+
+    def stop(self, wait: bool = True) -> None:
+        self._stop.set()
+        if wait and self._thread is not None:
+            self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.refresh()
+            except Exception:
+                # Keep serving the last good snapshot; retry next tick.
+                log.exception("inventory refresh failed")
+            self._stop.wait(self._ttl)
+
+    def __enter__(self) -> "DeviceInventory":
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    # ---------------------------
+    # Lookups
+    # ---------------------------
+
+    def devices(self) -> List[ManagedDevice]:
+        return list(self._current().by_serial.values())
+
+    def connected(self) -> List[ManagedDevice]:
+        return [d for d in self._current().by_serial.values() if d.connected]
+
+    def get(self, serial: str) -> Optional[ManagedDevice]:
+        return self._current().by_serial.get(serial)
+
+    def by_hostname(self, hostname: str) -> Optional[ManagedDevice]:
+        """Case-insensitive hostname lookup."""
+        return self._current().by_hostname.get(hostname.lower())
+
+    def by_ip(self, ip: str) -> Optional[ManagedDevice]:
+        """Lookup by management IPv4 or IPv6 address."""
+        return self._current().by_ip.get(ip)
+
+    def in_device_group(self, device_group: str) -> tuple[ManagedDevice, ...]:
+        return self._current().by_device_group.get(device_group, ())
+
+    def in_template_stack(self, template_stack: str) -> tuple[ManagedDevice, ...]:
+        return self._current().by_template_stack.get(template_stack, ())
+
+    def in_template(self, template: str) -> tuple[ManagedDevice, ...]:
+        """Devices assigned directly to a plain template (not through a stack)."""
+        return self._current().by_template.get(template, ())
+
+    def device_groups(self) -> List[str]:
+        return sorted(self._current().by_device_group)
+
+    def template_stacks(self) -> List[str]:
+        return sorted(self._current().by_template_stack)
+
+    def templates(self) -> List[str]:
+        return sorted(self._current().by_template)
+
+    def __len__(self) -> int:
+        return len(self._current().by_serial)
+
+    def __iter__(self) -> Iterator[ManagedDevice]:
+        return iter(self.devices())
+
+    def __contains__(self, serial: object) -> bool:
+        return serial in self._current().by_serial
@@ -0,0 +1,39 @@
+# src/optiv_lib/providers/pan/panorama/managed_devices/model.py
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+@dataclass(slots=True, frozen=True)
+class ManagedDevice:
+    """
+    Compact view of one Panorama-managed firewall.
+
+    Built from 'show devices all|connected'; device_group, template and
+    template_stack are filled from 'show devicegroups' / 'show templates'
+    when requested. `template` is a plain template the device is assigned
+    to directly; `template_stack` is its template stack.
+    """
+    serial: str
+    hostname: Optional[str] = None
+    ip_address: Optional[str] = None
+    ipv6_address: Optional[str] = None
+    model: Optional[str] = None
+    family: Optional[str] = None
+    sw_version: Optional[str] = None
+    connected: bool = False
+    ha_state: Optional[str] = None
+    ha_peer_serial: Optional[str] = None
+    multi_vsys: bool = False
+    vsys: tuple[str, ...] = field(default_factory=tuple)
+    device_group: Optional[str] = None
+    template_stack: Optional[str] = None
+    template: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        if not self.serial:
+            raise ValueError("serial required")
+
+    def key(self) -> str:
+        return self.serial
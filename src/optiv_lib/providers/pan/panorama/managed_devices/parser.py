@@ -0,0 +1,111 @@
+# src/optiv_lib/providers/pan/panorama/managed_devices/parser.py
+from __future__ import annotations
+
+import sys
+from typing import Any, Dict, List, Mapping, Optional
+
+from .model import ManagedDevice
+from optiv_lib.providers.pan.util import as_list, node_text, yn_bool
+
+
+class ManagedDeviceParseError(ValueError):
+    """Raised when a device <entry> cannot be parsed in strict mode."""
+
+
+def _intern(s: Optional[str]) -> Optional[str]:
+    # Model, version and group names repeat across hundreds of devices.
+    return None if s is None else sys.intern(s)
+
+
+# ----------------------------
+# XML → model
+# ----------------------------
+
+def from_xml(
+    result: Dict[str, Any],
+    *,
+    device_groups: Mapping[str, str] | None = None,
+    template_stacks: Mapping[str, str] | None = None,
+    templates: Mapping[str, str] | None = None,
+    strict: bool = True,
+) -> List[ManagedDevice]:
+    """
+    Convert 'show devices all|connected' result (inner 'result') into ManagedDevice items.
+
+    device_groups / template_stacks / templates map serial → name (see membership_from_xml).
+    """
+    dg_map = device_groups or {}
+    ts_map = template_stacks or {}
+    tpl_map = templates or {}
+    objs: List[ManagedDevice] = []
+    for entry in _pick_entries(result, "devices"):
+        try:
+            objs.append(_xml_entry_to_model(entry, dg_map, ts_map, tpl_map))
+        except Exception as exc:
+            if strict:
+                raise ManagedDeviceParseError(f"failed to parse device entry: {exc}") from exc
+    return objs
+
+
+def membership_from_xml(result: Dict[str, Any], container: str, *, stack: Optional[bool] = None) -> Dict[str, str]:
+    """
+    Map serial → group name from 'show devicegroups' (container='devicegroups')
+    or 'show templates' (container='templates').
+
+    'show templates' lists plain templates and template stacks together:
+    stack=True keeps only template stacks, stack=False only plain templates,
+    None every group.
+    """
+    out: Dict[str, str] = {}
+    for group in _pick_entries(result, container):
+        name = (group.get("@name") or "").strip()
+        if not name:
+            continue
+        if stack is not None and yn_bool(node_text(group.get("template-stack"))) != stack:
+            continue
+        for dev in as_list((group.get("devices") or {}).get("entry")):
+            if not isinstance(dev, dict):
+                continue
+            serial = node_text(dev.get("serial")) or (dev.get("@name") or "").strip()
+            if serial:
+                out[serial] = sys.intern(name)
+    return out
+
+
+def _pick_entries(result: Dict[str, Any], container: str) -> List[Dict[str, Any]]:
+    """
+    Accept either:
+      result[container]['entry']  OR  result['entry']
+    """
+    node = result.get(container)
+    raw = node.get("entry") if isinstance(node, dict) and "entry" in node else result.get("entry")
+    return [e for e in as_list(raw) if isinstance(e, dict)]
+
+
+def _xml_entry_to_model(entry: Dict[str, Any], dg_map: Mapping[str, str], ts_map: Mapping[str, str], tpl_map: Mapping[str, str]) -> ManagedDevice:
+    serial = node_text(entry.get("serial")) or (entry.get("@name") or "").strip()
+    if not serial:
+        raise ValueError("missing serial")
+
+    ha = entry.get("ha") if isinstance(entry.get("ha"), dict) else {}
+    peer = ha.get("peer") if isinstance(ha.get("peer"), dict) else {}
+    vsys_node = entry.get("vsys") if isinstance(entry.get("vsys"), dict) else {}
+    vsys = tuple(n for n in ((v.get("@name") or "").strip() for v in as_list(vsys_node.get("entry")) if isinstance(v, dict)) if n)
+
+    return ManagedDevice(
+        serial=serial,
+        hostname=node_text(entry.get("hostname")),
+        ip_address=node_text(entry.get("ip-address")),
+        ipv6_address=node_text(entry.get("ipv6-address")),
+        model=_intern(node_text(entry.get("model"))),
+        family=_intern(node_text(entry.get("family"))),
+        sw_version=_intern(node_text(entry.get("sw-version"))),
+        connected=yn_bool(node_text(entry.get("connected"))),
+        ha_state=_intern(node_text(ha.get("state"))),
+        ha_peer_serial=node_text(peer.get("serial")),
+        multi_vsys=yn_bool(node_text(entry.get("multi-vsys"))),
+        vsys=vsys,
+        device_group=dg_map.get(serial),
+        template_stack=ts_map.get(serial),
+        template=tpl_map.get(serial),
+    )
@@ -0,0 +1,421 @@
+# src/optiv_lib/providers/pan/references.py
+from __future__ import annotations
+
+import ipaddress
+import re
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from optiv_lib.providers.pan import ops
+from optiv_lib.providers.pan.objects.address.parser import from_xml as addresses_from_xml
+from optiv_lib.providers.pan.objects.address_group.resolver import AddressGroupResolveError, AddressGroupResolver, filter_tags
+from optiv_lib.providers.pan.session import PanoramaSession
+from optiv_lib.providers.pan.util import as_list, collect_members, node_text
+
+SHARED = "shared"
+RULE_KIND = "security-rule"
+
+# Rulebase section → node kind. Every enabled rule of any of these is a
+# root for live()/unused(): an address used only by a NAT or decryption
+# rule is still in use.
+RULEBASE_KINDS = {
+    "security": RULE_KIND,
+    "nat": "nat-rule",
+    "pbf": "pbf-rule",
+    "decryption": "decryption-rule",
+    "authentication": "authentication-rule",
+    "application-override": "application-override-rule",
+    "dos": "dos-rule",
+    "qos": "qos-rule",
+    "tunnel-inspect": "tunnel-inspect-rule",
+    "sdwan": "sdwan-rule",
+}
+RULE_KINDS = frozenset(RULEBASE_KINDS.values())
+
+# Object sections read from every scope (shared and each device group).
+_OBJECT_SECTIONS = (
+    "address", "address-group", "service", "service-group", "tag",
+    "application-group", "application-filter", "profile-group",
+)
+
+# Kinds that share one name space within a scope; a reference names a
+# name space, not a kind (a rule source may be an address or a group).
+_NAMESPACE_OF = {
+    "address": "address", "address-group": "address",
+    "service": "service", "service-group": "service",
+    "application-group": "application", "application-filter": "application",
+}
+
+_BUILTIN = {
+    "address": frozenset({"any"}),
+    "service": frozenset({"any", "application-default", "service-http", "service-https"}),
+    "url-category": frozenset({"any"}),
+    "application": frozenset({"any"}),
+}
+
+_URL_ACTIONS = ("alert", "allow", "block", "continue", "override")
+_PREDEFINED_PROFILES = frozenset({"default", "strict"})
+_REGION_RE = re.compile(r"^[A-Z]{2}$")
+
+
+@dataclass(slots=True, frozen=True, order=True)
+class ObjectRef:
+    """One config object: scope is 'shared' or a device-group name."""
+    scope: str
+    kind: str
+    name: str
+
+    def __str__(self) -> str:
+        return f"{self.scope}/{self.kind}/{self.name}"
+
+
+@dataclass(slots=True, frozen=True)
+class DanglingRef:
+    """A reference from `source` to a name that resolves nowhere in its scope chain."""
+    source: ObjectRef
+    namespace: str
+    name: str
+
+
+def _entries(node: Any) -> List[Dict[str, Any]]:
+    if not isinstance(node, dict):
+        return []
+    return [e for e in as_list(node.get("entry")) if isinstance(e, dict) and e.get("@name")]
+
+
+def _names(node: Any) -> List[str]:
+    """Member list or single text value (NAT service, translated-address, ...)."""
+    if isinstance(node, dict) and "member" in node:
+        return collect_members(node)
+    text = node_text(node) if isinstance(node, (str, dict)) else None
+    return [text] if text else []
+
+
+def _nat_translated(e: Dict[str, Any]) -> List[str]:
+    """Address names in a NAT rule's source and destination translation."""
+    out: List[str] = []
+    st = e.get("source-translation")
+    if isinstance(st, dict):
+        for mode in st.values():
+            if isinstance(mode, dict):
+                out.extend(_names(mode.get("translated-address")))
+    for key in ("destination-translation", "dynamic-destination-translation"):
+        dt = e.get(key)
+        if isinstance(dt, dict):
+            out.extend(_names(dt.get("translated-address")))
+    return out
+
+
+def _is_ip_literal(value: str) -> bool:
+    try:
+        if "-" in value:
+            a, _, b = value.partition("-")
+            ipaddress.ip_address(a.strip())
+            ipaddress.ip_address(b.strip())
+        else:
+            ipaddress.ip_network(value, strict=False)
+    except ValueError:
+        return False
+    return True
+
+
+def _iter_scopes(cfg: Dict[str, Any]) -> Iterable[Tuple[str, Dict[str, Any]]]:
+    yield SHARED, cfg.get("shared") or {}
+    for dev in _entries(cfg.get("devices")):
+        for dg in _entries(dev.get("device-group")):
+            yield dg["@name"], dg
+
+
+def _dg_parents(cfg: Dict[str, Any]) -> Dict[str, Optional[str]]:
+    """Device-group hierarchy from the readonly section (both known layouts)."""
+    ro = cfg.get("readonly") or {}
+    parents: Dict[str, Optional[str]] = {}
+    for dev in _entries(ro.get("devices")):
+        for e in _entries(dev.get("device-group")):
+            parents[e["@name"]] = node_text(e.get("parent-dg"))
+    for e in _entries((ro.get("dg-meta-data") or {}).get("dg-info")):
+        parents.setdefault(e["@name"], node_text(e.get("parent-dg")))
+    return parents
+
+
+class ReferenceGraph:
+    """
+    In-memory reference graph over one full config pull.
+
+    Nodes are objects (ObjectRef) in shared and every device group: addresses,
+    address/service/application groups, services, tags, custom URL
+    categories, security profiles, profile groups and the rules of every
+    rulebase (security, NAT, PBF, decryption, authentication, ...; see
+    RULEBASE_KINDS). Edges point from user to used (rule → group → address,
+    rule → profile group → url-filtering profile → URL category). Names
+    resolve like PAN-OS does: the referencing device group first, then its
+    ancestors, then shared.
+
+    Dynamic address groups link to their tags and to the address objects
+    their filter matches among objects visible from the group's own scope.
+    Inline IPs, region codes and built-ins (any, application-default,
+    service-http/https) are not objects. Unresolved application and URL
+    category names are assumed predefined unless `predefined_url_categories`
+    is given, in which case unknown categories are reported as dangling.
+
+    Example:
+        graph = ReferenceGraph.from_session(pano)
+        stale = graph.unused(kinds=("address", "address-group"))
+        hit = graph.blast_radius(ObjectRef("shared", "address", "dns-1"))
+    """
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        *,
+        predefined_url_categories: Optional[Iterable[str]] = None,
+        parents: Optional[Dict[str, Optional[str]]] = None,
+    ) -> None:
+        cfg = config.get("config", config)
+        self.parents: Dict[str, Optional[str]] = dict(parents) if parents is not None else _dg_parents(cfg)
+        self._predefined_urls = frozenset(predefined_url_categories) if predefined_url_categories is not None else None
+
+        self.entries: Dict[ObjectRef, Dict[str, Any]] = {}
+        self.rulebase: Dict[ObjectRef, str] = {}
+        self.uses: Dict[ObjectRef, Set[ObjectRef]] = {}
+        self.used_by: Dict[ObjectRef, Set[ObjectRef]] = {}
+        self.by_name: Dict[str, List[ObjectRef]] = {}
+        self.dangling: List[DanglingRef] = []
+        self._index: Dict[str, Dict[Tuple[str, str], ObjectRef]] = {}
+        self._chains: Dict[str, Tuple[str, ...]] = {}
+        self._resolvers: Dict[str, AddressGroupResolver] = {}
+        self._live: Optional[FrozenSet[ObjectRef]] = None
+
+        for scope, node in _iter_scopes(cfg):
+            self._collect(scope, node)
+        for ref in list(self.entries):
+            self._link(ref)
+
+    @classmethod
+    def from_session(cls, session: PanoramaSession, *, candidate: bool = True, **kwargs: Any) -> "ReferenceGraph":
+        """One '/config' pull (candidate or running), then build the graph offline."""
+        fetch = ops.config_get if candidate else ops.config_show
+        return cls(fetch(session=session, xpath="/config"), **kwargs)
+
+    # ----------------------------
+    # Build
+    # ----------------------------
+
+    def _add(self, scope: str, kind: str, entry: Dict[str, Any]) -> ObjectRef:
+        ref = ObjectRef(scope, kind, entry["@name"])
+        self.entries[ref] = entry
+        self._index.setdefault(scope, {})[(_NAMESPACE_OF.get(kind, kind), ref.name)] = ref
+        self.by_name.setdefault(ref.name, []).append(ref)
+        return ref
+
+    def _collect(self, scope: str, node: Dict[str, Any]) -> None:
+        self._index.setdefault(scope, {})
+        for section in _OBJECT_SECTIONS:
+            for e in _entries(node.get(section)):
+                self._add(scope, section, e)
+        profiles = node.get("profiles")
+        if isinstance(profiles, dict):
+            for ptype, pnode in profiles.items():
+                kind = "url-category" if ptype == "custom-url-category" else ptype
+                for e in _entries(pnode):
+                    self._add(scope, kind, e)
+        for rulebase in ("pre-rulebase", "post-rulebase"):
+            sections = node.get(rulebase) or {}
+            for section, kind in RULEBASE_KINDS.items():
+                for e in _entries((sections.get(section) or {}).get("rules")):
+                    self.rulebase[self._add(scope, kind, e)] = rulebase
+
+    def chain(self, scope: str) -> Tuple[str, ...]:
+        """Lookup order for names referenced from `scope`."""
+        hit = self._chains.get(scope)
+        if hit is None:
+            out: List[str] = []
+            s: Optional[str] = scope
+            while s is not None and s != SHARED and s not in out:
+                out.append(s)
+                s = self.parents.get(s)
+            out.append(SHARED)
+            hit = self._chains[scope] = tuple(out)
+        return hit
+
+    def resolve(self, scope: str, namespace: str, name: str) -> Optional[ObjectRef]:
+        """The object `name` refers to when used from `scope`, or None."""
+        for s in self.chain(scope):
+            ref = self._index.get(s, {}).get((namespace, name))
+            if ref is not None:
+                return ref
+        return None
+
+    def _ref(self, src: ObjectRef, namespace: str, names: Iterable[str], *, soft: bool = False) -> None:
+        for name in names:
+            if name in _BUILTIN.get(namespace, ()):
+                continue
+            target = self.resolve(src.scope, namespace, name)
+            if target is None:
+                if namespace == "address" and (_is_ip_literal(name) or _REGION_RE.match(name)):
+                    continue
+                known = soft
+                if namespace == "url-category" and self._predefined_urls is not None:
+                    known = name in self._predefined_urls
+                if not known:
+                    self.dangling.append(DanglingRef(src, namespace, name))
+                continue
+            self.uses.setdefault(src, set()).add(target)
+            self.used_by.setdefault(target, set()).add(src)
+
+    def _link(self, ref: ObjectRef) -> None:
+        e = self.entries[ref]
+        kind = ref.kind
+        self._ref(ref, "tag", collect_members(e.get("tag")))
+
+        if kind == "address-group":
+            static = e.get("static")
+            if isinstance(static, dict):
+                self._ref(ref, "address", collect_members(static))
+            flt = node_text((e.get("dynamic") or {}).get("filter")) if isinstance(e.get("dynamic"), dict) else None
+            if flt:
+                self._link_dynamic(ref, flt)
+        elif kind == "service-group":
+            self._ref(ref, "service", collect_members(e.get("members")))
+        elif kind == "application-group":
+            self._ref(ref, "application", collect_members(e.get("members")), soft=True)
+        elif kind == "profile-group":
+            for ptype, members in e.items():
+                if not ptype.startswith("@"):
+                    self._ref_profiles(ref, ptype, members)
+        elif kind == "url-filtering":
+            for action in _URL_ACTIONS:
+                self._ref(ref, "url-category", collect_members(e.get(action)), soft=True)
+        elif kind == RULE_KIND:
+            self._ref(ref, "address", collect_members(e.get("source")) + collect_members(e.get("destination")))
+            self._ref(ref, "service", collect_members(e.get("service")))
+            self._ref(ref, "application", collect_members(e.get("application")), soft=True)
+            self._ref(ref, "url-category", collect_members(e.get("category")), soft=True)
+            profile = e.get("profile-setting")
+            if isinstance(profile, dict):
+                self._ref(ref, "profile-group", collect_members(profile.get("group")))
+                profiles = profile.get("profiles")
+                if isinstance(profiles, dict):
+                    for ptype, members in profiles.items():
+                        self._ref_profiles(ref, ptype, members)
+        elif kind in RULE_KINDS:
+            self._ref(ref, "address", _names(e.get("source")) + _names(e.get("destination")))
+            self._ref(ref, "service", _names(e.get("service")))
+            self._ref(ref, "application", _names(e.get("application")), soft=True)
+            self._ref(ref, "url-category", _names(e.get("category")), soft=True)
+            if kind == "nat-rule":
+                self._ref(ref, "address", _nat_translated(e))
+            elif kind == "pbf-rule":
+                nexthop = ((e.get("action") or {}).get("forward") or {}).get("nexthop") if isinstance(e.get("action"), dict) else None
+                if isinstance(nexthop, dict):
+                    self._ref(ref, "address", _names(nexthop.get("ip-address")))
+            elif kind == "decryption-rule":
+                self._ref_profiles(ref, "decryption", e.get("profile"))
+
+    def _ref_profiles(self, ref: ObjectRef, ptype: str, node: Any) -> None:
+        self._ref(ref, ptype, [n for n in _names(node) if n not in _PREDEFINED_PROFILES])
+
+    def _link_dynamic(self, ref: ObjectRef, flt: str) -> None:
+        try:
+            tags = filter_tags(flt)
+            matched = self._resolver(ref.scope).match(flt)
+        except AddressGroupResolveError:
+            self.dangling.append(DanglingRef(ref, "filter", flt))
+            return
+        # Tags in filters need not exist as tag objects.
+        self._ref(ref, "tag", sorted(tags), soft=True)
+        self._ref(ref, "address", sorted(matched))
+
+    def _resolver(self, scope: str) -> AddressGroupResolver:
+        # Built only for scopes that define dynamic groups.
+        hit = self._resolvers.get(scope)
+        if hit is None:
+            raw: List[Dict[str, Any]] = []
+            for s in reversed(self.chain(scope)):
+                raw.extend(e for r, e in self._scope_entries(s, "address"))
+            hit = self._resolvers[scope] = AddressGroupResolver(addresses_from_xml({"entry": raw}, strict=False), ())
+        return hit
+
+    def _scope_entries(self, scope: str, kind: str) -> List[Tuple[ObjectRef, Dict[str, Any]]]:
+        return [(r, self.entries[r]) for r in self._index.get(scope, {}).values() if r.kind == kind]
+
+    # ----------------------------
+    # Queries
+    # ----------------------------
+
+    def find(self, name: str, kind: Optional[str] = None) -> List[ObjectRef]:
+        """Every object called `name` (any scope), optionally of one kind."""
+        refs = self.by_name.get(name, [])
+        return [r for r in refs if kind is None or r.kind == kind]
+
+    def where_used(self, ref: ObjectRef) -> List[ObjectRef]:
+        """Direct users of an object."""
+        return sorted(self.used_by.get(ref, ()))
+
+    def blast_radius(self, ref: ObjectRef) -> Dict[str, List[ObjectRef]]:
+        """Everything that transitively uses `ref`, grouped by kind (rules under 'security-rule', 'nat-rule', ...)."""
+        seen: Set[ObjectRef] = set()
+        queue = deque([ref])
+        while queue:
+            for user in self.used_by.get(queue.popleft(), ()):
+                if user not in seen:
+                    seen.add(user)
+                    queue.append(user)
+        out: Dict[str, List[ObjectRef]] = {}
+        for r in sorted(seen):
+            out.setdefault(r.kind, []).append(r)
+        return out
+
+    def live(self) -> FrozenSet[ObjectRef]:
+        """Objects reachable from any enabled rule of any rulebase (cached)."""
+        if self._live is None:
+            roots = [r for r in self.rulebase if node_text(self.entries[r].get("disabled")) != "yes"]
+            seen: Set[ObjectRef] = set(roots)
+            queue = deque(roots)
+            while queue:
+                for used in self.uses.get(queue.popleft(), ()):
+                    if used not in seen:
+                        seen.add(used)
+                        queue.append(used)
+            self._live = frozenset(seen)
+        return self._live
+
+    def unused(self, kinds: Optional[Iterable[str]] = None, *, scope: Optional[str] = None) -> List[ObjectRef]:
+        """
+        Objects no enabled rule reaches (security, NAT, PBF, decryption,
+        authentication, ...), directly or through groups and profiles. An
+        address used only by an unused group is unused too.
+        """
+        wanted = frozenset(kinds) if kinds is not None else None
+        live = self.live()
+        return sorted(
+            r for r in self.entries
+            if r.kind not in RULE_KINDS and r not in live
+            and (wanted is None or r.kind in wanted)
+            and (scope is None or r.scope == scope)
+        )
+
+    def unreferenced(self, kinds: Optional[Iterable[str]] = None) -> List[ObjectRef]:
+        """Objects with no incoming reference at all (not even from unused objects)."""
+        wanted = frozenset(kinds) if kinds is not None else None
+        return sorted(
+            r for r in self.entries
+            if r.kind not in RULE_KINDS and not self.used_by.get(r) and (wanted is None or r.kind in wanted)
+        )
+
+    def shadowed(self) -> List[Tuple[ObjectRef, ObjectRef]]:
+        """(overriding, overridden) pairs: device-group objects hiding an ancestor's object of the same name."""
+        out: List[Tuple[ObjectRef, ObjectRef]] = []
+        for scope, index in self._index.items():
+            if scope == SHARED:
+                continue
+            for key, ref in index.items():
+                if ref.kind in RULE_KINDS:
+                    continue
+                for s in self.chain(scope)[1:]:
+                    hidden = self._index.get(s, {}).get(key)
+                    if hidden is not None:
+                        out.append((ref, hidden))
+                        break
+        return sorted(out)
@@ -5,18 +5,11 @@ import ssl
 from typing import Callable, Union, overload
 
 import requests
-import truststore
-import xmltodict
 from requests.adapters import HTTPAdapter
 from urllib3.poolmanager import PoolManager
 
 from optiv_lib.config import AppConfig, PanoramaConfig
 
-try:
-    truststore.inject_into_ssl()
-except Exception:
-    pass
-
 VerifyType = Union[bool, str]
 
 
@@ -32,6 +25,23 @@ class PanoramaTimeoutError(PanoramaHTTPError):
     """Request timed out (after retries) while communicating with Panorama."""
 
 
+_TRUSTSTORE_INJECTED = False
+
+
+def _inject_truststore() -> None:
+    """Use the OS trust store for TLS. Runs once, on first session rather than at import."""
+    global _TRUSTSTORE_INJECTED
+    if _TRUSTSTORE_INJECTED:
+        return
+    _TRUSTSTORE_INJECTED = True
+    try:
+        import truststore
+
+        truststore.inject_into_ssl()
+    except Exception:
+        pass
+
+
 class _NoVerifyAdapter(HTTPAdapter):
     def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
         ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
@@ -75,6 +85,8 @@ def _api_key(*, base_url: str, username: str, password_get: Callable[[], str], v
     finally:
         pwd = ""
 
+    import xmltodict
+
     try:
         data = xmltodict.parse(r.text)
         key = data.get("response", {}).get("result", {}).get("key")
@@ -113,6 +125,7 @@ class PanoramaSession(requests.Session):
         ...
 
     def __init__(self, cfg: PanoramaConfig | AppConfig):
+        _inject_truststore()
         super().__init__()
         pano = _require_pano_cfg(cfg)
 
@@ -127,6 +140,12 @@ class PanoramaSession(requests.Session):
 
         self.api_key = _api_key(base_url=self.base_url, username=pano.username, password_get=pano.password.get, verify=self.verify, timeout=self.timeout, )
 
+    def iter_logs(self, query: str | None = None, log_type: str = "traffic", **kwargs):
+        """Stream log entries page by page. See optiv_lib.providers.pan.logs.iter_logs."""
+        from optiv_lib.providers.pan.logs import iter_logs
+
+        return iter_logs(session=self, query=query, log_type=log_type, **kwargs)
+
     def request(self, method: str, url: str, **kwargs):
         full_url = url if url.startswith("http") else (self.base_url + url.lstrip("/"))
         params = kwargs.pop("params", {}) or {}
@@ -0,0 +1,230 @@
+# src/optiv_lib/providers/pan/sync.py
+from __future__ import annotations
+
+import json
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from optiv_lib.providers.pan import ops
+from optiv_lib.providers.pan.jobs import list_jobs
+from optiv_lib.providers.pan.session import PanoramaSession
+from optiv_lib.providers.pan.util import as_list, node_text, split_xpath, yn_bool
+
+CMD_PENDING_CHANGES = "<check><pending-changes></pending-changes></check>"
+CMD_LIST_CHANGES = "<show><config><list><changes/></list></config></show>"
+
+_COMMIT_JOB_TYPES = {"commit"}
+
+
+# ---------------------------
+# Cheap change signals
+# ---------------------------
+
+def has_pending_changes(*, session: PanoramaSession) -> bool:
+    """True when the candidate config differs from running (one tiny op call)."""
+    result = ops.op(session=session, cmd=CMD_PENDING_CHANGES)
+    return yn_bool(node_text(result))
+
+
+def pending_change_xpaths(*, session: PanoramaSession) -> List[str]:
+    """XPaths from the candidate change journal (show config list changes)."""
+    result = ops.op(session=session, cmd=CMD_LIST_CHANGES)
+    out: List[str] = []
+    stack: List[Any] = [result]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(reversed(node))
+        elif isinstance(node, dict):
+            for k, v in node.items():
+                if k == "xpath":
+                    out.extend(x for x in (node_text(i) for i in as_list(v)) if x)
+                else:
+                    stack.append(v)
+    return out
+
+
+def last_commit_job_id(*, session: PanoramaSession) -> Optional[int]:
+    """Highest finished commit job ID, or None if no commit is on record."""
+    ids = [j.id for j in list_jobs(session=session) if j.done and j.type.lower() in _COMMIT_JOB_TYPES]
+    return max(ids, default=None)
+
+
+def _normalize(xpath: str) -> str:
+    x = xpath.strip()
+    return x if x.startswith("/") else "/" + x
+
+
+def _overlaps(a: List[tuple[str, str | None]], b: List[tuple[str, str | None]]) -> bool:
+    """True when one xpath is an ancestor of (or equal to) the other."""
+    n = min(len(a), len(b))
+    return a[:n] == b[:n]
+
+
+# ---------------------------
+# Sync
+# ---------------------------
+
+class ConfigSync:
+    """
+    Local copy of selected config containers, refreshed only when Panorama says so.
+
+    candidate=True tracks the candidate config. Each check costs a jobs
+    lookup and one 'check pending-changes' call, plus 'show config list changes' while changes
+    are pending; only containers that overlap journal entries added or removed
+    since the last check are refetched (a revert removes entries, so reverted
+    containers are refetched too). A change made and committed between two
+    checks never shows in the journal, so the latest finished commit job ID is
+    checked as well and a new commit refetches every tracked container.
+    Configuration loads are not journaled by PAN-OS; call invalidate() after one.
+
+    candidate=False tracks the running config, gated on the latest finished
+    commit job ID. PAN-OS does not report which xpaths a commit touched, so a
+    new commit refetches every tracked container.
+
+    Example:
+        sync = ConfigSync(pano, [parent_xpath("branch")])
+        sync.sync()
+        addrs = from_xml(sync.get(parent_xpath("branch")))
+    """
+
+    def __init__(self, session: PanoramaSession, xpaths: Iterable[str], *, candidate: bool = True) -> None:
+        self._session = session
+        self.candidate = candidate
+        self.xpaths: List[str] = list(dict.fromkeys(xpaths))
+        self._steps = {x: split_xpath(x) for x in self.xpaths}
+        self._data: Dict[str, Dict[str, Any]] = {}
+        self._stale: set[str] = set(self.xpaths)
+        self._journal: Counter[str] = Counter()
+        self._commit_id: Optional[int] = None
+        self.checked_at: Optional[float] = None
+        self.api_calls = 0
+
+    # ---------------------------
+    # Signals → stale set
+    # ---------------------------
+
+    def check(self) -> List[str]:
+        """Consult change signals and return the xpaths that need a refetch."""
+        if self.candidate:
+            self._check_candidate()
+        else:
+            self._check_running()
+        self.checked_at = time.time()
+        return [x for x in self.xpaths if x in self._stale]
+
+    def _check_candidate(self) -> None:
+        self._check_running()
+        self.api_calls += 1
+        pending = has_pending_changes(session=self._session)
+        if not pending and not self._journal:
+            return
+        journal: Counter[str] = Counter()
+        if pending:
+            self.api_calls += 1
+            journal = Counter(_normalize(x) for x in pending_change_xpaths(session=self._session))
+        delta = (journal - self._journal) + (self._journal - journal)
+        self._journal = journal
+        for changed in delta:
+            self._mark_overlapping(changed)
+
+    def _check_running(self) -> None:
+        self.api_calls += 1
+        commit_id = last_commit_job_id(session=self._session)
+        if commit_id != self._commit_id:
+            self._commit_id = commit_id
+            self._stale.update(self.xpaths)
+
+    def _mark_overlapping(self, changed: str) -> None:
+        try:
+            steps = split_xpath(changed)
+        except ValueError:
+            # Unparseable journal xpath: be safe.
+            self._stale.update(self.xpaths)
+            return
+        for x, xs in self._steps.items():
+            if _overlaps(steps, xs):
+                self._stale.add(x)
+
+    def invalidate(self, xpaths: Iterable[str] | None = None) -> None:
+        """Force a refetch on the next sync (all tracked xpaths when None)."""
+        self._stale.update(self.xpaths if xpaths is None else [x for x in xpaths if x in self._steps])
+
+    # ---------------------------
+    # Refetch
+    # ---------------------------
+
+    def sync(self) -> List[str]:
+        """
+        check(), then refetch stale containers.
+        Returns the xpaths whose content actually changed.
+        """
+        changed: List[str] = []
+        for xpath in self.check():
+            self.api_calls += 1
+            fetch = ops.config_get if self.candidate else ops.config_show
+            result = fetch(session=self._session, xpath=xpath)
+            if self._data.get(xpath) != result:
+                changed.append(xpath)
+            self._data[xpath] = result
+            self._stale.discard(xpath)
+        return changed
+
+    def get(self, xpath: str) -> Dict[str, Any]:
+        """Cached inner 'result' for a tracked xpath (sync() first)."""
+        if xpath not in self._steps:
+            raise KeyError(f"xpath not tracked: {xpath}")
+        if xpath not in self._data:
+            raise KeyError(f"xpath not synced yet: {xpath}")
+        return self._data[xpath]
+
+    # ---------------------------
+    # Persistence (periodic jobs run as fresh processes)
+    # ---------------------------
+
+    def to_json_dict(self) -> Dict[str, Any]:
+        return {
+            "candidate": self.candidate,
+            "xpaths": self.xpaths,
+            "data": self._data,
+            "stale": sorted(self._stale),
+            "journal": dict(self._journal),
+            "commit_id": self._commit_id,
+            "checked_at": self.checked_at,
+        }
+
+    def save(self, path: Path | str) -> None:
+        p = Path(path)
+        tmp = p.with_name(p.name + ".tmp")
+        tmp.write_text(json.dumps(self.to_json_dict(), ensure_ascii=False), encoding="utf-8")
+        tmp.replace(p)
+
+    @classmethod
+    def load(cls, path: Path | str, session: PanoramaSession, *, xpaths: Iterable[str] | None = None, candidate: Optional[bool] = None,
+            ) -> "ConfigSync":
+        """
+        Restore saved state. Passing xpaths adds/drops tracked containers; new
+        ones start stale. `candidate` defaults to the saved mode; switching
+        modes discards the saved data. A missing file yields a fresh sync for
+        `xpaths` (candidate=True unless given).
+        """
+        p = Path(path)
+        if not p.exists():
+            if xpaths is None:
+                raise FileNotFoundError(p)
+            return cls(session, xpaths, candidate=True if candidate is None else candidate)
+        d = json.loads(p.read_text(encoding="utf-8"))
+        saved_mode = bool(d.get("candidate", True))
+        mode = saved_mode if candidate is None else candidate
+        sync = cls(session, d["xpaths"] if xpaths is None else xpaths, candidate=mode)
+        if mode != saved_mode:
+            return sync
+        data = d.get("data") or {}
+        sync._data = {x: data[x] for x in sync.xpaths if x in data}
+        sync._stale = {x for x in sync.xpaths if x not in sync._data or x in set(d.get("stale") or ())}
+        sync._journal = Counter(d.get("journal") or {})
+        sync._commit_id = d.get("commit_id")
+        sync.checked_at = d.get("checked_at")
+        return sync
@@ -3,12 +3,12 @@ from __future__ import annotations
 
 from typing import Any, Callable, Iterable
 
-import xmltodict
-
 DEFAULT_FORCE_LIST: Iterable[str | Callable[..., bool]] = ("entry", "member", "line")
 
 
 def parse_xml(text: str, *, force_list: Iterable | None = None) -> dict:
+    import xmltodict
+
     return xmltodict.parse(text, force_list=force_list or DEFAULT_FORCE_LIST)
 
 
@@ -35,5 +35,41 @@ def collect_members(tag_node: Any) -> list[str]:
     return [v for v in (node_text(m) for m in as_list(tag_node.get("member"))) if v]
 
 
+def split_xpath(xpath: str) -> list[tuple[str, str | None]]:
+    """
+    Split an absolute PAN-OS XPath into (tag, name) steps.
+
+    Supports the subset the XML API uses: '/a/b/entry[@name='x']/c'.
+    Quoted names may contain '/' (e.g. entry[@name='10.0.0.0/24']).
+    """
+    steps: list[tuple[str, str | None]] = []
+    i, n = 0, len(xpath)
+    while i < n:
+        if xpath[i] == "/":
+            i += 1
+            continue
+        j = i
+        while j < n and xpath[j] not in "/[":
+            j += 1
+        tag = xpath[i:j].strip()
+        name: str | None = None
+        if j < n and xpath[j] == "[":
+            pred = xpath.find("@name=", j)
+            if pred < 0 or pred + 6 >= n or xpath[pred + 6] not in "'\"":
+                raise ValueError(f"unsupported xpath predicate: {xpath[j:]!r}")
+            quote = xpath[pred + 6]
+            end = xpath.find(quote, pred + 7)
+            close = xpath.find("]", end + 1) if end >= 0 else -1
+            if close < 0:
+                raise ValueError(f"unterminated xpath predicate: {xpath[j:]!r}")
+            name = xpath[pred + 7:end]
+            j = close + 1
+        if not tag:
+            raise ValueError(f"empty xpath step in {xpath!r}")
+        steps.append((tag, name))
+        i = j
+    return steps
+
+
 def xpath_dg_address(device_group: str) -> str:
     return f"/config/devices/entry/device-group/entry[@name='{device_group}']/address"
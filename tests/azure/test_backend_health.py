@@ -0,0 +1,86 @@
+# tests/azure/test_backend_health.py
+from __future__ import annotations
+
+import threading
+import time
+from types import SimpleNamespace
+
+from azure.mgmt.network.models import ApplicationGatewayBackendHealth
+
+from optiv_lib.providers.azure.objects.application_gateway import api
+from optiv_lib.providers.azure.objects.application_gateway.api import _SteppedPolling, iter_backend_health
+from optiv_lib.providers.azure.objects.application_gateway.model import GatewayHealth
+from optiv_lib.providers.azure.threads import TaskError
+
+
+class FakeArm:
+    """Terminal after `polls` status GETs; `fail` raises on the terminal poll."""
+
+    def __init__(self, polls: int, fail: bool = False) -> None:
+        self.polls, self.fail = polls, fail
+        self.done = 0
+        self.lock = threading.Lock()
+
+    def finished(self) -> bool:
+        return self.done >= self.polls
+
+    def update_status(self) -> None:
+        with self.lock:
+            self.done += 1
+        if self.fail and self.finished():
+            raise RuntimeError("backend health operation Failed")
+
+    def run(self) -> None:
+        pass
+
+    def resource(self) -> ApplicationGatewayBackendHealth:
+        return ApplicationGatewayBackendHealth(backend_address_pools=[])
+
+
+class FakePolling:
+    def __init__(self, arm: FakeArm, delay: float = 0.01) -> None:
+        self.arm, self.delay = arm, delay
+
+    def next_delay(self) -> float:
+        return self.delay
+
+
+def _drive(monkeypatch, arms, **kwargs):
+    started = []
+
+    def begin(args):
+        started.append(args[0])
+        return FakePolling(arms[args[0]])
+
+    monkeypatch.setattr(api, "_begin_health", begin)
+    return {(r.item if isinstance(r, TaskError) else r.gateway_id): r for r in iter_backend_health(list(arms), **kwargs)}, started
+
+
+def test_done_failed_and_timed_out(monkeypatch):
+    arms = {"gw-ok": FakeArm(3), "gw-now": FakeArm(0), "gw-fail": FakeArm(2, fail=True), "gw-slow": FakeArm(10 ** 6)}
+    out, started = _drive(monkeypatch, arms, timeout=0.3)
+    assert sorted(started) == sorted(arms)
+    assert isinstance(out["gw-ok"], GatewayHealth) and arms["gw-ok"].done == 3
+    assert isinstance(out["gw-now"], GatewayHealth) and arms["gw-now"].done == 0
+    assert isinstance(out["gw-fail"], TaskError) and "Failed" in str(out["gw-fail"].error)
+    assert isinstance(out["gw-slow"], TaskError) and isinstance(out["gw-slow"].error, TimeoutError)
+
+
+def test_close_cancels_polls_not_started(monkeypatch):
+    fast, slow = FakeArm(0), FakeArm(10 ** 6)
+    monkeypatch.setattr(api, "_begin_health", lambda args: FakePolling({"a": fast, "b": slow}[args[0]], delay=0.5))
+    gen = iter_backend_health(["a", "b"], timeout=60)
+    assert next(gen).gateway_id == "a"
+    gen.close()
+    polls = slow.done
+    time.sleep(0.7)
+    assert slow.done == polls
+
+
+def test_next_delay_reads_retry_after():
+    polling = _SteppedPolling(7.0)
+    assert polling.next_delay() == 7.0  # nothing polled yet
+    for headers, expected in (({"Retry-After": "3"}, 3.0), ({"Retry-After-Ms": "250"}, 0.25),
+                              ({"Retry-After": "Wed, 21 Oct 2026 07:28:00 GMT"}, 7.0), ({"Retry-After": "0"}, 7.0), ({}, 7.0)):
+        polling.arm._pipeline_response = SimpleNamespace(http_response=SimpleNamespace(headers=headers))
+        assert polling.next_delay() == expected
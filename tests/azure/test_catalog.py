@@ -0,0 +1,140 @@
+# tests/azure/test_catalog.py
+from __future__ import annotations
+
+import json
+import threading
+import time
+
+import pytest
+
+from optiv_lib.providers.azure.objects.subscription.catalog import SubscriptionCatalog, SubscriptionInfo
+
+RECORDS = [
+    SubscriptionInfo("s1", "prod", "Enabled", "t1"),
+    SubscriptionInfo("s2", "old", "Disabled", "t1"),
+    SubscriptionInfo("s3", "billing", "PastDue", "t1"),
+]
+
+
+class SlowFetch:
+    """Counts catalog fetches; each blocks until `release` is set, then returns or raises."""
+
+    def __init__(self, error: Exception | None = None) -> None:
+        self.calls = 0
+        self.error = error
+        self.release = threading.Event()
+
+    def __call__(self):
+        self.calls += 1
+        self.release.wait(5)
+        if self.error is not None:
+            raise self.error
+        return list(RECORDS)
+
+
+def _catalog(monkeypatch, fetch, **kwargs) -> SubscriptionCatalog:
+    cat = SubscriptionCatalog(**kwargs)
+    monkeypatch.setattr(cat, "_fetch", fetch)
+    monkeypatch.setattr(cat, "_tenant", lambda: "t1")
+    return cat
+
+
+def _concurrently(func, n: int = 8):
+    results = []
+
+    def target():
+        try:
+            results.append(func())
+        except Exception as e:
+            results.append(e)
+
+    workers = [threading.Thread(target=target) for _ in range(n)]
+    for w in workers:
+        w.start()
+    return workers, results
+
+
+def test_concurrent_callers_share_one_fetch(monkeypatch):
+    fetch = SlowFetch()
+    cat = _catalog(monkeypatch, fetch)
+    workers, results = _concurrently(cat.all)
+    time.sleep(0.1)
+    fetch.release.set()
+    for w in workers:
+        w.join(5)
+    assert fetch.calls == 1
+    assert all(r == RECORDS for r in results)
+    assert cat.all() == RECORDS and fetch.calls == 1
+
+
+def test_failure_reaches_waiters_and_is_not_cached(monkeypatch):
+    fetch = SlowFetch(error=RuntimeError("ARM down"))
+    cat = _catalog(monkeypatch, fetch)
+    workers, results = _concurrently(cat.all)
+    time.sleep(0.1)
+    fetch.release.set()
+    for w in workers:
+        w.join(5)
+    assert fetch.calls == 1
+    assert len(results) == 8 and all(isinstance(r, RuntimeError) for r in results)
+    fetch.error = None
+    assert cat.all() == RECORDS and fetch.calls == 2
+
+
+def test_ttl_refresh_and_invalidate(monkeypatch):
+    fetch = SlowFetch()
+    fetch.release.set()
+    cat = _catalog(monkeypatch, fetch, ttl=60)
+    assert cat.peek() is None
+    cat.all()
+    cat.all()
+    assert fetch.calls == 1
+    cat.all(refresh=True)
+    assert fetch.calls == 2
+    cat._fetched_at -= 61  # age the cached list past the TTL
+    assert cat.peek() is None
+    cat.all()
+    assert fetch.calls == 3
+    cat.invalidate()
+    cat.all()
+    assert fetch.calls == 4
+
+
+def test_state_filtering(monkeypatch):
+    fetch = SlowFetch()
+    fetch.release.set()
+    cat = _catalog(monkeypatch, fetch)
+    assert cat.subscription_ids() == ["s1", "s3"]
+    assert cat.subscription_ids(["disabled"]) == ["s2"]
+    assert cat.subscription_ids(None) == ["s1", "s2", "s3"]
+    assert cat.peek(["Enabled"]) == ["s1"]
+
+
+def test_persisted_file_reused_only_for_same_tenant(monkeypatch, tmp_path):
+    path = tmp_path / "subs.json"
+    fetch = SlowFetch()
+    fetch.release.set()
+    _catalog(monkeypatch, fetch, path=path).all()
+    assert fetch.calls == 1 and json.loads(path.read_text())["tenant"] == "t1"
+
+    again = _catalog(monkeypatch, fetch, path=path)  # a new process, same tenant
+    assert again.all() == RECORDS and fetch.calls == 1
+
+    other = _catalog(monkeypatch, fetch, path=path)
+    monkeypatch.setattr(other, "_tenant", lambda: "t2")
+    other.all()
+    assert fetch.calls == 2
+
+    path.write_text("{not json")
+    assert _catalog(monkeypatch, fetch, path=path).all() == RECORDS and fetch.calls == 3
+
+
+@pytest.mark.parametrize("age", [0, 1000])
+def test_persisted_file_respects_ttl(monkeypatch, tmp_path, age):
+    path = tmp_path / "subs.json"
+    doc = {"fetched_at": time.time() - age, "tenant": "t1", "subscriptions": [{"subscription_id": "sx", "display_name": "x", "state": "Enabled", "tenant_id": "t1"}]}
+    path.write_text(json.dumps(doc))
+    fetch = SlowFetch()
+    fetch.release.set()
+    ids = _catalog(monkeypatch, fetch, path=path, ttl=900).subscription_ids()
+    assert ids == (["sx"] if age == 0 else ["s1", "s3"])
@@ -0,0 +1,127 @@
+# tests/azure/test_crawl_modes.py
+from __future__ import annotations
+
+import pytest
+from azure.mgmt.network.models import Route, RouteTable, Subnet, VirtualNetwork
+
+from optiv_lib.providers.azure.objects.route import api as route_api
+from optiv_lib.providers.azure.objects.route.api import embedded_routes, list_all_routes
+from optiv_lib.providers.azure.objects.route.model import RouteRecord
+from optiv_lib.providers.azure.objects.subnet import api as subnet_api
+from optiv_lib.providers.azure.objects.subnet.api import embedded_subnets, list_all_subnets
+from optiv_lib.providers.azure.objects.subnet.model import SubnetRecord
+
+
+def _rg(sub: str) -> str:
+    return f"/subscriptions/{sub}/resourceGroups/rg/providers/Microsoft.Network"
+
+
+def _subnet(vnet_id: str, name: str, prefix: str | None = "10.0.0.0/24") -> Subnet:
+    s = Subnet(address_prefix=prefix)
+    s.id, s.name = f"{vnet_id}/subnets/{name}", name
+    return s
+
+
+def _vnet(sub: str, name: str, subnets: list | None) -> VirtualNetwork:
+    v = VirtualNetwork(location="eastus")
+    v.id, v.name = f"{_rg(sub)}/virtualNetworks/{name}", name
+    v.subnets = [_subnet(v.id, s) for s in subnets] if subnets is not None else None
+    return v
+
+
+def _route(table_id: str, name: str, hop: str | None = "Internet") -> Route:
+    r = Route(address_prefix="0.0.0.0/0", next_hop_type=hop)
+    r.id, r.name = f"{table_id}/routes/{name}", name
+    return r
+
+
+def _table(sub: str, name: str, routes: list | None) -> RouteTable:
+    t = RouteTable(location="eastus")
+    t.id, t.name = f"{_rg(sub)}/routeTables/{name}", name
+    t.routes = [_route(t.id, r) for r in routes] if routes is not None else None
+    return t
+
+
+class _Pager:
+    def __init__(self, owner: "FakeNetwork", attr: str) -> None:
+        self.owner, self.attr = owner, attr
+
+    def list_all(self):
+        return list(self.owner.top[self.attr])
+
+    def list(self, resource_group_name, **parent):
+        (parent_name,) = parent.values()
+        self.owner.child_lists.append(parent_name)
+        return list(self.owner.children[parent_name])
+
+
+class FakeNetwork:
+    """virtual_networks / route_tables list_all, plus per-parent subnets / routes list with full children."""
+
+    def __init__(self, vnets=(), tables=()) -> None:
+        self.top = {"virtual_networks": list(vnets), "route_tables": list(tables)}
+        self.children = {}
+        for v in vnets:
+            self.children[v.name] = [_subnet(v.id, f"{v.name}-s{i}") for i in range(2)]
+        for t in tables:
+            self.children[t.name] = [_route(t.id, f"{t.name}-r{i}") for i in range(2)]
+        self.child_lists: list = []
+        self.virtual_networks = _Pager(self, "virtual_networks")
+        self.route_tables = _Pager(self, "route_tables")
+        self.subnets = _Pager(self, "subnets")
+        self.routes = _Pager(self, "routes")
+
+
+@pytest.fixture
+def cloud(monkeypatch):
+    clouds = {}
+    for mod in (subnet_api, route_api):
+        monkeypatch.setattr(mod, "network_client", lambda subscription_id=None, **kw: clouds[subscription_id])
+        monkeypatch.setattr(mod, "subscription_ids", lambda: list(clouds))
+    return clouds
+
+
+def test_embedded_children_complete_or_none():
+    vnet = _vnet("s1", "v", ["a", "b"])
+    assert [s.name for s in embedded_subnets(vnet)] == ["a", "b"]
+    vnet.subnets.append(_subnet(vnet.id, "c", prefix=None))  # summary entry without prefixes
+    assert embedded_subnets(vnet) is None
+    assert embedded_subnets(_vnet("s1", "w", None)) is None
+    assert embedded_subnets(_vnet("s1", "e", [])) == []
+    table = _table("s1", "t", ["r"])
+    assert [r.name for r in embedded_routes(table)] == ["r"]
+    table.routes.append(_route(table.id, "x", hop=None))
+    assert embedded_routes(table) is None
+
+
+def test_subnets_fetch_only_incomplete_vnets_in_vnet_order(cloud):
+    partial = _vnet("s1", "v3", ["x"])
+    partial.subnets[0].address_prefix = None
+    cloud["s1"] = FakeNetwork(vnets=[_vnet("s1", "v1", ["a"]), _vnet("s1", "v2", None), partial, _vnet("s1", "v4", ["d"])])
+    got = list_all_subnets()
+    assert [s.name for s in got] == ["a", "v2-s0", "v2-s1", "v3-s0", "v3-s1", "d"]
+    assert sorted(cloud["s1"].child_lists) == ["v2", "v3"]
+
+    cloud["s1"].child_lists.clear()
+    per_parent = list_all_subnets(mode="per_parent")
+    assert [s.name for s in per_parent] == ["v1-s0", "v1-s1", "v2-s0", "v2-s1", "v3-s0", "v3-s1", "v4-s0", "v4-s1"]
+    assert sorted(cloud["s1"].child_lists) == ["v1", "v2", "v3", "v4"]
+
+
+def test_subnets_projected(cloud):
+    cloud["s1"] = FakeNetwork(vnets=[_vnet("s1", "v1", ["a"]), _vnet("s1", "v2", None)])
+    cloud["s2"] = FakeNetwork(vnets=[_vnet("s2", "v9", ["z"])])
+    got = list_all_subnets(project=True)
+    assert all(isinstance(s, SubnetRecord) for s in got)
+    assert sorted((s.subscription_id, s.name) for s in got) == [("s1", "a"), ("s1", "v2-s0"), ("s1", "v2-s1"), ("s2", "z")]
+    assert {s.vnet_id for s in got if s.subscription_id == "s1"} == {f"{_rg('s1')}/virtualNetworks/v1", f"{_rg('s1')}/virtualNetworks/v2"}
+
+
+def test_routes_embedded_fallback_and_projection(cloud):
+    cloud["s1"] = FakeNetwork(tables=[_table("s1", "t1", ["a", "b"]), _table("s1", "t2", None), _table("s1", "t3", [])])
+    assert sorted(r.name for r in list_all_routes()) == ["a", "b", "t2-r0", "t2-r1"]
+    assert cloud["s1"].child_lists == ["t2"]
+    records = list_all_routes(mode="per_parent", project=True)
+    assert all(isinstance(r, RouteRecord) for r in records)
+    assert sorted(r.name for r in records) == ["t1-r0", "t1-r1", "t2-r0", "t2-r1", "t3-r0", "t3-r1"]
+    assert {r.route_table_id.rsplit("/", 1)[-1] for r in records} == {"t1", "t2", "t3"}
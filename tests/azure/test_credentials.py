@@ -0,0 +1,104 @@
+# tests/azure/test_credentials.py
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+from azure.core.credentials import AccessToken
+
+from optiv_lib.providers.azure.credentials import CachingCredential
+
+SCOPE = "https://management.azure.com/.default"
+
+
+class SlowCredential:
+    """Counts get_token calls; each blocks until `release` is set."""
+
+    def __init__(self, lifetime: float = 3600) -> None:
+        self.lifetime = lifetime
+        self.calls = 0
+        self.kwargs: list = []
+        self.release = threading.Event()
+        self._lock = threading.Lock()
+
+    def get_token(self, *scopes, **kwargs) -> AccessToken:
+        with self._lock:
+            self.calls += 1
+            n = self.calls
+        self.kwargs.append(kwargs)
+        self.release.wait(5)
+        return AccessToken(f"token-{n}", int(time.time() + self.lifetime))
+
+
+def test_missing_token_fetched_once_for_all_threads():
+    inner = SlowCredential()
+    cred = CachingCredential(inner)
+    tokens = []
+    workers = [threading.Thread(target=lambda: tokens.append(cred.get_token(SCOPE).token)) for _ in range(8)]
+    for w in workers:
+        w.start()
+    time.sleep(0.1)
+    inner.release.set()
+    for w in workers:
+        w.join(5)
+    assert tokens == ["token-1"] * 8
+    assert inner.calls == 1
+    cred.get_token(SCOPE, tenant_id="other")
+    assert inner.calls == 2 and inner.kwargs[-1] == {"tenant_id": "other"}
+
+
+def test_refresh_in_margin_runs_in_background_once():
+    inner = SlowCredential(lifetime=120)
+    inner.release.set()
+    cred = CachingCredential(inner, refresh_margin=300)
+    assert cred.get_token(SCOPE).token == "token-1"
+    inner.release.clear()
+    # Inside the margin but not expired: callers keep the current token while one refresh runs.
+    assert [cred.get_token(SCOPE).token for _ in range(5)] == ["token-1"] * 5
+    assert inner.calls == 2
+    inner.lifetime = 3600
+    inner.release.set()
+    deadline = time.time() + 5
+    while cred.get_token(SCOPE).token == "token-1" and time.time() < deadline:
+        time.sleep(0.01)
+    assert cred.get_token(SCOPE).token == "token-2"
+    assert inner.calls == 2
+
+
+def test_claims_bypass_cache():
+    inner = SlowCredential()
+    inner.release.set()
+    cred = CachingCredential(inner)
+    cred.get_token(SCOPE)
+    cred.get_token(SCOPE, claims="{}")
+    assert inner.calls == 2 and inner.kwargs[-1] == {"claims": "{}"}
+
+
+def test_async_adapter_passes_through_inside_the_margin(monkeypatch):
+    from optiv_lib.providers.azure.aio.credentials import AsyncCredentialAdapter
+
+    inner = SlowCredential(lifetime=120)
+    inner.release.set()
+    cred = CachingCredential(inner, refresh_margin=300)
+    adapter = AsyncCredentialAdapter(cred)
+    hops = []
+    real = asyncio.to_thread
+
+    async def counting_to_thread(func, *args, **kwargs):
+        hops.append(func)
+        return await real(func, *args, **kwargs)
+
+    monkeypatch.setattr(asyncio, "to_thread", counting_to_thread)
+
+    async def main():
+        first = await adapter.get_token(SCOPE)  # missing: one worker-thread fetch
+        inner.release.clear()  # the background refresh now hangs
+        tokens = await asyncio.wait_for(asyncio.gather(*(adapter.get_token(SCOPE) for _ in range(50))), 2)
+        return first, tokens
+
+    first, tokens = asyncio.run(main())
+    inner.release.set()
+    assert first.token == "token-1" and {t.token for t in tokens} == {"token-1"}
+    assert len(hops) == 1
+    assert inner.calls == 2  # the initial fetch plus one background refresh
@@ -0,0 +1,80 @@
+# tests/azure/test_etag.py
+from __future__ import annotations
+
+import json
+
+from azure.core.pipeline import PipelineContext, PipelineRequest, PipelineResponse
+from azure.core.rest import HttpRequest
+
+from optiv_lib.providers.azure.etag import ETagCache, ETagPolicy
+
+_VNET = "https://management.azure.com/subscriptions/s1/resourceGroups/rg/providers/Microsoft.Network/virtualNetworks/hub"
+_API = "?api-version=2024-05-01"
+
+
+class _Response:
+    def __init__(self, status: int, body: dict | None = None, etag: str | None = None) -> None:
+        self.status_code = status
+        self.content = json.dumps(body or {}).encode()
+        self.headers = {"Content-Type": "application/json; charset=utf-8"}
+        if etag:
+            self.headers["ETag"] = etag
+
+    def json(self):
+        return json.loads(self.content)
+
+
+def _cached(cache: ETagCache, url: str, size: int = 10) -> None:
+    cache.put(url, "W/\"1\"", _Response(200, {"x": "y" * size}))
+
+
+def test_lru_eviction_by_entries_and_bytes():
+    cache = ETagCache(max_entries=2, max_bytes=10_000)
+    _cached(cache, "https://h/a")
+    _cached(cache, "https://h/b")
+    cache.get("https://h/A")  # case-insensitive; a is now most recent
+    _cached(cache, "https://h/c")
+    assert cache.get("https://h/b") is None
+    assert cache.get("https://h/a") is not None and cache.get("https://h/c") is not None
+
+    small = ETagCache(max_bytes=100)
+    _cached(small, "https://h/a", 60)
+    _cached(small, "https://h/b", 60)
+    assert small.get("https://h/a") is None
+    assert small.stats()["bytes"] <= 100
+    _cached(small, "https://h/huge", 500)  # larger than the whole cache: not stored
+    assert small.get("https://h/huge") is None and small.get("https://h/b") is not None
+
+
+def test_invalidate_drops_resource_children_and_parents():
+    cache = ETagCache()
+    for url in (_VNET, f"{_VNET}/subnets/app", f"{_VNET}s2", _VNET.rsplit("/", 2)[0]):
+        _cached(cache, url + _API)
+    cache.invalidate(f"{_VNET}/subnets/app{_API}")
+    assert cache.get(f"{_VNET}/subnets/app{_API}") is None
+    assert cache.get(_VNET + _API) is None  # parent embeds the subnet
+    assert cache.get(_VNET.rsplit("/", 2)[0] + _API) is None
+    assert cache.get(f"{_VNET}s2{_API}") is not None  # sibling with a common name prefix
+    assert cache.stats()["entries"] == 1
+
+
+def _exchange(policy: ETagPolicy, method: str, url: str, response: _Response) -> PipelineResponse:
+    request = PipelineRequest(HttpRequest(method, url), PipelineContext(None))
+    policy.on_request(request)
+    pipeline_response = PipelineResponse(request.http_request, response, request.context)
+    policy.on_response(request, pipeline_response)
+    return pipeline_response
+
+
+def test_policy_replays_on_304_and_invalidates_on_write():
+    cache = ETagCache()
+    policy = ETagPolicy(cache)
+    first = _Response(200, {"name": "hub"}, etag="W/\"7\"")
+    assert _exchange(policy, "GET", _VNET + _API, first).http_response is first
+    request = PipelineRequest(HttpRequest("GET", _VNET + _API), PipelineContext(None))
+    policy.on_request(request)
+    assert request.http_request.headers["If-None-Match"] == "W/\"7\""
+    assert _exchange(policy, "GET", _VNET + _API, _Response(304)).http_response is first
+    assert cache.stats()["hits"] == 1
+    _exchange(policy, "PUT", f"{_VNET}/subnets/app{_API}", _Response(200))
+    assert cache.get(_VNET + _API) is None
@@ -0,0 +1,59 @@
+# tests/azure/test_ip_index.py
+from __future__ import annotations
+
+from optiv_lib.providers.azure.inventory.ip_index import IPIndex
+from optiv_lib.providers.azure.objects.public_ip.model import PublicIPRecord
+from optiv_lib.providers.azure.objects.subnet.model import SubnetRecord
+
+
+def _rg(sub: str) -> str:
+    return f"/subscriptions/{sub}/resourceGroups/rg/providers/Microsoft.Network"
+
+
+def _subnet(sub: str, vnet: str, name: str, *prefixes: str) -> SubnetRecord:
+    vnet_id = f"{_rg(sub)}/virtualNetworks/{vnet}"
+    return SubnetRecord(id=f"{vnet_id}/subnets/{name}", name=name, subscription_id=sub, resource_group="rg", vnet_id=vnet_id, address_prefixes=prefixes)
+
+
+def _pip(sub: str, name: str, ip: str | None) -> PublicIPRecord:
+    nic = f"{_rg(sub)}/networkInterfaces/{name}-nic"
+    return PublicIPRecord(id=f"{_rg(sub)}/publicIPAddresses/{name}", name=name, subscription_id=sub, resource_group="rg", location="eastus",
+                          ip_address=ip, ip_configuration_id=f"{nic}/ipConfigurations/ipconfig1")
+
+
+def test_lookup_exact_then_containing_subnets():
+    index = IPIndex.build(
+        public_ips=[_pip("s1", "web", "20.1.2.3"), _pip("s1", "idle", None)],
+        subnets=[_subnet("s1", "hub", "wide", "10.0.0.0/16"), _subnet("s2", "spoke", "narrow", "10.0.1.0/24")],
+    )
+    assert len(index) == 3  # the unallocated public IP claims nothing
+    (owner,) = index.lookup("20.1.2.3")
+    assert owner.kind == "public_ip" and owner.attached_to.endswith("/networkInterfaces/web-nic")
+    assert [o.resource_id.rsplit("/", 1)[-1] for o in index.lookup("10.0.1.9")] == ["narrow", "wide"]
+    assert index.lookup("192.168.0.1") == []
+
+
+def test_sync_replaces_one_subscription_and_kind():
+    index = IPIndex.build(
+        public_ips=[_pip("s1", "a", "20.0.0.1"), _pip("s1", "b", "20.0.0.2"), _pip("s2", "c", "20.0.0.3")],
+        subnets=[_subnet("s1", "hub", "app", "10.0.0.0/24")],
+    )
+    index.sync("S1", "public_ip", [_pip("s1", "a", "20.0.0.9")])
+    assert index.lookup("20.0.0.1") == []
+    assert index.lookup("20.0.0.2") == []
+    assert [o.match for o in index.lookup("20.0.0.9")] == ["20.0.0.9"]
+    assert len(index.lookup("20.0.0.3")) == 1  # other subscription untouched
+    assert len(index.lookup("10.0.0.5")) == 1  # other kind untouched
+
+
+def test_remove_and_readd_subnet():
+    subnet = _subnet("s1", "hub", "app", "10.0.0.0/24", "fd00::/64")
+    index = IPIndex.build(subnets=[subnet, _subnet("s2", "other", "app", "10.0.0.0/24")])
+    assert len(index.lookup("10.0.0.5")) == 2
+    index.remove(subnet.id.upper())
+    assert [o.subscription_id for o in index.lookup("10.0.0.5")] == ["s2"]
+    assert index.lookup("fd00::1") == []
+    index.add_subnet(subnet)
+    index.add_subnet(subnet)  # upsert, no duplicate claim
+    assert len(index.lookup("10.0.0.5")) == 2
+    assert len(index.lookup("fd00::1")) == 1
@@ -0,0 +1,73 @@
+# tests/azure/test_records.py
+from __future__ import annotations
+
+from azure.mgmt.network.models import (
+    PublicIPAddress,
+    PublicIPAddressDnsSettings,
+    PublicIPAddressSku,
+    Route,
+    RouteTable,
+    SubResource,
+    Subnet,
+)
+
+from optiv_lib.providers.azure.objects.public_ip.model import to_record as public_ip_record
+from optiv_lib.providers.azure.objects.route.model import to_record as route_record
+from optiv_lib.providers.azure.objects.route_table.model import to_record as route_table_record
+from optiv_lib.providers.azure.objects.subnet.model import to_record as subnet_record
+
+_RG = "/subscriptions/s1/resourceGroups/RG-Net/providers/Microsoft.Network"
+VNET = f"{_RG}/virtualNetworks/hub"
+RT = f"{_RG}/routeTables/rt-app"
+
+
+def _fresh(s: str) -> str:
+    """An equal string that is not the same object (as deserialized IDs are)."""
+    return "".join(list(s))
+
+
+def test_subnet_record():
+    s = Subnet(address_prefixes=["10.0.1.0/24", "fd00::/64"], route_table=SubResource(id=_fresh(RT)), network_security_group=SubResource(id=f"{_RG}/nsgs/x"))
+    s.id, s.name, s.provisioning_state = _fresh(f"{VNET}/subnets/app"), "app", "Succeeded"
+    rec = subnet_record(s)
+    assert (rec.subscription_id, rec.resource_group, rec.vnet_id) == ("s1", "RG-Net", VNET)
+    assert rec.address_prefixes == ("10.0.1.0/24", "fd00::/64")
+    assert (rec.route_table_id, rec.nsg_id, rec.nat_gateway_id) == (RT, f"{_RG}/nsgs/x", None)
+    assert rec.provisioning_state == "Succeeded" and rec.key() == rec.id.lower()
+    single = Subnet(address_prefix="10.0.2.0/24")
+    single.id = f"{VNET}/subnets/db"
+    assert subnet_record(single).address_prefixes == ("10.0.2.0/24",)
+
+
+def test_ids_are_interned():
+    a, b = Subnet(address_prefix="10.0.1.0/24"), Subnet(address_prefix="10.0.1.0/24")
+    a.id, b.id = _fresh(f"{VNET}/subnets/app"), _fresh(f"{VNET}/subnets/app")
+    assert subnet_record(a).id is subnet_record(b).id
+    rt = RouteTable(subnets=[SubResource(id=_fresh(a.id))])
+    rt.id = _fresh(RT)
+    table = route_table_record(rt)
+    assert table.id is route_table_record(rt).id
+    assert table.subnet_ids[0] is subnet_record(a).id
+
+
+def test_route_and_route_table_records():
+    r = Route(address_prefix="0.0.0.0/0", next_hop_type="VirtualAppliance", next_hop_ip_address="10.0.0.4")
+    r.id = f"{RT}/routes/default"
+    rec = route_record(r)
+    assert (rec.name, rec.route_table_id, rec.next_hop_type, rec.next_hop_ip) == ("default", RT, "VirtualAppliance", "10.0.0.4")
+    rt = RouteTable(location="eastus", disable_bgp_route_propagation=True, subnets=[SubResource(id=f"{VNET}/subnets/app")])
+    rt.id = RT
+    table = route_table_record(rt)
+    assert (table.name, table.location, table.disable_bgp_route_propagation, table.subnet_ids) == ("rt-app", "eastus", True, (f"{VNET}/subnets/app",))
+
+
+def test_public_ip_record():
+    nic_config = f"{_RG}/networkInterfaces/web-nic/ipConfigurations/ipconfig1"
+    p = PublicIPAddress(location="eastus", public_ip_allocation_method="Static", public_ip_address_version="IPv4",
+                        sku=PublicIPAddressSku(name="Standard"), ip_configuration=SubResource(id=nic_config),
+                        dns_settings=PublicIPAddressDnsSettings(domain_name_label="web"))
+    p.id, p.ip_address = f"{_RG}/publicIPAddresses/web-pip", "20.1.2.3"
+    p.dns_settings.fqdn = "web.eastus.cloudapp.azure.com"
+    rec = public_ip_record(p)
+    assert (rec.name, rec.ip_address, rec.allocation, rec.version, rec.sku) == ("web-pip", "20.1.2.3", "Static", "IPv4", "Standard")
+    assert rec.ip_configuration_id == nic_config and rec.fqdn == "web.eastus.cloudapp.azure.com"
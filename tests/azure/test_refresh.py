@@ -0,0 +1,115 @@
+# tests/azure/test_refresh.py
+from __future__ import annotations
+
+from azure.core.exceptions import HttpResponseError, ResourceNotFoundError
+from azure.mgmt.network.models import AddressSpace, PublicIPAddress, VirtualNetwork
+from azure.mgmt.resource.resources.models import ResourceGroup
+
+from optiv_lib.providers.azure.inventory import crawler as crawler_mod
+from optiv_lib.providers.azure.inventory import refresh as refresh_mod
+from optiv_lib.providers.azure.inventory.refresh import refresh_inventory
+from optiv_lib.providers.azure.objects.subscription.catalog import SubscriptionCatalog, SubscriptionInfo
+
+SUB = "00000000-0000-0000-0000-000000000001"
+
+
+def _id(rg: str, kind: str, name: str) -> str:
+    return f"/subscriptions/{SUB}/resourceGroups/{rg}/providers/Microsoft.Network/{kind}/{name}"
+
+
+class _Lister:
+    def __init__(self, cloud: "FakeCloud", attr: str) -> None:
+        self.cloud, self.attr = cloud, attr
+
+    def list_all(self):
+        return [m for rg in self.cloud.groups.values() for m in rg.get(self.attr, [])]
+
+    def list(self, resource_group_name: str = None, **kwargs):
+        if self.attr in self.cloud.failing:
+            raise HttpResponseError(f"{self.attr} unavailable")
+        if resource_group_name is None:  # resource_groups.list()
+            return [ResourceGroup(location="eastus", id=f"/subscriptions/{SUB}/resourceGroups/{n}", name=n) for n in self.cloud.groups]
+        if resource_group_name not in self.cloud.groups:
+            raise ResourceNotFoundError("ResourceGroupNotFound")
+        return list(self.cloud.groups[resource_group_name].get(self.attr, []))
+
+
+class FakeCloud:
+    """One subscription's network resources by group, served like the SDK clients."""
+
+    def __init__(self) -> None:
+        self.groups: dict = {}
+        self.failing: set = set()
+        for attr in ("virtual_networks", "route_tables", "public_ip_addresses", "application_gateways", "resource_groups"):
+            setattr(self, attr, _Lister(self, attr))
+
+
+class FakeSource:
+    def __init__(self) -> None:
+        self.changed: set = set()
+
+    def changed_resource_groups(self, subscription_id, since, known):
+        return set(self.changed)
+
+
+def _vnet(rg: str, name: str) -> VirtualNetwork:
+    v = VirtualNetwork(location="eastus", address_space=AddressSpace(address_prefixes=["10.0.0.0/16"]), subnets=[])
+    v.id, v.name = _id(rg, "virtualNetworks", name), name
+    return v
+
+
+def _pip(rg: str, name: str, ip: str) -> PublicIPAddress:
+    p = PublicIPAddress(location="eastus")
+    p.id, p.name, p.ip_address = _id(rg, "publicIPAddresses", name), name, ip
+    return p
+
+
+def _setup(monkeypatch, tmp_path):
+    cloud = FakeCloud()
+    monkeypatch.setattr(crawler_mod, "network_client", lambda sub: cloud)
+    monkeypatch.setattr(crawler_mod, "resource_client", lambda sub: cloud)
+    catalog = SubscriptionCatalog()
+    monkeypatch.setattr(catalog, "_fetch", lambda: [SubscriptionInfo(SUB, "one", "Enabled", "t")])
+    monkeypatch.setattr(crawler_mod, "CATALOG", catalog)
+    monkeypatch.setattr(refresh_mod, "CATALOG", catalog)
+    return cloud, tmp_path / "inventory.db"
+
+
+def test_deleted_resource_group_is_dropped(monkeypatch, tmp_path):
+    cloud, path = _setup(monkeypatch, tmp_path)
+    cloud.groups = {"keep": {"virtual_networks": [_vnet("keep", "a")]}, "gone": {"virtual_networks": [_vnet("gone", "b")]}}
+    refresh_inventory(path).close()  # no snapshot yet: full crawl
+    del cloud.groups["gone"]
+    source = FakeSource()
+    source.changed = {"gone"}
+    synced = 0.0
+    for n in range(1, 4):
+        with refresh_inventory(path, source=source) as snap:
+            assert snap.counts() == {"resource_group": 1, "virtual_network": n}
+            assert snap.errors() == []
+            assert snap.meta()["synced_at"][SUB] > synced
+            synced = snap.meta()["synced_at"][SUB]
+        # Later changes in the same subscription keep arriving.
+        cloud.groups["keep"]["virtual_networks"].append(_vnet("keep", f"n{n}"))
+        source.changed = {"gone", "keep"}
+
+
+def test_failed_kind_keeps_its_rows_and_applies_the_rest(monkeypatch, tmp_path):
+    cloud, path = _setup(monkeypatch, tmp_path)
+    cloud.groups = {"rg": {"virtual_networks": [_vnet("rg", "a")], "public_ip_addresses": [_pip("rg", "web", "20.0.0.1")]}}
+    with refresh_inventory(path) as snap:
+        first_sync = snap.meta()["synced_at"][SUB]
+    cloud.groups["rg"] = {"virtual_networks": [_vnet("rg", "a"), _vnet("rg", "b")], "public_ip_addresses": []}
+    cloud.failing = {"public_ip_addresses"}
+    source = FakeSource()
+    source.changed = {"rg"}
+    for _ in range(2):
+        with refresh_inventory(path, source=source) as snap:
+            assert snap.counts()["virtual_network"] == 2
+            assert [r["name"] for r in snap.resources("public_ip")] == ["web"]  # previous row kept
+            assert [e["kind"] for e in snap.errors()] == ["public_ip"]  # replaced, not accumulated
+            assert snap.meta()["synced_at"][SUB] == first_sync
+    cloud.failing = set()
+    with refresh_inventory(path, source=source) as snap:
+        assert snap.resources("public_ip") == [] and snap.errors() == []
+        assert snap.meta()["synced_at"][SUB] > first_sync
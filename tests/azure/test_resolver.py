@@ -0,0 +1,139 @@
+# tests/azure/test_resolver.py
+from __future__ import annotations
+
+import pytest
+from azure.core.exceptions import ResourceNotFoundError
+from azure.mgmt.network.models import PublicIPAddress, Route, RouteTable
+
+from optiv_lib.providers.azure.objects import resolver
+from optiv_lib.providers.azure.objects.public_ip import api as public_ip_api
+from optiv_lib.providers.azure.objects.route import api as route_api
+from optiv_lib.providers.azure.objects.route_table import api as route_table_api
+from optiv_lib.providers.azure.objects.resolver import clear_resolver_cache, resolve_ids
+from optiv_lib.providers.azure.threads import TaskError
+
+SUB = "00000000-0000-0000-0000-000000000001"
+
+
+def _id(rg: str, path: str) -> str:
+    return f"/subscriptions/{SUB}/resourceGroups/{rg}/providers/Microsoft.Network/{path}"
+
+
+class _Ops:
+    """One operations group: list_all / list(rg) over top-level models, get by name kwargs."""
+
+    def __init__(self, net: "FakeNetwork", name: str, path: str) -> None:
+        self.net, self.name, self.path = net, name, path
+
+    def _top(self):
+        return [m for rid, m in self.net.models.items() if f"/{self.path.split('/')[0].lower()}/" in rid and rid.count("/") == 8]
+
+    def list_all(self):
+        self.net.calls.append((self.name, "list_all", None))
+        return self._top()
+
+    def list(self, resource_group_name):
+        self.net.calls.append((self.name, "list", resource_group_name))
+        return [m for m in self._top() if f"/resourcegroups/{resource_group_name.lower()}/" in m.id.lower()]
+
+    def get(self, resource_group_name, **names):
+        self.net.calls.append((self.name, "get", resource_group_name))
+        rid = _id(resource_group_name, self.path.format(*names.values())).lower()
+        if rid not in self.net.models:
+            raise ResourceNotFoundError("ResourceNotFound")
+        return self.net.models[rid]
+
+
+class FakeNetwork:
+    def __init__(self) -> None:
+        self.models: dict = {}
+        self.calls: list = []
+        self.public_ip_addresses = _Ops(self, "public_ip_addresses", "publicIPAddresses/{}")
+        self.route_tables = _Ops(self, "route_tables", "routeTables/{}")
+        self.routes = _Ops(self, "routes", "routeTables/{}/routes/{}")
+
+    def add(self, model):
+        self.models[model.id.lower()] = model
+        return model.id
+
+    def pip(self, rg: str, name: str) -> str:
+        p = PublicIPAddress()
+        p.id, p.name = _id(rg, f"publicIPAddresses/{name}"), name
+        return self.add(p)
+
+    def table(self, rg: str, name: str, routes: int, *, embedded: bool = True) -> list:
+        rt = RouteTable()
+        rt.id, rt.name = _id(rg, f"routeTables/{name}"), name
+        children = []
+        for i in range(routes):
+            r = Route(address_prefix=f"10.{i}.0.0/16", next_hop_type="VirtualAppliance", next_hop_ip_address="10.255.0.4")
+            r.id, r.name = f"{rt.id}/routes/r{i}", f"r{i}"
+            children.append(r)
+            self.models[r.id.lower()] = r  # reachable by GET
+        rt.routes = children if embedded else None
+        self.add(rt)
+        return [r.id for r in children]
+
+
+@pytest.fixture
+def net(monkeypatch):
+    fake = FakeNetwork()
+    for mod in (resolver, public_ip_api, route_api, route_table_api):
+        monkeypatch.setattr(mod, "network_client", lambda subscription_id=None, **kw: fake)
+    clear_resolver_cache()
+    yield fake
+    clear_resolver_cache()
+
+
+def _ops(net, method):
+    return sorted((op, rg) for op, m, rg in net.calls if m == method)
+
+
+def test_plans_gets_rg_lists_and_subscription_lists(net):
+    few = [net.pip("a", "p0"), net.pip("a", "p1")]
+    many = [net.pip("b", f"p{i}") for i in range(3)]
+    got = resolve_ids(few + many)
+    assert all(got[i].id == i for i in few + many)
+    assert _ops(net, "get") == [("public_ip_addresses", "a"), ("public_ip_addresses", "a")]
+    assert _ops(net, "list") == [("public_ip_addresses", "b")]
+
+    clear_resolver_cache()
+    net.calls.clear()
+    resolve_ids(few + many, sub_threshold=5)
+    assert [c for c in net.calls] == [("public_ip_addresses", "list_all", None)]
+
+
+def test_children_embedded_and_fallback_gets(net):
+    embedded = net.table("a", "rt1", 3)
+    bare = net.table("b", "rt2", 3, embedded=False)
+    (single,) = net.table("c", "rt3", 1)
+    got = resolve_ids(embedded + bare + [single])
+    assert [got[i].name for i in embedded + bare + [single]] == ["r0", "r1", "r2", "r0", "r1", "r2", "r0"]
+    assert _ops(net, "list") == [("route_tables", "a"), ("route_tables", "b")]
+    assert _ops(net, "get") == [("routes", "b")] * 3 + [("routes", "c")]
+    assert not any(isinstance(v, TaskError) for v in got.values())
+
+
+def test_missing_resources_are_none(net):
+    listed = net.table("a", "rt1", 3)
+    gone_child = listed[0].replace("/routes/r0", "/routes/nope")
+    gone_pip = _id("z", "publicIPAddresses/nope")
+    got = resolve_ids([*listed[1:], gone_child, gone_pip])
+    assert got[gone_child] is None and got[gone_pip] is None
+    with pytest.raises(ValueError):
+        resolve_ids([_id("a", "networkSecurityGroups/nsg")])
+
+
+def test_results_memoized_for_ttl(net):
+    ids = [net.pip("a", "p0"), net.pip("a", "p1")]
+    first = resolve_ids(ids)
+    net.calls.clear()
+    again = resolve_ids([i.upper() for i in ids])
+    assert net.calls == []
+    assert [again[i.upper()] for i in ids] == [first[i] for i in ids]
+    resolve_ids(ids, ttl=0)  # already cached from the first call
+    clear_resolver_cache()
+    resolve_ids(ids, ttl=0)
+    net.calls.clear()
+    resolve_ids(ids)
+    assert len(net.calls) == 2  # ttl=0 entries expire at once
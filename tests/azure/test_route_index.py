@@ -0,0 +1,72 @@
+# tests/azure/test_route_index.py
+from __future__ import annotations
+
+from azure.mgmt.network.models import (
+    AddressSpace,
+    Route,
+    RouteTable,
+    SubResource,
+    VirtualNetwork,
+    VirtualNetworkPeering,
+)
+
+from optiv_lib.providers.azure.objects.route_table.index import RouteIndex
+
+_SUB = "/subscriptions/s1/resourceGroups/rg/providers/Microsoft.Network"
+VNET = f"{_SUB}/virtualNetworks/hub"
+SUBNET = f"{VNET}/subnets/app"
+RT = f"{_SUB}/routeTables/rt-app"
+
+
+def _route(name: str, prefix: str, hop: str = "VirtualAppliance", ip: str = "10.0.0.4") -> Route:
+    r = Route(address_prefix=prefix, next_hop_type=hop, next_hop_ip_address=ip)
+    r.id, r.name = f"{RT}/routes/{name}", name
+    return r
+
+
+def _table(disable_bgp: bool = False) -> RouteTable:
+    rt = RouteTable(routes=[_route("default", "0.0.0.0/0"), _route("spoke", "10.20.0.0/16"), _route("pin", "10.10.5.0/24")],
+                    disable_bgp_route_propagation=disable_bgp)
+    rt.id = RT
+    rt.subnets = [SubResource(id=SUBNET.upper())]
+    return rt
+
+
+def _vnet(peering_state: str = "Connected") -> VirtualNetwork:
+    peering = VirtualNetworkPeering(remote_address_space=AddressSpace(address_prefixes=["10.20.0.0/16", "10.30.0.0/16"]))
+    peering.peering_state = peering_state
+    vnet = VirtualNetwork(address_space=AddressSpace(address_prefixes=["10.10.0.0/16"]), virtual_network_peerings=[peering])
+    vnet.id = VNET
+    return vnet
+
+
+def test_udrs_without_system_routes():
+    index = RouteIndex.from_route_tables([_table()])
+    assert index.lookup(SUBNET, "10.10.1.1").name == "default"
+    assert index.lookup(SUBNET, "10.20.1.1").name == "spoke"
+    assert index.lookup(f"{VNET}/subnets/other", "10.20.1.1") is None
+
+
+def test_system_routes_win_longer_matches():
+    index = RouteIndex.from_route_tables([_table()], [_vnet()])
+    # VnetLocal /16 beats 0.0.0.0/0; the /24 UDR beats VnetLocal.
+    assert index.lookup(SUBNET, "10.10.1.1") is None
+    assert index.lookup(SUBNET, "10.10.5.1").name == "pin"
+    # Equal prefix: the UDR wins over the peering route.
+    assert index.lookup(SUBNET, "10.20.1.1").name == "spoke"
+    assert index.lookup(SUBNET, "10.30.1.1") is None
+    assert index.lookup(SUBNET, "8.8.8.8").name == "default"
+    flows = [(SUBNET, "10.10.1.1"), (SUBNET, "10.10.5.1"), (SUBNET, "8.8.8.8"), (SUBNET, "10.10.1.1")]
+    assert [r.name if r else None for r in index.lookup_many(flows)] == [None, "pin", "default", None]
+
+
+def test_disconnected_peering_ignored():
+    index = RouteIndex.from_route_tables([_table()], [_vnet("Disconnected")])
+    assert index.lookup(SUBNET, "10.30.1.1").name == "default"
+
+
+def test_bgp_propagation_kept():
+    assert RouteIndex.from_route_tables([_table()]).propagates_bgp(SUBNET)
+    index = RouteIndex.from_route_tables([_table(disable_bgp=True)])
+    assert not index.propagates_bgp(SUBNET)
+    assert index.bgp_disabled == {RT.lower()}
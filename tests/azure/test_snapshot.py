@@ -0,0 +1,59 @@
+# tests/azure/test_snapshot.py
+from __future__ import annotations
+
+import pytest
+
+from optiv_lib.providers.azure.inventory.snapshot import InventorySnapshot, SnapshotWriter, prefix_range
+
+_VNET = "/subscriptions/s1/resourceGroups/rg/providers/Microsoft.Network/virtualNetworks/hub"
+
+
+@pytest.fixture
+def snapshot(tmp_path):
+    path = tmp_path / "inventory.db"
+    w = SnapshotWriter(path)
+    prefixes = {
+        _VNET: ["10.0.0.0/16", "fd00::/48"],
+        f"{_VNET}/subnets/app": ["10.0.1.0/24"],
+        f"{_VNET}/subnets/db": ["10.0.2.0/25"],
+        f"{_VNET}/subnets/edge": ["10.0.255.0/24", "fd00:0:0:1::/64"],
+    }
+    w.add_resources((rid, "virtual_network" if rid == _VNET else "subnet", "s1", "rg", rid.rsplit("/", 1)[-1], "eastus",
+                     None if rid == _VNET else _VNET, {"id": rid}) for rid in prefixes)
+    for rid, ps in prefixes.items():
+        w.add_prefixes(rid, [*ps, "AzureCloud"])  # service tags are skipped
+    w.commit()
+    with InventorySnapshot(path) as snap:
+        yield snap
+
+
+def _names(rows):
+    return [(r["name"], r["prefix"]) for r in rows]
+
+
+def test_prefix_range_is_fixed_width():
+    assert prefix_range("10.0.1.7/24") == ("10.0.1.0/24", 4, "0a000100", "0a0001ff")
+    assert prefix_range("fd00::1")[2] == "fd00" + "0" * 27 + "1"
+    assert prefix_range("AzureCloud") is None
+
+
+def test_containing_most_specific_first(snapshot):
+    assert _names(snapshot.containing("10.0.1.9")) == [("app", "10.0.1.0/24"), ("hub", "10.0.0.0/16")]
+    assert _names(snapshot.containing("10.0.2.0/26")) == [("db", "10.0.2.0/25"), ("hub", "10.0.0.0/16")]
+    assert _names(snapshot.containing("10.0.2.0/24")) == [("hub", "10.0.0.0/16")]
+    assert _names(snapshot.containing("fd00:0:0:1::5")) == [("edge", "fd00:0:0:1::/64"), ("hub", "fd00::/48")]
+    assert snapshot.containing("10.1.0.1") == []
+
+
+def test_overlapping_either_direction(snapshot):
+    assert sorted(_names(snapshot.overlapping("10.0.2.64/26"))) == [("db", "10.0.2.0/25"), ("hub", "10.0.0.0/16")]
+    assert sorted(r["name"] for r in snapshot.overlapping("10.0.0.0/8")) == ["app", "db", "edge", "hub"]
+    assert _names(snapshot.overlapping("10.0.3.0/24")) == [("hub", "10.0.0.0/16")]
+    assert snapshot.overlapping("192.168.0.0/16") == []
+    with pytest.raises(ValueError):
+        snapshot.overlapping("AzureCloud")
+
+
+def test_lookups_ignore_id_case(snapshot):
+    assert snapshot.get(_VNET.upper())["data"] == {"id": _VNET}
+    assert len(snapshot.children(_VNET.lower())) == 3
@@ -0,0 +1,92 @@
+# tests/azure/test_threads.py
+from __future__ import annotations
+
+import threading
+
+import pytest
+from azure.core.exceptions import ServiceRequestError
+
+from optiv_lib.providers.azure import threads
+
+
+@pytest.fixture
+def small_pool(monkeypatch):
+    """Two slots and four threads, so a handful of waiting parents fill the pool."""
+    threads.shutdown_threads(wait=True)
+    monkeypatch.setattr(threads, "_GLOBAL_MAX_WORKERS", 2)
+    monkeypatch.setattr(threads, "_GLOBAL_MAX_THREADS", 4)
+    monkeypatch.setattr(threads, "_GLOBAL_SEMAPHORE", threading.Semaphore(2))
+    yield
+    threads.shutdown_threads(wait=True)
+
+
+def _run_with_timeout(func, timeout: float = 20.0):
+    out: dict = {}
+
+    def target():
+        out["result"] = func()
+
+    t = threading.Thread(target=target, daemon=True)
+    t.start()
+    t.join(timeout)
+    assert not t.is_alive(), "fan-out deadlocked"
+    return out["result"]
+
+
+def _parents(fail_once: bool):
+    failed: set = set()
+    lock = threading.Lock()
+
+    def child(item):
+        with lock:
+            first = item not in failed
+            failed.add(item)
+        if fail_once and first:
+            raise ServiceRequestError("transient")
+        return item
+
+    def parent(p):
+        return threads.thread_map(child, [(p, i) for i in range(3)], base_delay=0.01, max_delay=0.05)
+
+    return threads.thread_map(parent, list(range(12)))
+
+
+def test_nested_fan_out(small_pool):
+    assert len(_run_with_timeout(lambda: _parents(fail_once=False))) == 12
+
+
+def test_nested_fan_out_with_retries_does_not_deadlock(small_pool):
+    results = _run_with_timeout(lambda: _parents(fail_once=True))
+    assert len(results) == 12
+    assert all(len(r) == 3 for r in results)
+
+
+def test_task_group_reports_errors():
+    def boom(x):
+        raise ValueError(x)
+
+    with threads.TaskGroup(retries=0) as group:
+        group.submit(boom, 1)
+        group.submit(lambda x: x * 2, 2)
+    first, second = group.results()
+    assert isinstance(first, threads.TaskError) and isinstance(first.error, ValueError)
+    assert second == 4
+
+
+def test_retry_helpers():
+    from azure.core.exceptions import HttpResponseError
+
+    class _Resp:
+        status_code = 429
+        reason = "Too Many Requests"
+        headers = {"Retry-After": "7"}
+
+        def text(self):
+            return ""
+
+    err = HttpResponseError(response=_Resp())
+    assert threads.default_retry_if(err)
+    assert threads.default_retry_if(ServiceRequestError("x"))
+    assert not threads.default_retry_if(ValueError())
+    assert threads.retry_after_seconds(err, 1.0) == 7.0
+    assert threads.retry_after_seconds(ValueError(), 2.5) == 2.5
@@ -0,0 +1,41 @@
+# tests/azure/test_trie.py
+from __future__ import annotations
+
+import ipaddress
+import random
+
+import pytest
+
+from optiv_lib.providers.azure.trie import PrefixTrie
+
+
+def test_longest_match():
+    t = PrefixTrie([("10.0.0.0/8", "a"), ("10.1.0.0/16", "b"), ("10.1.2.0/24", "c"), ("0.0.0.0/0", "d")])
+    assert t.lookup("10.1.2.3") == ("10.1.2.0/24", "c")
+    assert t.lookup("10.1.3.3") == ("10.1.0.0/16", "b")
+    assert t.lookup("10.2.0.1") == ("10.0.0.0/8", "a")
+    assert t.lookup("192.168.0.1") == ("0.0.0.0/0", "d")
+    assert [p for p, _ in t.lookup_all("10.1.2.3")] == ["10.1.2.0/24", "10.1.0.0/16", "10.0.0.0/8", "0.0.0.0/0"]
+
+
+def test_families_exact_and_replace():
+    t = PrefixTrie([("10.0.0.5/8", "a"), ("2001:db8::/32", "v6")])
+    assert t.lookup_value("2001:db8::1") == "v6"
+    assert t.lookup_value("2001:db9::1") is None
+    assert "10.0.0.0/8" in t and "10.0.0.0/9" not in t
+    t.insert("10.0.0.0/8", "a2")
+    assert len(t) == 2 and t.get("10.0.0.0/8") == "a2"
+    assert t.lookup_many(["10.9.9.9", "11.0.0.1", "10.9.9.9"]) == ["a2", None, "a2"]
+    with pytest.raises(ValueError):
+        t.insert("AzureCloud", "tag")
+
+
+def test_matches_linear_scan():
+    rng = random.Random(7)
+    nets = {ipaddress.ip_network((rng.getrandbits(32), rng.randint(4, 28)), strict=False) for _ in range(300)}
+    t = PrefixTrie((str(n), str(n)) for n in nets)
+    assert len(t) == len(nets)
+    for _ in range(500):
+        ip = ipaddress.ip_address(rng.getrandbits(32))
+        best = max((n for n in nets if ip in n), key=lambda n: n.prefixlen, default=None)
+        assert t.lookup_value(ip) == (str(best) if best else None)
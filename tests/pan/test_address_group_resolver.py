@@ -0,0 +1,103 @@
+# tests/pan/test_address_group_resolver.py
+from __future__ import annotations
+
+import pytest
+
+from optiv_lib.providers.pan.objects.address.model import AddressObject
+from optiv_lib.providers.pan.objects.address_group.model import AddressGroupObject
+from optiv_lib.providers.pan.objects.address_group.resolver import (
+    AddressGroupResolveError,
+    AddressGroupResolver,
+    compile_filter,
+    filter_tags,
+)
+
+
+def _addr(name: str, *tags: str) -> AddressObject:
+    return AddressObject(name=name, kind="ip-netmask", value="10.0.0.1", tags=tags)
+
+
+def _static(name: str, *members: str) -> AddressGroupObject:
+    return AddressGroupObject(name=name, kind="static", members=members)
+
+
+def _dynamic(name: str, expr: str) -> AddressGroupObject:
+    return AddressGroupObject(name=name, kind="dynamic", filter=expr)
+
+
+ADDRESSES = [
+    _addr("web1", "web", "prod"),
+    _addr("web2", "web", "dev"),
+    _addr("db1", "db", "prod"),
+    _addr("and1", "and", "prod"),
+    _addr("bare"),
+]
+
+
+def test_compile_precedence_and_quoting():
+    assert compile_filter("'a' or 'b' and not 'c'") == ("or", ("tag", "a"), ("and", ("tag", "b"), ("not", ("tag", "c"))))
+    assert compile_filter("('a' or b) AND c") == ("and", ("or", ("tag", "a"), ("tag", "b")), ("tag", "c"))
+    # A quoted operator word is a tag name.
+    assert compile_filter("'and' and \"not\"") == ("and", ("tag", "and"), ("tag", "not"))
+    assert filter_tags("'web' and not ('db' or 'dev')") == {"web", "db", "dev"}
+
+
+@pytest.mark.parametrize("expr", ["'a' and", "('a' or 'b'", "'a' 'b'", "'a", "and 'a'", ")"])
+def test_compile_rejects_malformed(expr):
+    with pytest.raises(AddressGroupResolveError):
+        compile_filter(expr)
+
+
+@pytest.mark.parametrize("expr,expected", [
+    ("'web'", {"web1", "web2"}),
+    ("'web' and 'prod'", {"web1"}),
+    ("'web' or 'db'", {"db1", "web1", "web2"}),
+    ("'prod' and not 'web'", {"db1", "and1"}),
+    ("not 'prod'", {"web2", "bare"}),
+    ("not 'web' and not 'prod'", {"bare"}),
+    ("'and' and 'prod'", {"and1"}),
+    ("'missing' or 'db'", {"db1"}),
+    ("'missing' and 'db'", set()),
+])
+def test_match_evaluates_over_tag_index(expr, expected):
+    assert AddressGroupResolver(ADDRESSES, []).match(expr) == expected
+
+
+def test_static_nesting_dynamic_members_and_unresolved():
+    r = AddressGroupResolver(ADDRESSES, [
+        _dynamic("prod-web", "'web' and 'prod'"),
+        _static("inner", "db1", "prod-web", "ghost"),
+        _static("outer", "inner", "web2"),
+    ])
+    assert r.members("outer") == {"db1", "web1", "web2"}
+    assert r.unresolved == {"inner": ("ghost",)}
+    assert [a.name for a in r.addresses_of("inner")] == ["db1", "web1"]
+    assert r.resolve_all().keys() == {"prod-web", "inner", "outer"}
+    with pytest.raises(KeyError):
+        r.members("nope")
+
+
+def test_later_scope_overrides_earlier():
+    r = AddressGroupResolver(
+        [_addr("web1", "web"), _addr("web1", "db")],
+        [_static("g", "web1"), _dynamic("g", "'db'")],
+    )
+    assert r.match("'web'") == set()
+    assert r.members("g") == {"web1"}
+    assert r.groups["g"].kind == "dynamic"
+
+
+def test_static_cycle_raises():
+    r = AddressGroupResolver(ADDRESSES, [_static("a", "b"), _static("b", "c"), _static("c", "a", "db1")])
+    with pytest.raises(AddressGroupResolveError, match="cycle"):
+        r.members("a")
+
+
+def test_shared_subexpressions_evaluate_once(monkeypatch):
+    r = AddressGroupResolver(ADDRESSES, [_dynamic("g1", "'web' and 'prod'"), _dynamic("g2", "('web' and 'prod') or 'db'")])
+    seen = []
+    real = AddressGroupResolver._eval_uncached
+    monkeypatch.setattr(AddressGroupResolver, "_eval_uncached", lambda self, node: seen.append(node) or real(self, node))
+    r.resolve_all()
+    assert seen.count(("and", ("tag", "web"), ("tag", "prod"))) == 1
+    assert seen.count(("tag", "web")) == 1
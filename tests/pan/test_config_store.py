@@ -0,0 +1,98 @@
+# tests/pan/test_config_store.py
+from __future__ import annotations
+
+import copy
+
+import pytest
+
+from optiv_lib.providers.pan.device.config.store import ConfigSnapshotStore, ConfigStoreError
+
+_VSYS = "/config/devices/entry[@name='localhost.localdomain']/vsys/entry[@name='vsys1']"
+
+
+def _rule(i: int) -> dict:
+    return {
+        "@name": f"rule-{i}",
+        "from": {"member": ["trust"]},
+        "to": {"member": ["untrust"]},
+        "source": {"member": [f"10.{i // 256}.{i % 256}.0/24"]},
+        "destination": {"member": ["any"]},
+        "action": "allow",
+    }
+
+
+def _config(rules: list) -> dict:
+    return {"config": {"@version": "10.2.0", "devices": {"entry": [{
+        "@name": "localhost.localdomain",
+        "vsys": {"entry": [{
+            "@name": "vsys1",
+            "address": {"entry": [{"@name": "a1", "ip-netmask": "10.0.0.1"}]},
+            "rulebase": {"security": {"rules": {"entry": rules}}},
+        }]},
+    }]}}}
+
+
+@pytest.fixture
+def store(tmp_path):
+    with ConfigSnapshotStore(tmp_path / "configs.db") as s:
+        yield s
+
+
+def test_round_trip_and_xpath_reads(store):
+    cfg = _config([_rule(i) for i in range(300)])
+    store.put("001", cfg, taken_at="2026-01-01T00:00:00Z")
+    snap = store.open("001")
+
+    assert snap.to_dict() == cfg
+    assert snap.get(f"{_VSYS}/address") == {"address": {"entry": [{"@name": "a1", "ip-netmask": "10.0.0.1"}]}}
+    # rule-200 lives in a later chunk of the chunked rules list.
+    assert snap.get(f"{_VSYS}/rulebase/security/rules/entry[@name='rule-200']") == {"entry": [_rule(200)]}
+    assert snap.exists(f"{_VSYS}/rulebase/security/rules")
+    assert not snap.exists(f"{_VSYS}/rulebase/security/rules/entry[@name='nope']")
+    with pytest.raises(ConfigStoreError):
+        snap.get(f"{_VSYS}/service")
+    with pytest.raises(ConfigStoreError):
+        store.open("002")
+
+
+def test_identical_snapshot_adds_no_blobs(store):
+    cfg = _config([_rule(i) for i in range(300)])
+    first = store.put("001", cfg, taken_at="2026-01-01T00:00:00Z")
+    again = store.put("001", copy.deepcopy(cfg), taken_at="2026-01-02T00:00:00Z")
+    assert first.new_blobs > 0
+    assert again.new_blobs == 0 and again.root == first.root
+    assert [s.taken_at for s in store.snapshots("001")] == ["2026-01-01T00:00:00Z", "2026-01-02T00:00:00Z"]
+
+
+def test_inserted_rule_only_rewrites_nearby_chunks(store):
+    rules = [_rule(i) for i in range(1000)]
+    first = store.put("001", _config(rules), taken_at="2026-01-01T00:00:00Z")
+    edited = rules[:10] + [_rule(5000)] + rules[10:]
+    second = store.put("001", _config(edited), taken_at="2026-01-02T00:00:00Z")
+
+    # Content-defined chunking: one new chunk plus the spine down to it,
+    # not every chunk after the insertion point.
+    assert second.new_blobs <= 8
+    assert second.new_blobs < first.new_blobs // 4
+    assert store.open("001").get(f"{_VSYS}/rulebase/security/rules/entry[@name='rule-5000']") == {"entry": [_rule(5000)]}
+    assert store.open("001", "2026-01-01T00:00:00Z").to_dict() == _config(rules)
+
+
+def test_gc_reclaims_only_unreachable_blobs(store):
+    old = _config([_rule(i) for i in range(300)])
+    new = _config([_rule(i) for i in range(100, 400)])
+    store.put("001", old, taken_at="2026-01-01T00:00:00Z")
+    store.put("001", new, taken_at="2026-01-02T00:00:00Z")
+    assert store.gc() == 0
+
+    assert store.delete("001", before="2026-01-02T00:00:00Z") == 1
+    before = store.stats()["blobs"]
+    removed = store.gc()
+    assert removed > 0
+    assert store.stats()["snapshots"] == 1
+    assert store.stats()["blobs"] == before - removed
+    assert store.open("001").to_dict() == new
+
+    store.delete("001")
+    store.gc()
+    assert store.stats()["blobs"] == 0
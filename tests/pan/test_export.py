@@ -0,0 +1,113 @@
+# tests/pan/test_export.py
+from __future__ import annotations
+
+import gzip
+import hashlib
+import io
+
+import pytest
+
+from optiv_lib.providers.pan.export import ExportedConfig, export_config
+from optiv_lib.providers.pan.session import PanoramaHTTPError
+
+_CONFIG = (
+    b'<?xml version="1.0"?>\n'
+    b'<config version="10.2.0"><shared><address>'
+    b'<entry name="a1"><ip-netmask>10.0.0.1</ip-netmask></entry>'
+    b'<entry name="a2"><fqdn>x.example</fqdn></entry>'
+    b'</address></shared></config>'
+)
+
+
+class _Stream:
+    def __init__(self, body: bytes) -> None:
+        self.body = body
+        self.closed = False
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def iter_content(self, chunk_size: int = 1):
+        for i in range(0, len(self.body), chunk_size):
+            yield self.body[i:i + chunk_size]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.closed = True
+
+
+class FakeSession:
+    def __init__(self, body: bytes) -> None:
+        self.response = _Stream(body)
+        self.params = None
+
+    def get(self, path, params=None, stream=False):
+        self.params = params
+        return self.response
+
+
+@pytest.mark.parametrize("body", [
+    b'<response status="error"><msg><line>no such file</line></msg></response>',
+    b'<?xml version="1.0" encoding="UTF-8"?>\n<response status="error"><msg><line>no such file</line></msg></response>',
+    b"\xef\xbb\xbf  <?xml version='1.0'?><response code='17' status='error'><msg>no such file</msg></response>",
+])
+def test_error_document_raises_and_writes_nothing(tmp_path, body):
+    dest = tmp_path / "running.xml"
+    with pytest.raises(PanoramaHTTPError, match="no such file"):
+        export_config(session=FakeSession(body), dest=dest, chunk_size=16)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_config_mentioning_error_is_not_an_error():
+    body = b'<?xml version="1.0"?><config><shared><tag><entry name="status=&quot;error&quot;"/></tag></shared></config>'
+    out = io.BytesIO()
+    res = export_config(session=FakeSession(body), dest=out)
+    assert out.getvalue() == body
+    assert res.path is None and res.compression == "none"
+
+
+def test_path_export_is_compressed_by_suffix_and_hashed(tmp_path):
+    dest = tmp_path / "running.xml.gz"
+    session = FakeSession(_CONFIG)
+    res = export_config(session=session, dest=dest, source="backup.xml", target="0123", chunk_size=32)
+
+    assert session.params == {"type": "export", "category": "configuration", "from": "backup.xml", "target": "0123"}
+    assert session.response.closed
+    assert res.path == str(dest) and res.compression == "gzip"
+    assert res.bytes_read == len(_CONFIG)
+    assert res.bytes_written == dest.stat().st_size
+    assert res.digest == hashlib.sha256(_CONFIG).hexdigest()
+    assert gzip.decompress(dest.read_bytes()) == _CONFIG
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["running.xml.gz"]
+
+
+def test_failed_download_removes_part_file(tmp_path):
+    class Broken(_Stream):
+        def iter_content(self, chunk_size: int = 1):
+            yield _CONFIG[:40]
+            raise OSError("reset")
+
+    session = FakeSession(_CONFIG)
+    session.response = Broken(_CONFIG)
+    dest = tmp_path / "running.xml"
+    with pytest.raises(OSError):
+        export_config(session=session, dest=dest)
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize("name,data", [("cfg.xml", _CONFIG), ("cfg.xml.gz", gzip.compress(_CONFIG))])
+def test_exported_config_reads_plain_and_compressed(tmp_path, name, data):
+    path = tmp_path / name
+    path.write_bytes(data)
+    cfg = ExportedConfig(path)
+
+    entry = cfg.get("/config/shared/address/entry[@name='a1']")
+    assert entry["entry"][0]["@name"] == "a1"
+    assert entry["entry"][0]["ip-netmask"] == "10.0.0.1"
+    assert [m["entry"][0]["@name"] for m in cfg.iter_xpath("/config/shared/address/entry")] == ["a1", "a2"]
+    assert cfg.exists("/config/shared/address")
+    assert not cfg.exists("/config/devices")
+    with pytest.raises(KeyError):
+        cfg.get("/config/shared/service")
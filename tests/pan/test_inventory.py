@@ -0,0 +1,57 @@
+# tests/pan/test_inventory.py
+from __future__ import annotations
+
+import threading
+
+from optiv_lib.providers.pan.panorama.managed_devices import inventory as inv_mod
+from optiv_lib.providers.pan.panorama.managed_devices.inventory import DeviceInventory
+from optiv_lib.providers.pan.panorama.managed_devices.model import ManagedDevice
+from optiv_lib.providers.pan.panorama.managed_devices.parser import from_xml, membership_from_xml
+
+_TEMPLATES = {
+    "templates": {
+        "entry": [
+            {"@name": "base", "template-stack": "no", "devices": {"entry": [{"@name": "001"}, {"@name": "002"}]}},
+            {"@name": "branch-stack", "template-stack": "yes", "devices": {"entry": {"@name": "001"}}},
+        ]
+    }
+}
+
+
+def test_templates_and_stacks_kept_apart():
+    stacks = membership_from_xml(_TEMPLATES, "templates", stack=True)
+    templates = membership_from_xml(_TEMPLATES, "templates", stack=False)
+    assert stacks == {"001": "branch-stack"}
+    assert templates == {"001": "base", "002": "base"}
+    devices = {"devices": {"entry": [{"@name": "001", "connected": "yes"}, {"@name": "002"}]}}
+    a, b = from_xml(devices, template_stacks=stacks, templates=templates)
+    assert (a.template_stack, a.template) == ("branch-stack", "base")
+    assert (b.template_stack, b.template) == (None, "base")
+
+
+def test_concurrent_stale_lookups_share_one_fetch(monkeypatch):
+    calls = []
+    release = threading.Event()
+
+    def fake_list_devices(*, session, membership):
+        calls.append(1)
+        release.wait(5)
+        return [ManagedDevice(serial="001", template="base")]
+
+    monkeypatch.setattr(inv_mod, "list_devices", fake_list_devices)
+    inv = DeviceInventory(object(), ttl=300)
+    results = []
+    workers = [threading.Thread(target=lambda: results.append(len(inv))) for _ in range(4)]
+    for w in workers:
+        w.start()
+    # Subscribing does not wait on the Panorama call.
+    unsubscribe = inv.subscribe(lambda diff: None)
+    unsubscribe()
+    release.set()
+    for w in workers:
+        w.join(5)
+    assert results == [1, 1, 1, 1]
+    assert len(calls) == 1
+    assert inv.templates() == ["base"]
+    inv.refresh()
+    assert len(calls) == 2
@@ -0,0 +1,52 @@
+# tests/pan/test_logs.py
+from __future__ import annotations
+
+import io
+
+import pytest
+
+from optiv_lib.providers.pan.logs import _NotReady, _parse_page
+from optiv_lib.providers.pan.session import PanoramaHTTPError
+
+
+def _page(job_status: str, entries: str, count: int) -> io.BytesIO:
+    return io.BytesIO(
+        f"""<response status="success"><result>
+<job><tenq>t</tenq><id>7</id><status>{job_status}</status></job>
+<log><logs count="{count}" progress="100">{entries}</logs></log>
+</result></response>""".encode()
+    )
+
+
+def _parse(stream):
+    counts = []
+    return list(_parse_page(stream, "7", counts.append)), counts
+
+
+def test_entries_and_count():
+    entries, counts = _parse(_page("FIN", '<entry logid="1"><src>10.0.0.1</src></entry><entry logid="2"><src>10.0.0.2</src></entry>', 2))
+    assert counts == [2]
+    assert entries == [{"@logid": "1", "src": "10.0.0.1"}, {"@logid": "2", "src": "10.0.0.2"}]
+
+
+def test_entry_status_field_is_not_the_job_status():
+    # GlobalProtect / system entries carry a <status> of their own.
+    body = '<entry logid="1"><status>failure</status><eventid>gateway-auth</eventid></entry>'
+    entries, _ = _parse(_page("FIN", body, 1))
+    assert entries == [{"@logid": "1", "status": "failure", "eventid": "gateway-auth"}]
+
+
+def test_job_not_finished():
+    with pytest.raises(_NotReady):
+        _parse(_page("ACT", "", 0))
+
+
+def test_error_response():
+    stream = io.BytesIO(b'<response status="error"><msg><line>Invalid job</line></msg></response>')
+    with pytest.raises(PanoramaHTTPError, match="Invalid job"):
+        _parse(stream)
+
+
+def test_malformed_xml_is_an_http_error():
+    with pytest.raises(PanoramaHTTPError, match="malformed"):
+        _parse(io.BytesIO(b'<response status="success"><result><job>'))
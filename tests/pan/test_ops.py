@@ -0,0 +1,64 @@
+# tests/pan/test_ops.py
+from __future__ import annotations
+
+import pytest
+import requests
+
+from optiv_lib.providers.pan import ops
+from optiv_lib.providers.pan.session import PanoramaHTTPError, PanoramaTimeoutError
+
+_OK = '<response status="success"><result><job>12</job></result></response>'
+
+
+class _Response:
+    def __init__(self, status: int, text: str = _OK) -> None:
+        self.status_code = status
+        self.text = text
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code}", response=self)
+
+
+class FakeSession:
+    def __init__(self, *outcomes) -> None:
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def _next(self):
+        self.calls += 1
+        out = self.outcomes.pop(0)
+        if isinstance(out, Exception):
+            raise out
+        return out
+
+    def get(self, path, params=None):
+        return self._next()
+
+    def post(self, path, data=None):
+        return self._next()
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(ops, "sleep", lambda s: None)
+
+
+def test_commit_not_retried_on_5xx():
+    s = FakeSession(_Response(502), _Response(200))
+    with pytest.raises(PanoramaHTTPError):
+        ops.commit(session=s, cmd="<commit></commit>")
+    assert s.calls == 1
+
+
+def test_commit_not_retried_on_timeout():
+    s = FakeSession(requests.ReadTimeout("read timed out"), _Response(200))
+    with pytest.raises(PanoramaTimeoutError):
+        ops.commit(session=s, cmd="<commit></commit>")
+    assert s.calls == 1
+
+
+def test_read_retried():
+    s = FakeSession(_Response(503), requests.ConnectionError("reset"), _Response(200))
+    assert ops.op(session=s, cmd="<show><jobs><all/></jobs></show>") == {"job": "12"}
+    assert s.calls == 3
@@ -0,0 +1,53 @@
+# tests/pan/test_references.py
+from __future__ import annotations
+
+from optiv_lib.providers.pan.references import ObjectRef, ReferenceGraph
+
+
+def _m(*names):
+    return {"member": list(names)}
+
+
+def _config():
+    return {"config": {
+        "shared": {
+            "address": {"entry": [{"@name": n, "ip-netmask": "10.0.0.%d" % i} for i, n in enumerate(
+                ["web", "nat-pool", "vip", "nexthop", "decrypt-src", "orphan", "in-group", "sec-only"], start=1)]},
+            "address-group": {"entry": [{"@name": "grp", "static": _m("in-group")}]},
+            "service": {"entry": [{"@name": "tcp-8443", "protocol": {"tcp": {"port": "8443"}}}]},
+        },
+        "devices": {"entry": [{"@name": "localhost.localdomain", "device-group": {"entry": [{
+            "@name": "branch",
+            "pre-rulebase": {
+                "security": {"rules": {"entry": [
+                    {"@name": "allow-web", "source": _m("any"), "destination": _m("sec-only"), "service": _m("any")},
+                    {"@name": "off", "disabled": "yes", "source": _m("orphan"), "destination": _m("any"), "service": _m("any")},
+                ]}},
+                "nat": {"rules": {"entry": [{
+                    "@name": "snat", "source": _m("web"), "destination": _m("any"), "service": "tcp-8443",
+                    "source-translation": {"dynamic-ip-and-port": {"translated-address": _m("nat-pool")}},
+                    "destination-translation": {"translated-address": "vip"},
+                }]}},
+                "pbf": {"rules": {"entry": [{
+                    "@name": "pbf", "source": _m("grp"), "destination": _m("any"),
+                    "action": {"forward": {"nexthop": {"ip-address": "nexthop"}}},
+                }]}},
+                "decryption": {"rules": {"entry": [{"@name": "dec", "source": _m("decrypt-src"), "destination": _m("any")}]}},
+            },
+        }]}}]},
+    }}
+
+
+def test_non_security_rulebases_are_roots():
+    g = ReferenceGraph(_config(), parents={"branch": None})
+    unused = {r.name for r in g.unused(kinds=("address", "address-group", "service"))}
+    assert unused == {"orphan"}
+    assert ObjectRef("shared", "address", "vip") in g.live()
+
+
+def test_where_used_and_blast_radius():
+    g = ReferenceGraph(_config(), parents={"branch": None})
+    assert g.where_used(ObjectRef("shared", "address", "nat-pool")) == [ObjectRef("branch", "nat-rule", "snat")]
+    radius = g.blast_radius(ObjectRef("shared", "address", "in-group"))
+    assert radius == {"address-group": [ObjectRef("shared", "address-group", "grp")], "pbf-rule": [ObjectRef("branch", "pbf-rule", "pbf")]}
+    assert not g.dangling
@@ -0,0 +1,177 @@
+# tests/pan/test_security_rule_engine.py
+from __future__ import annotations
+
+import ipaddress
+import random
+
+import pytest
+
+from optiv_lib.providers.pan.objects.address.model import AddressObject
+from optiv_lib.providers.pan.objects.address_group.model import AddressGroupObject
+from optiv_lib.providers.pan.objects.security_rule.engine import Flow, SecurityRuleEngine, parse_service_port
+from optiv_lib.providers.pan.objects.security_rule.model import SecurityRuleObject
+
+ADDRESSES = [
+    AddressObject(name="web-net", kind="ip-netmask", value="10.1.0.0/16", tags=("web",)),
+    AddressObject(name="db-range", kind="ip-range", value="10.2.0.10-10.2.0.20", tags=("db",)),
+    AddressObject(name="split-wild", kind="ip-wildcard", value="10.3.0.1/0.0.2.255"),
+    AddressObject(name="odd-hosts", kind="ip-wildcard", value="10.4.0.1/0.0.255.254"),
+    AddressObject(name="site", kind="fqdn", value="example.com"),
+    AddressObject(name="v6-net", kind="ip-netmask", value="2001:db8::/32", tags=("web",)),
+]
+GROUPS = [
+    AddressGroupObject(name="web-dyn", kind="dynamic", filter="'web'"),
+    AddressGroupObject(name="servers", kind="static", members=("web-dyn", "db-range")),
+]
+
+
+def _rule(name: str, **kw) -> SecurityRuleObject:
+    kw.setdefault("services", ("any",))
+    return SecurityRuleObject(name=name, **kw)
+
+
+def _flow(src: str, dst: str, *, port: int = 443, proto: str = "tcp", fz: str = "trust", tz: str = "untrust", **kw) -> Flow:
+    return Flow(fz, tz, src, dst, proto, port, **kw)
+
+
+def test_parse_service_port():
+    assert parse_service_port("TCP/443") == ("tcp", 443, 443)
+    assert parse_service_port("udp/1000-2000") == ("udp", 1000, 2000)
+    assert parse_service_port(("UDP", 53, 53)) == ("udp", 53, 53)
+    for bad in ("443", "tcp/70000", "tcp/20-10"):
+        with pytest.raises(ValueError):
+            parse_service_port(bad)
+
+
+def test_address_kinds_groups_and_literals():
+    rules = [
+        _rule("to-db", destinations=("db-range",)),
+        _rule("to-wild", destinations=("split-wild",)),
+        _rule("to-servers", destinations=("servers",)),
+        _rule("to-literal", destinations=("192.168.0.0/24", "172.16.0.1-172.16.0.3")),
+        _rule("to-fqdn", destinations=("site", "nope")),
+        _rule("to-odd", destinations=("odd-hosts",)),
+    ]
+    engine = SecurityRuleEngine(rules, addresses=ADDRESSES, address_groups=GROUPS)
+
+    def hit(dst: str):
+        r = engine.match(_flow("1.1.1.1", dst))
+        return r.name if r else None
+
+    assert hit("10.2.0.15") == "to-db"
+    assert hit("10.2.0.21") is None
+    # 0.0.2.255 has one scattered wildcard bit: 10.3.0.0/24 and 10.3.2.0/24.
+    assert hit("10.3.0.9") == "to-wild"
+    assert hit("10.3.2.9") == "to-wild"
+    assert hit("10.3.1.9") is None
+    assert hit("10.1.200.1") == "to-servers"
+    assert hit("2001:db8::1") == "to-servers"
+    assert hit("192.168.0.255") == "to-literal"
+    assert hit("172.16.0.3") == "to-literal"
+    assert hit("172.16.0.4") is None
+    # FQDNs, unknown names and wildcards with too many spans cannot be matched.
+    assert hit("10.4.0.1") is None
+    assert engine.unresolved == {"to-fqdn": ("site", "nope"), "to-odd": ("odd-hosts",)}
+
+
+def test_negation_zones_rule_type_and_disabled():
+    rules = [
+        _rule("off", disabled=True),
+        _rule("not-internal", from_zones=("trust",), destinations=("10.0.0.0/8",), negate_destination=True, action="deny"),
+        _rule("never", negate_source=True),
+        _rule("intra", rule_type="intrazone"),
+        _rule("inter", rule_type="interzone"),
+    ]
+    engine = SecurityRuleEngine(rules)
+
+    assert engine.match(_flow("10.0.0.1", "8.8.8.8")).name == "not-internal"
+    assert engine.match(_flow("10.0.0.1", "2001:db8::1")).name == "not-internal"
+    # Negated 'any' matches nothing, so inside 10/8 falls through to the rule types.
+    assert engine.match(_flow("10.0.0.1", "10.9.9.9")).name == "inter"
+    assert engine.match(_flow("10.0.0.1", "10.9.9.9", fz="dmz", tz="dmz")).name == "intra"
+    assert [r.name for r in engine.candidates(_flow("10.0.0.1", "8.8.8.8"))] == ["not-internal", "inter"]
+
+
+def test_services_apps_and_optional_fields():
+    rules = [
+        _rule("web", services=("service-https", "alt"), applications=("web-apps",)),
+        _rule("dns", services=("dns-grp",), source_users=("corp\\alice",)),
+        _rule("default", services=("application-default",), categories=("news",)),
+    ]
+    engine = SecurityRuleEngine(
+        rules,
+        services={"alt": ["tcp/8000-8010"], "dns": ["udp/53", ("tcp", 53, 53)]},
+        service_groups={"dns-grp": ["dns", "dns-grp"]},
+        application_groups={"web-apps": ["web-browsing", "ssl-apps"], "ssl-apps": ["ssl", "web-apps"]},
+    )
+
+    assert engine.match(_flow("1.1.1.1", "2.2.2.2", port=8005, application="ssl")).name == "web"
+    assert engine.match(_flow("1.1.1.1", "2.2.2.2", port=8011, application="ssl")).name == "default"
+    assert engine.match(_flow("1.1.1.1", "2.2.2.2", port=443, application="dns", category="sports")) is None
+    assert engine.match(_flow("1.1.1.1", "2.2.2.2", port=53, proto="udp", source_user="corp\\alice")).name == "dns"
+    assert engine.match(_flow("1.1.1.1", "2.2.2.2", port=53, proto="udp", source_user="corp\\bob", category="news")).name == "default"
+    # None leaves a field unconstrained.
+    assert engine.match(_flow("1.1.1.1", "2.2.2.2", port=53, proto="udp")).name == "dns"
+    # The self-referencing group member is reported rather than followed.
+    assert engine.unresolved == {"dns": ("dns-grp",)}
+
+
+def _naive(rules, flow):
+    src, dst = ipaddress.ip_address(flow.source), ipaddress.ip_address(flow.destination)
+
+    def addr_ok(members, negate, ip):
+        if members == ("any",):
+            return not negate
+        inside = any(ip in ipaddress.ip_network(m) for m in members if ipaddress.ip_network(m).version == ip.version)
+        return inside != negate
+
+    for r in rules:
+        if r.disabled:
+            continue
+        if "any" not in r.from_zones and flow.from_zone not in r.from_zones:
+            continue
+        if "any" not in r.to_zones and flow.to_zone not in r.to_zones:
+            continue
+        if r.services != ("any",):
+            ports = [parse_service_port(s) for s in r.services]
+            if not any(p == flow.protocol and lo <= flow.port <= hi for p, lo, hi in ports):
+                continue
+        if addr_ok(r.sources, r.negate_source, src) and addr_ok(r.destinations, r.negate_destination, dst):
+            return r
+    return None
+
+
+def test_first_match_agrees_with_linear_scan():
+    rng = random.Random(7)
+    nets = ["10.0.0.0/8", "10.1.0.0/16", "10.1.2.0/24", "10.1.2.128/25", "192.168.0.0/16", "0.0.0.0/1", "2001:db8::/32", "10.1.2.3/32"]
+    zones = ["trust", "untrust", "dmz"]
+
+    def members(pool):
+        return ("any",) if rng.random() < 0.3 else tuple(rng.sample(pool, rng.randint(1, 3)))
+
+    rules = []
+    for i in range(150):
+        lo = rng.randrange(0, 2000)
+        rules.append(_rule(
+            f"r{i}",
+            from_zones=members(zones),
+            to_zones=members(zones),
+            sources=members(nets),
+            destinations=members(nets),
+            negate_source=rng.random() < 0.2,
+            negate_destination=rng.random() < 0.2,
+            services=("any",) if rng.random() < 0.3 else (f"{rng.choice(['tcp', 'udp'])}/{lo}-{lo + rng.randrange(0, 500)}",),
+            disabled=rng.random() < 0.1,
+        ))
+    specs = {s: [s] for r in rules for s in r.services if s != "any"}
+    engine = SecurityRuleEngine(rules, services=specs)
+    # Service names are the specs themselves, so the naive scan can parse them.
+    assert engine.unresolved == {}
+
+    hosts = ["10.1.2.3", "10.1.2.200", "10.1.9.9", "10.200.0.1", "192.168.5.5", "8.8.8.8", "200.1.1.1", "2001:db8::5", "2001:db9::5"]
+    flows = [
+        _flow(rng.choice(hosts), rng.choice(hosts), port=rng.randrange(0, 2600), proto=rng.choice(["tcp", "udp"]),
+              fz=rng.choice(zones), tz=rng.choice(zones))
+        for _ in range(2000)
+    ]
+    assert engine.match_many(flows) == [_naive(rules, f) for f in flows]
@@ -0,0 +1,78 @@
+# tests/pan/test_sync.py
+from __future__ import annotations
+
+import pytest
+
+from optiv_lib.providers.pan import sync as sync_mod
+from optiv_lib.providers.pan.sync import ConfigSync, _overlaps
+from optiv_lib.providers.pan.util import split_xpath
+
+DG = "/config/devices/entry/device-group/entry[@name='branch']"
+ADDR = DG + "/address"
+SVC = DG + "/service"
+
+
+class FakePanorama:
+    def __init__(self):
+        self.commit_id = 10
+        self.journal: list[str] = []
+        self.config = {ADDR: {"v": 1}, SVC: {"v": 1}}
+
+    def install(self, monkeypatch):
+        monkeypatch.setattr(sync_mod, "last_commit_job_id", lambda session: self.commit_id)
+        monkeypatch.setattr(sync_mod, "has_pending_changes", lambda session: bool(self.journal))
+        monkeypatch.setattr(sync_mod, "pending_change_xpaths", lambda session: list(self.journal))
+        monkeypatch.setattr(sync_mod.ops, "config_get", lambda session, xpath: dict(self.config[xpath]))
+        monkeypatch.setattr(sync_mod.ops, "config_show", lambda session, xpath: dict(self.config[xpath]))
+
+
+@pytest.fixture
+def pano(monkeypatch):
+    p = FakePanorama()
+    p.install(monkeypatch)
+    return p
+
+
+def test_split_xpath_keeps_slashes_in_names():
+    assert split_xpath("/config/entry[@name='10.0.0.0/24']/x") == [("config", None), ("entry", "10.0.0.0/24"), ("x", None)]
+    with pytest.raises(ValueError):
+        split_xpath("/a/b[@name='x'")
+
+
+def test_overlaps_is_ancestor_or_equal():
+    assert _overlaps(split_xpath(ADDR + "/entry[@name='h1']"), split_xpath(ADDR))
+    assert _overlaps(split_xpath(DG), split_xpath(ADDR))
+    assert not _overlaps(split_xpath(SVC), split_xpath(ADDR))
+
+
+def test_journal_marks_only_overlapping(pano):
+    s = ConfigSync(None, [ADDR, SVC])
+    s.sync()
+    assert s.check() == []
+    pano.journal = [ADDR + "/entry[@name='h1']"]
+    pano.config[ADDR] = {"v": 2}
+    assert s.sync() == [ADDR]
+
+
+def test_commit_between_checks_marks_everything_stale(pano):
+    s = ConfigSync(None, [ADDR, SVC])
+    s.sync()
+    # Edited and committed between two checks: the journal is empty both times.
+    pano.config[ADDR] = {"v": 2}
+    pano.commit_id = 11
+    assert s.check() == [ADDR, SVC]
+    assert s.sync() == [ADDR]
+    assert s.get(ADDR) == {"v": 2}
+
+
+def test_load_honors_candidate_flag(tmp_path, pano):
+    missing = tmp_path / "none.json"
+    assert ConfigSync.load(missing, None, xpaths=[ADDR], candidate=False).candidate is False
+    path = tmp_path / "sync.json"
+    s = ConfigSync(None, [ADDR])
+    s.sync()
+    s.save(path)
+    same = ConfigSync.load(path, None)
+    assert same.candidate is True and same.check() == []
+    switched = ConfigSync.load(path, None, candidate=False)
+    assert switched.candidate is False and switched.check() == [ADDR]